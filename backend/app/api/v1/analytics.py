@@ -281,6 +281,36 @@ async def get_trades_data(
     return result
 
 
+@router.get("/monte-carlo/{backtest_id}")
+async def get_monte_carlo_analysis(
+    backtest_id: int,
+    n_paths: int = Query(10000, ge=1, le=100000, description="Number of resampled equity paths"),
+    method: str = Query("bootstrap", pattern="^(bootstrap|shuffle)$", description="bootstrap: draw trades with replacement; shuffle: permute the historical trades"),
+    n_trades: Optional[int] = Query(None, ge=1, le=1000000, description="Trades per bootstrap path (defaults to the historical trade count)"),
+    ruin_drawdown_pct: float = Query(50.0, gt=0, le=100, description="Loss of starting equity, in percent, that counts as ruin"),
+    seed: Optional[int] = Query(None, ge=0, description="Random seed for reproducible paths")
+) -> Dict[str, Any]:
+    """
+    Monte Carlo resampling of a backtest's trade log
+
+    Returns distributions (percentiles and histograms) of final equity and
+    maximum drawdown across the resampled paths, plus the probability of ruin.
+    """
+    result = analytics_service.get_monte_carlo_analysis(
+        backtest_id,
+        n_paths=n_paths,
+        method=method,
+        n_trades=n_trades,
+        ruin_drawdown_pct=ruin_drawdown_pct,
+        seed=seed
+    )
+
+    if not result['success']:
+        raise HTTPException(status_code=404, detail=result['error'])
+
+    return result
+
+
 @router.get("/summary/metrics")
 async def get_metrics_summary() -> Dict[str, Any]:
     """
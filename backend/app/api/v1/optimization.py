@@ -3,7 +3,7 @@ Optimization API endpoints
 Provides parameter optimization functionality for trading strategies
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import Dict, Any, List, Union, Optional
 from pydantic import BaseModel, Field
 
@@ -13,7 +13,7 @@ from backend.app.api.dependencies import (
     get_optimization_service,
 )
 from backend.app.services.dataset_service import DatasetService
-from backend.app.services.optimization import ParameterGridError, generate_parameter_grid
+from backend.app.services.optimization import ParameterGridError, count_parameter_grid, generate_parameter_grid
 from backend.app.services.optimization_service import OptimizationService
 from backend.app.tasks import JobRunner, JobStatus
 
@@ -28,14 +28,54 @@ class ParameterRange(BaseModel):
     values: Optional[List[Union[int, float, str]]] = Field(None, description="List of values for choice type")
 
 
+class WalkForwardConfig(BaseModel):
+    in_sample_sessions: int = Field(..., description="Trading sessions in each in-sample window", ge=1)
+    out_of_sample_sessions: int = Field(..., description="Trading sessions in each out-of-sample window", ge=1)
+    step_sessions: Optional[int] = Field(None, description="Sessions to advance between folds (defaults to out_of_sample_sessions)", ge=1)
+    anchored: bool = Field(False, description="Keep every in-sample window anchored at the first session")
+
+
+class CrossValidationConfig(BaseModel):
+    n_groups: int = Field(6, description="Contiguous session groups the data is cut into", ge=2)
+    test_groups: int = Field(2, description="Groups held out per split; every combination is one split", ge=1)
+    embargo_sessions: int = Field(1, description="Sessions next to each test group excluded from training", ge=0)
+
+
+class HalvingConfig(BaseModel):
+    min_sessions: int = Field(5, description="Trading sessions in the first (cheapest) rung", ge=1)
+    reduction_factor: float = Field(3, description="Keep the top 1/reduction_factor candidates per rung; session windows grow by the same factor", gt=1)
+
+
+class PruningConfig(BaseModel):
+    max_drawdown_pct: Optional[float] = Field(None, description="Abort once equity falls this many percent below its peak", gt=0, le=100)
+    equity_floor: Optional[float] = Field(None, description="Abort once equity falls below this level")
+    min_trades: Optional[int] = Field(None, description="Abort when fewer trades than this were closed after min_trades_sessions sessions", ge=1)
+    min_trades_sessions: Optional[int] = Field(None, description="Sessions after which min_trades is enforced", ge=1)
+
+
+class Objective(BaseModel):
+    metric: str = Field(..., description="Metric to optimize (same names as optimization_metric)")
+    direction: str = Field("maximize", description="'maximize' or 'minimize'")
+
+
 class OptimizationRequest(BaseModel):
     strategy_path: str = Field(..., description="Module path to strategy class (e.g., 'strategies.ema10_scalper.EMA10ScalperStrategy')")
     dataset_id: int = Field(..., description="ID of dataset to use for optimization")
     param_ranges: Dict[str, ParameterRange] = Field(..., description="Parameter ranges to optimize")
     optimization_metric: str = Field("sharpe_ratio", description="Metric to optimize (sharpe_ratio, total_return_pct, profit_factor, etc.)")
     engine_options: Optional[Dict[str, Any]] = Field(None, description="Engine configuration options")
-    max_workers: int = Field(2, description="Number of parallel workers", ge=1, le=8)
+    max_workers: int = Field(2, description="Number of parallel workers", ge=1, le=32)
     validation_split: float = Field(0.3, description="Fraction of data to reserve for validation", ge=0.1, le=0.5)
+    walk_forward: Optional[WalkForwardConfig] = Field(None, description="Run a walk-forward analysis instead of a single validation split")
+    execution_mode: Optional[str] = Field(None, description="Sweep backend: 'process' (shared-memory process pool), 'thread' or 'distributed' (batches queued for `cli.py worker` processes)")
+    search: str = Field("grid", description="Search method: 'grid' (every combination), 'halving' (successive halving over session windows), 'bayesian' (adaptive TPE sampling), 'random' (uniform sampling) or 'lhs' (Latin hypercube sampling)")
+    n_trials: Optional[int] = Field(None, description="Evaluation budget for sampling-based search methods; points answered by the evaluation memo count toward it", ge=1, le=10000)
+    seed: Optional[int] = Field(None, description="Random seed for sampling-based search methods")
+    halving: Optional[HalvingConfig] = Field(None, description="Fidelity schedule for search='halving'")
+    pruning: Optional[PruningConfig] = Field(None, description="Abort hopeless parameter sets early; they are recorded with status 'pruned'")
+    objectives: Optional[List[Objective]] = Field(None, description="Two or more metrics to trade off; the results include their Pareto front with crowding distances")
+    cross_validation: Optional[CrossValidationConfig] = Field(None, description="Run combinatorial purged cross-validation over session groups instead of a single validation split")
+    metrics_only: bool = Field(False, description="Compute only the optimization metric and objectives per backtest, skipping equity/trade serialization")
 
 
 @router.post("/")
@@ -79,7 +119,17 @@ async def start_optimization(
         optimization_metric=request.optimization_metric,
         engine_options=request.engine_options,
         max_workers=request.max_workers,
-        validation_split=request.validation_split
+        validation_split=request.validation_split,
+        walk_forward=request.walk_forward.dict() if request.walk_forward else None,
+        execution_mode=request.execution_mode,
+        search=request.search,
+        n_trials=request.n_trials,
+        seed=request.seed,
+        halving=request.halving.dict() if request.halving else None,
+        pruning=request.pruning.dict(exclude_none=True) if request.pruning else None,
+        objectives=[o.dict() for o in request.objectives] if request.objectives else None,
+        metrics_only=request.metrics_only,
+        cross_validation=request.cross_validation.dict() if request.cross_validation else None,
     )
     
     if not result['success']:
@@ -141,6 +191,31 @@ async def get_optimization_results(
     return result
 
 
+@router.get("/{job_id}/results/all")
+async def get_all_optimization_results(
+    job_id: str,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    sort: str = Query("score", description="'score' (best first) or 'completion'"),
+    optimization_service: OptimizationService = Depends(get_optimization_service),
+) -> Dict[str, Any]:
+    """
+    Page through every evaluated parameter set of a completed optimization job
+
+    The inline results only carry the best entries; the full sweep is stored
+    on disk and served here in pages.
+    """
+    result = optimization_service.get_optimization_result_page(job_id, offset=offset, limit=limit, sort=sort)
+
+    if not result['success']:
+        if 'not found' in result['error']:
+            raise HTTPException(status_code=404, detail=result['error'])
+        else:
+            raise HTTPException(status_code=400, detail=result['error'])
+
+    return result
+
+
 @router.post("/{job_id}/cancel")
 async def cancel_optimization(
     job_id: str,
@@ -229,7 +304,7 @@ async def validate_optimization_request(
         }
 
         try:
-            param_combinations = generate_parameter_grid(param_ranges_dict)
+            total_combinations = count_parameter_grid(param_ranges_dict)
         except ParameterGridError as exc:
             raise HTTPException(status_code=400, detail=str(exc))
 
@@ -238,18 +313,18 @@ async def validate_optimization_request(
         except ValueError:
             raise HTTPException(status_code=404, detail="Dataset not found")
 
-        estimated_time_minutes = optimization_service._estimate_optimization_time(len(param_combinations))
+        estimated_time_minutes = optimization_service._estimate_optimization_time(total_combinations)
         
         return {
             'success': True,
             'validation': {
-                'total_combinations': len(param_combinations),
+                'total_combinations': total_combinations,
                 'estimated_time_minutes': estimated_time_minutes,
                 'dataset_exists': True,
                 'parameter_ranges_valid': True,
                 'warnings': [
                     "Large optimization runs may take significant time"
-                ] if len(param_combinations) > 100 else []
+                ] if total_combinations > 100 else []
             }
         }
     
@@ -37,6 +37,28 @@ class Settings(BaseSettings):
     )
     data_dir: Path = Field(Path("data/market_data"), env="DATA_DIR")
     gzip_minimum_size: int = Field(500, env="GZIP_MINIMUM_SIZE")
+    signal_cache_enabled: bool = Field(True, env="SIGNAL_CACHE_ENABLED")
+    signal_cache_dir: Path = Field(Path("data/cache/signals"), env="SIGNAL_CACHE_DIR")
+    signal_cache_max_mb: int = Field(512, env="SIGNAL_CACHE_MAX_MB")
+    indicator_cache_enabled: bool = Field(True, env="INDICATOR_CACHE_ENABLED")
+    indicator_cache_dir: Path = Field(Path("data/cache/indicators"), env="INDICATOR_CACHE_DIR")
+    indicator_cache_memory_mb: int = Field(256, env="INDICATOR_CACHE_MEMORY_MB")
+    indicator_cache_max_mb: int = Field(1024, env="INDICATOR_CACHE_MAX_MB")
+    optimization_execution_mode: str = Field("process", env="OPTIMIZATION_EXECUTION_MODE")
+    optimization_results_dir: Path = Field(Path("data/optimization_results"), env="OPTIMIZATION_RESULTS_DIR")
+    optimization_checkpoint_seconds: float = Field(30.0, env="OPTIMIZATION_CHECKPOINT_SECONDS")
+    optimization_memo_enabled: bool = Field(True, env="OPTIMIZATION_MEMO_ENABLED")
+    optimization_memo_path: Path = Field(
+        Path("data/cache/optimization_memo.sqlite"), env="OPTIMIZATION_MEMO_PATH"
+    )
+    optimization_memo_max_entries: int = Field(1_000_000, env="OPTIMIZATION_MEMO_MAX_ENTRIES")
+    optimization_worker_batch_size: int = Field(8, env="OPTIMIZATION_WORKER_BATCH_SIZE")
+    optimization_worker_lease_seconds: float = Field(120.0, env="OPTIMIZATION_WORKER_LEASE_SECONDS")
+    optimization_worker_poll_seconds: float = Field(1.0, env="OPTIMIZATION_WORKER_POLL_SECONDS")
+    optimization_worker_max_attempts: int = Field(3, env="OPTIMIZATION_WORKER_MAX_ATTEMPTS")
+    optimization_worker_idle_timeout_seconds: float = Field(
+        600.0, env="OPTIMIZATION_WORKER_IDLE_TIMEOUT_SECONDS"
+    )
 
     class Config:
         env_file = ".env"
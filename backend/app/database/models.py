@@ -215,6 +215,28 @@ class Backtest(Base):
     completed_at = Column(DateTime)
 
 
+class OptimizationWorkItem(Base):
+    """Batch of parameter sets queued for distributed optimization workers"""
+    __tablename__ = "optimization_work_items"
+
+    id = Column(Integer, primary_key=True, index=True)
+    run_id = Column(String(64), nullable=False, index=True)
+    status = Column(String(20), default="pending", index=True)  # pending, leased, done, failed, collected
+    payload = Column(JSON, nullable=False)  # strategy, dataset, rows, engine options, parameter sets
+    results = Column(JSON)  # compact result entries, one per parameter set
+    error_message = Column(Text)
+
+    # Leasing
+    worker_id = Column(String(200))
+    lease_expires_at = Column(DateTime)
+    attempts = Column(Integer, default=0)
+    max_attempts = Column(Integer, default=3)
+
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+
 # Database configuration
 settings = get_settings()
 DATABASE_URL = settings.database_url
@@ -19,7 +19,7 @@ from backend.app.api.v1.analytics import router as analytics_router
 from backend.app.api.v1.optimization import router as optimization_router
 from backend.app.api.v1.admin import router as admin_router
 from backend.app.config import configure_logging, get_settings
-from backend.app.tasks.job_runner import shutdown_job_runner
+from backend.app.tasks.job_runner import get_job_runner, shutdown_job_runner
 
 settings = get_settings()
 configure_logging(settings)
@@ -88,6 +88,9 @@ atexit.register(_shutdown_job_runner)
 
 @app.on_event("startup")
 async def on_startup() -> None:
+    resumed = get_job_runner().resume_interrupted_jobs()
+    if resumed:
+        logger.info("Resumed %d interrupted optimization jobs", len(resumed))
     logger.info("Application startup completed")
 
 
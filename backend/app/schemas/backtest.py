@@ -18,6 +18,8 @@ class EngineOptions(BaseModel):
     intraday: bool = Field(default=True, description="Enable intraday trading")
     use_daily_profit_target: bool = Field(default=True, description="Enable daily profit target override")
     daily_profit_target: Optional[float] = Field(default=30.0, description="Daily profit target")
+    fill_model: str = Field(default="close", description="Exit fill model: 'close' or 'ohlc' (intrabar high/low fills)")
+    intrabar_tie_break: str = Field(default="stop", description="Same-bar stop/target tie-break: 'stop', 'target' or 'nearest'")
 
 
 class BacktestRequest(BaseModel):
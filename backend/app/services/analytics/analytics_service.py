@@ -165,6 +165,27 @@ class AnalyticsService:
             lambda _db, backtest: self._metrics_service.drawdown_analysis(backtest),
         )
 
+    def get_monte_carlo_analysis(
+        self,
+        backtest_id: int,
+        n_paths: int = 10000,
+        method: str = 'bootstrap',
+        n_trades: Optional[int] = None,
+        ruin_drawdown_pct: float = 50.0,
+        seed: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        return self._with_backtest(
+            backtest_id,
+            lambda _db, backtest: self._metrics_service.monte_carlo_analysis(
+                backtest,
+                n_paths=n_paths,
+                method=method,
+                n_trades=n_trades,
+                ruin_drawdown_pct=ruin_drawdown_pct,
+                seed=seed,
+            ),
+        )
+
     def get_trade_streaks(self, backtest_id: int) -> Dict[str, Any]:
         return self._with_backtest(
             backtest_id,
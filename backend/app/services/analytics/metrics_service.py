@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
-from typing import Dict
+from typing import Dict, Optional
 
+import numpy as np
 import pandas as pd
 
+from backtester.monte_carlo import distribution_summary, simulate_trade_paths
+
+DEFAULT_INITIAL_EQUITY = 100000.0
+
 
 class MetricsService:
     def __init__(self, performance_calc, risk_calc, chart_generator, formatter) -> None:
@@ -48,3 +53,65 @@ class MetricsService:
             'backtest_id': backtest.id,
             'drawdown_analysis': drawdown_analysis,
         }
+
+    def monte_carlo_analysis(
+        self,
+        backtest,
+        *,
+        n_paths: int,
+        method: str,
+        n_trades: Optional[int],
+        ruin_drawdown_pct: float,
+        seed: Optional[int],
+    ) -> Dict[str, object]:
+        """Resample the trade log into equity paths and summarise their outcomes.
+
+        A path counts as ruined once equity falls ``ruin_drawdown_pct`` percent
+        below the starting equity, which is taken from the equity curve.
+        """
+        results = backtest.results or {}
+        trades = pd.DataFrame(results.get('trades') or results.get('trade_log') or [])
+        if trades.empty or 'pnl' not in trades.columns:
+            return {'success': False, 'error': 'Backtest has no trades to resample'}
+        pnl = pd.to_numeric(trades['pnl'], errors='coerce').dropna().to_numpy(dtype=float)
+        if not len(pnl):
+            return {'success': False, 'error': 'Backtest has no trades to resample'}
+
+        equity_curve = pd.DataFrame(results.get('equity_curve', []))
+        initial_equity = DEFAULT_INITIAL_EQUITY
+        if 'equity' in equity_curve.columns:
+            equity = pd.to_numeric(equity_curve['equity'], errors='coerce').dropna()
+            if not equity.empty:
+                initial_equity = float(equity.iloc[0])
+        ruin_equity = initial_equity * (1.0 - ruin_drawdown_pct / 100.0)
+
+        try:
+            paths = simulate_trade_paths(
+                pnl,
+                initial_equity,
+                n_paths=n_paths,
+                method=method,
+                n_trades=n_trades,
+                ruin_equity=ruin_equity,
+                seed=seed,
+            )
+        except ValueError as exc:
+            return {'success': False, 'error': str(exc)}
+
+        return {
+            'success': True,
+            'backtest_id': backtest.id,
+            'monte_carlo': {
+                'method': method,
+                'n_paths': int(n_paths),
+                'n_trades': int(len(pnl) if n_trades is None or method == 'shuffle' else n_trades),
+                'historical_trades': int(len(pnl)),
+                'initial_equity': initial_equity,
+                'ruin_equity': ruin_equity,
+                'seed': seed,
+                'ruin_probability': float(np.mean(paths['ruined'])),
+                'final_equity': distribution_summary(paths['final_equity']),
+                'max_drawdown': distribution_summary(paths['max_drawdown']),
+                'max_drawdown_pct': distribution_summary(paths['max_drawdown_pct']),
+            },
+        }
@@ -67,6 +67,15 @@ class AnalyticsService:
         """Get drawdown analysis - new modular method"""
         return self.modular_service.get_drawdown_analysis(backtest_id)
     
+    def get_monte_carlo_analysis(self, backtest_id: int, n_paths: int = 10000, method: str = 'bootstrap',
+                                 n_trades: Optional[int] = None, ruin_drawdown_pct: float = 50.0,
+                                 seed: Optional[int] = None):
+        """Get Monte Carlo trade resampling analysis - new modular method"""
+        return self.modular_service.get_monte_carlo_analysis(
+            backtest_id, n_paths=n_paths, method=method, n_trades=n_trades,
+            ruin_drawdown_pct=ruin_drawdown_pct, seed=seed
+        )
+    
     def get_trade_streaks(self, backtest_id: int):
         """Get trade streaks - new modular method"""
         return self.modular_service.get_trade_streaks(backtest_id)
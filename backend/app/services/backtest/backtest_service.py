@@ -4,7 +4,7 @@ Main orchestrator for backtest operations with clean separation of concerns
 """
 
 import logging
-from typing import Dict, Any, Optional, Union, Callable
+from typing import Dict, Any, Iterable, Optional, Union, Callable
 from io import StringIO
 import pandas as pd
 
@@ -47,7 +47,9 @@ class BacktestService:
         strategy: str,
         strategy_params: Optional[Dict[str, Any]] = None,
         engine_options: Optional[Dict[str, Any]] = None,
-        progress_callback: Optional[Callable] = None
+        progress_callback: Optional[Callable] = None,
+        metrics_only: bool = False,
+        metrics: Optional[Iterable[str]] = None
     ) -> Dict[str, Any]:
         """
         Run a complete backtest with comprehensive error handling.
@@ -58,6 +60,9 @@ class BacktestService:
             strategy_params: Optional strategy parameters
             engine_options: Optional engine configuration
             progress_callback: Optional progress callback function
+            metrics_only: Return only ``{'success', 'metrics'}`` (plus ``pruned``),
+                skipping equity/trade serialization and indicator extraction
+            metrics: With ``metrics_only``, the metric names to compute (default all)
             
         Returns:
             Dict containing complete backtest results
@@ -95,7 +100,8 @@ class BacktestService:
                 data=data,
                 strategy_instance=strategy_instance,
                 engine_options=engine_options,
-                progress_tracker=progress_tracker
+                progress_tracker=progress_tracker,
+                metrics_only=metrics_only
             )
             
             # Step 3: Process results and calculate metrics
@@ -104,6 +110,16 @@ class BacktestService:
             
             initial_cash = engine_options.get('initial_cash', 100000) if engine_options else 100000
             
+            if metrics_only:
+                processed_results = self.result_processor.process_metrics_only(
+                    raw_results=execution_results,
+                    initial_cash=initial_cash,
+                    metrics=metrics
+                )
+                if progress_tracker:
+                    progress_tracker.complete("Backtest completed successfully")
+                return processed_results
+            
             processed_results = self.result_processor.process_backtest_results(
                 raw_results=execution_results,
                 initial_cash=initial_cash,
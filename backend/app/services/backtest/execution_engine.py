@@ -9,9 +9,15 @@ import logging
 from typing import Dict, Any, Optional, Union
 from io import StringIO
 import os
+from pathlib import Path
 from backend.app.utils.path_utils import normalize_path, windows_to_wsl, resolve_dataset_path
 
-from backtester.engine import BacktestEngine
+from backend.app.config import get_settings
+from backtester.engine import BacktestEngine, FILL_MODELS, TIE_BREAKS
+from backtester.indicator_cache import configure_indicator_cache
+from backtester.pruning import normalize_pruning
+from backtester.result import BacktestResult
+from backtester.signal_cache import SignalCache
 from backtester.data_loader import load_csv
 from .progress_tracker import ProgressTracker
 
@@ -23,6 +29,18 @@ class ExecutionEngineError(Exception):
     pass
 
 
+_signal_caches: Dict[str, SignalCache] = {}
+
+
+def shared_signal_cache(cache_dir, max_bytes: int) -> SignalCache:
+    """Return the process-wide SignalCache for ``cache_dir``."""
+    key = str(Path(cache_dir).resolve())
+    cache = _signal_caches.get(key)
+    if cache is None:
+        cache = _signal_caches[key] = SignalCache(cache_dir, max_bytes)
+    return cache
+
+
 class ExecutionEngine:
     """
     Handles the core backtest execution with clean architecture.
@@ -35,8 +53,21 @@ class ExecutionEngine:
     - Error handling and logging
     """
     
-    def __init__(self):
+    def __init__(self, signal_cache: Optional[SignalCache] = None):
         """Initialize execution engine"""
+        settings = get_settings()
+        if signal_cache is None and settings.signal_cache_enabled:
+            signal_cache = shared_signal_cache(
+                settings.signal_cache_dir, settings.signal_cache_max_mb * 1024 * 1024
+            )
+        self.signal_cache = signal_cache
+        if settings.indicator_cache_enabled:
+            # Backs StrategyBase.indicator() with the disk tier for every strategy in this process
+            configure_indicator_cache(
+                settings.indicator_cache_dir,
+                memory_bytes=settings.indicator_cache_memory_mb * 1024 * 1024,
+                max_bytes=settings.indicator_cache_max_mb * 1024 * 1024,
+            )
         self.default_config = {
             'initial_cash': 100000,
             'lots': 2,
@@ -45,7 +76,9 @@ class ExecutionEngine:
             'slippage': 0.0,
             'intraday': True,
             'use_daily_profit_target': True,
-            'daily_target': 30.0
+            'daily_target': 30.0,
+            'fill_model': 'close',
+            'intrabar_tie_break': 'stop'
         }
     
     def execute_backtest(
@@ -53,7 +86,8 @@ class ExecutionEngine:
         data: Union[pd.DataFrame, str, bytes],
         strategy_instance: Any,
         engine_options: Optional[Dict[str, Any]] = None,
-        progress_tracker: Optional[ProgressTracker] = None
+        progress_tracker: Optional[ProgressTracker] = None,
+        metrics_only: bool = False
     ) -> Dict[str, Any]:
         """
         Execute backtest with comprehensive error handling and progress tracking.
@@ -63,6 +97,7 @@ class ExecutionEngine:
             strategy_instance: Instantiated strategy object
             engine_options: Optional engine configuration
             progress_tracker: Optional progress tracking
+            metrics_only: Skip extracting indicator columns (nothing will chart them)
             
         Returns:
             Dict containing backtest results
@@ -100,7 +135,7 @@ class ExecutionEngine:
                 progress_tracker.update(0.8, "Processing results")
             
             # Process and validate results
-            processed_result = self._process_results(engine_result, engine_config)
+            processed_result = self._process_results(engine_result, engine_config, metrics_only)
             
             if progress_tracker:
                 progress_tracker.update(0.9, "Finalizing results")
@@ -245,6 +280,23 @@ class ExecutionEngine:
 
         # Validate boolean fields
         validated_config['intraday'] = bool(config.get('intraday', self.default_config['intraday']))
+
+        # Validate exit fill model options
+        choice_fields = {
+            'fill_model': FILL_MODELS,
+            'intrabar_tie_break': tuple(TIE_BREAKS),
+        }
+        for field, choices in choice_fields.items():
+            value = config.get(field, self.default_config[field])
+            if value not in choices:
+                logger.warning(f"Invalid {field} value: {value}, using default: {self.default_config[field]}")
+                value = self.default_config[field]
+            validated_config[field] = value
+
+        # Early-abort rules; invalid rules fail the run rather than being dropped
+        pruning = normalize_pruning(config.get('pruning'))
+        if pruning:
+            validated_config['pruning'] = pruning
         
         return validated_config
     
@@ -265,7 +317,11 @@ class ExecutionEngine:
                 fee_per_trade=config['fee_per_trade'],
                 slippage=config['slippage'],
                 intraday=config['intraday'],
-                daily_profit_target=config['daily_target'] if config.get('use_daily_profit_target', True) else None
+                daily_profit_target=config['daily_target'] if config.get('use_daily_profit_target', True) else None,
+                fill_model=config.get('fill_model', 'close'),
+                intrabar_tie_break=config.get('intrabar_tie_break', 'stop'),
+                signal_cache=self.signal_cache,
+                pruning=config.get('pruning')
             )
             
             logger.debug("Backtest engine created successfully")
@@ -312,121 +368,37 @@ class ExecutionEngine:
         else:
             logger.warning(f"Trade log has unexpected type: {type(trade_log)}")
     
-    def _process_results(self, engine_result: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any]:
-        """Process and clean engine results"""
+    def _process_results(
+        self,
+        engine_result: Dict[str, Any],
+        config: Dict[str, Any],
+        metrics_only: bool = False
+    ) -> Dict[str, Any]:
+        """Wrap engine output in a columnar BacktestResult"""
         try:
-            # Extract core results
-            equity_curve = engine_result.get('equity_curve', pd.DataFrame())
-            trades = engine_result.get('trade_log', pd.DataFrame())
-            
-            # Process equity curve
-            processed_equity = self._process_equity_curve(equity_curve)
-            
-            # Process trades
-            processed_trades = self._process_trades(trades)
-            
-            # Build final result
-            result = {
+            source = engine_result
+            if metrics_only:
+                source = {k: v for k, v in engine_result.items() if k not in ('indicators', 'indicator_cfg')}
+            result = BacktestResult.from_engine_result(
+                source, initial_equity=config.get('initial_cash')
+            )
+            logger.debug(
+                f"Results processed: {len(result)} equity points, {result.trade_count} trades"
+            )
+            return {
                 'success': True,
-                'equity_curve': processed_equity,
-                'trades': processed_trades,
+                'result': result,
                 'raw_engine_result': engine_result  # Keep original for debugging
             }
-            
-            logger.debug("Results processed successfully")
-            return result
-            
+
         except Exception as e:
             raise ExecutionEngineError(f"Result processing failed: {str(e)}") from e
     
-    def _process_equity_curve(self, equity_curve: pd.DataFrame) -> list:
-        """Convert equity curve to JSON-serializable format"""
-        if equity_curve.empty:
-            return []
-        
-        try:
-            # Convert to list of dictionaries
-            processed = []
-            has_ts_col = 'timestamp' in equity_curve.columns
-            for idx, row in equity_curve.iterrows():
-                record = {}
-                
-                # Prefer explicit timestamp column if present
-                if has_ts_col:
-                    ts_val = row['timestamp']
-                    try:
-                        ts = pd.to_datetime(ts_val)
-                        record['timestamp'] = ts.isoformat()
-                    except Exception:
-                        record['timestamp'] = str(ts_val)
-                else:
-                    # Fallback to index
-                    if hasattr(idx, 'isoformat'):
-                        record['timestamp'] = idx.isoformat()
-                    else:
-                        record['timestamp'] = str(idx)
-                
-                # Handle equity value
-                if 'equity' in row:
-                    record['equity'] = float(row['equity'])
-                elif len(row) > 0:
-                    record['equity'] = float(row.iloc[0])  # First column
-                else:
-                    record['equity'] = 0.0
-                
-                processed.append(record)
-            
-            logger.debug(f"Processed {len(processed)} equity curve points")
-            return processed
-            
-        except Exception as e:
-            logger.error(f"Equity curve processing failed: {e}")
-            return []
-    
-    def _process_trades(self, trades: pd.DataFrame) -> list:
-        """Convert trades to JSON-serializable format"""
-        if trades.empty:
-            return []
-        
-        try:
-            # Convert to list of dictionaries with proper type handling
-            processed = []
-            for _, row in trades.iterrows():
-                record = {}
-                
-                for col, value in row.items():
-                    try:
-                        if pd.isna(value):
-                            record[col] = None
-                        elif isinstance(value, (pd.Timestamp, np.datetime64)):
-                            record[col] = pd.Timestamp(value).isoformat()
-                        # Preserve numeric types (Python and NumPy) as numbers
-                        elif isinstance(value, (int, np.integer)):
-                            record[col] = int(value)
-                        elif isinstance(value, (float, np.floating)):
-                            record[col] = float(value)
-                        else:
-                            record[col] = str(value)
-                    except Exception:
-                        # Best-effort fallback
-                        try:
-                            record[col] = str(value)
-                        except Exception:
-                            record[col] = None
-                
-                processed.append(record)
-            
-            logger.debug(f"Processed {len(processed)} trades")
-            return processed
-            
-        except Exception as e:
-            logger.error(f"Trades processing failed: {e}")
-            return []
-    
     def get_engine_info(self) -> Dict[str, Any]:
         """Get information about the execution engine"""
         return {
             'default_config': self.default_config,
             'engine_type': 'BacktestEngine',
-            'supported_data_types': ['DataFrame', 'file_path', 'csv_bytes']
+            'supported_data_types': ['DataFrame', 'file_path', 'csv_bytes'],
+            'signal_cache': self.signal_cache.info() if self.signal_cache else None
         }
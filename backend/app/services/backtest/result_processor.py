@@ -6,7 +6,7 @@ Handles metrics calculation, data serialization, and database storage
 import pandas as pd
 import numpy as np
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Optional
 from datetime import datetime, timezone
 
 from backtester.metrics import (
@@ -14,10 +14,30 @@ from backtester.metrics import (
     largest_winning_trade, largest_losing_trade, average_holding_time,
     max_consecutive_wins, max_consecutive_losses, trading_sessions_days
 )
+from backtester.result import NAT, BacktestResult
 from backend.app.database.models import get_session_factory, BacktestJob
 
 logger = logging.getLogger(__name__)
 
+# Metrics produced by each calculation group of ResultProcessor
+METRIC_GROUPS = {
+    'return': ('total_return', 'total_return_pct', 'sharpe_ratio', 'final_equity'),
+    'risk': ('max_drawdown', 'max_drawdown_pct'),
+    'trade': (
+        'total_trades', 'win_rate', 'profit_factor', 'largest_winning_trade', 'largest_losing_trade',
+        'max_consecutive_wins', 'max_consecutive_losses', 'average_holding_time',
+    ),
+    'time': ('trading_sessions_days', 'data_points'),
+}
+
+
+def _longest_run(mask: np.ndarray) -> int:
+    """Length of the longest run of True values in a boolean array."""
+    if not mask.any():
+        return 0
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], mask.astype(np.int8), [0]))))
+    return int((edges[1::2] - edges[::2]).max())
+
 
 class ResultProcessorError(Exception):
     """Custom exception for result processing errors"""
@@ -63,17 +83,24 @@ class ResultProcessor:
         try:
             logger.debug(f"Processing backtest results for strategy: {strategy_name}")
             
-            # Extract data from raw results
-            equity_curve_data = raw_results.get('equity_curve', [])
-            # Accept both 'trades' and 'trade_log' from execution engine
-            trades_data = raw_results.get('trades') or raw_results.get('trade_log') or []
-            
-            # Convert to DataFrames for metrics calculation
-            equity_df = self._create_equity_dataframe(equity_curve_data)
-            trades_df = self._create_trades_dataframe(trades_data)
-            
-            # Calculate comprehensive metrics
-            metrics = self._calculate_comprehensive_metrics(equity_df, trades_df, initial_cash)
+            columnar = raw_results.get('result')
+            if isinstance(columnar, BacktestResult):
+                # Metrics straight from the columnar arrays; records built once at the edge
+                metrics = self._calculate_columnar_metrics(columnar, initial_cash)
+                equity_curve_data = columnar.equity_records()
+                trades_data = columnar.trade_records()
+            else:
+                # Extract data from raw results
+                equity_curve_data = raw_results.get('equity_curve', [])
+                # Accept both 'trades' and 'trade_log' from execution engine
+                trades_data = raw_results.get('trades') or raw_results.get('trade_log') or []
+
+                # Convert to DataFrames for metrics calculation
+                equity_df = self._create_equity_dataframe(equity_curve_data)
+                trades_df = self._create_trades_dataframe(trades_data)
+
+                # Calculate comprehensive metrics
+                metrics = self._calculate_comprehensive_metrics(equity_df, trades_df, initial_cash)
             
             # Serialize all data
             serialized_results = self._serialize_results(
@@ -101,6 +128,55 @@ class ResultProcessor:
             logger.error(error_msg, exc_info=True)
             raise ResultProcessorError(error_msg) from e
     
+    def process_metrics_only(
+        self,
+        raw_results: Dict[str, Any],
+        initial_cash: float,
+        metrics: Optional[Iterable[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Metrics of a backtest without serializing its equity curve, trades or indicators.
+
+        Only the calculation groups needed for ``metrics`` run (all of them
+        when None), straight from the columnar result; the values match
+        those of ``process_backtest_results``.
+
+        Raises:
+            ResultProcessorError: If processing fails
+        """
+        try:
+            groups = self._metric_groups(metrics)
+            columnar = raw_results.get('result')
+            if isinstance(columnar, BacktestResult):
+                computed = self._calculate_columnar_metrics(columnar, initial_cash, groups)
+            else:
+                equity_df = self._create_equity_dataframe(raw_results.get('equity_curve', []))
+                trades_df = self._create_trades_dataframe(
+                    raw_results.get('trades') or raw_results.get('trade_log') or []
+                )
+                computed = self._calculate_comprehensive_metrics(equity_df, trades_df, initial_cash, groups)
+            result_obj = {'success': True, 'metrics': self._clean_metrics(computed)}
+            raw_engine = raw_results.get('raw_engine_result')
+            if isinstance(raw_engine, dict) and 'pruned' in raw_engine:
+                result_obj['pruned'] = raw_engine['pruned']
+            return result_obj
+
+        except Exception as e:
+            error_msg = f"Result processing failed: {str(e)}"
+            logger.error(error_msg, exc_info=True)
+            raise ResultProcessorError(error_msg) from e
+
+    @staticmethod
+    def _metric_groups(metrics: Optional[Iterable[str]]) -> set:
+        """Calculation groups producing ``metrics`` (every group for None)."""
+        if metrics is None:
+            return set(METRIC_GROUPS)
+        wanted = set(metrics)
+        unknown = wanted.difference(*METRIC_GROUPS.values())
+        if unknown:
+            raise ResultProcessorError(f"Unknown metrics: {sorted(unknown)}")
+        return {group for group, names in METRIC_GROUPS.items() if wanted.intersection(names)}
+
     def _create_equity_dataframe(self, equity_data: list) -> pd.DataFrame:
         """Create equity DataFrame from serialized data"""
         if not equity_data:
@@ -153,35 +229,42 @@ class ResultProcessor:
         self, 
             equity_curve: pd.DataFrame, 
             trades: pd.DataFrame, 
-            initial_cash: float
+            initial_cash: float,
+            groups: Optional[set] = None
     ) -> Dict[str, Any]:
-        """Calculate comprehensive backtest metrics with error handling"""
+        """Calculate comprehensive backtest metrics with error handling.
+
+        ``groups`` limits the work to those keys of ``METRIC_GROUPS``.
+        """
         metrics = {}
+        groups = set(METRIC_GROUPS) if groups is None else groups
         
         try:
             # Basic return metrics
-            if not equity_curve.empty and 'equity' in equity_curve.columns:
+            if 'return' in groups and not equity_curve.empty and 'equity' in equity_curve.columns:
                 metrics.update(self._calculate_return_metrics(equity_curve, initial_cash))
             
             # Risk metrics
-            if not equity_curve.empty:
+            if 'risk' in groups and not equity_curve.empty:
                 metrics.update(self._calculate_risk_metrics(equity_curve))
             
             # Trade metrics
-            if not trades.empty:
-                metrics.update(self._calculate_trade_metrics(trades))
-            else:
-                # Provide required defaults when no trades present
-                metrics.update({'total_trades': 0, 'win_rate': 0.0, 'profit_factor': 0.0})
+            if 'trade' in groups:
+                if not trades.empty:
+                    metrics.update(self._calculate_trade_metrics(trades))
+                else:
+                    # Provide required defaults when no trades present
+                    metrics.update({'total_trades': 0, 'win_rate': 0.0, 'profit_factor': 0.0})
             
             # Time-based metrics
-            if not equity_curve.empty:
+            if 'time' in groups and not equity_curve.empty:
                 metrics.update(self._calculate_time_metrics(equity_curve))
             
             # Ensure required keys exist for schema compliance
-            metrics.setdefault('total_trades', len(trades))
-            metrics.setdefault('win_rate', 0.0)
-            metrics.setdefault('profit_factor', 0.0)
+            if 'trade' in groups:
+                metrics.setdefault('total_trades', len(trades))
+                metrics.setdefault('win_rate', 0.0)
+                metrics.setdefault('profit_factor', 0.0)
 
             logger.debug(f"Calculated {len(metrics)} metrics")
             return metrics
@@ -190,6 +273,103 @@ class ResultProcessor:
             logger.error(f"Metrics calculation failed: {e}")
             return self._get_default_metrics()
     
+    def _calculate_columnar_metrics(
+        self,
+        result: BacktestResult,
+        initial_cash: float,
+        groups: Optional[set] = None
+    ) -> Dict[str, Any]:
+        """Same metrics as ``_calculate_comprehensive_metrics``, from the result's arrays.
+
+        No DataFrames are built; ``groups`` limits the work to those keys of
+        ``METRIC_GROUPS``.
+        """
+        metrics = {}
+        groups = set(METRIC_GROUPS) if groups is None else groups
+
+        try:
+            if len(result) and groups.intersection(('return', 'risk')):
+                equity = result.equity.astype(np.float64)
+                if result.final_equity is not None:
+                    equity[-1] = result.final_equity  # exact value, not the float32 copy
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    if 'return' in groups:
+                        metrics.update(self._array_return_metrics(equity))
+                    if 'risk' in groups:
+                        roll_max = np.maximum.accumulate(equity)
+                        max_dd = float(-np.nanmin((equity - roll_max) / roll_max))
+                        metrics.update({'max_drawdown': max_dd, 'max_drawdown_pct': max_dd * 100})
+
+            if 'trade' in groups:
+                if result.trade_count:
+                    metrics.update(self._array_trade_metrics(result))
+                metrics.setdefault('total_trades', result.trade_count)
+                metrics.setdefault('win_rate', 0.0)
+                metrics.setdefault('profit_factor', 0.0)
+
+            if 'time' in groups and len(result):
+                metrics.update({
+                    'trading_sessions_days': result.session_count(),
+                    'data_points': len(result),
+                })
+
+            logger.debug(f"Calculated {len(metrics)} metrics")
+            return metrics
+
+        except Exception as e:
+            logger.error(f"Metrics calculation failed: {e}")
+            return self._get_default_metrics()
+
+    @staticmethod
+    def _array_return_metrics(equity: np.ndarray) -> Dict[str, Any]:
+        """Return metrics of a float64 equity array (``total_return``/``sharpe_ratio`` semantics)."""
+        total_return_val = float((equity[-1] - equity[0]) / equity[0])
+        returns = equity[1:] / equity[:-1] - 1
+        returns = returns[~np.isnan(returns)]
+        std = returns.std(ddof=1) if len(returns) > 1 else np.nan
+        sharpe = np.nan if std == 0 else float(np.sqrt(252 * 390) * returns.mean() / std)
+        return {
+            'total_return': total_return_val,
+            'total_return_pct': total_return_val * 100,
+            'sharpe_ratio': sharpe,
+            'final_equity': float(equity[-1]),
+        }
+
+    @staticmethod
+    def _array_trade_metrics(result: BacktestResult) -> Dict[str, Any]:
+        """Trade metrics from the result's trade columns (same values as ``_calculate_trade_metrics``)."""
+        metrics = {'total_trades': result.trade_count}
+        # Trades with a non-numeric PnL are left out, as in the DataFrame path
+        kept = np.ones(result.trade_count, dtype=bool)
+        if 'pnl' in result.trades:
+            pnl = pd.to_numeric(result.trades['pnl'], errors='coerce').astype(np.float64)
+            kept = ~np.isnan(pnl)
+            pnl = pnl[kept]
+            if len(pnl):
+                wins, losses = pnl > 0, pnl < 0
+                gross_profit, gross_loss = pnl[wins].sum(), pnl[losses].sum()
+                if gross_loss == 0:
+                    pf = np.inf if gross_profit > 0 else np.nan
+                else:
+                    pf = gross_profit / abs(gross_loss)
+                metrics.update({
+                    'win_rate': float(wins.sum() / len(pnl) * 100),
+                    'profit_factor': float(pf) if pd.notna(pf) else 0.0,
+                    'largest_winning_trade': float(pnl.max()),
+                    'largest_losing_trade': float(pnl.min()),
+                    'max_consecutive_wins': _longest_run(wins),
+                    'max_consecutive_losses': _longest_run(losses),
+                })
+
+        if {'entry_time', 'exit_time'} <= set(result.time_columns):
+            entry = result.trades['entry_time'][kept]
+            exit_ = result.trades['exit_time'][kept]
+            valid = (entry != NAT) & (exit_ != NAT)
+            if valid.any():
+                minutes = (exit_[valid] - entry[valid]) / 1e9 / 60
+                metrics['average_holding_time'] = float(minutes.mean())
+        return metrics
+
     def _calculate_return_metrics(self, equity_curve: pd.DataFrame, initial_cash: float) -> Dict[str, Any]:
         """Calculate return-based metrics"""
         try:
@@ -322,21 +502,17 @@ class ResultProcessor:
         """Serialize all results into final format"""
         execution_info = raw_results.get('execution_info', {}) if isinstance(raw_results, dict) else {}
         engine_cfg = execution_info.get('engine_config', {}) if isinstance(execution_info, dict) else {}
-        # Sanitize metrics for JSON (no NaN/Inf)
-        clean_metrics = {}
-        for k, v in (metrics or {}).items():
-            try:
-                if isinstance(v, float) and (pd.isna(v) or not np.isfinite(v)):
-                    clean_metrics[k] = 0.0
-                else:
-                    clean_metrics[k] = v
-            except Exception:
-                clean_metrics[k] = v
+        clean_metrics = self._clean_metrics(metrics)
 
         # Serialize indicator data from raw engine result if present
         indicators_serialized: Dict[str, list] = {}
+        columnar = raw_results.get('result') if isinstance(raw_results, dict) else None
         try:
-            raw_engine = raw_results.get('raw_engine_result', {}) if isinstance(raw_results, dict) else {}
+            if isinstance(columnar, BacktestResult):
+                indicators_serialized = columnar.indicator_lists()
+                raw_engine = {}
+            else:
+                raw_engine = raw_results.get('raw_engine_result', {}) if isinstance(raw_results, dict) else {}
             raw_ind = raw_engine.get('indicators') if isinstance(raw_engine, dict) else None
             if raw_ind is not None:
                 if hasattr(raw_ind, 'to_dict'):
@@ -369,11 +545,28 @@ class ResultProcessor:
             raw_engine = raw_results.get('raw_engine_result', {}) if isinstance(raw_results, dict) else {}
             if isinstance(raw_engine, dict) and 'indicator_cfg' in raw_engine:
                 result_obj['indicator_cfg'] = raw_engine['indicator_cfg']
+            # Early-abort summary when the run had pruning rules
+            if isinstance(raw_engine, dict) and 'pruned' in raw_engine:
+                result_obj['pruned'] = raw_engine['pruned']
         except Exception:
             pass
 
         return result_obj
     
+    @staticmethod
+    def _clean_metrics(metrics: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Sanitize metrics for JSON (no NaN/Inf)"""
+        clean_metrics = {}
+        for k, v in (metrics or {}).items():
+            try:
+                if isinstance(v, float) and (pd.isna(v) or not np.isfinite(v)):
+                    clean_metrics[k] = 0.0
+                else:
+                    clean_metrics[k] = v
+            except Exception:
+                clean_metrics[k] = v
+        return clean_metrics
+
     def save_to_database(self, job_id: int, processed_results: Dict[str, Any]) -> bool:
         """
         Save processed results to database.
@@ -40,9 +40,12 @@ class BacktestService:
         progress_callback=None,
         dataset_path: str = None,
         csv_bytes: bytes = None,
+        metrics_only: bool = False,
+        metrics=None,
     ):
         """Run backtest - uses modular service with full compatibility.
         Accepts legacy arguments like dataset_path/csv_bytes in addition to data.
+        ``metrics_only`` returns just the (requested) metrics, without serialized curves.
         """
         # Coerce legacy args into the unified 'data' parameter
         input_data = data
@@ -59,7 +62,9 @@ class BacktestService:
             strategy=strategy,
             strategy_params=strategy_params,
             engine_options=engine_options,
-            progress_callback=progress_callback
+            progress_callback=progress_callback,
+            metrics_only=metrics_only,
+            metrics=metrics
         )
     
     def run_backtest_from_upload(
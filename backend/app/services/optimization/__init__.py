@@ -1,9 +1,87 @@
 """Optimization service utilities."""
 
-from .utils import ParameterGridError, generate_parameter_grid, validate_metric
+from .checkpoint import OptimizationCheckpoint, job_directory
+from .cross_validation import (
+    CrossValidationError,
+    build_cv_splits,
+    normalize_cross_validation_config,
+    overfitting_probability,
+    weighted_scores,
+)
+from .indicator_batches import (
+    SharedIndicatorBatches,
+    attach_indicator_batches,
+    prime_indicator_batches,
+    sweep_indicator_batches,
+)
+from .memo import EvaluationMemo, evaluation_context, evaluation_key, shared_evaluation_memo
+from .pareto import ParetoFront, crowding_distances, normalize_objectives
+from .results_store import StreamingResults, params_key, read_results, read_scores
+from .search import (
+    LatinHypercubeSampler,
+    ParameterSpace,
+    RandomSampler,
+    TPESampler,
+    normalize_halving_config,
+    successive_halving_rungs,
+)
+from .shared_data import SharedFrame, attach_shared_frame
+from .utils import (
+    ParameterGridError,
+    count_parameter_grid,
+    generate_parameter_grid,
+    iter_parameter_grid,
+    validate_metric,
+)
+from .walk_forward import (
+    WalkForwardError,
+    build_folds,
+    equity_summary,
+    normalize_walk_forward_config,
+    session_bounds,
+    stitch_equity,
+)
 
 __all__ = [
+    "CrossValidationError",
+    "EvaluationMemo",
+    "LatinHypercubeSampler",
+    "OptimizationCheckpoint",
     "ParameterGridError",
+    "ParameterSpace",
+    "ParetoFront",
+    "RandomSampler",
+    "SharedFrame",
+    "SharedIndicatorBatches",
+    "StreamingResults",
+    "TPESampler",
+    "WalkForwardError",
+    "attach_indicator_batches",
+    "attach_shared_frame",
+    "build_cv_splits",
+    "build_folds",
+    "count_parameter_grid",
+    "crowding_distances",
+    "equity_summary",
+    "evaluation_context",
+    "evaluation_key",
     "generate_parameter_grid",
+    "iter_parameter_grid",
+    "job_directory",
+    "normalize_cross_validation_config",
+    "normalize_halving_config",
+    "normalize_objectives",
+    "normalize_walk_forward_config",
+    "overfitting_probability",
+    "params_key",
+    "prime_indicator_batches",
+    "read_results",
+    "read_scores",
+    "session_bounds",
+    "shared_evaluation_memo",
+    "stitch_equity",
+    "successive_halving_rungs",
+    "sweep_indicator_batches",
     "validate_metric",
+    "weighted_scores",
 ]
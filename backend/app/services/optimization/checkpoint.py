@@ -0,0 +1,76 @@
+"""On-disk checkpoints that let optimization jobs resume after a restart."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+CHECKPOINT_FILE = "checkpoint.json"
+JOB_PREFIX = "job-"
+
+
+def job_directory(root: Path | str, job_id: str) -> Path:
+    """Results/checkpoint directory of ``job_id`` under ``root``."""
+    return Path(root) / f"{JOB_PREFIX}{job_id}"
+
+
+class OptimizationCheckpoint:
+    """
+    Checkpoint of one optimization job, stored next to its results file.
+
+    ``checkpoint.json`` holds the job payload and the latest search state
+    (entries already written, the current best and, for adaptive searches,
+    the sampler's RNG state). Completed combinations themselves are the
+    results chunks in the same directory, so a checkpoint never duplicates
+    them. The file is removed once the job finishes.
+    """
+
+    def __init__(self, directory: Path | str):
+        self.directory = Path(directory)
+        self.path = self.directory / CHECKPOINT_FILE
+
+    @property
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as fh:
+                return json.load(fh)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    @property
+    def job_data(self) -> Optional[Dict[str, Any]]:
+        stored = self.load()
+        return stored["job_data"] if stored else None
+
+    @property
+    def state(self) -> Dict[str, Any]:
+        stored = self.load()
+        return (stored or {}).get("state") or {}
+
+    def create(self, job_data: Dict[str, Any]) -> None:
+        """Record the job payload unless a checkpoint already exists."""
+        if not self.exists:
+            self._write({"job_data": job_data, "state": None})
+
+    def save_state(self, state: Dict[str, Any]) -> None:
+        stored = self.load()
+        if stored is None:
+            raise FileNotFoundError(f"No checkpoint at {self.path}")
+        stored["state"] = {**state, "updated_at": time.time()}
+        self._write(stored)
+
+    def complete(self) -> None:
+        self.path.unlink(missing_ok=True)
+
+    def _write(self, payload: Dict[str, Any]) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp = self.directory / f".{CHECKPOINT_FILE}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(payload, fh, default=str)
+        os.replace(tmp, self.path)
@@ -0,0 +1,129 @@
+"""Combinatorial purged cross-validation over trading sessions."""
+
+from __future__ import annotations
+
+import itertools
+import math
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .walk_forward import WalkForwardError, session_bounds, session_labels
+
+Rows = Tuple[int, int]
+
+
+class CrossValidationError(WalkForwardError):
+    """Raised when a cross-validation configuration cannot be applied."""
+
+
+def normalize_cross_validation_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate a cross-validation config dict and fill in defaults."""
+
+    if not isinstance(config, dict):
+        raise CrossValidationError("cross_validation must be a mapping")
+
+    normalized: Dict[str, Any] = {}
+    for key, default, minimum in (("n_groups", 6, 2), ("test_groups", 2, 1), ("embargo_sessions", 1, 0)):
+        value = config.get(key)
+        if value is None:
+            value = default
+        if not isinstance(value, int) or isinstance(value, bool) or value < minimum:
+            raise CrossValidationError(f"{key} must be an integer of at least {minimum}")
+        normalized[key] = value
+    if normalized["test_groups"] >= normalized["n_groups"]:
+        raise CrossValidationError("test_groups must be smaller than n_groups")
+    return normalized
+
+
+def _runs(mask: np.ndarray) -> List[Tuple[int, int]]:
+    """``[start, stop)`` index ranges of the True runs of ``mask``."""
+
+    edges = np.diff(np.r_[0, mask.astype(np.int8), 0])
+    return list(zip(np.flatnonzero(edges == 1).tolist(), np.flatnonzero(edges == -1).tolist()))
+
+
+def build_cv_splits(
+    data: pd.DataFrame,
+    n_groups: int,
+    test_groups: int,
+    embargo_sessions: int = 0,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Combinatorial purged cross-validation splits of ``data``.
+
+    The sessions are cut into ``n_groups`` contiguous groups and every
+    combination of ``test_groups`` groups is the test set of one split.
+    Training uses the remaining sessions minus the ``embargo_sessions`` on
+    either side of every test group, so trades and indicator state that run
+    across a test boundary cannot leak into training. Returns
+    ``(groups, splits)``; all ranges are ``[start, stop)`` rows of ``data``,
+    so folds are sliced from the one frame instead of being copied.
+    """
+
+    days = session_labels(data)
+    bounds = session_bounds(data, days)
+    n_sessions = len(bounds) - 1
+    if n_sessions < n_groups:
+        raise CrossValidationError(f"Dataset has {n_sessions} sessions; at least {n_groups} are needed")
+
+    edges = np.arange(n_groups + 1) * n_sessions // n_groups
+    groups = [
+        {
+            "group": g,
+            "rows": (int(bounds[edges[g]]), int(bounds[edges[g + 1]])),
+            "sessions": [str(days[bounds[edges[g]]]), str(days[bounds[edges[g + 1]] - 1])],
+        }
+        for g in range(n_groups)
+    ]
+
+    splits: List[Dict[str, Any]] = []
+    for test in itertools.combinations(range(n_groups), test_groups):
+        in_test = np.zeros(n_sessions, dtype=bool)
+        for g in test:
+            in_test[edges[g]:edges[g + 1]] = True
+        blocked = in_test.copy()
+        for shift in range(1, min(embargo_sessions, n_sessions - 1) + 1):
+            blocked[shift:] |= in_test[:-shift]
+            blocked[:-shift] |= in_test[shift:]
+        train_sessions = ~blocked
+        if not train_sessions.any():
+            raise CrossValidationError("embargo_sessions leaves no training sessions")
+        splits.append({
+            "split": len(splits),
+            "test_groups": list(test),
+            "train": [(int(bounds[a]), int(bounds[b])) for a, b in _runs(train_sessions)],
+            "test": [groups[g]["rows"] for g in test],
+            "train_sessions": int(train_sessions.sum()),
+            "embargoed_sessions": int((blocked & ~in_test).sum()),
+        })
+    return groups, splits
+
+
+def weighted_scores(scores: np.ndarray, segments: Sequence[Rows], use: Sequence[int]) -> np.ndarray:
+    """
+    Bar-weighted mean score of every parameter set over the segments ``use``.
+
+    ``scores`` has one row per parameter set and one column per segment; a
+    parameter set with a missing (NaN) score on any used segment gets NaN.
+    """
+
+    weights = np.array([segments[j][1] - segments[j][0] for j in use], dtype=float)
+    return scores[:, list(use)] @ weights / weights.sum()
+
+
+def overfitting_probability(relative_ranks: Sequence[float]) -> Optional[float]:
+    """
+    Probability of backtest overfitting (Bailey et al.).
+
+    ``relative_ranks`` holds, per split, the out-of-sample rank of the
+    in-sample winner among all parameter sets scaled into (0, 1); the
+    probability is the share of splits whose logit rank is not above zero,
+    i.e. where the winner did no better than the median out-of-sample.
+    """
+
+    if not len(relative_ranks):
+        return None
+    logits = [math.log(w / (1.0 - w)) for w in relative_ranks]
+    return float(np.mean([logit <= 0 for logit in logits]))
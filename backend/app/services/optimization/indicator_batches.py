@@ -0,0 +1,97 @@
+"""Precompute a sweep's indicators for every swept period in one pass."""
+
+from __future__ import annotations
+
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from backtester.indicator_cache import BATCH_INDICATORS, IndicatorCache, compute_batch
+from backtester.signal_cache import normalize_params
+
+from .search import ParameterSpace
+from .shared_data import SharedFrame, attach_shared_frame
+
+
+def sweep_indicator_batches(strategy_class: Any, param_ranges: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Batches of the strategy's ``sweep_indicators`` whose period is swept.
+
+    Each batch is ``{'indicator', 'params', 'periods'}``; declarations of
+    the same indicator and params (e.g. a fast and a slow EMA) share one
+    batch over the union of their periods. Non-numeric periods are skipped.
+    """
+
+    declarations = getattr(strategy_class, "sweep_indicators", ()) or ()
+    if not declarations or not param_ranges:
+        return []
+    space = ParameterSpace(param_ranges)
+    swept = dict(zip(space.names, space.values))
+    batches: Dict[tuple, Dict[str, Any]] = {}
+    for declaration in declarations:
+        name = declaration["indicator"]
+        values = swept.get(declaration["param"])
+        if name not in BATCH_INDICATORS or not values:
+            continue
+        if not all(isinstance(v, (int, float)) and not isinstance(v, bool) and v >= 1 for v in values):
+            continue
+        params = dict(declaration.get("params") or {})
+        batch = batches.setdefault(
+            (name, normalize_params(params)), {"indicator": name, "params": params, "periods": []}
+        )
+        batch["periods"].extend(v for v in values if v not in batch["periods"])
+    return list(batches.values())
+
+
+def prime_indicator_batches(cache: IndicatorCache, data: pd.DataFrame, batches: List[Dict[str, Any]]) -> None:
+    """Compute ``batches`` on ``data`` into ``cache`` (threads share the process-wide cache)."""
+
+    for batch in batches:
+        cache.get_batch(data, batch["indicator"], batch["periods"], **batch["params"])
+
+
+class SharedIndicatorBatches:
+    """
+    ``batches`` computed once on ``data`` and placed in shared memory.
+
+    Pool workers receive ``descriptor`` with their tasks and call
+    ``attach_indicator_batches`` to cache column views of the block, so
+    no worker recomputes a swept indicator. The owner must ``close()``.
+    """
+
+    def __init__(self, data: pd.DataFrame, batches: List[Dict[str, Any]]):
+        columns: Dict[str, Any] = {}
+        specs = []
+        for index, batch in enumerate(batches):
+            matrix = compute_batch(data, batch["indicator"], batch["periods"], **batch["params"])
+            names = [f"{index}:{j}" for j in range(matrix.shape[1])]
+            columns.update(zip(names, matrix.T))
+            specs.append({**batch, "columns": names})
+        self._shared = SharedFrame(pd.DataFrame(columns))
+        self.descriptor = {"frame": self._shared.descriptor, "batches": specs}
+
+    def close(self) -> None:
+        self._shared.close()
+
+
+def attach_indicator_batches(
+    cache: IndicatorCache, data: pd.DataFrame, descriptor: Dict[str, Any]
+) -> shared_memory.SharedMemory:
+    """
+    Cache the shared batches described by ``descriptor`` as indicators of ``data``.
+
+    ``data`` must hold the rows the batches were computed on. The returned
+    handle must stay referenced for as long as the cached columns are used.
+    """
+
+    frame, handle = attach_shared_frame(descriptor["frame"])
+    for spec in descriptor["batches"]:
+        cache.prime(
+            data,
+            spec["indicator"],
+            spec["periods"],
+            [frame[column].to_numpy() for column in spec["columns"]],
+            **spec["params"],
+        )
+    return handle
@@ -0,0 +1,145 @@
+"""Persistent memo of backtest metrics shared by optimization jobs."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+from backtester.signal_cache import backtester_source_hash, dataset_fingerprint, normalize_params
+
+# Backtest service modules that configure the engine and compute metrics
+_BACKTEST_SERVICE_DIR = Path(__file__).resolve().parents[1] / "backtest"
+
+
+def _json_default(value: Any) -> Any:
+    return value.item() if hasattr(value, "item") else str(value)
+
+
+@lru_cache(maxsize=1)
+def _backtest_service_hash() -> str:
+    digest = hashlib.sha256()
+    for path in sorted(_BACKTEST_SERVICE_DIR.glob("*.py")):
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def evaluation_context(strategy_hash: str, data: pd.DataFrame, engine_options: Optional[Dict[str, Any]]) -> str:
+    """
+    Digest of everything except the parameters that determines a backtest.
+
+    The strategy source hash, the source of the backtester package and of
+    the backtest service (engine, exit rules, indicators and metrics code,
+    so a fix there retires old entries), a content fingerprint of the exact
+    rows the backtest sees (so train/validation splits and fidelity windows
+    key separately) and the normalized engine options.
+    """
+
+    digest = hashlib.sha256()
+    digest.update(strategy_hash.encode())
+    digest.update(backtester_source_hash().encode())
+    digest.update(_backtest_service_hash().encode())
+    digest.update(dataset_fingerprint(data).encode())
+    digest.update(normalize_params(engine_options).encode())
+    return digest.hexdigest()
+
+
+def evaluation_key(context: str, params: Dict[str, Any]) -> str:
+    """Memo key of one parameter set within an ``evaluation_context``."""
+
+    return hashlib.sha256((context + normalize_params(params)).encode()).hexdigest()
+
+
+class EvaluationMemo:
+    """
+    SQLite-backed map from evaluation key to the metrics of a successful backtest.
+
+    Only metrics are stored, never the optimization score, so re-running a
+    grid with a different optimization metric is served entirely from the
+    memo. Entries are evicted oldest-first once ``max_entries`` is exceeded.
+    """
+
+    def __init__(self, path: Path | str, max_entries: int = 1_000_000):
+        self.path = Path(path)
+        self.max_entries = int(max_entries)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # Entries are written one by one; a lost tail after a crash only costs recomputation
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS evaluations ("
+            "key TEXT PRIMARY KEY, metrics TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS evaluations_created_at ON evaluations (created_at)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Stored metrics for ``key`` or None (counted as a hit or a miss)."""
+        with self._lock:
+            row = self._conn.execute("SELECT metrics FROM evaluations WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key: str, metrics: Dict[str, Any]) -> None:
+        payload = json.dumps(metrics, default=_json_default)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO evaluations (key, metrics, created_at) VALUES (?, ?, ?)",
+                (key, payload, time.time()),
+            )
+            self._conn.commit()
+
+    def prune(self) -> int:
+        """Drop the oldest entries beyond ``max_entries``; returns the number removed."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM evaluations WHERE key IN ("
+                "SELECT key FROM evaluations ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM evaluations")
+            self._conn.commit()
+
+    def info(self) -> Dict[str, Any]:
+        """Entry count and hit/miss counters."""
+        with self._lock:
+            (entries,) = self._conn.execute("SELECT COUNT(*) FROM evaluations").fetchone()
+        return {"entries": entries, "max_entries": self.max_entries, "hits": self.hits, "misses": self.misses}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_memos: Dict[str, EvaluationMemo] = {}
+
+
+def shared_evaluation_memo(path: Path | str, max_entries: int) -> EvaluationMemo:
+    """Return the process-wide EvaluationMemo for ``path``."""
+    key = str(Path(path).resolve())
+    memo = _memos.get(key)
+    if memo is None:
+        memo = _memos[key] = EvaluationMemo(path, max_entries)
+    return memo
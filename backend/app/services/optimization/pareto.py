@@ -0,0 +1,145 @@
+"""Multi-objective (Pareto front) ranking of optimization results."""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from .utils import ParameterGridError
+
+DIRECTIONS = ("maximize", "minimize")
+
+
+def normalize_objectives(objectives: Any, available_metrics: Iterable[str]) -> List[Dict[str, str]]:
+    """
+    Validate a list of objectives and fill in defaults.
+
+    Each objective is a metric name (maximized) or a dict with ``metric`` and
+    an optional ``direction`` ('maximize' or 'minimize').
+    """
+
+    if not isinstance(objectives, (list, tuple)) or len(objectives) < 2:
+        raise ParameterGridError("objectives must list at least two metrics")
+    available = set(available_metrics)
+    normalized = []
+    for objective in objectives:
+        if isinstance(objective, str):
+            objective = {"metric": objective}
+        if not isinstance(objective, dict):
+            raise ParameterGridError(f"Invalid objective: {objective!r}")
+        metric = objective.get("metric")
+        direction = objective.get("direction") or "maximize"
+        if metric not in available:
+            raise ParameterGridError(f"Unsupported objective metric '{metric}'")
+        if direction not in DIRECTIONS:
+            raise ParameterGridError(f"Objective direction must be one of {DIRECTIONS}")
+        normalized.append({"metric": metric, "direction": direction})
+    metrics = [o["metric"] for o in normalized]
+    if len(set(metrics)) != len(metrics):
+        raise ParameterGridError("Each objective metric may appear only once")
+    return normalized
+
+
+def crowding_distances(points: np.ndarray) -> np.ndarray:
+    """
+    NSGA-II crowding distance of every row of ``points`` (one column per objective).
+
+    Per objective the rows are sorted, the two extremes get an infinite
+    distance and every other row adds the gap between its neighbours,
+    normalized by that objective's range.
+    """
+
+    n, k = points.shape
+    distances = np.zeros(n)
+    if n <= 2:
+        distances[:] = np.inf
+        return distances
+    for j in range(k):
+        order = np.argsort(points[:, j], kind="stable")
+        column = points[order, j]
+        distances[order[0]] = distances[order[-1]] = np.inf
+        span = column[-1] - column[0]
+        if span > 0:
+            distances[order[1:-1]] += (column[2:] - column[:-2]) / span
+    return distances
+
+
+class ParetoFront:
+    """
+    Non-dominated set of result entries, updated one entry at a time.
+
+    A new entry is compared with the current front only: it is dropped if a
+    member dominates it, otherwise it joins and evicts the members it
+    dominates. Objectives are stored sign-adjusted so larger is always
+    better. Entries missing an objective are ignored. With successive
+    halving only the highest rung seen so far is kept, since scores of
+    different fidelities are not comparable.
+    """
+
+    def __init__(self, objectives: List[Dict[str, str]]):
+        self.objectives = objectives
+        self._signs = np.array([1.0 if o["direction"] == "maximize" else -1.0 for o in objectives])
+        self._points = np.empty((0, len(objectives)))
+        self._entries: List[Dict[str, Any]] = []
+        self._rung = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, entry: Dict[str, Any]) -> bool:
+        """Offer ``entry`` to the front; returns whether it joined."""
+        rung = entry.get("rung", 0)
+        if rung < self._rung:
+            return False
+        if rung > self._rung:
+            self._rung = rung
+            self._points = self._points[:0]
+            self._entries = []
+
+        point = self._point(entry.get("metrics") or {})
+        if point is None:
+            return False
+        front = self._points
+        if len(front):
+            if np.any(np.all(front >= point, axis=1) & np.any(front > point, axis=1)):
+                return False
+            keep = ~(np.all(point >= front, axis=1) & np.any(point > front, axis=1))
+            if not keep.all():
+                front = front[keep]
+                self._entries = [e for e, k in zip(self._entries, keep) if k]
+        self._points = np.vstack([front, point])
+        self._entries.append(entry)
+        return True
+
+    def result(self) -> List[Dict[str, Any]]:
+        """
+        Front members with their crowding distance, most isolated first.
+
+        Extreme points have an infinite distance, reported as None so the
+        result stays JSON-friendly.
+        """
+        if not self._entries:
+            return []
+        distances = crowding_distances(self._points)
+        order = np.argsort(-distances, kind="stable")
+        return [
+            {
+                **self._entries[i],
+                "crowding_distance": None if math.isinf(distances[i]) else float(distances[i]),
+            }
+            for i in order
+        ]
+
+    def _point(self, metrics: Dict[str, Any]) -> Optional[np.ndarray]:
+        values = []
+        for objective in self.objectives:
+            try:
+                value = float(metrics.get(objective["metric"]))
+            except (TypeError, ValueError):
+                return None
+            if not math.isfinite(value):
+                return None
+            values.append(value)
+        return np.array(values) * self._signs
@@ -0,0 +1,356 @@
+"""Streaming storage and incremental analysis of optimization results."""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import json
+import math
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .pareto import ParetoFront
+
+CHUNK_PREFIX = "chunk-"
+METRIC_PREFIX = "metric:"
+DEFAULT_CHUNK_ROWS = 2048
+
+
+def params_key(parameters: Dict[str, Any]) -> str:
+    """Canonical JSON text of a parameter set, as stored in the results file."""
+    return json.dumps(parameters, sort_keys=True, default=str)
+
+
+def _finite_or_none(value: Any) -> Optional[float]:
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return None
+    return value if math.isfinite(value) else None
+
+
+class ResultsWriter:
+    """
+    Append-only columnar results file.
+
+    Entries are buffered and flushed every ``chunk_rows`` rows to one ``.npz``
+    chunk in ``directory``: parameters (JSON text), score, status, error,
+    pruning reason, rung/sessions and one float column per numeric metric. Nothing is pickled.
+    Chunks are written atomically, so after a crash every chunk on disk is
+    complete; reopening a directory appends after the existing chunks.
+    """
+
+    def __init__(self, directory: Path | str, chunk_rows: int = DEFAULT_CHUNK_ROWS):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for stale in self.directory.glob(".chunk-*.tmp"):
+            stale.unlink(missing_ok=True)
+        self.chunk_rows = chunk_rows
+        self._buffer: List[Dict[str, Any]] = []
+        existing = _chunk_paths(self.directory)
+        self._chunks = len(existing)
+        self.rows = sum(_chunk_size(path) for path in existing)
+
+    def append(self, entry: Dict[str, Any]) -> None:
+        self._buffer.append(entry)
+        self.rows += 1
+        if len(self._buffer) >= self.chunk_rows:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._buffer:
+            return
+        entries, self._buffer = self._buffer, []
+        metric_names = sorted({
+            name for entry in entries for name, value in (entry.get("metrics") or {}).items()
+            if _finite_or_none(value) is not None
+        })
+        columns = {
+            "parameters": np.array([params_key(entry["parameters"]) for entry in entries]),
+            "score": np.array([entry["optimization_score"] for entry in entries], dtype=np.float64),
+            "status": np.array([entry["status"] for entry in entries]),
+            "error": np.array([entry.get("error") or "" for entry in entries]),
+            "pruned": np.array([entry.get("pruned") or "" for entry in entries]),
+            "rung": np.array([entry.get("rung", -1) for entry in entries], dtype=np.int64),
+            "sessions": np.array([entry.get("sessions", -1) for entry in entries], dtype=np.int64),
+        }
+        for name in metric_names:
+            values = [_finite_or_none((entry.get("metrics") or {}).get(name)) for entry in entries]
+            columns[METRIC_PREFIX + name] = np.array(
+                [np.nan if v is None else v for v in values], dtype=np.float64
+            )
+        name = f"{CHUNK_PREFIX}{self._chunks:06d}.npz"
+        tmp = self.directory / f".{name}.tmp"
+        with open(tmp, "wb") as fh:
+            np.savez(fh, **columns)
+        os.replace(tmp, self.directory / name)
+        self._chunks += 1
+
+    def close(self) -> None:
+        self.flush()
+
+
+def _chunk_paths(directory: Path | str) -> List[Path]:
+    return sorted(Path(directory).glob(f"{CHUNK_PREFIX}*.npz"))
+
+
+def _chunk_size(path: Path) -> int:
+    with np.load(path) as chunk:
+        return len(chunk["score"])
+
+
+def _entry_from_row(chunk: Dict[str, np.ndarray], i: int) -> Dict[str, Any]:
+    entry: Dict[str, Any] = {
+        "parameters": json.loads(str(chunk["parameters"][i])),
+        "metrics": {},
+        "optimization_score": float(chunk["score"][i]),
+        "status": str(chunk["status"][i]),
+    }
+    for name, values in chunk.items():
+        if name.startswith(METRIC_PREFIX) and not np.isnan(values[i]):
+            entry["metrics"][name[len(METRIC_PREFIX):]] = float(values[i])
+    if chunk["error"][i]:
+        entry["error"] = str(chunk["error"][i])
+    if "pruned" in chunk and chunk["pruned"][i]:
+        entry["pruned"] = str(chunk["pruned"][i])
+    if chunk["rung"][i] >= 0:
+        entry["rung"] = int(chunk["rung"][i])
+        entry["sessions"] = int(chunk["sessions"][i])
+    return entry
+
+
+def read_results(
+    directory: Path | str,
+    offset: int = 0,
+    limit: int = 100,
+    sort_by_score: bool = True,
+) -> Dict[str, Any]:
+    """
+    One page of a results file.
+
+    With ``sort_by_score`` rows are ordered like the in-memory results
+    (highest rung, then highest score); otherwise in completion order. Only
+    the sort columns and the chunks holding the requested rows are loaded.
+    """
+
+    paths = _chunk_paths(directory)
+    sizes = []
+    keys = []
+    for path in paths:
+        with np.load(path) as chunk:
+            sizes.append(len(chunk["score"]))
+            if sort_by_score:
+                keys.append((chunk["rung"], chunk["score"]))
+    total = int(sum(sizes))
+    if sort_by_score and keys:
+        rungs = np.concatenate([k[0] for k in keys])
+        scores = np.nan_to_num(np.concatenate([k[1] for k in keys]), nan=-np.inf)
+        order = np.lexsort((np.arange(total), -scores, -rungs))
+    else:
+        order = np.arange(total)
+    selected = order[offset:offset + max(0, limit)]
+
+    starts = np.cumsum([0] + sizes)
+    rows: Dict[int, Dict[str, Any]] = {}
+    chunk_ids = np.searchsorted(starts, selected, side="right") - 1
+    for chunk_id in np.unique(chunk_ids):
+        with np.load(paths[chunk_id]) as stored:
+            chunk = {name: stored[name] for name in stored.files}
+        for row in selected[chunk_ids == chunk_id]:
+            rows[int(row)] = _entry_from_row(chunk, int(row - starts[chunk_id]))
+    return {
+        "total": total,
+        "offset": offset,
+        "limit": limit,
+        "results": [rows[int(row)] for row in selected],
+    }
+
+
+def iter_results(directory: Path | str) -> Iterator[Dict[str, Any]]:
+    """Every stored entry in completion order."""
+
+    for path in _chunk_paths(directory):
+        with np.load(path) as stored:
+            chunk = {name: stored[name] for name in stored.files}
+        for i in range(len(chunk["score"])):
+            yield _entry_from_row(chunk, i)
+
+
+def read_scores(directory: Path | str, completed_only: bool = True) -> np.ndarray:
+    """Score column of a results file (optionally completed rows only)."""
+
+    scores = []
+    for path in _chunk_paths(directory):
+        with np.load(path) as chunk:
+            values = chunk["score"]
+            if completed_only:
+                values = values[chunk["status"] == "completed"]
+            scores.append(values)
+    return np.concatenate(scores) if scores else np.empty(0)
+
+
+def remove_results(directory: Path | str) -> None:
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+class TopK:
+    """Bounded min-heap keeping the ``k`` best entries under ``key``."""
+
+    def __init__(self, k: int, key: Callable[[Dict[str, Any]], Tuple]):
+        self.k = k
+        self.key = key
+        self._heap: List[Tuple[Tuple, int, Dict[str, Any]]] = []
+        self._counter = itertools.count()
+
+    def push(self, entry: Dict[str, Any]) -> None:
+        # Earlier entries win ties, as with a stable sort of the full list
+        item = (self.key(entry), -next(self._counter), entry)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, item)
+        elif item[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, item)
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def sorted(self) -> List[Dict[str, Any]]:
+        return [item[2] for item in sorted(self._heap, key=lambda item: item[:2], reverse=True)]
+
+
+class SensitivityAccumulator:
+    """
+    Running per-parameter statistics of the optimization score.
+
+    Keeps, for every parameter, the score count/sum/sum of squares per value
+    and the sums needed for the Pearson correlation, so memory grows with
+    the number of distinct values rather than with the number of results.
+    """
+
+    def __init__(self):
+        self._by_value: Dict[str, Dict[Any, List[float]]] = {}
+        self._corr: Dict[str, List[float]] = {}
+        self._numeric: Dict[str, bool] = {}
+        self.count = 0
+
+    def add(self, parameters: Dict[str, Any], score: float) -> None:
+        self.count += 1
+        for name, value in parameters.items():
+            key = value if isinstance(value, (str, int, float, bool)) or value is None else str(value)
+            stats = self._by_value.setdefault(name, {}).setdefault(key, [0, 0.0, 0.0])
+            stats[0] += 1
+            stats[1] += score
+            stats[2] += score * score
+            numeric = isinstance(value, (int, float)) and not isinstance(value, bool)
+            self._numeric[name] = self._numeric.get(name, True) and numeric
+            if numeric:
+                sums = self._corr.setdefault(name, [0.0] * 5)
+                x = float(value)
+                sums[0] += x
+                sums[1] += score
+                sums[2] += x * x
+                sums[3] += score * score
+                sums[4] += x * score
+
+    def result(self) -> Dict[str, Any]:
+        """Same layout as ``OptimizationService._analyze_parameter_sensitivity``."""
+        if self.count < 2:
+            return {}
+        sensitivity = {}
+        n = self.count
+        for name, values in self._by_value.items():
+            try:
+                score_by_value = {}
+                for value, (count, total, total_sq) in values.items():
+                    mean = total / count
+                    var = (total_sq - count * mean * mean) / (count - 1) if count > 1 else float("nan")
+                    score_by_value[value] = {
+                        "mean": mean,
+                        "std": math.sqrt(max(var, 0.0)) if count > 1 else float("nan"),
+                        "count": count,
+                    }
+                correlation = 0.0
+                if self._numeric.get(name) and name in self._corr:
+                    sx, sy, sxx, syy, sxy = self._corr[name]
+                    cov = sxy - sx * sy / n
+                    var_x = sxx - sx * sx / n
+                    var_y = syy - sy * sy / n
+                    if var_x > 1e-12 and var_y > 1e-12:
+                        correlation = float(cov / math.sqrt(var_x * var_y))
+                keys = list(values.keys())
+                sensitivity[name] = {
+                    "correlation": correlation,
+                    "score_by_value": score_by_value,
+                    "unique_values": len(keys),
+                    "value_range": {"min": float(min(keys)), "max": float(max(keys))},
+                }
+            except Exception as e:
+                sensitivity[name] = {"error": str(e)}
+        return sensitivity
+
+
+class StreamingResults:
+    """
+    Collect sweep entries in bounded memory.
+
+    Every entry is appended to a ``ResultsWriter``; only the top ``top_k``
+    entries, counters and the sensitivity sums are kept in memory, plus the
+    non-dominated entries when a ``front`` is given.
+    """
+
+    def __init__(
+        self,
+        directory: Path | str,
+        key: Callable[[Dict[str, Any]], Tuple],
+        top_k: int = 50,
+        chunk_rows: int = DEFAULT_CHUNK_ROWS,
+        front: Optional[ParetoFront] = None,
+    ):
+        self.writer = ResultsWriter(directory, chunk_rows=chunk_rows)
+        self.top = TopK(top_k, key)
+        self.front = front
+        self.sensitivity = SensitivityAccumulator()
+        self.completed = 0
+        self.failed = 0
+        self.pruned = 0
+
+    @property
+    def directory(self) -> Path:
+        return self.writer.directory
+
+    @property
+    def total(self) -> int:
+        return self.writer.rows
+
+    def add(self, entry: Dict[str, Any]) -> None:
+        self.writer.append(entry)
+        self._track(entry)
+
+    def restore(self) -> List[Dict[str, Any]]:
+        """Re-read entries already on disk (e.g. from a checkpoint) into the in-memory state."""
+        entries = list(iter_results(self.directory))
+        for entry in entries:
+            self._track(entry)
+        return entries
+
+    def flush(self) -> None:
+        self.writer.flush()
+
+    def close(self) -> None:
+        self.writer.close()
+
+    def _track(self, entry: Dict[str, Any]) -> None:
+        if entry["status"] == "completed":
+            self.completed += 1
+            self.top.push(entry)
+            self.sensitivity.add(entry["parameters"], entry["optimization_score"])
+            if self.front is not None:
+                self.front.add(entry)
+        elif entry["status"] == "pruned":
+            self.pruned += 1
+        else:
+            self.failed += 1
+
@@ -0,0 +1,275 @@
+"""Adaptive parameter search strategies for optimization jobs."""
+
+from __future__ import annotations
+
+import itertools
+import math
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .utils import ParamRange, ParameterGridError, _range_from_config
+
+
+def _plain(value: Any) -> Any:
+    """Builtin Python value for numpy scalars (keeps results JSON-friendly)."""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+class ParameterSpace:
+    """
+    Finite search space built from the same ``param_ranges`` as the grid.
+
+    Every parameter is a list of candidate values. Numeric parameters are
+    treated as ordered (neighbouring values are similar), anything else as
+    categorical. Points are addressed by a tuple of value indices.
+    """
+
+    def __init__(self, param_ranges: Dict[str, ParamRange]):
+        if not param_ranges:
+            raise ParameterGridError("At least one parameter range is required")
+        self.names: List[str] = []
+        self.values: List[List[Any]] = []
+        self.ordered: List[bool] = []
+        self._lookup: List[Dict[Any, int]] = []
+        for name, config in param_ranges.items():
+            if isinstance(config, list):
+                if not config:
+                    raise ParameterGridError(f"Parameter '{name}' list cannot be empty")
+                values = config
+            elif isinstance(config, dict):
+                values = _range_from_config(config)
+            else:
+                raise ParameterGridError(f"Invalid configuration for parameter '{name}'")
+            values = [_plain(v) for v in values]
+            self.names.append(name)
+            self.values.append(values)
+            self.ordered.append(all(
+                isinstance(v, (int, float)) and not isinstance(v, bool) for v in values
+            ))
+            self._lookup.append({v: i for i, v in enumerate(values)})
+
+    @property
+    def size(self) -> int:
+        return math.prod(len(v) for v in self.values)
+
+    @property
+    def cardinalities(self) -> List[int]:
+        return [len(v) for v in self.values]
+
+    def params(self, key: Sequence[int]) -> Dict[str, Any]:
+        return {name: values[i] for name, values, i in zip(self.names, self.values, key)}
+
+    def key(self, params: Dict[str, Any]) -> Tuple[int, ...]:
+        return tuple(lookup[_plain(params[name])] for name, lookup in zip(self.names, self._lookup))
+
+    def random_key(self, rng: np.random.Generator) -> Tuple[int, ...]:
+        return tuple(int(rng.integers(k)) for k in self.cardinalities)
+
+    def random_unseen(self, rng: np.random.Generator, seen) -> Optional[Tuple[int, ...]]:
+        """Uniformly random point not in ``seen``, or None once the space is exhausted."""
+        if len(seen) >= self.size:
+            return None
+        for _ in range(64):
+            key = self.random_key(rng)
+            if key not in seen:
+                return key
+        remaining = [k for k in itertools.product(*(range(c) for c in self.cardinalities)) if k not in seen]
+        return remaining[int(rng.integers(len(remaining)))] if remaining else None
+
+
+class RandomSampler:
+    """
+    Uniform random sampling of a ``ParameterSpace`` without replacement.
+
+    ``sample`` lazily yields unseen points, so a sweep can stream them
+    straight into the executor. Points passed to ``exclude`` (e.g. entries
+    restored from a checkpoint) are never proposed.
+    """
+
+    def __init__(self, space: ParameterSpace, seed: Optional[int] = None):
+        self.space = space
+        self.rng = np.random.default_rng(seed)
+        self._seen: set = set()
+
+    def exclude(self, params: Dict[str, Any]) -> None:
+        self._seen.add(self.space.key(params))
+
+    def sample(self, n: int) -> Iterator[Dict[str, Any]]:
+        """Up to ``n`` new parameter sets (fewer once the space is exhausted)."""
+        for _ in range(n):
+            key = self._next_key()
+            if key is None:
+                return
+            self._seen.add(key)
+            yield self.space.params(key)
+
+    def _next_key(self) -> Optional[Tuple[int, ...]]:
+        return self.space.random_unseen(self.rng, self._seen)
+
+
+class LatinHypercubeSampler(RandomSampler):
+    """
+    Latin hypercube design of ``n_samples`` points over a ``ParameterSpace``.
+
+    Every parameter's index range is cut into ``n_samples`` equal strata and
+    each stratum is used exactly once, in an independent random order per
+    parameter, so even small budgets cover every parameter's full range.
+    Strata map onto the discrete values of ``range`` steps and ``choice``
+    lists; points the design repeats (or that were excluded) are replaced
+    by uniform random unseen points.
+    """
+
+    def __init__(self, space: ParameterSpace, n_samples: int, seed: Optional[int] = None):
+        super().__init__(space, seed)
+        self._design = self._latin_hypercube(min(int(n_samples), space.size))
+        self._position = 0
+
+    def _latin_hypercube(self, n: int) -> List[Tuple[int, ...]]:
+        if n < 1:
+            return []
+        columns = []
+        for k in self.space.cardinalities:
+            strata = (self.rng.permutation(n) + self.rng.random(n)) / n
+            columns.append(np.minimum((strata * k).astype(np.int64), k - 1))
+        return [tuple(int(v) for v in row) for row in zip(*columns)]
+
+    def _next_key(self) -> Optional[Tuple[int, ...]]:
+        while self._position < len(self._design):
+            key = self._design[self._position]
+            self._position += 1
+            if key not in self._seen:
+                return key
+        return super()._next_key()
+
+
+class TPESampler:
+    """
+    Tree-structured Parzen estimator over a finite ``ParameterSpace``.
+
+    After ``n_startup`` random trials the observations are split into the
+    best ``gamma`` fraction and the rest. One density per parameter is fitted
+    to each group (a discretized Gaussian mixture for ordered values, smoothed
+    counts for categories), candidates are drawn from the good density and
+    the one with the highest good/bad likelihood ratio is proposed.
+    Suggestions are never repeated, including points still being evaluated.
+    """
+
+    def __init__(
+        self,
+        space: ParameterSpace,
+        seed: Optional[int] = None,
+        n_startup: Optional[int] = None,
+        gamma: float = 0.25,
+        n_candidates: int = 32,
+    ):
+        self.space = space
+        self.rng = np.random.default_rng(seed)
+        self.n_startup = n_startup if n_startup is not None else max(10, 2 * len(space.names))
+        self.gamma = gamma
+        self.n_candidates = n_candidates
+        self._scores: Dict[Tuple[int, ...], float] = {}
+        self._pending: set = set()
+
+    def ask(self, n: int = 1) -> List[Dict[str, Any]]:
+        """Up to ``n`` new parameter sets (fewer once the space is exhausted)."""
+        suggestions = []
+        for _ in range(n):
+            key = self._suggest()
+            if key is None:
+                break
+            self._pending.add(key)
+            suggestions.append(self.space.params(key))
+        return suggestions
+
+    def tell(self, params: Dict[str, Any], score: Optional[float]) -> None:
+        """Record the score of an evaluated parameter set (None for failures)."""
+        key = self.space.key(params)
+        self._pending.discard(key)
+        if score is None or not np.isfinite(score):
+            score = -np.inf
+        self._scores[key] = float(score)
+
+    def _suggest(self) -> Optional[Tuple[int, ...]]:
+        seen = self._scores.keys() | self._pending
+        if len(self._scores) < self.n_startup:
+            return self.space.random_unseen(self.rng, seen)
+
+        keys = np.array(list(self._scores.keys()), dtype=np.int64)
+        scores = np.array(list(self._scores.values()))
+        order = np.argsort(-scores, kind="stable")
+        n_good = max(1, int(math.ceil(self.gamma * len(order))))
+        good, bad = keys[order[:n_good]], keys[order[n_good:]]
+
+        log_ratio = np.zeros(self.n_candidates)
+        candidates = np.empty((self.n_candidates, len(self.space.names)), dtype=np.int64)
+        for d, (k, ordered) in enumerate(zip(self.space.cardinalities, self.space.ordered)):
+            l_density = self._density(good[:, d], k, ordered)
+            g_density = self._density(bad[:, d], k, ordered)
+            candidates[:, d] = self.rng.choice(k, size=self.n_candidates, p=l_density)
+            log_ratio += np.log(l_density[candidates[:, d]]) - np.log(g_density[candidates[:, d]])
+
+        for i in np.argsort(-log_ratio, kind="stable"):
+            key = tuple(int(v) for v in candidates[i])
+            if key not in seen:
+                return key
+        return self.space.random_unseen(self.rng, seen)
+
+    @staticmethod
+    def _density(observed: np.ndarray, k: int, ordered: bool) -> np.ndarray:
+        """Probability of each of the ``k`` values given observed indices, with a uniform prior."""
+        prior = np.full(k, 1.0 / k)
+        if len(observed) == 0:
+            return prior
+        if not ordered:
+            counts = np.bincount(observed, minlength=k).astype(float)
+            return (counts + 1.0) / (len(observed) + k)
+        bandwidth = max(1.0, k / (len(observed) + 1))
+        grid = np.arange(k)[:, None]
+        kernels = np.exp(-0.5 * ((grid - observed[None, :]) / bandwidth) ** 2)
+        kernels /= kernels.sum(axis=0, keepdims=True)
+        mixture = kernels.sum(axis=1) + prior
+        return mixture / mixture.sum()
+
+
+def normalize_halving_config(config: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Validate a successive-halving config dict and fill in defaults."""
+
+    config = dict(config or {})
+    min_sessions = config.get("min_sessions", 5)
+    factor = config.get("reduction_factor", 3)
+    if not isinstance(min_sessions, int) or isinstance(min_sessions, bool) or min_sessions < 1:
+        raise ParameterGridError("min_sessions must be a positive integer")
+    if not isinstance(factor, (int, float)) or isinstance(factor, bool) or factor <= 1:
+        raise ParameterGridError("reduction_factor must be greater than 1")
+    return {"min_sessions": min_sessions, "reduction_factor": factor}
+
+
+def successive_halving_rungs(
+    n_candidates: int,
+    total_sessions: int,
+    min_sessions: int,
+    reduction_factor: float,
+) -> List[Dict[str, int]]:
+    """
+    Fidelity schedule for successive halving.
+
+    Rung ``r`` evaluates ``ceil(n / eta**r)`` candidates on the first
+    ``min_sessions * eta**r`` sessions; the last rung always uses every
+    session. Returns ``[{'rung', 'sessions', 'candidates'}]``.
+    """
+
+    rungs: List[Dict[str, int]] = []
+    sessions = float(min(min_sessions, total_sessions))
+    candidates = float(n_candidates)
+    while True:
+        rung_sessions = min(int(round(sessions)), total_sessions)
+        rungs.append({
+            "rung": len(rungs),
+            "sessions": rung_sessions,
+            "candidates": max(1, int(math.ceil(candidates))),
+        })
+        if rung_sessions >= total_sessions:
+            return rungs
+        sessions *= reduction_factor
+        candidates /= reduction_factor
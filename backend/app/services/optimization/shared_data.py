@@ -0,0 +1,123 @@
+"""Share a market-data DataFrame with worker processes without copying it."""
+
+from __future__ import annotations
+
+from multiprocessing import shared_memory
+from typing import Any, Dict, Tuple
+
+import numpy as np
+import pandas as pd
+
+_ALIGN = 64
+
+
+def _column_array(values: pd.Series) -> Tuple[np.ndarray, Any]:
+    """Fixed-width array for ``values`` plus its timezone, or (None, None)."""
+
+    if pd.api.types.is_datetime64_any_dtype(values):
+        tz = getattr(values.dt, "tz", None)
+        if tz is not None:
+            values = values.dt.tz_convert("UTC").dt.tz_localize(None)
+        return values.to_numpy(), (str(tz) if tz is not None else None)
+    if pd.api.types.is_bool_dtype(values) or pd.api.types.is_numeric_dtype(values):
+        array = values.to_numpy()
+        if array.dtype.kind in "biuf":
+            return array, None
+    return None, None
+
+
+class SharedFrame:
+    """
+    Owner of a DataFrame copied once into a single shared memory block.
+
+    Fixed-width columns (numbers, booleans, datetimes) live in shared memory;
+    a ``timestamp`` column of strings is parsed to datetimes first. Any other
+    column travels in the pickled descriptor. Workers rebuild the frame with
+    ``attach_shared_frame(descriptor)``. The owner must call ``close()``
+    (or use it as a context manager) to release the block.
+    """
+
+    def __init__(self, data: pd.DataFrame):
+        columns = []
+        extras: Dict[str, list] = {}
+        arrays = []
+        offset = 0
+        for name in data.columns:
+            values = data[name]
+            if name == "timestamp" and not pd.api.types.is_datetime64_any_dtype(values):
+                values = pd.to_datetime(values)
+            array, tz = _column_array(values)
+            if array is None:
+                extras[name] = values.tolist()
+                columns.append({"name": name, "extra": True})
+                continue
+            array = np.ascontiguousarray(array)
+            columns.append({
+                "name": name,
+                "dtype": array.dtype.str,
+                "offset": offset,
+                "tz": tz,
+            })
+            arrays.append((offset, array))
+            offset += -(-array.nbytes // _ALIGN) * _ALIGN
+
+        self._shm = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+        for start, array in arrays:
+            target = np.ndarray(array.shape, dtype=array.dtype, buffer=self._shm.buf, offset=start)
+            target[:] = array
+        self.descriptor = {
+            "name": self._shm.name,
+            "length": len(data),
+            "columns": columns,
+            "extras": extras,
+        }
+
+    @property
+    def nbytes(self) -> int:
+        return self._shm.size
+
+    def close(self) -> None:
+        """Release and unlink the shared block."""
+        if self._shm is None:
+            return
+        self._shm.close()
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+        self._shm = None
+
+    def __enter__(self) -> "SharedFrame":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def attach_shared_frame(descriptor: Dict[str, Any]) -> Tuple[pd.DataFrame, shared_memory.SharedMemory]:
+    """
+    Rebuild the DataFrame described by ``descriptor`` on top of shared memory.
+
+    Columns are read-only views into the block, so the returned handle must
+    stay referenced for as long as the frame is used.
+    """
+
+    try:
+        # The owner unlinks the block; workers must not register it for cleanup
+        shm = shared_memory.SharedMemory(name=descriptor["name"], track=False)
+    except TypeError:  # Python < 3.13
+        shm = shared_memory.SharedMemory(name=descriptor["name"])
+    length = descriptor["length"]
+    columns = {}
+    for column in descriptor["columns"]:
+        name = column["name"]
+        if column.get("extra"):
+            columns[name] = descriptor["extras"][name]
+            continue
+        array = np.ndarray((length,), dtype=np.dtype(column["dtype"]), buffer=shm.buf, offset=column["offset"])
+        array.flags.writeable = False
+        if column["tz"] is not None:
+            columns[name] = pd.Series(pd.DatetimeIndex(array).tz_localize("UTC").tz_convert(column["tz"]))
+        else:
+            columns[name] = array
+    return pd.DataFrame(columns, copy=False), shm
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import itertools
-from typing import Any, Dict, Iterable, List, Sequence, Union
+import math
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Union
 
 import numpy as np
 
@@ -36,12 +37,7 @@ def _range_from_config(config: Dict[str, Any]) -> Sequence[Any]:
     raise ParameterGridError(f"Unknown parameter type '{range_type}'")
 
 
-def generate_parameter_grid(param_ranges: Dict[str, ParamRange]) -> List[Dict[str, Any]]:
-    """Expand structured parameter ranges into a concrete grid."""
-
-    if not param_ranges:
-        return []
-
+def _parameter_lists(param_ranges: Dict[str, ParamRange]) -> Dict[str, Sequence[Any]]:
     param_lists: Dict[str, Sequence[Any]] = {}
     for name, config in param_ranges.items():
         if isinstance(config, list):
@@ -52,13 +48,32 @@ def generate_parameter_grid(param_ranges: Dict[str, ParamRange]) -> List[Dict[st
             param_lists[name] = _range_from_config(config)
         else:
             raise ParameterGridError(f"Invalid configuration for parameter '{name}'")
+    return param_lists
 
+
+def iter_parameter_grid(param_ranges: Dict[str, ParamRange]) -> Iterator[Dict[str, Any]]:
+    """Lazily yield the combinations of ``generate_parameter_grid``."""
+
+    if not param_ranges:
+        return
+    param_lists = _parameter_lists(param_ranges)
     param_names = list(param_lists.keys())
-    combinations = [
-        dict(zip(param_names, values))
-        for values in itertools.product(*(param_lists[name] for name in param_names))
-    ]
-    return combinations
+    for values in itertools.product(*(param_lists[name] for name in param_names)):
+        yield dict(zip(param_names, values))
+
+
+def count_parameter_grid(param_ranges: Dict[str, ParamRange]) -> int:
+    """Number of grid combinations, without expanding the grid."""
+
+    if not param_ranges:
+        return 0
+    return math.prod(len(values) for values in _parameter_lists(param_ranges).values())
+
+
+def generate_parameter_grid(param_ranges: Dict[str, ParamRange]) -> List[Dict[str, Any]]:
+    """Expand structured parameter ranges into a concrete grid."""
+
+    return list(iter_parameter_grid(param_ranges))
 
 
 def validate_metric(metric: str, available_metrics: Iterable[str]) -> str:
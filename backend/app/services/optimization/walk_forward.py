@@ -0,0 +1,147 @@
+"""Walk-forward fold construction and out-of-sample equity stitching."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+class WalkForwardError(ValueError):
+    """Raised when a walk-forward configuration cannot be applied."""
+
+
+def normalize_walk_forward_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate a walk-forward config dict and fill in defaults."""
+
+    if not isinstance(config, dict):
+        raise WalkForwardError("walk_forward must be a mapping")
+
+    normalized: Dict[str, Any] = {}
+    for key in ("in_sample_sessions", "out_of_sample_sessions"):
+        value = config.get(key)
+        if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+            raise WalkForwardError(f"{key} must be a positive integer")
+        normalized[key] = value
+
+    step = config.get("step_sessions")
+    if step is None:
+        step = normalized["out_of_sample_sessions"]
+    if not isinstance(step, int) or isinstance(step, bool) or step < 1:
+        raise WalkForwardError("step_sessions must be a positive integer")
+    normalized["step_sessions"] = step
+    normalized["anchored"] = bool(config.get("anchored", False))
+    return normalized
+
+
+def session_labels(data: pd.DataFrame) -> np.ndarray:
+    """Trading date (datetime64[D]) of every row of ``data``."""
+
+    if "timestamp" in data.columns:
+        timestamps = pd.to_datetime(data["timestamp"], errors="coerce")
+    elif isinstance(data.index, pd.DatetimeIndex):
+        timestamps = pd.Series(data.index)
+    else:
+        raise WalkForwardError("Session-aligned analysis requires a timestamp column")
+    if timestamps.isna().any():
+        raise WalkForwardError("Session-aligned analysis requires valid timestamps on every row")
+    if getattr(timestamps.dt, "tz", None) is not None:
+        timestamps = timestamps.dt.tz_localize(None)
+    return timestamps.to_numpy(dtype="datetime64[ns]").astype("datetime64[D]")
+
+
+def session_bounds(data: pd.DataFrame, days: Optional[np.ndarray] = None) -> np.ndarray:
+    """Row offset of the first bar of every session, followed by ``len(data)``."""
+
+    days = session_labels(data) if days is None else days
+    if len(days) and np.any(days[1:] < days[:-1]):
+        raise WalkForwardError("Session-aligned analysis requires data sorted by timestamp")
+    starts = np.flatnonzero(np.r_[True, days[1:] != days[:-1]]) if len(days) else np.empty(0, dtype=int)
+    return np.r_[starts, len(days)]
+
+
+def build_folds(
+    data: pd.DataFrame,
+    in_sample_sessions: int,
+    out_of_sample_sessions: int,
+    step_sessions: Optional[int] = None,
+    anchored: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Split ``data`` into in-sample/out-of-sample folds on session boundaries.
+
+    Rolling folds keep a fixed in-sample length; anchored folds always start
+    at the first session. Each fold holds ``[start, stop)`` row ranges.
+    """
+
+    step_sessions = step_sessions or out_of_sample_sessions
+    days = session_labels(data)
+    bounds = session_bounds(data, days)
+    n_sessions = len(bounds) - 1
+
+    folds: List[Dict[str, Any]] = []
+    oos_start = in_sample_sessions
+    while oos_start + out_of_sample_sessions <= n_sessions:
+        is_start = 0 if anchored else oos_start - in_sample_sessions
+        oos_stop = oos_start + out_of_sample_sessions
+        folds.append({
+            "fold": len(folds),
+            "in_sample": (int(bounds[is_start]), int(bounds[oos_start])),
+            "out_of_sample": (int(bounds[oos_start]), int(bounds[oos_stop])),
+            "in_sample_sessions": [str(days[bounds[is_start]]), str(days[bounds[oos_start] - 1])],
+            "out_of_sample_sessions": [str(days[bounds[oos_start]]), str(days[bounds[oos_stop] - 1])],
+        })
+        oos_start += step_sessions
+
+    if not folds:
+        raise WalkForwardError(
+            f"Dataset has {n_sessions} sessions; at least "
+            f"{in_sample_sessions + out_of_sample_sessions} are needed for one fold"
+        )
+    return folds
+
+
+def stitch_equity(
+    curves: Sequence[Sequence[Dict[str, Any]]],
+    initial_equity: Optional[float] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Chain per-fold out-of-sample equity curves into one curve.
+
+    Every fold starts from a fresh account, so each curve is rescaled by the
+    equity the previous folds ended with. Records keep their timestamp and
+    gain a ``fold`` index.
+    """
+
+    stitched: List[Dict[str, Any]] = []
+    running = initial_equity
+    for fold, curve in enumerate(curves):
+        if not curve:
+            continue
+        equity = np.array([float(point["equity"]) for point in curve])
+        if running is None:
+            running = float(equity[0])
+        base = equity[0] if equity[0] else 1.0
+        scaled = running * equity / base
+        stitched.extend(
+            {"timestamp": point["timestamp"], "equity": float(value), "fold": fold}
+            for point, value in zip(curve, scaled)
+        )
+        running = float(scaled[-1])
+    return stitched
+
+
+def equity_summary(curve: Sequence[Dict[str, Any]]) -> Dict[str, float]:
+    """Total return and max drawdown (in percent) of a stitched equity curve."""
+
+    if not curve:
+        return {"total_return_pct": 0.0, "max_drawdown_pct": 0.0, "final_equity": 0.0}
+    equity = np.array([point["equity"] for point in curve], dtype=float)
+    peaks = np.maximum.accumulate(equity)
+    drawdown = np.where(peaks > 0, (peaks - equity) / peaks, 0.0)
+    return {
+        "total_return_pct": float((equity[-1] / equity[0] - 1.0) * 100) if equity[0] else 0.0,
+        "max_drawdown_pct": float(drawdown.max() * 100),
+        "final_equity": float(equity[-1]),
+    }
@@ -1,16 +1,73 @@
 """Optimization service that orchestrates backtest parameter sweeps."""
 
 import concurrent.futures
-from typing import Dict, Any, List, Optional, Tuple, Union
+import itertools
+import json
+import logging
+import multiprocessing
+import os
+import socket
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Callable, Dict, Any, Iterable, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
 import traceback
 
+from backend.app.config import get_settings
 from backend.app.services.backtest_service import BacktestService
 from backend.app.services.datasets import DatasetRepository, DatasetStorage
-from backend.app.services.optimization import ParameterGridError, generate_parameter_grid
+from backend.app.services.optimization import (
+    EvaluationMemo,
+    LatinHypercubeSampler,
+    OptimizationCheckpoint,
+    ParameterGridError,
+    ParameterSpace,
+    ParetoFront,
+    RandomSampler,
+    SharedFrame,
+    SharedIndicatorBatches,
+    StreamingResults,
+    TPESampler,
+    WalkForwardError,
+    attach_indicator_batches,
+    attach_shared_frame,
+    build_cv_splits,
+    build_folds,
+    count_parameter_grid,
+    equity_summary,
+    evaluation_context,
+    evaluation_key,
+    generate_parameter_grid,
+    iter_parameter_grid,
+    job_directory,
+    normalize_cross_validation_config,
+    normalize_halving_config,
+    normalize_objectives,
+    normalize_walk_forward_config,
+    overfitting_probability,
+    params_key,
+    prime_indicator_batches,
+    read_results,
+    read_scores,
+    session_bounds,
+    shared_evaluation_memo,
+    stitch_equity,
+    successive_halving_rungs,
+    sweep_indicator_batches,
+    weighted_scores,
+)
 from backend.app.tasks import JobStatus, get_job_runner
+from backend.app.tasks.backtest_runner import JobCancelledError
+from backend.app.tasks.work_queue import LEASED, WorkQueue
+from backtester.indicator_cache import get_indicator_cache
+from backtester.pruning import normalize_pruning
+from backtester.signal_cache import dataset_fingerprint, strategy_source_hash
+
+logger = logging.getLogger(__name__)
 
 SUPPORTED_METRICS = {
     "total_return",
@@ -31,6 +88,28 @@ SUPPORTED_METRICS = {
     "data_points",
 }
 
+# 'process' runs sweeps on a process pool over shared-memory market data,
+# 'thread' keeps everything in the job runner's process, 'distributed' queues
+# parameter batches for `cli.py worker` processes on any machine
+EXECUTION_MODES = ("process", "thread", "distributed")
+
+# 'grid' evaluates every combination, 'halving' prunes the grid with
+# successive halving over growing session windows, 'bayesian' samples adaptively,
+# 'random' and 'lhs' (Latin hypercube) draw a fixed budget of points up front
+SEARCH_METHODS = ("grid", "halving", "bayesian", "random", "lhs")
+GRID_SEARCH_METHODS = ("grid", "halving")
+SAMPLING_SEARCH_METHODS = ("random", "lhs")
+DEFAULT_SEARCH_TRIALS = 100
+
+# Grids are streamed lazily and results spill to disk, so the limit only
+# guards against accidental explosions of the parameter space
+MAX_COMBINATIONS = 100_000
+MAX_SEARCH_TRIALS = 10_000
+# Best entries kept in memory and returned inline with the job results
+TOP_RESULTS = 50
+# Batches a distributed sweep keeps queued ahead of the workers
+MAX_QUEUED_BATCHES = 64
+
 
 class OptimizationService:
     """Service for running parameter optimization on trading strategies."""
@@ -42,11 +121,31 @@ class OptimizationService:
         job_runner=None,
         dataset_repository: Optional[DatasetRepository] = None,
         storage: Optional[DatasetStorage] = None,
+        results_dir: Optional[Path] = None,
+        evaluation_memo: Optional[EvaluationMemo] = None,
+        work_queue: Optional[WorkQueue] = None,
     ) -> None:
+        settings = get_settings()
         self.backtest_service = backtest_service or BacktestService()
         self.job_runner = job_runner or get_job_runner()
         self.repository = dataset_repository or DatasetRepository()
         self.storage = storage or DatasetStorage()
+        self.results_dir = Path(results_dir or settings.optimization_results_dir)
+        self.checkpoint_interval = settings.optimization_checkpoint_seconds
+        if evaluation_memo is None and settings.optimization_memo_enabled:
+            evaluation_memo = shared_evaluation_memo(
+                settings.optimization_memo_path, settings.optimization_memo_max_entries
+            )
+        # Metrics of earlier backtests, keyed by strategy source, data rows, engine options and params
+        self.evaluation_memo = evaluation_memo
+        self._work_queue = work_queue
+
+    @property
+    def work_queue(self) -> WorkQueue:
+        """Queue shared with distributed workers (created on first use)."""
+        if self._work_queue is None:
+            self._work_queue = WorkQueue()
+        return self._work_queue
     
     def start_optimization_job(
         self,
@@ -56,43 +155,150 @@ class OptimizationService:
         optimization_metric: str = 'sharpe_ratio',
         engine_options: Optional[Dict[str, Any]] = None,
         max_workers: int = 2,
-        validation_split: float = 0.3
+        validation_split: float = 0.3,
+        walk_forward: Optional[Dict[str, Any]] = None,
+        execution_mode: Optional[str] = None,
+        search: str = 'grid',
+        n_trials: Optional[int] = None,
+        seed: Optional[int] = None,
+        halving: Optional[Dict[str, Any]] = None,
+        pruning: Optional[Dict[str, Any]] = None,
+        objectives: Optional[List[Union[str, Dict[str, str]]]] = None,
+        metrics_only: bool = False,
+        cross_validation: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
-        """Start a parameter optimization job"""
+        """
+        Start a parameter optimization job.
+
+        Passing ``walk_forward`` (in_sample_sessions, out_of_sample_sessions,
+        optional step_sessions and anchored) runs a walk-forward analysis
+        instead of a single train/validation split. ``execution_mode`` picks
+        the 'process', 'thread' or 'distributed' backend (default from
+        settings); 'distributed' needs at least one ``cli.py worker``.
+        ``search='bayesian'`` samples ``n_trials`` points of the parameter
+        space adaptively instead of evaluating the full grid, while
+        ``search='random'`` and ``search='lhs'`` draw ``n_trials`` distinct
+        points uniformly or as a space-filling Latin hypercube (all three
+        are reproducible with ``seed``). Points answered by the evaluation
+        memo count toward ``n_trials`` like fresh backtests, so a seeded
+        search returns the same points whatever the memo holds;
+        ``search='halving'`` ranks the grid on ``halving['min_sessions']``
+        sessions and re-runs the top ``1 / reduction_factor`` on ever longer
+        session windows up to the full training data. ``pruning``
+        (max_drawdown_pct, equity_floor, min_trades with min_trades_sessions)
+        aborts sweep backtests of hopeless parameter sets early; they are
+        recorded with status 'pruned' and the metrics of the simulated part.
+        ``objectives`` (metrics with a 'maximize'/'minimize' direction)
+        additionally tracks the Pareto front of the sweep, returned with
+        crowding distances; ``optimization_metric`` still drives the search
+        and the single best result. ``metrics_only`` skips serializing
+        equity curves, trades and indicators of sweep backtests and computes
+        only the optimization metric and objectives. ``cross_validation``
+        (n_groups, test_groups, embargo_sessions) runs combinatorial purged
+        cross-validation of the grid over session groups instead of a
+        single train/validation split.
+        """
         dataset = self.repository.get(dataset_id)
         if not dataset:
             return {'success': False, 'error': 'Dataset not found'}
 
-        try:
-            param_combinations = generate_parameter_grid(param_ranges)
-        except ParameterGridError as exc:
-            return {'success': False, 'error': str(exc)}
+        if search not in SEARCH_METHODS:
+            return {'success': False, 'error': f"Unsupported search method '{search}'"}
+
+        if search != 'grid' and walk_forward is not None:
+            return {'success': False, 'error': 'Walk-forward analysis only supports grid search'}
+
+        if cross_validation is not None:
+            if search != 'grid' or walk_forward is not None or objectives is not None:
+                return {
+                    'success': False,
+                    'error': 'Cross-validation only supports a single-objective grid search',
+                }
+            try:
+                cross_validation = normalize_cross_validation_config(cross_validation)
+            except WalkForwardError as exc:
+                return {'success': False, 'error': str(exc)}
+
+        if objectives is not None:
+            if walk_forward is not None:
+                return {'success': False, 'error': 'Walk-forward analysis does not support multiple objectives'}
+            try:
+                objectives = normalize_objectives(objectives, SUPPORTED_METRICS)
+            except ParameterGridError as exc:
+                return {'success': False, 'error': str(exc)}
+
+        if search == 'halving':
+            try:
+                halving = normalize_halving_config(halving)
+            except ParameterGridError as exc:
+                return {'success': False, 'error': str(exc)}
 
-        if not param_combinations:
-            return {'success': False, 'error': 'No parameter combinations generated'}
+        if search in GRID_SEARCH_METHODS:
+            try:
+                total = count_parameter_grid(param_ranges)
+            except ParameterGridError as exc:
+                return {'success': False, 'error': str(exc)}
+
+            if not total:
+                return {'success': False, 'error': 'No parameter combinations generated'}
+
+            if total > MAX_COMBINATIONS:
+                return {
+                    'success': False,
+                    'error': f'Too many combinations ({total}). Maximum allowed is {MAX_COMBINATIONS}.',
+                }
+        else:
+            try:
+                space = ParameterSpace(param_ranges)
+            except ParameterGridError as exc:
+                return {'success': False, 'error': str(exc)}
+            n_trials = DEFAULT_SEARCH_TRIALS if n_trials is None else int(n_trials)
+            if n_trials < 1 or n_trials > MAX_SEARCH_TRIALS:
+                return {'success': False, 'error': f'n_trials must be between 1 and {MAX_SEARCH_TRIALS}'}
+            total = min(n_trials, space.size)
 
-        if len(param_combinations) > 1000:
+        if optimization_metric not in SUPPORTED_METRICS:
             return {
                 'success': False,
-                'error': f'Too many combinations ({len(param_combinations)}). Maximum allowed is 1000.',
+                'error': f"Unsupported optimization metric '{optimization_metric}'",
             }
 
-        if optimization_metric not in SUPPORTED_METRICS:
+        if execution_mode is not None and execution_mode not in EXECUTION_MODES:
             return {
                 'success': False,
-                'error': f"Unsupported optimization metric '{optimization_metric}'",
+                'error': f"Unsupported execution mode '{execution_mode}'",
             }
 
+        if walk_forward is not None:
+            try:
+                walk_forward = normalize_walk_forward_config(walk_forward)
+            except WalkForwardError as exc:
+                return {'success': False, 'error': str(exc)}
+
+        try:
+            pruning = normalize_pruning(pruning)
+        except ValueError as exc:
+            return {'success': False, 'error': str(exc)}
+
         job_data = {
             'strategy_path': strategy_path,
             'dataset_id': dataset_id,
             'param_ranges': param_ranges,
-            'param_combinations': param_combinations,
             'optimization_metric': optimization_metric,
             'engine_options': engine_options or {},
             'max_workers': max_workers,
             'validation_split': validation_split,
-            'total_combinations': len(param_combinations)
+            'walk_forward': walk_forward,
+            'execution_mode': execution_mode,
+            'search': search,
+            'n_trials': None if search in GRID_SEARCH_METHODS else total,
+            'seed': seed,
+            'halving': halving if search == 'halving' else None,
+            'pruning': pruning,
+            'objectives': objectives,
+            'metrics_only': bool(metrics_only),
+            'cross_validation': cross_validation,
+            'total_combinations': total
         }
 
         job_id = self.job_runner.submit_job(
@@ -101,7 +307,6 @@ class OptimizationService:
             progress_callback=self._optimization_progress_callback
         )
 
-        total = len(param_combinations)
         return {
             'success': True,
             'job_id': job_id,
@@ -109,15 +314,25 @@ class OptimizationService:
             'estimated_time_minutes': self._estimate_optimization_time(total)
         }
     
-    def run_optimization(self, job_data: Dict[str, Any], progress_callback=None) -> Dict[str, Any]:
-        """Run the actual optimization process"""
+    def run_optimization(
+        self,
+        job_data: Dict[str, Any],
+        progress_callback=None,
+        job_id: Optional[str] = None,
+        cancel_requested: Optional[Callable[[], bool]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run the actual optimization process.
+
+        With a ``job_id`` the results live in that job's directory and a
+        checkpoint is written every ``checkpoint_interval`` seconds; running
+        the same job again resumes after the combinations already stored.
+        ``cancel_requested`` is polled while distributed sweeps wait for
+        workers; cancellation raises ``JobCancelledError``.
+        """
         try:
-            strategy_path = job_data['strategy_path']
             dataset_id = job_data['dataset_id']
-            param_combinations = job_data['param_combinations']
             optimization_metric = job_data['optimization_metric']
-            engine_options = job_data.get('engine_options') or {}
-            max_workers = max(1, int(job_data.get('max_workers', 1)))
             validation_split = job_data.get('validation_split', 0.0)
             
             dataset = self.repository.get(dataset_id)
@@ -126,106 +341,113 @@ class OptimizationService:
 
             self.repository.touch_last_accessed(dataset)
             data = self.storage.load_dataframe(dataset.file_path)
-            train_data, validation_data = self._split_data(data, validation_split)
-            
-            # Track results
-            results = []
-            best_result = None
-            completed = 0
-            
-            # Run optimization with parallel processing
-            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-                # Submit all jobs
-                future_to_params = {}
-                for i, params in enumerate(param_combinations):
-                    future = executor.submit(
-                        self._run_single_backtest,
-                        strategy_path,
-                        train_data,
-                        params,
-                        engine_options,
-                    )
-                    future_to_params[future] = params
-                
-                # Collect results as they complete
-                for future in concurrent.futures.as_completed(future_to_params):
-                    params = future_to_params[future]
-                    completed += 1
-                    
-                    try:
-                        backtest_result = future.result()
-                        if backtest_result['success']:
-                            metrics = backtest_result['result']['metrics']
-                            metric_value = metrics.get(optimization_metric, 0)
-                            
-                            result_entry = {
-                                'parameters': params,
-                                'metrics': metrics,
-                                'optimization_score': float(metric_value),
-                                'status': 'completed'
-                            }
-                            
-                            results.append(result_entry)
-                            
-                            # Track best result
-                            if best_result is None or metric_value > best_result['optimization_score']:
-                                best_result = result_entry.copy()
-                        else:
-                            results.append({
-                                'parameters': params,
-                                'metrics': {},
-                                'optimization_score': -float('inf'),
-                                'status': 'failed',
-                                'error': backtest_result.get('error', 'Unknown error')
-                            })
-                    
-                    except Exception as e:
-                        results.append({
-                            'parameters': params,
-                            'metrics': {},
-                            'optimization_score': -float('inf'),
-                            'status': 'error',
-                            'error': str(e)
-                        })
-                    
-                    # Update progress
-                    if progress_callback:
-                        progress_callback(completed, len(param_combinations))
-            
-            # Validate best parameters on out-of-sample data
-            validation_result = None
-            if best_result and not validation_data.empty:
-                validation_backtest = self._run_single_backtest(
-                    strategy_path,
-                    validation_data,
-                    best_result['parameters'],
-                    engine_options,
+            execution_mode = job_data.get('execution_mode') or get_settings().optimization_execution_mode
+            if execution_mode not in EXECUTION_MODES:
+                raise ValueError(f"Unsupported execution mode '{execution_mode}'")
+
+            if job_data.get('walk_forward'):
+                return self._run_walk_forward(
+                    data, job_data, execution_mode, progress_callback, job_id, cancel_requested
                 )
-                
-                if validation_backtest['success']:
-                    validation_result = validation_backtest['result']['metrics']
-            
-            # Sort results by optimization score
-            results.sort(key=lambda x: x['optimization_score'], reverse=True)
-            
+
+            if job_data.get('cross_validation'):
+                return self._run_cross_validation(
+                    data, job_data, execution_mode, progress_callback, job_id, cancel_requested
+                )
+
+            # Train and validation windows are row ranges of ``data``, never copies
+            split_index = _split_index(len(data), validation_split)
+
+            search = job_data.get('search') or 'grid'
+            total = int(job_data.get('total_combinations') or 0)
+            if not total and search in GRID_SEARCH_METHODS:
+                total = _grid_size(job_data)
+            schedule = None
+            if search == 'halving':
+                schedule = self._halving_schedule(job_data, data.iloc[:split_index])
+                total = sum(rung['candidates'] for rung in schedule)
+
+            checkpoint = None
+            if job_id is not None:
+                checkpoint = OptimizationCheckpoint(job_directory(self.results_dir, job_id))
+                checkpoint.create(job_data)
+                directory = checkpoint.directory
+            else:
+                directory = self.results_dir / uuid.uuid4().hex
+
+            # Every entry is written to disk; only the best TOP_RESULTS stay in memory
+            objectives = job_data.get('objectives')
+            front = ParetoFront(objectives) if objectives else None
+            results = StreamingResults(directory, key=_rank_key, top_k=TOP_RESULTS, front=front)
+            search_state: Dict[str, Any] = {}
+            if checkpoint is not None:
+                search_state['done'] = results.restore()
+                search_state['rng_state'] = checkpoint.state.get('rng_state')
+            try:
+                with self._sweep_executor(data, job_data, execution_mode, job_id, cancel_requested) as executor:
+                    entries = self._search_entries(
+                        executor, job_data, (0, split_index), schedule, search_state
+                    )
+                    last_checkpoint = time.monotonic()
+                    for result_entry in entries:
+                        results.add(result_entry)
+
+                        # Update progress
+                        if progress_callback:
+                            progress_callback(results.total, total)
+
+                        if checkpoint is not None and time.monotonic() - last_checkpoint >= self.checkpoint_interval:
+                            self._save_checkpoint(checkpoint, results, search_state)
+                            last_checkpoint = time.monotonic()
+
+                    top_results = results.top.sorted()
+                    best_result = top_results[0] if top_results else None
+
+                    # Validate best parameters on out-of-sample data (never pruned)
+                    validation_result = None
+                    if best_result and split_index < len(data):
+                        validation_rows = (split_index, len(data))
+                        for entry in executor.run([best_result['parameters']], validation_rows, prune=False):
+                            if entry['status'] == 'completed':
+                                validation_result = entry['metrics']
+                    cache_stats = executor.cache_stats()
+            finally:
+                results.close()
+                if self.evaluation_memo is not None:
+                    self.evaluation_memo.prune()
+
             # Generate optimization analysis
-            analysis = self._analyze_optimization_results(results, optimization_metric)
+            analysis = self._score_analysis(read_scores(results.directory), top_results)
+            if checkpoint is not None:
+                checkpoint.complete()
             
             return {
                 'success': True,
                 'optimization_metric': optimization_metric,
-                'total_combinations': len(param_combinations),
-                'successful_runs': len([r for r in results if r['status'] == 'completed']),
-                'failed_runs': len([r for r in results if r['status'] != 'completed']),
+                'execution_mode': execution_mode,
+                'search': search,
+                'fidelity_schedule': schedule,
+                'total_combinations': results.total,
+                'successful_runs': results.completed,
+                'failed_runs': results.failed,
+                'pruned_runs': results.pruned,
                 'best_parameters': best_result['parameters'] if best_result else None,
                 'best_score': best_result['optimization_score'] if best_result else None,
                 'best_metrics': best_result['metrics'] if best_result else None,
                 'validation_metrics': validation_result,
-                'all_results': results[:50],  # Limit to top 50 results
+                'all_results': top_results,  # Top results; page through results_file for the rest
+                'results_file': str(results.directory),
                 'analysis': analysis,
-                'parameter_sensitivity': self._analyze_parameter_sensitivity(results)
+                'parameter_sensitivity': results.sensitivity.result(),
+                'objectives': objectives,
+                'metrics_only': bool(job_data.get('metrics_only')),
+                'pareto_front': front.result() if front is not None else None,
+                'evaluation_cache': cache_stats,
+                'resumed_from': len(search_state.get('done') or []),
             }
         
+        except JobCancelledError:
+            raise
         except Exception as e:
             return {
                 'success': False,
@@ -233,6 +455,442 @@ class OptimizationService:
                 'traceback': traceback.format_exc()
             }
     
+    def _sweep(
+        self,
+        strategy_path: str,
+        data: pd.DataFrame,
+        rows: Tuple[int, int],
+        param_combinations: List[Dict[str, Any]],
+        optimization_metric: str,
+        engine_options: Dict[str, Any],
+        max_workers: int,
+        execution_mode: str,
+    ) -> Iterator[Dict[str, Any]]:
+        """Backtest every combination on ``data[rows]``, yielding result entries as they finish."""
+        with _SweepExecutor(
+            self, strategy_path, data, optimization_metric, engine_options, max_workers, execution_mode
+        ) as executor:
+            yield from executor.run(param_combinations, rows)
+
+    def _search_entries(
+        self,
+        executor: "_SweepExecutor",
+        job_data: Dict[str, Any],
+        rows: Tuple[int, int],
+        schedule: Optional[List[Dict[str, int]]] = None,
+        search_state: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Result entries of the job's search strategy, in completion order.
+
+        ``search_state['done']`` holds entries restored from a checkpoint;
+        they are not evaluated or yielded again but still drive halving
+        survivors and the Bayesian sampler, and are never re-drawn by the
+        random samplers. The sampler is published as
+        ``search_state['sampler']`` so its RNG state can be checkpointed.
+        """
+        search_state = search_state if search_state is not None else {}
+        done = search_state.get('done') or []
+        search = job_data.get('search') or 'grid'
+        if search == 'grid':
+            combinations = _parameter_grid(job_data)
+            if done:
+                done_keys = {params_key(e['parameters']) for e in done}
+                combinations = (p for p in combinations if params_key(p) not in done_keys)
+            yield from executor.run(combinations, rows)
+            return
+
+        if search == 'halving':
+            candidates = list(_parameter_grid(job_data))
+            for rung in schedule:
+                restored = {
+                    params_key(e['parameters']): e for e in done if e.get('rung') == rung['rung']
+                }
+                rung_entries = []
+                pending = []
+                for params in candidates[:rung['candidates']]:
+                    entry = restored.get(params_key(params))
+                    if entry is None:
+                        pending.append(params)
+                    else:
+                        rung_entries.append(entry)
+                rung_rows = (rows[0], rows[0] + rung['bars'])
+                for entry in executor.run(pending, rung_rows):
+                    entry['rung'] = rung['rung']
+                    entry['sessions'] = rung['sessions']
+                    rung_entries.append(entry)
+                    yield entry
+                survivors = sorted(
+                    (e for e in rung_entries if e['status'] == 'completed'),
+                    key=lambda e: e['optimization_score'],
+                    reverse=True,
+                )
+                candidates = [e['parameters'] for e in survivors]
+                if not candidates:
+                    return
+            return
+
+        space = ParameterSpace(job_data['param_ranges'])
+        n_trials = min(int(job_data['n_trials']), space.size)
+        if search in SAMPLING_SEARCH_METHODS:
+            if search == 'lhs':
+                sampler = LatinHypercubeSampler(space, n_trials, seed=job_data.get('seed'))
+            else:
+                sampler = RandomSampler(space, seed=job_data.get('seed'))
+            for entry in done:
+                sampler.exclude(entry['parameters'])
+            if search_state.get('rng_state'):
+                sampler.rng.bit_generator.state = search_state['rng_state']
+            search_state['sampler'] = sampler
+            # Nothing to learn between points, so the whole budget streams into the pool.
+            # Memo hits are part of the budget: the same seed always yields the same points.
+            yield from executor.run(sampler.sample(n_trials - len(done)), rows)
+            return
+
+        sampler = TPESampler(space, seed=job_data.get('seed'))
+        for entry in done:
+            sampler.tell(entry['parameters'], entry['optimization_score'] if entry['status'] == 'completed' else None)
+        if search_state.get('rng_state'):
+            sampler.rng.bit_generator.state = search_state['rng_state']
+        search_state['sampler'] = sampler
+        # One suggestion per worker keeps the pool busy; smaller batches learn faster
+        batch_size = max(1, executor.max_workers)
+        evaluated = len(done)
+        while evaluated < n_trials:
+            batch = sampler.ask(min(batch_size, n_trials - evaluated))
+            if not batch:
+                break
+            for entry in executor.run(batch, rows):
+                score = entry['optimization_score'] if entry['status'] == 'completed' else None
+                sampler.tell(entry['parameters'], score)
+                evaluated += 1
+                yield entry
+
+    @staticmethod
+    def _save_checkpoint(
+        checkpoint: OptimizationCheckpoint,
+        results: StreamingResults,
+        search_state: Dict[str, Any],
+    ) -> None:
+        """Flush buffered entries, then record the search state that goes with them."""
+        results.flush()
+        top = results.top.sorted()
+        sampler = search_state.get('sampler')
+        checkpoint.save_state({
+            'completed': results.total,
+            'best_parameters': top[0]['parameters'] if top else None,
+            'best_score': top[0]['optimization_score'] if top else None,
+            'rng_state': sampler.rng.bit_generator.state if sampler is not None else None,
+        })
+
+    def _halving_schedule(self, job_data: Dict[str, Any], train_data: pd.DataFrame) -> List[Dict[str, int]]:
+        """Successive-halving rungs for ``train_data``, with the bar count of every rung."""
+        config = normalize_halving_config(job_data.get('halving'))
+        bounds = session_bounds(train_data)
+        rungs = successive_halving_rungs(
+            _grid_size(job_data),
+            len(bounds) - 1,
+            config['min_sessions'],
+            config['reduction_factor'],
+        )
+        for rung in rungs:
+            rung['bars'] = int(bounds[rung['sessions']])
+        return rungs
+
+    def _sweep_executor(
+        self,
+        data: pd.DataFrame,
+        job_data: Dict[str, Any],
+        execution_mode: str,
+        job_id: Optional[str] = None,
+        cancel_requested: Optional[Callable[[], bool]] = None,
+    ) -> "_SweepExecutor":
+        """Executor for the sweeps of one job, on the backend its ``execution_mode`` selects."""
+        sweep_args = (
+            self,
+            job_data['strategy_path'],
+            data,
+            job_data['optimization_metric'],
+            job_data.get('engine_options') or {},
+            max(1, int(job_data.get('max_workers', 1))),
+            execution_mode,
+        )
+        sweep_kwargs = {
+            'pruning': job_data.get('pruning'),
+            'metrics': _job_metrics(job_data),
+            'metrics_only': bool(job_data.get('metrics_only')),
+            'param_ranges': job_data.get('param_ranges'),
+        }
+        if execution_mode == 'distributed':
+            return _DistributedExecutor(
+                *sweep_args,
+                **sweep_kwargs,
+                dataset_id=job_data['dataset_id'],
+                run_id=job_id,
+                cancel_requested=cancel_requested,
+            )
+        return _SweepExecutor(*sweep_args, **sweep_kwargs)
+
+    def _run_cross_validation(
+        self,
+        data: pd.DataFrame,
+        job_data: Dict[str, Any],
+        execution_mode: str,
+        progress_callback=None,
+        job_id: Optional[str] = None,
+        cancel_requested: Optional[Callable[[], bool]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Combinatorial purged cross-validation of the parameter grid.
+
+        Every parameter set is backtested once on every distinct training
+        segment and test group of all splits; these evaluations are
+        scheduled together on the sweep executor. A split's train (test)
+        score is the bar-weighted mean over its training segments (test
+        groups); its winner is the best set on the training score.
+        """
+        config = normalize_cross_validation_config(job_data['cross_validation'])
+        param_combinations = list(_parameter_grid(job_data))
+        optimization_metric = job_data['optimization_metric']
+        groups, splits = build_cv_splits(data, **config)
+        segments = sorted({rows for split in splits for rows in split['train'] + split['test']})
+        column = {rows: j for j, rows in enumerate(segments)}
+        row_of = {params_key(params): i for i, params in enumerate(param_combinations)}
+
+        # NaN marks failed evaluations; a set failing on any segment of a split is skipped there
+        scores = np.full((len(param_combinations), len(segments)), np.nan)
+        total = len(param_combinations) * len(segments)
+        done = 0
+        failed = 0
+        tasks = ((params, rows) for rows in segments for params in param_combinations)
+        cv_job = {**job_data, 'pruning': None}
+        with self._sweep_executor(data, cv_job, execution_mode, job_id, cancel_requested) as executor:
+            for rows, entry in executor.run_windows(tasks):
+                if entry['status'] == 'completed':
+                    scores[row_of[params_key(entry['parameters'])], column[rows]] = entry['optimization_score']
+                else:
+                    failed += 1
+                done += 1
+                if progress_callback:
+                    progress_callback(done, total)
+            cache_stats = executor.cache_stats()
+
+        split_results = []
+        relative_ranks = []
+        for split in splits:
+            train = weighted_scores(scores, segments, [column[rows] for rows in split['train']])
+            test = weighted_scores(scores, segments, [column[rows] for rows in split['test']])
+            result = {
+                'split': split['split'],
+                'test_groups': split['test_groups'],
+                'train_sessions': split['train_sessions'],
+                'embargoed_sessions': split['embargoed_sessions'],
+                'status': 'failed',
+                'best_parameters': None,
+                'train_score': None,
+                'test_score': None,
+            }
+            split_results.append(result)
+            valid = np.isfinite(train) & np.isfinite(test)
+            if not valid.any():
+                continue
+            best = int(np.argmax(np.where(valid, train, -np.inf)))
+            # Out-of-sample rank of the winner among all evaluated sets, scaled into (0, 1)
+            rank = int(np.sum(test[valid] < test[best])) + 1
+            relative_ranks.append(rank / (int(valid.sum()) + 1))
+            result.update(
+                status='completed',
+                best_parameters=param_combinations[best],
+                train_score=float(train[best]),
+                test_score=float(test[best]),
+                test_rank=rank,
+            )
+
+        completed = [r for r in split_results if r['status'] == 'completed']
+        train_scores = [r['train_score'] for r in completed]
+        test_scores = [r['test_score'] for r in completed]
+        # Whole-period score of every set: all groups, weighted by their bars
+        overall = weighted_scores(scores, segments, [column[group['rows']] for group in groups])
+        best_overall = int(np.nanargmax(overall)) if np.isfinite(overall).any() else None
+
+        stability: Dict[str, int] = {}
+        for r in completed:
+            key = json.dumps(r['best_parameters'], sort_keys=True, default=str)
+            stability[key] = stability.get(key, 0) + 1
+
+        return {
+            'success': True,
+            'mode': 'cross_validation',
+            'optimization_metric': optimization_metric,
+            'execution_mode': execution_mode,
+            'cross_validation': config,
+            'total_combinations': len(param_combinations),
+            'total_evaluations': total,
+            'failed_evaluations': failed,
+            'groups': groups,
+            'total_splits': len(split_results),
+            'successful_splits': len(completed),
+            'best_parameters': param_combinations[best_overall] if best_overall is not None else None,
+            'best_score': float(overall[best_overall]) if best_overall is not None else None,
+            'splits': split_results,
+            'cv_summary': {
+                'mean_train_score': float(np.mean(train_scores)) if train_scores else None,
+                'mean_test_score': float(np.mean(test_scores)) if test_scores else None,
+                'std_test_score': float(np.std(test_scores)) if test_scores else None,
+                'overfitting_probability': overfitting_probability(relative_ranks),
+            },
+            'parameter_stability': stability,
+            'evaluation_cache': cache_stats,
+        }
+
+    def _run_walk_forward(
+        self,
+        data: pd.DataFrame,
+        job_data: Dict[str, Any],
+        execution_mode: str,
+        progress_callback=None,
+        job_id: Optional[str] = None,
+        cancel_requested: Optional[Callable[[], bool]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Optimize every in-sample window and evaluate the winner out-of-sample.
+
+        The in-sample evaluations of all folds (fold x parameter set) are
+        scheduled together on the sweep executor, as in cross-validation,
+        so the pool stays busy however few folds there are; they honor the
+        job's pruning rules, ``metrics_only`` and the evaluation memo. A
+        fold's winner is its best completed set (the first in grid order on
+        ties); its out-of-sample run needs the equity curve and runs in full.
+        """
+        config = normalize_walk_forward_config(job_data['walk_forward'])
+        param_combinations = list(_parameter_grid(job_data))
+        optimization_metric = job_data['optimization_metric']
+        folds = build_folds(data, **config)
+        order = {params_key(params): i for i, params in enumerate(param_combinations)}
+
+        best: Dict[Tuple[int, int], Tuple[Tuple[float, int], Dict[str, Any]]] = {}
+        failures = {fold['in_sample']: 0 for fold in folds}
+        pruned = {fold['in_sample']: 0 for fold in folds}
+        total = len(param_combinations) * len(folds) + len(folds)
+        done = 0
+        tasks = ((params, fold['in_sample']) for fold in folds for params in param_combinations)
+        with self._sweep_executor(data, job_data, execution_mode, job_id, cancel_requested) as executor:
+            for rows, entry in executor.run_windows(tasks):
+                done += 1
+                if progress_callback:
+                    progress_callback(done, total)
+                if entry['status'] == 'pruned':
+                    pruned[rows] += 1
+                    continue
+                if entry['status'] != 'completed':
+                    failures[rows] += 1
+                    continue
+                rank = (entry['optimization_score'], -order[params_key(entry['parameters'])])
+                if rows not in best or rank > best[rows][0]:
+                    best[rows] = (rank, entry)
+            cache_stats = executor.cache_stats()
+
+        fold_results = []
+        for fold in folds:
+            rows = fold['in_sample']
+            result = {
+                'fold': fold['fold'],
+                'in_sample_sessions': fold['in_sample_sessions'],
+                'out_of_sample_sessions': fold['out_of_sample_sessions'],
+                'in_sample_bars': rows[1] - rows[0],
+                'out_of_sample_bars': fold['out_of_sample'][1] - fold['out_of_sample'][0],
+                'status': 'failed',
+                'best_parameters': None,
+                'in_sample_score': None,
+                'in_sample_metrics': {},
+                'in_sample_failures': failures[rows],
+                'in_sample_pruned': pruned[rows],
+                'out_of_sample_score': None,
+                'out_of_sample_metrics': {},
+                'oos_equity_curve': [],
+            }
+            fold_results.append(result)
+            if rows in best:
+                winner = best[rows][1]
+                result.update(
+                    best_parameters=winner['parameters'],
+                    in_sample_score=winner['optimization_score'],
+                    in_sample_metrics=winner['metrics'],
+                )
+                self._run_out_of_sample(data, job_data, fold, result)
+            else:
+                result['error'] = 'No successful in-sample runs'
+            done += 1
+            if progress_callback:
+                progress_callback(done, total)
+
+        completed = [r for r in fold_results if r['status'] == 'completed']
+        oos_curve = stitch_equity([r.pop('oos_equity_curve') for r in fold_results])
+        summary = equity_summary(oos_curve)
+        summary['total_trades'] = int(sum(
+            r['out_of_sample_metrics'].get('total_trades', 0) for r in completed
+        ))
+        is_scores = [r['in_sample_score'] for r in completed]
+        oos_scores = [r['out_of_sample_score'] for r in completed]
+        mean_is = float(np.mean(is_scores)) if is_scores else 0.0
+        summary['mean_in_sample_score'] = mean_is
+        summary['mean_out_of_sample_score'] = float(np.mean(oos_scores)) if oos_scores else 0.0
+        summary['walk_forward_efficiency'] = (
+            summary['mean_out_of_sample_score'] / mean_is if mean_is else None
+        )
+
+        stability: Dict[str, int] = {}
+        for r in completed:
+            key = json.dumps(r['best_parameters'], sort_keys=True, default=str)
+            stability[key] = stability.get(key, 0) + 1
+
+        return {
+            'success': True,
+            'mode': 'walk_forward',
+            'optimization_metric': optimization_metric,
+            'walk_forward': config,
+            'total_combinations': len(param_combinations),
+            'total_folds': len(fold_results),
+            'successful_folds': len(completed),
+            # The latest window's winner is the set that would be traded next
+            'best_parameters': completed[-1]['best_parameters'] if completed else None,
+            'folds': fold_results,
+            'oos_equity_curve': oos_curve,
+            'oos_summary': summary,
+            'parameter_stability': stability,
+            'evaluation_cache': cache_stats,
+        }
+
+    def _run_out_of_sample(
+        self,
+        data: pd.DataFrame,
+        job_data: Dict[str, Any],
+        fold: Dict[str, Any],
+        result: Dict[str, Any],
+    ) -> None:
+        """Backtest ``result['best_parameters']`` on the fold's out-of-sample rows into ``result``."""
+        start, stop = fold['out_of_sample']
+        try:
+            backtest = self.backtest_service.run_backtest(
+                data=data.iloc[start:stop],
+                strategy=job_data['strategy_path'],
+                strategy_params=result['best_parameters'],
+                engine_options=job_data.get('engine_options') or {},
+            )
+        except Exception as exc:
+            result['error'] = str(exc)
+            return
+        if not backtest.get('success'):
+            result['error'] = backtest.get('error', 'Out-of-sample backtest failed')
+            return
+
+        metrics = _backtest_metrics(backtest)
+        result['out_of_sample_metrics'] = metrics
+        result['out_of_sample_score'] = float(metrics.get(job_data['optimization_metric'], 0) or 0)
+        nested = backtest.get('result') if isinstance(backtest.get('result'), dict) else backtest
+        result['oos_equity_curve'] = nested.get('equity_curve') or []
+        result['status'] = 'completed'
+
     def get_optimization_results(self, job_id: str) -> Dict[str, Any]:
         """Get optimization results for a job"""
         job = self.job_runner.get_job_status(job_id)
@@ -254,6 +912,47 @@ class OptimizationService:
             'results': results
         }
 
+    def get_optimization_result_page(
+        self,
+        job_id: str,
+        offset: int = 0,
+        limit: int = 100,
+        sort: str = 'score',
+    ) -> Dict[str, Any]:
+        """Page through every result of a completed job (sorted by score or in completion order)."""
+        response = self.get_optimization_results(job_id)
+        if not response['success']:
+            return response
+
+        results_file = (response['results'] or {}).get('results_file')
+        if not results_file or not Path(results_file).exists():
+            return {'success': False, 'error': 'Full results are not available for this job'}
+        if sort not in ('score', 'completion'):
+            return {'success': False, 'error': f"Unsupported sort '{sort}'"}
+
+        page = read_results(results_file, offset=max(0, offset), limit=max(0, limit), sort_by_score=sort == 'score')
+        return {'success': True, 'job_id': job_id, 'sort': sort, **page}
+
+    def create_checkpoint(self, job_id: str, job_data: Dict[str, Any]) -> None:
+        """Record ``job_data`` so the job can be resumed even if it never starts before a restart."""
+        # Walk-forward and cross-validation jobs are not resumable and would never complete one
+        if not (job_data.get('walk_forward') or job_data.get('cross_validation')):
+            OptimizationCheckpoint(job_directory(self.results_dir, job_id)).create(job_data)
+
+    def load_checkpoint(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Payload of an unfinished job's checkpoint, or None."""
+        return OptimizationCheckpoint(job_directory(self.results_dir, job_id)).job_data
+
+    def discard_checkpoint(self, job_id: str) -> None:
+        OptimizationCheckpoint(job_directory(self.results_dir, job_id)).complete()
+
+    def _strategy_hash(self, strategy_path: str) -> Optional[str]:
+        """Source hash of the strategy class hierarchy, or None when it cannot be loaded here."""
+        try:
+            return strategy_source_hash(self.backtest_service.load_strategy(strategy_path))
+        except Exception:
+            return None
+
     # Backwards compatibility for existing tests/utilities
     def _generate_parameter_combinations(self, param_ranges: Dict[str, Union[List, Dict]]) -> List[Dict[str, Any]]:
         return generate_parameter_grid(param_ranges)
@@ -263,7 +962,7 @@ class OptimizationService:
         if validation_split <= 0 or validation_split >= 1:
             return data, pd.DataFrame()
         
-        split_index = int(len(data) * (1 - validation_split))
+        split_index = _split_index(len(data), validation_split)
         train_data = data.iloc[:split_index].copy()
         validation_data = data.iloc[split_index:].copy()
         
@@ -274,15 +973,17 @@ class OptimizationService:
         strategy_path: str,
         data: pd.DataFrame,
         params: Dict[str, Any],
-        engine_options: Dict[str, Any]
+        engine_options: Dict[str, Any],
+        metrics: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
-        """Run a single backtest with given parameters"""
+        """Run a single backtest with given parameters (only ``metrics`` when given)"""
         try:
             return self.backtest_service.run_backtest(
                 data=data,
                 strategy=strategy_path,
                 strategy_params=params,
                 engine_options=engine_options,
+                **_metrics_only_kwargs(metrics),
             )
         except Exception as e:
             return {
@@ -294,11 +995,13 @@ class OptimizationService:
     def _analyze_optimization_results(self, results: List[Dict], optimization_metric: str) -> Dict[str, Any]:
         """Analyze optimization results to extract insights"""
         successful_results = [r for r in results if r['status'] == 'completed']
-        
-        if len(successful_results) == 0:
-            return {'error': 'No successful optimization runs'}
-        
         scores = [r['optimization_score'] for r in successful_results]
+        return self._score_analysis(scores, successful_results)
+
+    def _score_analysis(self, scores, top_results: List[Dict]) -> Dict[str, Any]:
+        """Score statistics and distribution of successful runs, with the best ten results."""
+        if len(scores) == 0:
+            return {'error': 'No successful optimization runs'}
         
         analysis = {
             'score_statistics': {
@@ -310,7 +1013,7 @@ class OptimizationService:
                 'q25': float(np.percentile(scores, 25)),
                 'q75': float(np.percentile(scores, 75))
             },
-            'top_10_results': successful_results[:10],
+            'top_10_results': top_results[:10],
             'performance_distribution': self._create_performance_distribution(scores)
         }
         
@@ -392,6 +1095,693 @@ class OptimizationService:
         }
 
 
+def _backtest_metrics(backtest_result: Dict[str, Any]) -> Dict[str, Any]:
+    """Metrics dict of a ``BacktestService.run_backtest`` response."""
+    nested = backtest_result.get('result')
+    if isinstance(nested, dict) and 'metrics' in nested:
+        return nested['metrics']
+    return backtest_result['metrics']
+
+
+def _split_index(n_rows: int, validation_split: float) -> int:
+    """First validation row when the last ``validation_split`` of ``n_rows`` is held out."""
+    if validation_split <= 0 or validation_split >= 1:
+        return n_rows
+    return int(n_rows * (1 - validation_split))
+
+
+def _job_metrics(job_data: Dict[str, Any]) -> List[str]:
+    """Metrics a job scores and ranks by: its optimization metric and objectives."""
+    metrics = {job_data['optimization_metric']}
+    metrics.update(o['metric'] for o in job_data.get('objectives') or [])
+    return sorted(metrics)
+
+
+def _metrics_only_kwargs(metrics: Optional[List[str]]) -> Dict[str, Any]:
+    """Extra ``run_backtest`` arguments for a metrics-only run of ``metrics`` (none for a full run)."""
+    return {'metrics_only': True, 'metrics': metrics} if metrics is not None else {}
+
+
+def _parameter_grid(job_data: Dict[str, Any]) -> Iterable[Dict[str, Any]]:
+    """Explicit ``param_combinations`` of a job, or its grid expanded lazily."""
+    combinations = job_data.get('param_combinations')
+    if combinations is not None:
+        return combinations
+    return iter_parameter_grid(job_data['param_ranges'])
+
+
+def _grid_size(job_data: Dict[str, Any]) -> int:
+    combinations = job_data.get('param_combinations')
+    if combinations is not None:
+        return len(combinations)
+    return count_parameter_grid(job_data['param_ranges'])
+
+
+def _rank_key(entry: Dict[str, Any]) -> Tuple[int, float]:
+    """Sort key for result entries: higher fidelity rungs first, then score."""
+    return entry.get('rung', 0), entry['optimization_score']
+
+
+def _error_entry(params: Dict[str, Any], status: str, error: str) -> Dict[str, Any]:
+    return {
+        'parameters': params,
+        'metrics': {},
+        'optimization_score': -float('inf'),
+        'status': status,
+        'error': error,
+    }
+
+
+def _result_entry(params: Dict[str, Any], backtest_result: Dict[str, Any], optimization_metric: str) -> Dict[str, Any]:
+    """
+    Compact sweep entry (parameters, metrics, score) for one backtest response.
+
+    A backtest aborted by pruning rules keeps the metrics of its simulated
+    part but scores as -inf, so it never ranks above a completed run.
+    """
+    if not backtest_result.get('success'):
+        return _error_entry(params, 'failed', backtest_result.get('error', 'Unknown error'))
+    metrics = _backtest_metrics(backtest_result)
+    pruned = backtest_result.get('pruned')
+    if pruned:
+        return {
+            'parameters': params,
+            'metrics': metrics,
+            'optimization_score': -float('inf'),
+            'status': 'pruned',
+            'pruned': pruned['reason'],
+        }
+    return {
+        'parameters': params,
+        'metrics': metrics,
+        'optimization_score': float(metrics.get(optimization_metric, 0)),
+        'status': 'completed',
+    }
+
+
+# Per-process state of pool workers: the attached market data and a backtest service
+_WORKER_STATE: Dict[str, Any] = {}
+
+
+def _init_pool_worker(descriptor: Dict[str, Any]) -> None:
+    data, handle = attach_shared_frame(descriptor)
+    _WORKER_STATE.update(data=data, handle=handle, service=BacktestService())
+
+
+def _process_pool(max_workers: int, shared: SharedFrame) -> concurrent.futures.ProcessPoolExecutor:
+    """
+    Process pool whose workers attach to ``shared`` once at start-up.
+
+    Signal generation and the exit loop hold the GIL, so sweeps scale with
+    processes rather than threads. Spawn avoids forking the job runner's
+    threads; only parameters and metrics are pickled per task.
+    """
+    return concurrent.futures.ProcessPoolExecutor(
+        max_workers=max(1, min(max_workers, os.cpu_count() or 1)),
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=_init_pool_worker,
+        initargs=(shared.descriptor,),
+    )
+
+
+def _sweep_worker(
+    strategy_path: str,
+    rows: Tuple[int, int],
+    params: Dict[str, Any],
+    optimization_metric: str,
+    engine_options: Dict[str, Any],
+    metrics: Optional[List[str]] = None,
+    indicators: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Process-pool entry point for one parameter combination.
+
+    ``indicators`` describes the window's shared indicator batches; the
+    first task of a window caches column views of them in this worker.
+    """
+    try:
+        data = _WORKER_STATE['data'].iloc[rows[0]:rows[1]]
+        if indicators is not None:
+            handles = _WORKER_STATE.setdefault('indicator_handles', {})
+            name = indicators['frame']['name']
+            if name not in handles:
+                handles[name] = attach_indicator_batches(get_indicator_cache(), data, indicators)
+        backtest = _WORKER_STATE['service'].run_backtest(
+            data=data,
+            strategy=strategy_path,
+            strategy_params=params,
+            engine_options=engine_options,
+            **_metrics_only_kwargs(metrics),
+        )
+        return _result_entry(params, backtest, optimization_metric)
+    except Exception as e:
+        return _error_entry(params, 'error', str(e))
+
+
+class _SweepExecutor:
+    """
+    Worker pool that evaluates batches of parameter sets for one job.
+
+    In 'process' mode the data is placed in shared memory once and the pool
+    is reused across batches, so adaptive searches do not pay the worker
+    start-up cost per batch. Parameter sets found in the service's
+    evaluation memo are answered without dispatching a backtest. With
+    ``pruning`` rules the dispatched backtests abort hopeless runs early;
+    only runs that complete are memoized. Memo keys include the pruning
+    rules, so a pruning job is never answered by a run another job did not
+    prune; a run that completes under pruning rules is also memoized as the
+    unpruned run. ``metrics`` are the metrics the
+    job scores by (default the optimization metric); memo entries missing
+    any of them are recomputed. With ``metrics_only`` the backtests skip
+    result serialization and compute just those metrics. Indicators the
+    strategy declares in ``sweep_indicators`` are computed for every period
+    in ``param_ranges`` in one batch per window and served from the
+    indicator cache (shared memory in 'process' mode).
+    """
+
+    def __init__(
+        self,
+        service: "OptimizationService",
+        strategy_path: str,
+        data: pd.DataFrame,
+        optimization_metric: str,
+        engine_options: Dict[str, Any],
+        max_workers: int,
+        execution_mode: str,
+        pruning: Optional[Dict[str, Any]] = None,
+        metrics: Optional[List[str]] = None,
+        metrics_only: bool = False,
+        param_ranges: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.service = service
+        self.strategy_path = strategy_path
+        self.data = data
+        self.optimization_metric = optimization_metric
+        self.engine_options = engine_options
+        self.pruned_options = {**engine_options, 'pruning': pruning} if pruning else engine_options
+        self.metrics = sorted(metrics or [optimization_metric])
+        # Metric names forwarded to metrics-only backtests; None runs the full result pipeline
+        self.run_metrics = self.metrics if metrics_only else None
+        self.max_workers = max_workers
+        self.use_processes = execution_mode == 'process' and max_workers > 1
+        self.memo = service.evaluation_memo
+        self.hits = 0
+        self.misses = 0
+        self._strategy_hash: Optional[str] = None
+        self._contexts: Dict[Tuple[Tuple[int, int], bool], str] = {}
+        self._shared: Optional[SharedFrame] = None
+        self._executor = None
+        self.param_ranges = param_ranges
+        self._indicator_batches: List[Dict[str, Any]] = []
+        self._window_tasks: Dict[Tuple[int, int], int] = {}
+        # rows -> shared block descriptor ('process' mode) or None once primed
+        self._indicator_windows: Dict[Tuple[int, int], Optional[Dict[str, Any]]] = {}
+        self._shared_indicators: List[SharedIndicatorBatches] = []
+
+    def __enter__(self) -> "_SweepExecutor":
+        if self.memo is not None:
+            self._strategy_hash = self.service._strategy_hash(self.strategy_path)
+        try:
+            self._indicator_batches = sweep_indicator_batches(
+                self.service.backtest_service.load_strategy(self.strategy_path), self.param_ranges
+            )
+        except Exception as e:
+            logger.debug(f"Skipping indicator batches: {e}")
+        if self.use_processes:
+            self._shared = SharedFrame(self.data)
+            self._executor = _process_pool(self.max_workers, self._shared)
+        else:
+            self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        if self._shared is not None:
+            self._shared.close()
+        for shared in self._shared_indicators:
+            shared.close()
+
+    def run(
+        self,
+        param_combinations: Iterable[Dict[str, Any]],
+        rows: Tuple[int, int],
+        prune: bool = True,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Evaluate ``param_combinations`` on ``data[rows]``, yielding entries as they finish.
+
+        Combinations are pulled lazily and only a few per worker are in
+        flight, so arbitrarily large grids never sit in memory as futures.
+        ``prune=False`` runs every backtest to the end despite pruning rules.
+        """
+        windows = self.run_windows(((params, rows) for params in param_combinations), prune)
+        try:
+            for _, entry in windows:
+                yield entry
+        finally:
+            windows.close()
+
+    def run_windows(
+        self,
+        tasks: Iterable[Tuple[Dict[str, Any], Tuple[int, int]]],
+        prune: bool = True,
+    ) -> Iterator[Tuple[Tuple[int, int], Dict[str, Any]]]:
+        """
+        Evaluate ``(params, rows)`` pairs, yielding ``(rows, entry)`` as they finish.
+
+        Windows of different rows share the pool, so evaluations over many
+        folds are scheduled together; every window is a slice of the one
+        frame (or of the shared-memory copy), never a copy.
+        """
+        engine_options = self.pruned_options if prune else self.engine_options
+        windows: Dict[Tuple[int, int], Optional[pd.DataFrame]] = {}
+        max_in_flight = self.max_workers * 4
+        pending: Dict[concurrent.futures.Future, Tuple[Dict[str, Any], Tuple[int, int], Optional[str]]] = {}
+        tasks_iter = iter(tasks)
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(pending) < max_in_flight:
+                    task = next(tasks_iter, None)
+                    if task is None:
+                        exhausted = True
+                        break
+                    params, rows = task
+                    rows = tuple(rows)
+                    key = self._memo_key(params, rows, engine_options)
+                    metrics = self._recall(key)
+                    if metrics is not None:
+                        yield rows, _result_entry(params, {'success': True, 'metrics': metrics}, self.optimization_metric)
+                        continue
+                    if rows not in windows:
+                        windows[rows] = None if self.use_processes else self.data.iloc[rows[0]:rows[1]]
+                    indicators = self._window_indicators(rows)
+                    pending[self._submit(params, rows, windows[rows], engine_options, indicators)] = (params, rows, key)
+                if not pending:
+                    return
+                done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    params, rows, key = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        yield rows, _error_entry(params, 'error', str(e))
+                        continue
+                    entry = result if self.use_processes else _result_entry(params, result, self.optimization_metric)
+                    # Failures may be transient (e.g. resources), so only successes are memoized
+                    if key and entry['status'] == 'completed':
+                        self._remember_run(params, rows, engine_options, key, entry['metrics'])
+                    yield rows, entry
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Evaluation memo usage of this job."""
+        return {'enabled': self._strategy_hash is not None, 'hits': self.hits, 'misses': self.misses}
+
+    def _recall(self, key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Memoized metrics for ``key`` if they include every metric this job needs."""
+        if not key:
+            return None
+        metrics = self.memo.get(key)
+        if metrics is not None and metrics.keys() >= set(self.metrics):
+            self.hits += 1
+            return metrics
+        self.misses += 1
+        return None
+
+    def _remember(self, key: str, metrics: Dict[str, Any]) -> None:
+        """Memoize ``metrics``, keeping metrics another job stored for the same run."""
+        if self.run_metrics is not None:
+            metrics = {**(self.memo.get(key) or {}), **metrics}
+        self.memo.put(key, metrics)
+
+    def _remember_run(
+        self,
+        params: Dict[str, Any],
+        rows: Tuple[int, int],
+        engine_options: Dict[str, Any],
+        key: str,
+        metrics: Dict[str, Any],
+    ) -> None:
+        """Memoize a completed run; one that completed under pruning rules is also the unpruned run."""
+        self._remember(key, metrics)
+        if engine_options is not self.engine_options:
+            self._remember(self._memo_key(params, rows), metrics)
+
+    def _memo_key(
+        self,
+        params: Dict[str, Any],
+        rows: Tuple[int, int],
+        engine_options: Optional[Dict[str, Any]] = None,
+    ) -> Optional[str]:
+        """Memo key of ``params`` on ``data[rows]``; ``engine_options`` (with any pruning rules) default to unpruned."""
+        if self._strategy_hash is None:
+            return None
+        if engine_options is None:
+            engine_options = self.engine_options
+        pruned = engine_options is not self.engine_options
+        context = self._contexts.get((rows, pruned))
+        if context is None:
+            context = evaluation_context(
+                self._strategy_hash, self.data.iloc[rows[0]:rows[1]], engine_options
+            )
+            self._contexts[(rows, pruned)] = context
+        return evaluation_key(context, params)
+
+    def _window_indicators(self, rows: Tuple[int, int]) -> Optional[Dict[str, Any]]:
+        """
+        Batch the swept indicators of window ``rows``, returning the shared descriptor for workers.
+
+        A window is batched on its second dispatched task: a single
+        evaluation (e.g. validating the best parameters) gains nothing.
+        """
+        if not self._indicator_batches:
+            return None
+        if rows in self._indicator_windows:
+            return self._indicator_windows[rows]
+        self._window_tasks[rows] = self._window_tasks.get(rows, 0) + 1
+        if self._window_tasks[rows] < 2:
+            return None
+        window = self.data.iloc[rows[0]:rows[1]]
+        descriptor = None
+        try:
+            if self.use_processes:
+                shared = SharedIndicatorBatches(window, self._indicator_batches)
+                self._shared_indicators.append(shared)
+                descriptor = shared.descriptor
+            else:
+                prime_indicator_batches(get_indicator_cache(), window, self._indicator_batches)
+        except Exception as e:
+            # Strategies compute the indicators themselves as before
+            logger.warning(f"Indicator batches failed for rows {rows}: {e}")
+        self._indicator_windows[rows] = descriptor
+        return descriptor
+
+    def _submit(
+        self,
+        params: Dict[str, Any],
+        rows: Tuple[int, int],
+        train_data: Optional[pd.DataFrame],
+        engine_options: Dict[str, Any],
+        indicators: Optional[Dict[str, Any]] = None,
+    ):
+        if self.use_processes:
+            return self._executor.submit(
+                _sweep_worker,
+                self.strategy_path,
+                rows,
+                params,
+                self.optimization_metric,
+                engine_options,
+                self.run_metrics,
+                indicators,
+            )
+        return self._executor.submit(
+            self.service._run_single_backtest,
+            self.strategy_path,
+            train_data,
+            params,
+            engine_options,
+            self.run_metrics,
+        )
+
+
+class _DistributedExecutor(_SweepExecutor):
+    """
+    Coordinator that evaluates parameter sets on ``cli.py worker`` processes.
+
+    Combinations are cut into batches and queued in the service's work
+    queue under this run's id; at most ``MAX_QUEUED_BATCHES`` are
+    outstanding at a time. The coordinator polls for finished batches,
+    returns batches with expired leases to the queue and turns batches that
+    ran out of attempts into error entries. Workers load the dataset
+    themselves and must see exactly the coordinator's data: the content
+    fingerprint travels with every batch.
+
+    Every poll checks ``cancel_requested`` and raises ``JobCancelledError``
+    once it returns true. When no batch of the run is leased or finished
+    for ``optimization_worker_idle_timeout_seconds`` (no worker running),
+    the sweep fails with ``TimeoutError``; 0 waits indefinitely.
+    """
+
+    def __init__(
+        self,
+        *args,
+        dataset_id: Optional[int] = None,
+        run_id: Optional[str] = None,
+        cancel_requested: Optional[Callable[[], bool]] = None,
+        **kwargs,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        settings = get_settings()
+        self.queue = self.service.work_queue
+        self.dataset_id = dataset_id
+        self.run_id = str(run_id) if run_id is not None else uuid.uuid4().hex
+        self.batch_size = max(1, settings.optimization_worker_batch_size)
+        self.poll_interval = settings.optimization_worker_poll_seconds
+        self.max_attempts = max(1, settings.optimization_worker_max_attempts)
+        self.idle_timeout = settings.optimization_worker_idle_timeout_seconds
+        self.cancel_requested = cancel_requested
+        self._fingerprint: Optional[str] = None
+
+    def __enter__(self) -> "_DistributedExecutor":
+        if self.dataset_id is None:
+            raise ValueError("Distributed execution requires a stored dataset")
+        if self.memo is not None:
+            self._strategy_hash = self.service._strategy_hash(self.strategy_path)
+        self._fingerprint = dataset_fingerprint(self.data)
+        # Batches left behind by an interrupted run of the same job are stale
+        self.queue.purge(self.run_id)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.queue.purge(self.run_id)
+
+    def run(
+        self,
+        param_combinations: Iterable[Dict[str, Any]],
+        rows: Tuple[int, int],
+        prune: bool = True,
+    ) -> Iterator[Dict[str, Any]]:
+        engine_options = self.pruned_options if prune else self.engine_options
+        params_iter = iter(param_combinations)
+        outstanding: Dict[int, Tuple[List[Dict[str, Any]], List[Optional[str]]]] = {}
+        exhausted = False
+        last_activity = time.monotonic()
+        while True:
+            if self.cancel_requested is not None and self.cancel_requested():
+                raise JobCancelledError()
+            batches = []
+            while not exhausted and len(outstanding) + len(batches) < MAX_QUEUED_BATCHES:
+                batch: List[Dict[str, Any]] = []
+                keys: List[Optional[str]] = []
+                while len(batch) < self.batch_size:
+                    params = next(params_iter, None)
+                    if params is None:
+                        exhausted = True
+                        break
+                    key = self._memo_key(params, rows, engine_options)
+                    metrics = self._recall(key)
+                    if metrics is not None:
+                        yield _result_entry(params, {'success': True, 'metrics': metrics}, self.optimization_metric)
+                        continue
+                    batch.append(params)
+                    keys.append(key)
+                if batch:
+                    batches.append((batch, keys))
+            if batches:
+                payloads = [self._payload(batch, rows, engine_options) for batch, _ in batches]
+                for item_id, batch in zip(self.queue.enqueue(self.run_id, payloads, self.max_attempts), batches):
+                    outstanding[item_id] = batch
+            if not outstanding:
+                return
+
+            finished = self.queue.take_finished(self.run_id)
+            if not finished:
+                self.queue.requeue_expired(self.run_id)
+                if self.queue.counts(self.run_id).get(LEASED):
+                    last_activity = time.monotonic()
+                elif self.idle_timeout > 0 and time.monotonic() - last_activity > self.idle_timeout:
+                    raise TimeoutError(
+                        f"No optimization worker leased or finished a batch in {self.idle_timeout:g}s; "
+                        "is a worker (python cli.py worker) running?"
+                    )
+                time.sleep(self.poll_interval)
+                continue
+            last_activity = time.monotonic()
+            for item in finished:
+                if item['id'] not in outstanding:
+                    continue
+                batch, keys = outstanding.pop(item['id'])
+                if item['status'] != 'done':
+                    error = f"Batch failed after {item['attempts']} attempt(s): {item['error']}"
+                    for params in batch:
+                        yield _error_entry(params, 'error', error)
+                    continue
+                for params, entry, key in zip(batch, item['results'], keys):
+                    if entry['optimization_score'] is None:
+                        entry['optimization_score'] = -float('inf')
+                    if key and entry['status'] == 'completed':
+                        self._remember_run(params, rows, engine_options, key, entry['metrics'])
+                    yield entry
+
+    def run_windows(
+        self,
+        tasks: Iterable[Tuple[Dict[str, Any], Tuple[int, int]]],
+        prune: bool = True,
+    ) -> Iterator[Tuple[Tuple[int, int], Dict[str, Any]]]:
+        """Queue consecutive tasks of the same rows as one sweep (batches carry a single window)."""
+        for rows, window_tasks in itertools.groupby(tasks, key=lambda task: tuple(task[1])):
+            for entry in self.run((params for params, _ in window_tasks), rows, prune):
+                yield rows, entry
+
+    def _payload(
+        self,
+        batch: List[Dict[str, Any]],
+        rows: Tuple[int, int],
+        engine_options: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        return {
+            'strategy_path': self.strategy_path,
+            'dataset_id': self.dataset_id,
+            'fingerprint': self._fingerprint,
+            'rows': list(rows),
+            'optimization_metric': self.optimization_metric,
+            'engine_options': engine_options,
+            'metrics': self.run_metrics,
+            'params': batch,
+        }
+
+
+class OptimizationWorker:
+    """
+    Worker process of distributed optimization sweeps (``python cli.py worker``).
+
+    Leases one batch at a time from the work queue, backtests every
+    parameter set on its own copy of the dataset and reports compact result
+    entries. Loaded datasets are cached in memory by dataset id and checked
+    against the coordinator's fingerprint, so a worker never scores a
+    different version of the data. The lease is renewed while a batch runs;
+    run several workers per machine to use more cores.
+    """
+
+    def __init__(
+        self,
+        work_queue: Optional[WorkQueue] = None,
+        *,
+        backtest_service: Optional[BacktestService] = None,
+        dataset_repository: Optional[DatasetRepository] = None,
+        storage: Optional[DatasetStorage] = None,
+        worker_id: Optional[str] = None,
+        lease_seconds: Optional[float] = None,
+        poll_interval: Optional[float] = None,
+    ) -> None:
+        settings = get_settings()
+        self.queue = work_queue or WorkQueue()
+        self.backtest_service = backtest_service or BacktestService()
+        self.repository = dataset_repository or DatasetRepository()
+        self.storage = storage or DatasetStorage()
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.lease_seconds = lease_seconds or settings.optimization_worker_lease_seconds
+        self.poll_interval = settings.optimization_worker_poll_seconds if poll_interval is None else poll_interval
+        self.processed = 0
+        self._datasets: Dict[int, Tuple[str, pd.DataFrame]] = {}
+
+    def run(
+        self,
+        max_items: Optional[int] = None,
+        stop_event: Optional[threading.Event] = None,
+        exit_when_idle: bool = False,
+    ) -> int:
+        """
+        Process batches until ``stop_event`` is set, ``max_items`` were
+        handled or, with ``exit_when_idle``, the queue is empty; returns the
+        number of batches handled.
+        """
+        handled = 0
+        while not (stop_event and stop_event.is_set()) and (max_items is None or handled < max_items):
+            if self.run_once():
+                handled += 1
+            elif exit_when_idle:
+                break
+            elif stop_event is not None:
+                stop_event.wait(self.poll_interval)
+            else:
+                time.sleep(self.poll_interval)
+        return handled
+
+    def run_once(self) -> bool:
+        """Lease and process one batch; False when the queue is empty."""
+        item = self.queue.lease(self.worker_id, self.lease_seconds)
+        if item is None:
+            return False
+        payload = item['payload']
+        try:
+            data = self._dataset(payload['dataset_id'], payload['fingerprint'])
+            window = data.iloc[payload['rows'][0]:payload['rows'][1]]
+            results = []
+            renewed = time.monotonic()
+            for params in payload['params']:
+                try:
+                    backtest = self.backtest_service.run_backtest(
+                        data=window,
+                        strategy=payload['strategy_path'],
+                        strategy_params=params,
+                        engine_options=payload['engine_options'],
+                        **_metrics_only_kwargs(payload.get('metrics')),
+                    )
+                    results.append(_result_entry(params, backtest, payload['optimization_metric']))
+                except Exception as e:
+                    results.append(_error_entry(params, 'error', str(e)))
+                if time.monotonic() - renewed > self.lease_seconds / 2:
+                    if not self.queue.renew(item['id'], self.worker_id, self.lease_seconds):
+                        logger.warning("Lost the lease on work item %s; dropping it", item['id'])
+                        return True
+                    renewed = time.monotonic()
+        except Exception as e:
+            logger.error("Work item %s failed: %s", item['id'], e)
+            self.queue.fail(item['id'], self.worker_id, str(e))
+            return True
+        if self.queue.complete(item['id'], self.worker_id, _json_safe(results)):
+            self.processed += 1
+        return True
+
+    def _dataset(self, dataset_id: int, fingerprint: str) -> pd.DataFrame:
+        cached = self._datasets.get(dataset_id)
+        if cached is None or cached[0] != fingerprint:
+            dataset = self.repository.get(dataset_id)
+            if not dataset:
+                raise ValueError(f"Dataset {dataset_id} not found")
+            data = self.storage.load_dataframe(dataset.file_path)
+            local = dataset_fingerprint(data)
+            if local != fingerprint:
+                raise ValueError(f"Local copy of dataset {dataset_id} differs from the coordinator's")
+            # Keep only the latest dataset; sweeps rarely alternate between datasets
+            self._datasets = {dataset_id: (local, data)}
+            cached = self._datasets[dataset_id]
+        return cached[1]
+
+
+def _json_safe(value: Any) -> Any:
+    """
+    Worker results as strict JSON: numpy scalars become Python values and
+    non-finite floats None (the coordinator reads a None score as -inf).
+    """
+    if isinstance(value, dict):
+        return {str(k): _json_safe(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(v) for v in value]
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not np.isfinite(value):
+        return None
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
 # Optimization helper functions
 def create_parameter_range(param_type: str, **kwargs) -> Dict[str, Any]:
     """Helper function to create parameter range specifications"""
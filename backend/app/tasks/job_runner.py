@@ -121,18 +121,8 @@ class JobRunner:
                 raise ValueError("job_data required for optimization jobs")
             job_id = self._store.create_optimization_job(job_data)
             payload = OptimizationJobPayload(job_data=job_data)
-            cancel_event = Event()
-            start_event = Event()
-            with self._lock:
-                self._cancellations[job_id] = cancel_event
-            future = self._executor.submit(
-                self._run_optimization_job,
-                job_id,
-                payload,
-                cancel_event,
-                progress_callback,
-                start_event,
-            )
+            self._optimization_runner.create_checkpoint(job_id, payload)
+            future, start_event = self._submit_optimization_job(job_id, payload, progress_callback)
         else:
             raise ValueError(f"Unknown job type: {job_type}")
 
@@ -142,6 +132,56 @@ class JobRunner:
         logger.info("Submitted %s job %s", normalized_type.value, job_id)
         return job_id
 
+    def resume_interrupted_jobs(self) -> list[str]:
+        """
+        Restart optimization jobs left pending/running by a previous process.
+
+        Jobs with a checkpoint continue after their stored results; jobs
+        without one are marked failed instead of staying RUNNING forever.
+        """
+        resumed = []
+        for status in (JobStatus.RUNNING, JobStatus.PENDING):
+            for job in self._store.list_jobs(job_type=JobType.OPTIMIZATION, status=status, limit=1000):
+                job_id = str(job["id"])
+                with self._lock:
+                    if job_id in self._active_jobs:
+                        continue
+                payload = self._optimization_runner.resumable_job(job_id)
+                if payload is None:
+                    self._store.update_status(
+                        job_id,
+                        JobStatus.FAILED,
+                        error_message="Interrupted by a restart before a checkpoint was written",
+                    )
+                    continue
+                future, start_event = self._submit_optimization_job(job_id, payload, None)
+                with self._lock:
+                    self._active_jobs[job_id] = future
+                Timer(0.01, start_event.set).start()
+                resumed.append(job_id)
+                logger.info("Resumed optimization job %s from checkpoint", job_id)
+        return resumed
+
+    def _submit_optimization_job(
+        self,
+        job_id: str,
+        payload: OptimizationJobPayload,
+        progress_callback: Optional[Callable[[int, int], Any]],
+    ) -> tuple[Future, Event]:
+        cancel_event = Event()
+        start_event = Event()
+        with self._lock:
+            self._cancellations[job_id] = cancel_event
+        future = self._executor.submit(
+            self._run_optimization_job,
+            job_id,
+            payload,
+            cancel_event,
+            progress_callback,
+            start_event,
+        )
+        return future, start_event
+
     def get_job_status(self, job_id: str) -> Optional[Dict[str, Any]]:
         return self._store.get_job(job_id)
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import logging
 from dataclasses import dataclass
 from typing import Any, Callable, Dict, Optional
 
@@ -9,6 +10,8 @@ from .backtest_runner import JobCancelledError
 from .enums import JobStatus
 from .store import JobStore
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class OptimizationJobPayload:
@@ -18,7 +21,12 @@ class OptimizationJobPayload:
 
 
 class OptimizationRunner:
-    """Execute optimization jobs via the optimization service."""
+    """
+    Execute optimization jobs via the optimization service.
+
+    Jobs run with their id, so the service checkpoints them; ``resumable_job``
+    returns the stored payload of a job interrupted by a restart.
+    """
 
     def __init__(self, store: JobStore, service_factory: Optional[Callable[[], Any]] = None):
         self._store = store
@@ -52,11 +60,14 @@ class OptimizationRunner:
                     external_progress(completed, total_steps)
 
             service = self._resolve_service()
-            result = service.run_optimization(payload.job_data, update_progress)
+            result = service.run_optimization(
+                payload.job_data, update_progress, job_id=job_id, cancel_requested=cancel_requested
+            )
             if result.get("success"):
                 self._store.store_results(job_id, result)
                 self._store.update_status(job_id, JobStatus.COMPLETED)
             else:
+                self.discard_checkpoint(job_id)
                 self._store.update_status(
                     job_id,
                     JobStatus.FAILED,
@@ -64,11 +75,30 @@ class OptimizationRunner:
                 )
             progress(1.0, "Optimization completed", total)
         except JobCancelledError:
+            self.discard_checkpoint(job_id)
             self._store.update_status(job_id, JobStatus.CANCELLED)
         except Exception as exc:
+            self.discard_checkpoint(job_id)
             self._store.update_status(job_id, JobStatus.FAILED, error_message=str(exc))
             raise
 
+    def create_checkpoint(self, job_id: str, payload: OptimizationJobPayload) -> None:
+        try:
+            self._resolve_service().create_checkpoint(job_id, payload.job_data)
+        except Exception:
+            logger.exception("Failed to write checkpoint for optimization job %s", job_id)
+
+    def resumable_job(self, job_id: str) -> Optional[OptimizationJobPayload]:
+        """Payload of an unfinished job that left a checkpoint, or None."""
+        job_data = self._resolve_service().load_checkpoint(job_id)
+        return OptimizationJobPayload(job_data=job_data) if job_data is not None else None
+
+    def discard_checkpoint(self, job_id: str) -> None:
+        try:
+            self._resolve_service().discard_checkpoint(job_id)
+        except Exception:
+            logger.exception("Failed to remove checkpoint of optimization job %s", job_id)
+
     def _resolve_service(self):
         if self._service_factory:
             return self._service_factory()
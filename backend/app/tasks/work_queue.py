@@ -0,0 +1,252 @@
+"""Database-backed work queue feeding distributed optimization workers."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import case, func, or_
+from sqlalchemy.orm import Session
+
+from backend.app.database.models import OptimizationWorkItem, get_session_factory
+
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"
+COLLECTED = "collected"
+
+
+class WorkQueue:
+    """
+    Queue of parameter batches stored in the application database.
+
+    A coordinator enqueues batches under a ``run_id`` and collects finished
+    ones; workers on any machine that can reach the database lease a batch,
+    renew the lease while working and report results or an error. Leases
+    are claimed with a conditional UPDATE, so two workers never own the same
+    batch. Expired leases and reported errors are retried until the batch's
+    ``max_attempts`` is used up, after which it is marked failed.
+
+    Any object with the same methods can stand in as the broker.
+    """
+
+    def __init__(self, session_factory: Optional[Callable[[], Session]] = None):
+        self._session_factory = session_factory or get_session_factory()
+
+    def _session(self) -> Session:
+        return self._session_factory()
+
+    def enqueue(self, run_id: str, payloads: List[Dict[str, Any]], max_attempts: int = 3) -> List[int]:
+        session = self._session()
+        try:
+            now = datetime.utcnow()
+            items = [
+                OptimizationWorkItem(
+                    run_id=run_id,
+                    status=PENDING,
+                    payload=payload,
+                    attempts=0,
+                    max_attempts=max_attempts,
+                    created_at=now,
+                    updated_at=now,
+                )
+                for payload in payloads
+            ]
+            session.add_all(items)
+            session.commit()
+            return [item.id for item in items]
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def lease(self, worker_id: str, lease_seconds: float) -> Optional[Dict[str, Any]]:
+        """Claim the oldest pending batch; returns ``{'id', 'run_id', 'payload', 'attempts'}`` or None."""
+        session = self._session()
+        try:
+            candidates = (
+                session.query(OptimizationWorkItem.id)
+                .filter(OptimizationWorkItem.status == PENDING)
+                .order_by(OptimizationWorkItem.id)
+                .limit(16)
+                .all()
+            )
+            for (item_id,) in candidates:
+                now = datetime.utcnow()
+                claimed = (
+                    session.query(OptimizationWorkItem)
+                    .filter(OptimizationWorkItem.id == item_id, OptimizationWorkItem.status == PENDING)
+                    .update(
+                        {
+                            OptimizationWorkItem.status: LEASED,
+                            OptimizationWorkItem.worker_id: worker_id,
+                            OptimizationWorkItem.lease_expires_at: now + timedelta(seconds=lease_seconds),
+                            OptimizationWorkItem.attempts: OptimizationWorkItem.attempts + 1,
+                            OptimizationWorkItem.updated_at: now,
+                        },
+                        synchronize_session=False,
+                    )
+                )
+                session.commit()
+                if claimed:
+                    item = session.get(OptimizationWorkItem, item_id)
+                    return {
+                        "id": item.id,
+                        "run_id": item.run_id,
+                        "payload": item.payload,
+                        "attempts": item.attempts,
+                    }
+            return None
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def renew(self, item_id: int, worker_id: str, lease_seconds: float) -> bool:
+        """Extend a lease; False when the worker no longer owns the batch."""
+        now = datetime.utcnow()
+        return self._update_owned(item_id, worker_id, {
+            OptimizationWorkItem.lease_expires_at: now + timedelta(seconds=lease_seconds),
+            OptimizationWorkItem.updated_at: now,
+        })
+
+    def complete(self, item_id: int, worker_id: str, results: List[Dict[str, Any]]) -> bool:
+        """Store a batch's results; ignored (False) if the lease was lost meanwhile."""
+        return self._update_owned(item_id, worker_id, {
+            OptimizationWorkItem.status: DONE,
+            OptimizationWorkItem.results: results,
+            OptimizationWorkItem.lease_expires_at: None,
+            OptimizationWorkItem.updated_at: datetime.utcnow(),
+        })
+
+    def fail(self, item_id: int, worker_id: str, error: str) -> bool:
+        """Report an error; the batch is retried while attempts remain."""
+        return self._update_owned(item_id, worker_id, {
+            OptimizationWorkItem.status: _retry_status(),
+            OptimizationWorkItem.error_message: error,
+            OptimizationWorkItem.worker_id: None,
+            OptimizationWorkItem.lease_expires_at: None,
+            OptimizationWorkItem.updated_at: datetime.utcnow(),
+        })
+
+    def requeue_expired(self, run_id: str) -> int:
+        """Return batches whose lease ran out to the queue (or fail them); returns the number touched."""
+        session = self._session()
+        try:
+            now = datetime.utcnow()
+            # One conditional UPDATE: a lease renewed or completed meanwhile no longer matches
+            expired = (
+                session.query(OptimizationWorkItem)
+                .filter(
+                    OptimizationWorkItem.run_id == run_id,
+                    OptimizationWorkItem.status == LEASED,
+                    OptimizationWorkItem.lease_expires_at < now,
+                )
+                .update({
+                    OptimizationWorkItem.status: _retry_status(),
+                    OptimizationWorkItem.error_message: (
+                        "Lease held by " + OptimizationWorkItem.worker_id + " expired"
+                    ),
+                    OptimizationWorkItem.worker_id: None,
+                    OptimizationWorkItem.lease_expires_at: None,
+                    OptimizationWorkItem.updated_at: now,
+                }, synchronize_session=False)
+            )
+            session.commit()
+            return expired
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def take_finished(self, run_id: str) -> List[Dict[str, Any]]:
+        """Done and failed batches of ``run_id`` not collected yet; marks them collected."""
+        session = self._session()
+        try:
+            items = (
+                session.query(OptimizationWorkItem)
+                .filter(
+                    OptimizationWorkItem.run_id == run_id,
+                    or_(OptimizationWorkItem.status == DONE, OptimizationWorkItem.status == FAILED),
+                )
+                .order_by(OptimizationWorkItem.id)
+                .all()
+            )
+            finished = [
+                {
+                    "id": item.id,
+                    "status": item.status,
+                    "results": item.results,
+                    "error": item.error_message,
+                    "attempts": item.attempts,
+                }
+                for item in items
+            ]
+            for item in items:
+                item.status = COLLECTED
+            session.commit()
+            return finished
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def purge(self, run_id: str) -> int:
+        session = self._session()
+        try:
+            removed = (
+                session.query(OptimizationWorkItem)
+                .filter(OptimizationWorkItem.run_id == run_id)
+                .delete(synchronize_session=False)
+            )
+            session.commit()
+            return removed
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def counts(self, run_id: Optional[str] = None) -> Dict[str, int]:
+        """Number of batches per status (of one run, or of the whole queue)."""
+        session = self._session()
+        try:
+            query = session.query(OptimizationWorkItem.status, func.count(OptimizationWorkItem.id))
+            if run_id is not None:
+                query = query.filter(OptimizationWorkItem.run_id == run_id)
+            return {status: count for status, count in query.group_by(OptimizationWorkItem.status).all()}
+        finally:
+            session.close()
+
+    def _update_owned(self, item_id: int, worker_id: str, values: Dict[Any, Any]) -> bool:
+        session = self._session()
+        try:
+            updated = (
+                session.query(OptimizationWorkItem)
+                .filter(
+                    OptimizationWorkItem.id == item_id,
+                    OptimizationWorkItem.status == LEASED,
+                    OptimizationWorkItem.worker_id == worker_id,
+                )
+                .update(values, synchronize_session=False)
+            )
+            session.commit()
+            return bool(updated)
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+
+def _retry_status():
+    """SQL status of a batch giving up its lease: pending while attempts remain, else failed."""
+    return case(
+        (OptimizationWorkItem.attempts < OptimizationWorkItem.max_attempts, PENDING),
+        else_=FAILED,
+    )
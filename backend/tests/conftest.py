@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 import os
+import shutil
 import tempfile
 from pathlib import Path
+from types import SimpleNamespace
 
+import numpy as np
+import pandas as pd
 import pytest
 
 # ---------------------------------------------------------------------------
@@ -20,6 +24,16 @@ _TEST_DB_PATH = _TEST_DB_DIR / "test.db"
 # imported so they pick up the new connection information.
 os.environ["DATABASE_URL"] = f"sqlite:///{_TEST_DB_PATH}"
 
+# The evaluation memo, signal and indicator caches and streamed optimization
+# results default to paths under data/ relative to the working directory;
+# keep them in a temporary directory so test runs neither touch the
+# developer's caches nor leak memo state into each other.
+_TEST_CACHE_DIR = Path(tempfile.mkdtemp(prefix="backtester_pytest_cache_"))
+os.environ["OPTIMIZATION_MEMO_PATH"] = str(_TEST_CACHE_DIR / "optimization_memo.sqlite")
+os.environ["SIGNAL_CACHE_DIR"] = str(_TEST_CACHE_DIR / "signals")
+os.environ["INDICATOR_CACHE_DIR"] = str(_TEST_CACHE_DIR / "indicators")
+os.environ["OPTIMIZATION_RESULTS_DIR"] = str(_TEST_CACHE_DIR / "optimization_results")
+
 # Clear the cached settings so the new DATABASE_URL is respected.
 from backend.app.config import get_settings  # noqa: E402
 
@@ -53,3 +67,63 @@ def _cleanup_test_database() -> None:
             except OSError:
                 # Directory not empty; leave it for inspection.
                 pass
+        shutil.rmtree(_TEST_CACHE_DIR, ignore_errors=True)
+
+
+def _intraday_sessions(days: int = 4, bars: int = 375, seed: int = 9) -> pd.DataFrame:
+    """Random-walk 1-minute OHLCV bars from 09:15 on ``days`` business days."""
+    rng = np.random.default_rng(seed)
+    frames = []
+    for day in pd.bdate_range("2024-01-01", periods=days):
+        start = day + pd.Timedelta(hours=9, minutes=15)
+        frames.append(pd.DataFrame({"timestamp": pd.date_range(start, periods=bars, freq="min")}))
+    df = pd.concat(frames, ignore_index=True)
+    close = 22000 + np.cumsum(rng.normal(0, 4, len(df)))
+    df["open"] = close
+    df["high"] = close + 2
+    df["low"] = close - 2
+    df["close"] = close
+    df["volume"] = 1000
+    return df
+
+
+@pytest.fixture
+def sessions():
+    """Builder of synthetic intraday sessions: ``sessions(days, bars, seed)``."""
+    return _intraday_sessions
+
+
+class _FrameStorage:
+    """Dataset storage serving a copy of one frame for every file."""
+
+    def __init__(self, data: pd.DataFrame) -> None:
+        self.data = data
+
+    def load_dataframe(self, file_path):
+        return self.data.copy()
+
+
+class _DatasetRepository:
+    """Dataset repository resolving every id to a placeholder file."""
+
+    def get(self, dataset_id):
+        return SimpleNamespace(id=dataset_id, file_path="unused.csv")
+
+    def touch_last_accessed(self, dataset):
+        pass
+
+
+@pytest.fixture
+def frame_storage():
+    """Factory of storage fakes: ``frame_storage(data)``, 20 closes when omitted."""
+
+    def make(data: pd.DataFrame | None = None) -> _FrameStorage:
+        return _FrameStorage(pd.DataFrame({"close": np.arange(20.0)}) if data is None else data)
+
+    return make
+
+
+@pytest.fixture
+def dataset_repository():
+    """Dataset repository fake for optimization services."""
+    return _DatasetRepository()
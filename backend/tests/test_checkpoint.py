@@ -0,0 +1,158 @@
+"""Tests for checkpointing and resuming optimization jobs."""
+
+import time
+
+import pytest
+
+from backend.app.services.optimization import OptimizationCheckpoint, job_directory, read_results
+from backend.app.services.optimization_service import OptimizationService
+from backend.app.tasks import JobRunner, JobStatus, JobType
+from backend.app.tasks.optimization_runner import OptimizationJobPayload
+
+
+class _Crash(BaseException):
+    """Stands in for the process dying: not caught by the service's error handling."""
+
+
+class _Backtests:
+    def __init__(self):
+        self.calls = []
+
+    def run_backtest(self, data, strategy, strategy_params, engine_options):
+        self.calls.append(dict(strategy_params))
+        x, y = strategy_params["x"], strategy_params["y"]
+        noise = 30.0 / len(data) * ((x * 7 + y) % 5)
+        return {"success": True, "metrics": {"sharpe_ratio": -abs(x - 6) - abs(y - 2) + noise}}
+
+
+@pytest.fixture
+def make_service(sessions, dataset_repository, frame_storage):
+    """``make_service(results_dir, backtests)`` over 27 sessions of 10 bars."""
+    storage = frame_storage(sessions(days=27, bars=10))
+
+    def make(results_dir, backtests):
+        service = OptimizationService(
+            backtest_service=backtests,
+            job_runner=object(),
+            dataset_repository=dataset_repository,
+            storage=storage,
+            results_dir=results_dir,
+        )
+        service.evaluation_memo = None
+        service.checkpoint_interval = 0
+        return service
+
+    return make
+
+
+def _job(**overrides):
+    job = {
+        "strategy_path": "unused",
+        "dataset_id": 1,
+        "param_ranges": {"x": list(range(10)), "y": list(range(4))},
+        "optimization_metric": "sharpe_ratio",
+        "max_workers": 1,
+        "execution_mode": "thread",
+        "validation_split": 0.0,
+    }
+    job.update(overrides)
+    return job
+
+
+def _crash_after(n):
+    def progress(done, total):
+        if done >= n:
+            raise _Crash()
+    return progress
+
+
+def _run_interrupted(make_service, tmp_path, job, crash_after):
+    first = _Backtests()
+    with pytest.raises(_Crash):
+        make_service(tmp_path, first).run_optimization(job, _crash_after(crash_after), job_id="7")
+    checkpoint = OptimizationCheckpoint(job_directory(tmp_path, "7"))
+    assert checkpoint.exists and checkpoint.job_data == job
+    # The last checkpoint precedes the entry whose progress update crashed
+    assert checkpoint.state["completed"] == crash_after - 1
+
+    second = _Backtests()
+    result = make_service(tmp_path, second).run_optimization(checkpoint.job_data, job_id="7")
+    assert result["success"], result.get("error")
+    assert not checkpoint.exists
+    return first, second, result
+
+
+def test_grid_resumes_without_recomputation(make_service, tmp_path):
+    first, second, result = _run_interrupted(make_service, tmp_path, _job(), crash_after=15)
+    # Only combinations missing from the stored results are evaluated again
+    assert result["resumed_from"] == 15
+    assert len(second.calls) == 25
+    assert result["total_combinations"] == result["successful_runs"] == 40
+    assert result["best_parameters"] == {"x": 6, "y": 2}
+    stored = read_results(result["results_file"], limit=100)["results"]
+    assert len({tuple(sorted(r["parameters"].items())) for r in stored}) == 40
+
+
+def test_bayesian_resume_keeps_budget_and_never_repeats(make_service, tmp_path):
+    job = _job(search="bayesian", n_trials=30, seed=5, total_combinations=30)
+    first, second, result = _run_interrupted(make_service, tmp_path, job, crash_after=12)
+    assert result["resumed_from"] + len(second.calls) == 30
+    stored = read_results(result["results_file"], limit=100)["results"]
+    assert len({tuple(sorted(r["parameters"].items())) for r in stored}) == 30
+
+
+def test_halving_resume_matches_uninterrupted_run(make_service, tmp_path):
+    job = _job(search="halving", halving={"min_sessions": 3, "reduction_factor": 3})
+    reference = make_service(tmp_path / "reference", _Backtests()).run_optimization(job)
+
+    first, second, result = _run_interrupted(make_service, tmp_path, job, crash_after=45)
+    assert result["resumed_from"] + len(second.calls) == reference["total_combinations"]
+    assert result["best_parameters"] == reference["best_parameters"]
+    assert [(r["rung"], r["optimization_score"]) for r in result["all_results"]] == [
+        (r["rung"], r["optimization_score"]) for r in reference["all_results"]
+    ]
+
+
+class _Store:
+    def __init__(self, jobs):
+        self.jobs = jobs
+        self.updates = []
+
+    def list_jobs(self, *, job_type=None, status=None, limit=50, offset=0):
+        assert job_type is JobType.OPTIMIZATION
+        return [job for job in self.jobs if job["status"] is status]
+
+    def update_status(self, job_id, status, *, error_message=None, result_data=None):
+        self.updates.append((job_id, status))
+
+
+class _OptimizationRunner:
+    def __init__(self, checkpoints):
+        self.checkpoints = checkpoints
+        self.ran = []
+
+    def resumable_job(self, job_id):
+        job_data = self.checkpoints.get(job_id)
+        return OptimizationJobPayload(job_data=job_data) if job_data else None
+
+    def run(self, job_id, payload, cancel_requested, progress, external_progress=None):
+        self.ran.append((job_id, payload.job_data))
+
+
+def test_job_runner_resumes_checkpointed_jobs_and_fails_the_rest():
+    store = _Store([
+        {"id": 1, "status": JobStatus.RUNNING},
+        {"id": 2, "status": JobStatus.RUNNING},
+        {"id": 3, "status": JobStatus.PENDING},
+    ])
+    optimization_runner = _OptimizationRunner({"1": {"a": 1}, "3": {"c": 3}})
+    runner = JobRunner(max_workers=1, store=store, optimization_runner=optimization_runner)
+    try:
+        assert runner.resume_interrupted_jobs() == ["1", "3"]
+        deadline = time.time() + 5
+        while len(optimization_runner.ran) < 2 and time.time() < deadline:
+            time.sleep(0.01)
+    finally:
+        runner.shutdown()
+    assert sorted(optimization_runner.ran) == [("1", {"a": 1}), ("3", {"c": 3})]
+    assert store.updates == [("2", JobStatus.FAILED)]
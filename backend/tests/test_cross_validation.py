@@ -0,0 +1,132 @@
+"""Tests for combinatorial purged cross-validation of optimization jobs."""
+
+import numpy as np
+import pytest
+
+from backend.app.services.optimization import (
+    CrossValidationError,
+    OptimizationCheckpoint,
+    build_cv_splits,
+    job_directory,
+    normalize_cross_validation_config,
+    overfitting_probability,
+)
+from backend.app.services.optimization_service import OptimizationService
+
+
+@pytest.fixture
+def numbered_sessions(sessions):
+    """Sessions whose close is the session number."""
+
+    def make(days=12, bars=10):
+        df = sessions(days=days, bars=bars)
+        df["close"] = np.repeat(np.arange(days, dtype=float), bars)
+        return df
+
+    return make
+
+
+def test_splits_embargo_sessions_next_to_test_groups(numbered_sessions):
+    groups, splits = build_cv_splits(numbered_sessions(), n_groups=4, test_groups=2, embargo_sessions=1)
+    assert [g["rows"] for g in groups] == [(0, 30), (30, 60), (60, 90), (90, 120)]
+    assert len(splits) == 6
+    split = next(s for s in splits if s["test_groups"] == [0, 2])
+    assert split["test"] == [(0, 30), (60, 90)]
+    # Sessions 3, 5 and 9 border a test group
+    assert split["train"] == [(40, 50), (100, 120)]
+    assert (split["train_sessions"], split["embargoed_sessions"]) == (3, 3)
+    for s in splits:
+        train = np.zeros(120, dtype=bool)
+        for a, b in s["train"]:
+            train[a:b] = True
+        for a, b in s["test"]:
+            assert not train[max(0, a - 10):b + 10].any()
+
+    with pytest.raises(CrossValidationError):
+        build_cv_splits(numbered_sessions(days=3), n_groups=4, test_groups=1)
+    with pytest.raises(CrossValidationError):
+        build_cv_splits(numbered_sessions(days=4), n_groups=2, test_groups=1, embargo_sessions=2)
+
+
+def test_normalize_cross_validation_config():
+    assert normalize_cross_validation_config({}) == {"n_groups": 6, "test_groups": 2, "embargo_sessions": 1}
+    for bad in ({"n_groups": 1}, {"n_groups": 3, "test_groups": 3}, {"embargo_sessions": -1}, {"n_groups": 2.5}):
+        with pytest.raises(CrossValidationError):
+            normalize_cross_validation_config(bad)
+
+
+def test_overfitting_probability():
+    assert overfitting_probability([0.2, 0.8, 0.5]) == pytest.approx(2 / 3)
+    assert overfitting_probability([]) is None
+
+
+class _WindowBacktests:
+    """x=2 wins everywhere; x=3 only on the first sessions (an overfit set)."""
+
+    def __init__(self):
+        self.windows = []
+
+    def run_backtest(self, data, strategy, strategy_params, engine_options):
+        first = int(data["close"].iloc[0])
+        self.windows.append((first, len(data)))
+        x = strategy_params["x"]
+        score = {1: 0.0, 2: 1.0, 3: 5.0 if first < 3 else -5.0}[x]
+        return {"success": True, "metrics": {"sharpe_ratio": score}}
+
+
+def test_run_optimization_cross_validation(tmp_path, numbered_sessions, dataset_repository, frame_storage):
+    backtests = _WindowBacktests()
+    service = OptimizationService(
+        backtest_service=backtests,
+        job_runner=object(),
+        dataset_repository=dataset_repository,
+        storage=frame_storage(numbered_sessions()),
+        results_dir=tmp_path,
+    )
+    job = {
+        "strategy_path": "unused",
+        "dataset_id": 1,
+        "param_combinations": [{"x": 1}, {"x": 2}, {"x": 3}],
+        "optimization_metric": "sharpe_ratio",
+        "max_workers": 3,
+        "execution_mode": "thread",
+        "cross_validation": {"n_groups": 4, "test_groups": 1, "embargo_sessions": 1},
+    }
+    progress = []
+    # Cross-validation jobs are not resumable and must not leave a checkpoint behind
+    service.create_checkpoint("cv", job)
+    result = service.run_optimization(job, lambda done, total: progress.append((done, total)), job_id="cv")
+    assert not OptimizationCheckpoint(job_directory(tmp_path, "cv")).exists
+    assert result["success"], result.get("error")
+    assert result["mode"] == "cross_validation"
+    assert result["total_splits"] == result["successful_splits"] == 4
+    # 4 test groups + 6 distinct training stretches, each evaluated once per parameter set
+    assert result["total_evaluations"] == 30
+    assert len(backtests.windows) == 30 and progress[-1] == (30, 30)
+    assert sorted(set(backtests.windows)) == [
+        (0, 20), (0, 30), (0, 50), (0, 80), (3, 30), (4, 80), (6, 30), (7, 50), (9, 30), (10, 20),
+    ]
+    assert result["best_parameters"] == {"x": 2}
+    by_test_group = {s["test_groups"][0]: s for s in result["splits"]}
+    # Trained away from the first group, x=2 wins; trained on it, the overfit x=3 wins and fails
+    assert by_test_group[0]["best_parameters"] == {"x": 2}
+    assert by_test_group[3]["best_parameters"] == {"x": 3}
+    assert by_test_group[3]["test_score"] == -5.0
+    assert result["cv_summary"]["overfitting_probability"] == pytest.approx(0.75)
+
+
+class _JobRunner:
+    def submit_job(self, job_type, job_data, progress_callback=None):
+        self.job_data = job_data
+        return "job-1"
+
+
+def test_start_optimization_job_validates_cross_validation(dataset_repository):
+    runner = _JobRunner()
+    service = OptimizationService(backtest_service=object(), job_runner=runner, dataset_repository=dataset_repository)
+    assert service.start_optimization_job("unused", 1, {"x": [1, 2]}, cross_validation={"n_groups": 5})["success"]
+    assert runner.job_data["cross_validation"] == {"n_groups": 5, "test_groups": 2, "embargo_sessions": 1}
+    assert not service.start_optimization_job("unused", 1, {"x": [1, 2]}, cross_validation={"n_groups": 1})["success"]
+    assert not service.start_optimization_job(
+        "unused", 1, {"x": [1, 2]}, search="bayesian", cross_validation={}
+    )["success"]
@@ -0,0 +1,126 @@
+"""Tests for the cross-job evaluation memo."""
+
+import numpy as np
+import pandas as pd
+
+from backend.app.services.optimization import EvaluationMemo, evaluation_context, evaluation_key
+from backend.app.services.optimization import memo as memo_module
+from backend.app.services.optimization_service import OptimizationService
+
+
+class _Strategy:
+    pass
+
+
+def test_memo_round_trip_and_prune(tmp_path):
+    memo = EvaluationMemo(tmp_path / "memo.sqlite", max_entries=2)
+    data = pd.DataFrame({"close": np.arange(5.0)})
+    context = evaluation_context("abc", data, {"fee_per_trade": 4.0})
+    assert context != evaluation_context("abc", data.iloc[:4], {"fee_per_trade": 4.0})
+    assert context != evaluation_context("abc", data, {"fee_per_trade": 5.0})
+    assert evaluation_key(context, {"a": 1, "b": 2}) == evaluation_key(context, {"b": 2, "a": 1})
+
+    assert memo.get("k1") is None
+    memo.put("k1", {"sharpe_ratio": np.float64(1.5), "total_trades": np.int64(3), "max_drawdown": float("nan")})
+    stored = memo.get("k1")
+    assert stored["sharpe_ratio"] == 1.5 and stored["total_trades"] == 3
+    assert np.isnan(stored["max_drawdown"])
+    assert (memo.hits, memo.misses) == (1, 1)
+
+    memo.put("k2", {})
+    memo.put("k3", {})
+    assert memo.prune() == 1
+    assert memo.get("k1") is None
+    assert memo.info()["entries"] == 2
+
+    # Entries survive reopening the file
+    assert EvaluationMemo(tmp_path / "memo.sqlite").get("k3") == {}
+
+
+def test_context_depends_on_engine_and_metrics_source(monkeypatch):
+    data = pd.DataFrame({"close": np.arange(5.0)})
+    context = evaluation_context("abc", data, None)
+    # An engine, indicator or metrics fix changes the source hashes and retires old entries
+    monkeypatch.setattr(memo_module, "backtester_source_hash", lambda: "patched")
+    patched = evaluation_context("abc", data, None)
+    assert patched != context
+    monkeypatch.setattr(memo_module, "_backtest_service_hash", lambda: "patched")
+    assert evaluation_context("abc", data, None) != patched
+
+
+class _Backtests:
+    def __init__(self):
+        self.calls = 0
+
+    def load_strategy(self, strategy_path):
+        return _Strategy
+
+    def run_backtest(self, data, strategy, strategy_params, engine_options):
+        self.calls += 1
+        a, b = strategy_params["a"], strategy_params["b"]
+        return {
+            "success": True,
+            "metrics": {"sharpe_ratio": float(a - b), "total_return": float(b - a), "rows": len(data)},
+        }
+
+
+def _job(metric, **overrides):
+    job = {
+        "strategy_path": "unused",
+        "dataset_id": 1,
+        "param_ranges": {"a": [1, 2, 3], "b": [1, 2]},
+        "optimization_metric": metric,
+        "max_workers": 1,
+        "execution_mode": "thread",
+        "validation_split": 0.25,
+    }
+    job.update(overrides)
+    return job
+
+
+def test_changing_metric_reuses_every_backtest(tmp_path, dataset_repository, frame_storage):
+    backtests = _Backtests()
+    service = OptimizationService(
+        backtest_service=backtests,
+        job_runner=object(),
+        dataset_repository=dataset_repository,
+        storage=frame_storage(),
+        results_dir=tmp_path / "results",
+        evaluation_memo=EvaluationMemo(tmp_path / "memo.sqlite"),
+    )
+
+    first = service.run_optimization(_job("sharpe_ratio"))
+    assert first["success"], first.get("error")
+    assert backtests.calls == 7  # 6 combinations + validation
+    assert first["evaluation_cache"] == {"enabled": True, "hits": 0, "misses": 7}
+    assert first["best_parameters"] == {"a": 3, "b": 1}
+    assert first["validation_metrics"]["rows"] == 5
+
+    second = service.run_optimization(_job("total_return"))
+    assert second["success"], second.get("error")
+    assert second["best_parameters"] == {"a": 1, "b": 2}
+    assert second["best_score"] == 1.0
+    # The validation run of the new winner is the only new backtest
+    assert backtests.calls == 8
+    assert second["evaluation_cache"]["hits"] == 6
+
+    third = service.run_optimization(_job("sharpe_ratio", engine_options={"fee_per_trade": 1.0}))
+    assert third["evaluation_cache"]["misses"] == 7
+    assert backtests.calls == 15
+
+
+def test_memo_is_bypassed_when_strategy_cannot_be_hashed(tmp_path, dataset_repository, frame_storage):
+    backtests = _Backtests()
+    backtests.load_strategy = None
+    service = OptimizationService(
+        backtest_service=backtests,
+        job_runner=object(),
+        dataset_repository=dataset_repository,
+        storage=frame_storage(),
+        results_dir=tmp_path / "results",
+        evaluation_memo=EvaluationMemo(tmp_path / "memo.sqlite"),
+    )
+    for _ in range(2):
+        result = service.run_optimization(_job("sharpe_ratio"))
+        assert result["evaluation_cache"] == {"enabled": False, "hits": 0, "misses": 0}
+    assert backtests.calls == 14
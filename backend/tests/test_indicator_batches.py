@@ -0,0 +1,81 @@
+"""Tests for sweep-wide indicator batches."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.app.services.optimization import (
+    SharedIndicatorBatches,
+    attach_indicator_batches,
+    sweep_indicator_batches,
+)
+from backend.app.services.optimization_service import OptimizationService, _SweepExecutor
+from backtester import indicator_cache
+from backtester.indicator_cache import IndicatorCache
+from strategies.ema_bband_scalper import EmaBbandScalper
+
+EMA50_STRATEGY = "strategies.ema50_scalper.EMA50ScalperStrategy"
+
+
+def _market_data(n=750, seed=4):
+    rng = np.random.default_rng(seed)
+    close = 22000 + np.cumsum(rng.normal(0, 4, n))
+    timestamps = pd.date_range("2024-01-01 09:15", periods=n, freq="min")
+    return pd.DataFrame({
+        "timestamp": timestamps,
+        "open": close,
+        "high": close + 2,
+        "low": close - 2,
+        "close": close,
+        "volume": rng.integers(100, 1000, n),
+    })
+
+
+def test_declarations_sharing_an_indicator_share_a_batch():
+    batches = sweep_indicator_batches(EmaBbandScalper, {
+        "fast_period": [8, 12],
+        "slow_period": {"type": "range", "start": 12, "stop": 20, "step": 4},
+        "bb_std_dev": [2.0, 2.5],
+    })
+    assert batches == [
+        {"indicator": "ema", "params": {}, "periods": [8, 12, 16, 20]},
+    ]
+    assert sweep_indicator_batches(EmaBbandScalper, {"bb_period": ["auto"]}) == []
+    assert sweep_indicator_batches(object, {"fast_period": [8]}) == []
+
+
+def test_shared_batches_prime_a_worker_cache():
+    data = _market_data()
+    batches = [{"indicator": "atr", "params": {"wilder": False}, "periods": [5, 14]}]
+    shared = SharedIndicatorBatches(data, batches)
+    try:
+        cache = IndicatorCache()
+        handle = attach_indicator_batches(cache, data, shared.descriptor)
+        atr = cache.get(data, "atr", period=14, wilder=False)
+        assert (cache.hits, cache.misses) == (1, 0)
+        np.testing.assert_array_equal(atr, IndicatorCache().get(data, "atr", period=14, wilder=False))
+        del atr
+        cache.clear()
+        handle.close()
+    finally:
+        shared.close()
+
+
+@pytest.mark.parametrize("mode", ["thread", "process"])
+def test_batched_sweep_matches_unbatched_sweep(mode, monkeypatch):
+    monkeypatch.setattr(indicator_cache, "_shared_cache", IndicatorCache())
+    service = OptimizationService(job_runner=object())
+    service.evaluation_memo = None
+    data = _market_data()
+    param_ranges = {"ema_period": [20, 30, 40]}
+    combos = [{"ema_period": p} for p in param_ranges["ema_period"]]
+    scores = {}
+    for ranges in (None, param_ranges):
+        executor = _SweepExecutor(
+            service, EMA50_STRATEGY, data, "total_return", {}, 2, mode, param_ranges=ranges
+        )
+        with executor:
+            entries = list(executor.run(combos, (0, 600)))
+            assert bool(executor._indicator_windows) == (ranges is not None)
+        scores[ranges is None] = {e["parameters"]["ema_period"]: e["optimization_score"] for e in entries}
+    assert scores[True] == scores[False]
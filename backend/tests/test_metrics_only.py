@@ -0,0 +1,152 @@
+"""Tests for metrics-only backtests used by optimization sweeps."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtester.result import BacktestResult
+from backend.app.services.backtest import BacktestService
+from backend.app.services.backtest.backtest_service import BacktestServiceError
+from backend.app.services.backtest.result_processor import ResultProcessor
+from backend.app.services.optimization import EvaluationMemo
+from backend.app.services.optimization_service import OptimizationService
+
+RSI_STRATEGY = "strategies.rsi_midday_reversion_scalper.RSIMiddayReversionScalper"
+
+
+def test_metrics_only_matches_full_backtest(sessions):
+    service = BacktestService()
+    data = sessions(days=3, seed=5)
+    options = {"intraday": True}
+    full = service.run_backtest(data=data, strategy=RSI_STRATEGY, engine_options=options)
+    lean = service.run_backtest(data=data, strategy=RSI_STRATEGY, engine_options=options, metrics_only=True)
+    assert set(lean) == {"success", "metrics"}
+    assert lean["metrics"] == full["metrics"]
+
+    subset = service.run_backtest(
+        data=data, strategy=RSI_STRATEGY, engine_options=options,
+        metrics_only=True, metrics=["sharpe_ratio", "max_drawdown_pct"],
+    )
+    assert set(subset["metrics"]) == {
+        "total_return", "total_return_pct", "sharpe_ratio", "final_equity", "max_drawdown", "max_drawdown_pct",
+    }
+    assert subset["metrics"]["sharpe_ratio"] == full["metrics"]["sharpe_ratio"]
+    with pytest.raises(BacktestServiceError):
+        service.run_backtest(data=data, strategy=RSI_STRATEGY, metrics_only=True, metrics=["alpha"])
+
+
+def test_columnar_metrics_match_dataframe_metrics():
+    rng = np.random.default_rng(3)
+    timestamps = pd.date_range("2024-01-01 09:15", periods=400, freq="min", tz="Asia/Kolkata")
+    equity = pd.DataFrame({"timestamp": timestamps, "equity": 100000 + np.cumsum(rng.normal(0, 50, 400))})
+    entries = timestamps[::40]
+    trades = pd.DataFrame({
+        "entry_time": entries,
+        "exit_time": entries + pd.Timedelta(minutes=25),
+        "pnl": [120.0, -40.0, -15.0, np.nan, 60.0, 75.0, 30.0, -90.0, 0.0, 10.0],
+    })
+    result = BacktestResult.from_engine_result({"equity_curve": equity, "trade_log": trades}, 100000)
+    processor = ResultProcessor()
+
+    columnar = processor._calculate_columnar_metrics(result, 100000)
+    frames = processor._calculate_comprehensive_metrics(result.equity_frame(), result.trades_frame(), 100000)
+    assert set(columnar) == set(frames)
+    assert columnar == pytest.approx(frames, rel=1e-12)
+    assert columnar["max_consecutive_wins"] == 3
+    assert columnar["trading_sessions_days"] == 1
+
+    groups = {"trade"}
+    assert processor._calculate_columnar_metrics(result, 100000, groups) == pytest.approx(
+        processor._calculate_comprehensive_metrics(pd.DataFrame(), result.trades_frame(), 100000, groups)
+    )
+
+
+class _LeanBacktests:
+    def __init__(self):
+        self.calls = []
+
+    def run_backtest(self, data, strategy, strategy_params, engine_options, metrics_only=False, metrics=None):
+        self.calls.append((metrics_only, metrics))
+        return {"success": True, "metrics": {"sharpe_ratio": float(strategy_params["x"]), "win_rate": 50.0}}
+
+
+def test_optimization_requests_only_scored_metrics(tmp_path, dataset_repository, frame_storage):
+    backtests = _LeanBacktests()
+    service = OptimizationService(
+        backtest_service=backtests,
+        job_runner=object(),
+        dataset_repository=dataset_repository,
+        storage=frame_storage(),
+        results_dir=tmp_path,
+    )
+    job = {
+        "strategy_path": "unused",
+        "dataset_id": 1,
+        "param_combinations": [{"x": x} for x in range(4)],
+        "optimization_metric": "sharpe_ratio",
+        "max_workers": 2,
+        "execution_mode": "thread",
+        "validation_split": 0.25,
+        "objectives": [
+            {"metric": "sharpe_ratio", "direction": "maximize"},
+            {"metric": "win_rate", "direction": "maximize"},
+        ],
+        "metrics_only": True,
+    }
+    result = service.run_optimization(job)
+    assert result["success"], result.get("error")
+    assert result["metrics_only"] is True
+    assert result["best_parameters"] == {"x": 3}
+    assert backtests.calls == [(True, ["sharpe_ratio", "win_rate"])] * 5
+
+    backtests.calls.clear()
+    assert service.run_optimization({**job, "metrics_only": False})["success"]
+    assert backtests.calls == [(False, None)] * 5
+
+
+class _SubsetBacktests:
+    """Returns only the requested metrics, like a metrics-only run."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def load_strategy(self, strategy_path):
+        return _SubsetBacktests
+
+    def run_backtest(self, data, strategy, strategy_params, engine_options, metrics_only=False, metrics=None):
+        self.calls += 1
+        x = float(strategy_params["x"])
+        computed = {"sharpe_ratio": x, "win_rate": 100.0 - x}
+        return {"success": True, "metrics": {m: computed[m] for m in metrics or computed}}
+
+
+def test_memo_entries_missing_a_metric_are_recomputed(tmp_path, dataset_repository, frame_storage):
+    backtests = _SubsetBacktests()
+    memo = EvaluationMemo(tmp_path / "memo.sqlite")
+    service = OptimizationService(
+        backtest_service=backtests,
+        job_runner=object(),
+        dataset_repository=dataset_repository,
+        storage=frame_storage(),
+        results_dir=tmp_path / "results",
+        evaluation_memo=memo,
+    )
+    job = {
+        "strategy_path": "unused",
+        "dataset_id": 1,
+        "param_combinations": [{"x": x} for x in range(3)],
+        "optimization_metric": "sharpe_ratio",
+        "max_workers": 1,
+        "execution_mode": "thread",
+        "validation_split": 0.0,
+        "metrics_only": True,
+    }
+    assert service.run_optimization(job)["success"]
+    assert backtests.calls == 3
+    second = service.run_optimization({**job, "optimization_metric": "win_rate"})
+    assert second["evaluation_cache"]["misses"] == 3
+    assert second["best_parameters"] == {"x": 0}
+    # Both metrics are now memoized, so either job is served from the memo
+    third = service.run_optimization(job)
+    assert third["evaluation_cache"]["hits"] == 3
+    assert backtests.calls == 6
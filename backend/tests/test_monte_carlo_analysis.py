@@ -0,0 +1,70 @@
+"""Tests for the Monte Carlo trade resampling analytics."""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.app.database.models import Backtest, get_session_factory, init_db
+from backend.app.main import app
+from backend.app.services.analytics.metrics_service import MetricsService
+
+TRADES = [{'pnl': pnl} for pnl in (120.0, -80.0, 45.0, -30.0, 60.0, -150.0, 90.0)]
+EQUITY_CURVE = [{'timestamp': '2024-01-01T09:15:00', 'equity': 1000.0}]
+
+
+def _analysis(results, **overrides):
+    options = dict(n_paths=2000, method='bootstrap', n_trades=None, ruin_drawdown_pct=20.0, seed=11)
+    options.update(overrides)
+    backtest = SimpleNamespace(id=5, results=results)
+    return MetricsService(None, None, None, None).monte_carlo_analysis(backtest, **options)
+
+
+def test_monte_carlo_analysis_summarises_paths():
+    result = _analysis({'trades': TRADES, 'equity_curve': EQUITY_CURVE})
+    assert result['success'] and result['backtest_id'] == 5
+    mc = result['monte_carlo']
+    assert (mc['n_paths'], mc['n_trades'], mc['historical_trades']) == (2000, 7, 7)
+    assert (mc['initial_equity'], mc['ruin_equity']) == (1000.0, 800.0)
+    assert 0.0 < mc['ruin_probability'] < 1.0
+    assert mc['max_drawdown_pct']['percentiles']['p5'] <= mc['max_drawdown_pct']['percentiles']['p95']
+    assert sum(mc['final_equity']['histogram']['counts']) == 2000
+    assert _analysis({'trades': TRADES, 'equity_curve': EQUITY_CURVE})['monte_carlo'] == mc
+
+    shuffled = _analysis({'trades': TRADES, 'equity_curve': EQUITY_CURVE}, method='shuffle', n_trades=50)
+    final = shuffled['monte_carlo']['final_equity']
+    assert shuffled['monte_carlo']['n_trades'] == 7
+    assert final['min'] == pytest.approx(final['max']) and final['mean'] == pytest.approx(1055.0)
+
+
+def test_monte_carlo_analysis_needs_trades():
+    assert not _analysis({'trades': [], 'equity_curve': EQUITY_CURVE})['success']
+    assert not _analysis({'trades': TRADES}, n_paths=0)['success']
+
+
+def test_monte_carlo_endpoint():
+    init_db()
+    db = get_session_factory()()
+    try:
+        backtest = Backtest(
+            strategy_name="MonteCarloTest",
+            strategy_params={},
+            dataset_id=1,
+            status='completed',
+            results={'equity_curve': EQUITY_CURVE, 'trades': TRADES, 'metrics': {}},
+            created_at=datetime.utcnow(),
+            completed_at=datetime.utcnow(),
+        )
+        db.add(backtest)
+        db.commit()
+        backtest_id = backtest.id
+    finally:
+        db.close()
+
+    client = TestClient(app)
+    response = client.get(f"/api/v1/analytics/monte-carlo/{backtest_id}", params={'n_paths': 500, 'seed': 1})
+    assert response.status_code == 200
+    assert response.json()['monte_carlo']['n_paths'] == 500
+    assert client.get(f"/api/v1/analytics/monte-carlo/{backtest_id}", params={'method': 'block'}).status_code == 422
+    assert client.get("/api/v1/analytics/monte-carlo/999999").status_code == 404
@@ -175,6 +175,12 @@ def test_start_optimization_job_too_many_combinations(optimization_service, samp
             'start': 1,
             'stop': 20,
             'step': 1
+        },
+        'param3': {
+            'type': 'range',
+            'start': 1,
+            'stop': 100,
+            'step': 1
         }
     }
     
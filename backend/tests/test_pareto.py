@@ -0,0 +1,132 @@
+"""Tests for the multi-objective (Pareto front) optimization mode."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.app.services.optimization import (
+    ParameterGridError,
+    ParetoFront,
+    crowding_distances,
+    normalize_objectives,
+)
+from backend.app.services.optimization_service import SUPPORTED_METRICS, OptimizationService
+
+OBJECTIVES = [
+    {"metric": "sharpe_ratio", "direction": "maximize"},
+    {"metric": "max_drawdown_pct", "direction": "minimize"},
+    {"metric": "total_trades", "direction": "maximize"},
+]
+
+
+def _entry(i, sharpe, drawdown, trades, rung=None):
+    entry = {
+        "parameters": {"i": i},
+        "metrics": {"sharpe_ratio": sharpe, "max_drawdown_pct": drawdown, "total_trades": trades},
+        "optimization_score": sharpe,
+        "status": "completed",
+    }
+    if rung is not None:
+        entry["rung"] = rung
+    return entry
+
+
+def _brute_force_front(points):
+    front = []
+    for i, p in enumerate(points):
+        dominated = any(np.all(q >= p) and np.any(q > p) for q in points)
+        if not dominated:
+            front.append(i)
+    return front
+
+
+def test_incremental_front_matches_brute_force():
+    rng = np.random.default_rng(4)
+    sharpe = rng.normal(size=400)
+    drawdown = rng.uniform(1, 30, size=400)
+    trades = rng.integers(1, 12, size=400)
+    front = ParetoFront(OBJECTIVES)
+    for i in range(400):
+        front.add(_entry(i, sharpe[i], drawdown[i], trades[i]))
+    signed = np.column_stack([sharpe, -drawdown, trades])
+    expected = _brute_force_front(signed)
+    assert sorted(e["parameters"]["i"] for e in front.result()) == expected
+
+
+def test_front_skips_missing_metrics_and_keeps_highest_rung():
+    front = ParetoFront(OBJECTIVES[:2])
+    assert not front.add({"parameters": {}, "metrics": {"sharpe_ratio": 1.0}, "status": "completed"})
+    assert front.add(_entry(0, 1.0, 5.0, 1, rung=0))
+    assert front.add(_entry(1, 2.0, 9.0, 1, rung=0))
+    assert not front.add(_entry(2, 0.5, 6.0, 1, rung=0))
+    # A higher-fidelity rung replaces the front; lower rungs are ignored afterwards
+    assert front.add(_entry(3, 0.1, 20.0, 1, rung=1))
+    assert not front.add(_entry(4, 5.0, 1.0, 1, rung=0))
+    assert [e["parameters"]["i"] for e in front.result()] == [3]
+
+
+def test_crowding_distances():
+    points = np.array([[0.0, 4.0], [1.0, 3.0], [3.0, 1.0], [4.0, 0.0]])
+    distances = crowding_distances(points)
+    assert np.isinf(distances[[0, 3]]).all()
+    assert distances[1] == pytest.approx(3 / 4 + 3 / 4)
+    assert distances[2] == pytest.approx(3 / 4 + 3 / 4)
+    assert np.isinf(crowding_distances(points[:2])).all()
+
+
+def test_normalize_objectives():
+    assert normalize_objectives(["sharpe_ratio", {"metric": "max_drawdown_pct", "direction": "minimize"}],
+                                SUPPORTED_METRICS) == OBJECTIVES[:2]
+    for bad in (["sharpe_ratio"], ["sharpe_ratio", "sharpe_ratio"], ["sharpe_ratio", "alpha"],
+                ["sharpe_ratio", {"metric": "win_rate", "direction": "up"}]):
+        with pytest.raises(ParameterGridError):
+            normalize_objectives(bad, SUPPORTED_METRICS)
+
+
+class _TradeOffBacktests:
+    """Higher leverage raises both the Sharpe ratio and the drawdown."""
+
+    def run_backtest(self, data, strategy, strategy_params, engine_options):
+        x, y = strategy_params["x"], strategy_params["y"]
+        return {"success": True, "metrics": {
+            "sharpe_ratio": float(x), "max_drawdown_pct": float(x * x + y), "total_trades": 10,
+        }}
+
+
+def test_run_optimization_returns_pareto_front(tmp_path, dataset_repository, frame_storage):
+    service = OptimizationService(
+        backtest_service=_TradeOffBacktests(),
+        job_runner=object(),
+        dataset_repository=dataset_repository,
+        storage=frame_storage(pd.DataFrame({"close": np.arange(10.0)})),
+        results_dir=tmp_path,
+    )
+    result = service.run_optimization({
+        "strategy_path": "unused",
+        "dataset_id": 1,
+        "param_ranges": {"x": [1, 2, 3, 4], "y": [0, 1, 2]},
+        "optimization_metric": "sharpe_ratio",
+        "max_workers": 2,
+        "execution_mode": "thread",
+        "validation_split": 0.0,
+        "objectives": OBJECTIVES[:2],
+    })
+    assert result["success"], result.get("error")
+    assert result["best_parameters"]["x"] == 4
+    front = result["pareto_front"]
+    # Only y=0 is efficient: for each x it has the lowest drawdown
+    assert sorted(e["parameters"]["x"] for e in front) == [1, 2, 3, 4]
+    assert all(e["parameters"]["y"] == 0 for e in front)
+    assert [e["crowding_distance"] for e in front][:2] == [None, None]
+    assert all(d > 0 for d in [e["crowding_distance"] for e in front][2:])
+
+
+def test_start_optimization_job_validates_objectives(dataset_repository):
+    service = OptimizationService(backtest_service=object(), job_runner=object(), dataset_repository=dataset_repository)
+    result = service.start_optimization_job("unused", 1, {"x": [1, 2]}, objectives=["sharpe_ratio"])
+    assert not result["success"]
+    result = service.start_optimization_job(
+        "unused", 1, {"x": [1, 2]}, objectives=["sharpe_ratio", "win_rate"],
+        walk_forward={"in_sample_sessions": 2, "out_of_sample_sessions": 1},
+    )
+    assert not result["success"]
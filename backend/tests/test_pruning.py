@@ -0,0 +1,135 @@
+"""Tests for early pruning of hopeless parameter sets during optimization."""
+
+import pytest
+
+from backend.app.services.backtest import BacktestService
+from backend.app.services.backtest.backtest_service import BacktestServiceError
+from backend.app.services.optimization import EvaluationMemo, read_results
+from backend.app.services.optimization_service import OptimizationService
+
+RSI_STRATEGY = "strategies.rsi_midday_reversion_scalper.RSIMiddayReversionScalper"
+
+
+def test_backtest_service_reports_pruned_runs(sessions):
+    service = BacktestService()
+    data = sessions()
+    result = service.run_backtest(
+        data=data,
+        strategy=RSI_STRATEGY,
+        engine_options={"intraday": True, "pruning": {"equity_floor": 10**9}},
+    )
+    assert result["success"]
+    assert result["pruned"]["reason"] == "equity_floor"
+    assert result["pruned"]["sessions"] == 1
+    assert len(result["equity_curve"]) == 375
+
+    full = service.run_backtest(data=data, strategy=RSI_STRATEGY, engine_options={"intraday": True})
+    assert "pruned" not in full
+    with pytest.raises(BacktestServiceError):
+        service.run_backtest(data=data, strategy=RSI_STRATEGY, engine_options={"pruning": {"min_trades": 2}})
+
+
+class _PruningBacktests:
+    """Odd parameter values are pruned whenever the run carries pruning rules."""
+
+    def __init__(self):
+        self.calls = []
+
+    def run_backtest(self, data, strategy, strategy_params, engine_options):
+        pruning = engine_options.get("pruning")
+        self.calls.append((strategy_params["x"], pruning))
+        result = {"success": True, "metrics": {"sharpe_ratio": float(strategy_params["x"])}}
+        if pruning and strategy_params["x"] % 2:
+            result["pruned"] = {"reason": "max_drawdown", "bar": 3, "timestamp": "", "sessions": 1}
+        return result
+
+
+def test_run_optimization_records_pruned_entries(tmp_path, dataset_repository, frame_storage):
+    backtests = _PruningBacktests()
+    service = OptimizationService(
+        backtest_service=backtests,
+        job_runner=object(),
+        dataset_repository=dataset_repository,
+        storage=frame_storage(),
+        results_dir=tmp_path,
+    )
+    result = service.run_optimization({
+        "strategy_path": "unused",
+        "dataset_id": 1,
+        "param_combinations": [{"x": x} for x in range(6)],
+        "optimization_metric": "sharpe_ratio",
+        "max_workers": 1,
+        "execution_mode": "thread",
+        "validation_split": 0.25,
+        "pruning": {"max_drawdown_pct": 30.0},
+    })
+    assert result["success"], result.get("error")
+    assert (result["successful_runs"], result["pruned_runs"], result["failed_runs"]) == (3, 3, 0)
+    # x=5 scores higher but was pruned, so it cannot win
+    assert result["best_parameters"] == {"x": 4}
+    # The out-of-sample check of the winner always runs to the end
+    assert backtests.calls[-1] == (4, None)
+    stored = {e["parameters"]["x"]: e for e in read_results(result["results_file"], limit=10)["results"]}
+    assert stored[5]["status"] == "pruned"
+    assert stored[5]["pruned"] == "max_drawdown"
+    assert stored[5]["metrics"] == {"sharpe_ratio": 5.0}
+    assert "pruned" not in stored[4]
+
+
+class _Strategy:
+    pass
+
+
+class _MemoizedPruningBacktests(_PruningBacktests):
+    def load_strategy(self, strategy_path):
+        return _Strategy
+
+
+def test_memo_hits_never_bypass_pruning_rules(tmp_path, dataset_repository, frame_storage):
+    backtests = _MemoizedPruningBacktests()
+    service = OptimizationService(
+        backtest_service=backtests,
+        job_runner=object(),
+        dataset_repository=dataset_repository,
+        storage=frame_storage(),
+        results_dir=tmp_path / "results",
+        evaluation_memo=EvaluationMemo(tmp_path / "memo.sqlite"),
+    )
+    job = {
+        "strategy_path": "unused",
+        "dataset_id": 1,
+        "param_combinations": [{"x": x} for x in range(6)],
+        "optimization_metric": "sharpe_ratio",
+        "max_workers": 1,
+        "execution_mode": "thread",
+        "validation_split": 0.25,
+    }
+    warm = service.run_optimization(job)
+    assert warm["best_parameters"] == {"x": 5}
+
+    # A job with pruning rules is not answered by the unpruned runs above,
+    # so it prunes exactly what a cold run would
+    for _ in range(2):
+        pruned = service.run_optimization({**job, "pruning": {"max_drawdown_pct": 30.0}})
+        assert (pruned["successful_runs"], pruned["pruned_runs"]) == (3, 3)
+        assert pruned["best_parameters"] == {"x": 4}
+    # The second pruning job only re-ran the pruned (never memoized) sets
+    assert pruned["evaluation_cache"]["hits"] == 4
+    assert [x for x, _ in backtests.calls[-3:]] == [1, 3, 5]
+
+
+def test_start_optimization_job_validates_pruning(dataset_repository):
+    class _JobRunner:
+        submitted = []
+
+        def submit_job(self, job_type, job_data, progress_callback=None):
+            self.submitted.append(job_data)
+            return "job-1"
+
+    runner = _JobRunner()
+    service = OptimizationService(backtest_service=object(), job_runner=runner, dataset_repository=dataset_repository)
+    ranges = {"x": [1, 2]}
+    assert service.start_optimization_job("unused", 1, ranges, pruning={"max_drawdown_pct": 25})["success"]
+    assert runner.submitted[-1]["pruning"] == {"max_drawdown_pct": 25.0}
+    failed = service.start_optimization_job("unused", 1, ranges, pruning={"max_drawdown_pct": 250})
+    assert not failed["success"] and "max_drawdown_pct" in failed["error"]
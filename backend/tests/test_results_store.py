@@ -0,0 +1,144 @@
+"""Tests for streamed optimization results."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.app.services.optimization import StreamingResults, read_results, read_scores
+from backend.app.services.optimization.results_store import SensitivityAccumulator, TopK
+from backend.app.services.optimization_service import OptimizationService, _rank_key
+from backend.app.tasks import JobStatus
+
+
+def _entries(n, seed=0):
+    rng = np.random.default_rng(seed)
+    entries = []
+    for i in range(n):
+        params = {"fast": int(rng.integers(5, 15)), "slow": int(rng.integers(20, 25)), "mode": "ab"[i % 2]}
+        if i % 7 == 3:
+            entries.append({
+                "parameters": params, "metrics": {}, "optimization_score": -float("inf"),
+                "status": "failed", "error": "boom",
+            })
+            continue
+        score = float(rng.normal())
+        entries.append({
+            "parameters": params,
+            "metrics": {"sharpe_ratio": score, "total_trades": int(rng.integers(0, 50)), "note": "x"},
+            "optimization_score": score,
+            "status": "completed",
+        })
+    return entries
+
+
+def test_streaming_results_round_trip(tmp_path):
+    entries = _entries(40)
+    results = StreamingResults(tmp_path / "run", key=_rank_key, top_k=5, chunk_rows=8)
+    for entry in entries:
+        results.add(entry)
+    results.close()
+
+    assert len(list((tmp_path / "run").glob("chunk-*.npz"))) == 5
+    assert results.total == 40
+    assert results.failed == len([e for e in entries if e["status"] != "completed"])
+
+    ranked = sorted(entries, key=_rank_key, reverse=True)
+    assert [e["parameters"] for e in results.top.sorted()] == [e["parameters"] for e in ranked[:5]]
+
+    page = read_results(tmp_path / "run", offset=3, limit=4)
+    assert page["total"] == 40
+    assert [r["optimization_score"] for r in page["results"]] == pytest.approx(
+        [e["optimization_score"] for e in ranked[3:7]]
+    )
+    first = page["results"][0]
+    assert set(first["metrics"]) == {"sharpe_ratio", "total_trades"}
+
+    in_order = read_results(tmp_path / "run", offset=0, limit=40, sort_by_score=False)["results"]
+    assert [r["parameters"] for r in in_order] == [e["parameters"] for e in entries]
+    assert in_order[3]["status"] == "failed" and in_order[3]["error"] == "boom"
+
+    completed = [e["optimization_score"] for e in entries if e["status"] == "completed"]
+    assert np.array_equal(read_scores(tmp_path / "run"), completed)
+
+
+def test_top_k_keeps_first_of_ties():
+    top = TopK(2, key=lambda e: e["score"])
+    for i, score in enumerate([1.0, 3.0, 3.0, 2.0]):
+        top.push({"id": i, "score": score})
+    assert [e["id"] for e in top.sorted()] == [1, 2]
+
+
+def test_sensitivity_accumulator_matches_in_memory_analysis():
+    entries = [e for e in _entries(60, seed=4) if e["status"] == "completed"]
+    for entry in entries:
+        entry["parameters"].pop("mode")
+    accumulator = SensitivityAccumulator()
+    for entry in entries:
+        accumulator.add(entry["parameters"], entry["optimization_score"])
+    streamed = accumulator.result()
+    expected = OptimizationService._analyze_parameter_sensitivity(None, entries)
+
+    assert streamed.keys() == expected.keys()
+    for name in expected:
+        assert streamed[name]["correlation"] == pytest.approx(expected[name]["correlation"])
+        assert streamed[name]["unique_values"] == expected[name]["unique_values"]
+        assert streamed[name]["value_range"] == expected[name]["value_range"]
+        for value, stats in expected[name]["score_by_value"].items():
+            got = streamed[name]["score_by_value"][value]
+            assert got["count"] == stats["count"]
+            assert got["mean"] == pytest.approx(stats["mean"])
+            assert got["std"] == pytest.approx(stats["std"], nan_ok=True)
+
+
+class _Backtests:
+    def run_backtest(self, data, strategy, strategy_params, engine_options):
+        score = -abs(strategy_params["a"] - 17) - abs(strategy_params["b"] - 3) / 10
+        return {"success": True, "metrics": {"sharpe_ratio": score}}
+
+
+class _JobRunner:
+    def __init__(self):
+        self.results = None
+
+    def get_job_status(self, job_id):
+        return {"status": JobStatus.COMPLETED}
+
+    def get_job_results(self, job_id):
+        return self.results
+
+
+def test_run_optimization_streams_large_grid(tmp_path, dataset_repository, frame_storage):
+    runner = _JobRunner()
+    service = OptimizationService(
+        backtest_service=_Backtests(),
+        job_runner=runner,
+        dataset_repository=dataset_repository,
+        storage=frame_storage(pd.DataFrame({"close": np.arange(10.0)})),
+        results_dir=tmp_path,
+    )
+    result = service.run_optimization({
+        "strategy_path": "unused",
+        "dataset_id": 1,
+        "param_ranges": {
+            "a": {"type": "range", "start": 1, "stop": 40, "step": 1},
+            "b": {"type": "range", "start": 0, "stop": 29, "step": 1},
+        },
+        "optimization_metric": "sharpe_ratio",
+        "max_workers": 2,
+        "execution_mode": "thread",
+        "validation_split": 0.0,
+    })
+    assert result["success"], result.get("error")
+    assert result["total_combinations"] == 1200
+    assert result["successful_runs"] == 1200
+    assert len(result["all_results"]) == 50
+    assert result["best_parameters"] == {"a": 17, "b": 3}
+    assert result["analysis"]["score_statistics"]["max"] == pytest.approx(0.0)
+    assert result["parameter_sensitivity"]["a"]["unique_values"] == 40
+
+    runner.results = result
+    page = service.get_optimization_result_page("1", offset=1195, limit=10)
+    assert page["success"] and page["total"] == 1200
+    assert len(page["results"]) == 5
+    assert page["results"][-1]["optimization_score"] == pytest.approx(result["analysis"]["score_statistics"]["min"])
+    assert not service.get_optimization_result_page("1", sort="random")["success"]
@@ -0,0 +1,256 @@
+"""Tests for the adaptive (TPE) and sampling-based parameter searches."""
+
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.app.services.optimization import (
+    LatinHypercubeSampler,
+    ParameterGridError,
+    ParameterSpace,
+    RandomSampler,
+    TPESampler,
+)
+from backend.app.services.optimization_service import OptimizationService
+
+PARAM_RANGES = {
+    "fast": {"type": "range", "start": 1, "stop": 40, "step": 1},
+    "stop_atr": {"type": "range", "start": 0.5, "stop": 5.0, "step": 0.25},
+    "mode": {"type": "choice", "values": ["a", "b", "c", "d"]},
+}
+
+
+def _objective(params):
+    return (
+        -((params["fast"] - 27) / 10) ** 2
+        - (params["stop_atr"] - 3.25) ** 2
+        + {"a": 0.0, "b": 0.5, "c": 0.2, "d": 0.0}[params["mode"]]
+    )
+
+
+def _best_after(sampler, n_trials, batch=4):
+    best = -np.inf
+    evaluated = 0
+    while evaluated < n_trials:
+        for params in sampler.ask(batch):
+            score = _objective(params)
+            sampler.tell(params, score)
+            best = max(best, score)
+            evaluated += 1
+    return best
+
+
+def test_parameter_space_round_trip():
+    space = ParameterSpace(PARAM_RANGES)
+    assert space.size == 40 * 19 * 4
+    assert space.ordered == [True, True, False]
+    params = space.params((3, 2, 1))
+    assert params == {"fast": 4, "stop_atr": 1.0, "mode": "b"}
+    assert type(params["stop_atr"]) is float
+    assert space.key(params) == (3, 2, 1)
+    with pytest.raises(ParameterGridError):
+        ParameterSpace({})
+
+
+def test_tpe_beats_random_search_on_small_budget():
+    tpe = [_best_after(TPESampler(ParameterSpace(PARAM_RANGES), seed=s), 80) for s in range(8)]
+    rand = [
+        _best_after(TPESampler(ParameterSpace(PARAM_RANGES), seed=s, n_startup=10**6), 80)
+        for s in range(8)
+    ]
+    assert np.mean(tpe) > np.mean(rand)
+    # 80 of 3040 points land close to the optimum (0.5)
+    assert np.mean(tpe) > 0.3
+
+
+def test_tpe_never_repeats_and_exhausts_small_space():
+    space = ParameterSpace({"x": [1, 2, 3], "y": ["p", "q"]})
+    sampler = TPESampler(space, seed=1, n_startup=2)
+    seen = []
+    while True:
+        batch = sampler.ask(4)
+        if not batch:
+            break
+        for params in batch:
+            seen.append(space.key(params))
+            sampler.tell(params, float(params["x"]))
+    assert sorted(seen) == sorted(itertools.product(range(3), range(2)))
+
+
+def test_latin_hypercube_covers_every_stratum():
+    space = ParameterSpace(PARAM_RANGES)
+    points = list(LatinHypercubeSampler(space, 20, seed=5).sample(20))
+    keys = [space.key(p) for p in points]
+    assert len(set(keys)) == 20
+    # 40 'fast' values in 20 strata: one point per pair of neighbouring values
+    assert sorted(k[0] // 2 for k in keys) == list(range(20))
+    # 4 choices over 20 points: every choice 5 times
+    assert sorted(np.bincount([k[2] for k in keys]).tolist()) == [5, 5, 5, 5]
+    assert all(p["stop_atr"] in space.values[1] for p in points)
+    assert points == list(LatinHypercubeSampler(space, 20, seed=5).sample(20))
+
+
+def test_random_samplers_never_repeat_and_skip_excluded_points():
+    space = ParameterSpace({"x": [1, 2, 3], "y": {"type": "choice", "values": ["p", "q"]}})
+    for sampler in (RandomSampler(space, seed=2), LatinHypercubeSampler(space, 6, seed=2)):
+        sampler.exclude({"x": 2, "y": "q"})
+        keys = [space.key(p) for p in sampler.sample(10)]
+        assert len(keys) == 5
+        assert sorted(keys) == sorted(set(itertools.product(range(3), range(2))) - {(1, 1)})
+
+
+class _ObjectiveBacktests:
+    def __init__(self):
+        self.calls = 0
+
+    def run_backtest(self, data, strategy, strategy_params, engine_options):
+        self.calls += 1
+        return {"success": True, "metrics": {"sharpe_ratio": _objective(strategy_params)}}
+
+
+def test_run_optimization_bayesian_respects_budget(tmp_path, dataset_repository, frame_storage):
+    backtests = _ObjectiveBacktests()
+    service = OptimizationService(
+        backtest_service=backtests,
+        job_runner=object(),
+        dataset_repository=dataset_repository,
+        storage=frame_storage(pd.DataFrame({"close": np.arange(10.0)})),
+        results_dir=tmp_path,
+    )
+    progress = []
+    result = service.run_optimization(
+        {
+            "strategy_path": "unused",
+            "dataset_id": 1,
+            "param_ranges": PARAM_RANGES,
+            "optimization_metric": "sharpe_ratio",
+            "max_workers": 2,
+            "execution_mode": "thread",
+            "validation_split": 0.0,
+            "search": "bayesian",
+            "n_trials": 60,
+            "seed": 3,
+            "total_combinations": 60,
+        },
+        lambda done, total: progress.append((done, total)),
+    )
+    assert result["success"], result.get("error")
+    assert result["search"] == "bayesian"
+    assert backtests.calls == 60
+    assert result["total_combinations"] == 60
+    assert progress[-1] == (60, 60)
+    assert result["best_score"] > 0.0
+    assert len({tuple(sorted(r["parameters"].items())) for r in result["all_results"]}) == 50
+
+
+@pytest.mark.parametrize("search", ["random", "lhs"])
+def test_run_optimization_sampling_search(tmp_path, search, dataset_repository, frame_storage):
+    backtests = _ObjectiveBacktests()
+    service = OptimizationService(
+        backtest_service=backtests,
+        job_runner=object(),
+        dataset_repository=dataset_repository,
+        storage=frame_storage(pd.DataFrame({"close": np.arange(10.0)})),
+        results_dir=tmp_path,
+    )
+    job = {
+        "strategy_path": "unused",
+        "dataset_id": 1,
+        "param_ranges": PARAM_RANGES,
+        "optimization_metric": "sharpe_ratio",
+        "max_workers": 3,
+        "execution_mode": "thread",
+        "validation_split": 0.0,
+        "search": search,
+        "n_trials": 40,
+        "seed": 11,
+    }
+    result = service.run_optimization(job)
+    assert result["success"], result.get("error")
+    assert backtests.calls == 40 and result["total_combinations"] == 40
+    again = service.run_optimization(job)
+    best = lambda r: sorted(e["optimization_score"] for e in r["all_results"])
+    assert best(again) == best(result)
+
+
+class _JobRunner:
+    def __init__(self):
+        self.submitted = []
+
+    def submit_job(self, job_type, job_data, progress_callback=None):
+        self.submitted.append(job_data)
+        return "job-1"
+
+
+def test_start_optimization_job_bayesian_skips_grid_expansion(dataset_repository):
+    runner = _JobRunner()
+    service = OptimizationService(backtest_service=object(), job_runner=runner, dataset_repository=dataset_repository)
+    huge = {f"p{i}": {"type": "range", "start": 1, "stop": 20, "step": 1} for i in range(6)}
+    result = service.start_optimization_job("unused", 1, huge, search="bayesian", n_trials=200)
+    assert result["success"] and result["total_combinations"] == 200
+    assert "param_combinations" not in runner.submitted[0]
+    assert runner.submitted[0]["n_trials"] == 200
+    result = service.start_optimization_job("unused", 1, {"x": [1, 2, 3]}, search="lhs", n_trials=50)
+    assert result["success"] and result["total_combinations"] == 3
+
+    over_cap = {f"p{i}": {"type": "range", "start": 1, "stop": 20, "step": 1} for i in range(4)}
+    assert not service.start_optimization_job("unused", 1, over_cap)["success"]
+    assert not service.start_optimization_job("unused", 1, huge, search="annealing")["success"]
+    assert not service.start_optimization_job(
+        "unused", 1, huge, search="bayesian",
+        walk_forward={"in_sample_sessions": 2, "out_of_sample_sessions": 1},
+    )["success"]
+
+
+def test_successive_halving_rungs():
+    from backend.app.services.optimization import successive_halving_rungs
+
+    rungs = successive_halving_rungs(81, 200, min_sessions=5, reduction_factor=3)
+    assert [r["sessions"] for r in rungs] == [5, 15, 45, 135, 200]
+    assert [r["candidates"] for r in rungs] == [81, 27, 9, 3, 1]
+    # Fewer sessions than the first rung: one full-data rung
+    assert successive_halving_rungs(10, 3, 5, 3) == [{"rung": 0, "sessions": 3, "candidates": 10}]
+
+
+class _FidelityBacktests:
+    """Score is the parameter value, plus noise that fades with more data."""
+
+    def __init__(self):
+        self.calls = []
+
+    def run_backtest(self, data, strategy, strategy_params, engine_options):
+        self.calls.append(len(data))
+        noise = 50.0 / len(data) * ((strategy_params["x"] * 7) % 5)
+        return {"success": True, "metrics": {"sharpe_ratio": strategy_params["x"] + noise}}
+
+
+def test_run_optimization_successive_halving(tmp_path, sessions, dataset_repository, frame_storage):
+    data = sessions(days=27, bars=10)
+    backtests = _FidelityBacktests()
+    service = OptimizationService(
+        backtest_service=backtests,
+        job_runner=object(),
+        dataset_repository=dataset_repository,
+        storage=frame_storage(data),
+        results_dir=tmp_path,
+    )
+    result = service.run_optimization({
+        "strategy_path": "unused",
+        "dataset_id": 1,
+        "param_combinations": [{"x": x} for x in range(27)],
+        "optimization_metric": "sharpe_ratio",
+        "max_workers": 1,
+        "execution_mode": "thread",
+        "validation_split": 0.0,
+        "search": "halving",
+        "halving": {"min_sessions": 3, "reduction_factor": 3},
+    })
+    assert result["success"], result.get("error")
+    assert [r["sessions"] for r in result["fidelity_schedule"]] == [3, 9, 27]
+    # 27 + 9 + 3 backtests instead of 27 on the full data
+    assert sorted(set(backtests.calls)) == [30, 90, 270]
+    assert len(backtests.calls) == 39
+    assert result["best_parameters"] == {"x": 26}
+    assert result["all_results"][0]["rung"] == 2
@@ -0,0 +1,77 @@
+"""Tests for shared-memory market data and the process-pool sweep backend."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.app.services.optimization import SharedFrame, attach_shared_frame
+from backend.app.services.optimization_service import OptimizationService
+
+RSI_STRATEGY = "strategies.rsi_midday_reversion_scalper.RSIMiddayReversionScalper"
+
+
+def _market_data(days=2, seed=3):
+    rng = np.random.default_rng(seed)
+    frames = []
+    for day in pd.bdate_range("2024-01-01", periods=days):
+        start = day + pd.Timedelta(hours=9, minutes=15)
+        frames.append(pd.DataFrame({"timestamp": pd.date_range(start, periods=375, freq="min")}))
+    df = pd.concat(frames, ignore_index=True)
+    close = 22000 + np.cumsum(rng.normal(0, 4, len(df)))
+    df["open"] = close
+    df["high"] = close + 2
+    df["low"] = close - 2
+    df["close"] = close
+    df["volume"] = rng.integers(100, 1000, len(df))
+    df["timestamp"] = df["timestamp"].dt.strftime("%Y-%m-%d %H:%M:%S")
+    return df
+
+
+def test_shared_frame_round_trip_is_zero_copy():
+    data = _market_data(days=1)
+    data["symbol"] = "NIFTY"
+    with SharedFrame(data) as shared:
+        frame, handle = attach_shared_frame(shared.descriptor)
+        try:
+            assert list(frame.columns) == list(data.columns)
+            assert frame["timestamp"].equals(pd.to_datetime(data["timestamp"]))
+            assert np.array_equal(frame["close"].to_numpy(), data["close"].to_numpy())
+            assert frame["volume"].dtype == data["volume"].dtype
+            assert frame["symbol"].tolist() == data["symbol"].tolist()
+            offset = next(c["offset"] for c in shared.descriptor["columns"] if c["name"] == "close")
+            view = np.ndarray((len(data),), dtype=np.float64, buffer=handle.buf, offset=offset)
+            assert np.shares_memory(frame["close"].to_numpy(), view)
+            with pytest.raises(ValueError):
+                frame["close"].to_numpy()[0] = 0.0
+            del frame, view
+        finally:
+            handle.close()
+
+
+def test_shared_frame_keeps_timezone():
+    data = pd.DataFrame({
+        "timestamp": pd.date_range("2024-01-01 09:15", periods=3, freq="min", tz="Asia/Kolkata"),
+        "close": [1.0, 2.0, 3.0],
+    })
+    with SharedFrame(data) as shared:
+        frame, handle = attach_shared_frame(shared.descriptor)
+        assert frame["timestamp"].equals(data["timestamp"])
+        del frame
+        handle.close()
+
+
+def test_process_sweep_matches_thread_sweep():
+    service = OptimizationService(job_runner=object())
+    data = _market_data()
+    combos = [{"stop_atr": 1.5}, {"stop_atr": 2.0}, {"stop_atr": 2.5}]
+    args = (RSI_STRATEGY, data, (0, 500), combos, "total_return", {"intraday": True}, 2)
+    by_mode = {}
+    for mode in ("process", "thread"):
+        entries = list(service._sweep(*args, mode))
+        by_mode[mode] = {e["parameters"]["stop_atr"]: e for e in entries}
+    assert set(by_mode["process"]) == {1.5, 2.0, 2.5}
+    for key, entry in by_mode["process"].items():
+        assert entry["status"] == "completed"
+        assert entry["optimization_score"] == pytest.approx(by_mode["thread"][key]["optimization_score"])
+        assert entry["metrics"]["total_trades"] == by_mode["thread"][key]["metrics"]["total_trades"]
+        assert entry["metrics"]["data_points"] == 500
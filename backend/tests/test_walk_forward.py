@@ -0,0 +1,167 @@
+"""Tests for walk-forward fold construction and the walk-forward optimization mode."""
+
+import pytest
+
+from backend.app.services.optimization import (
+    WalkForwardError,
+    build_folds,
+    equity_summary,
+    normalize_walk_forward_config,
+    stitch_equity,
+)
+from backend.app.services.optimization_service import OptimizationService
+
+RSI_STRATEGY = "strategies.rsi_midday_reversion_scalper.RSIMiddayReversionScalper"
+
+
+@pytest.fixture
+def csv_sessions(sessions):
+    """Sessions with string timestamps, as loaded from a CSV dataset."""
+
+    def make(days=6, bars=30, seed=5):
+        df = sessions(days=days, bars=bars, seed=seed)
+        df["timestamp"] = df["timestamp"].dt.strftime("%Y-%m-%d %H:%M:%S")
+        return df
+
+    return make
+
+
+def test_rolling_folds_align_to_sessions(csv_sessions):
+    data = csv_sessions(days=6, bars=30)
+    folds = build_folds(data, in_sample_sessions=3, out_of_sample_sessions=1)
+    assert len(folds) == 3
+    assert folds[0]["in_sample"] == (0, 90)
+    assert folds[0]["out_of_sample"] == (90, 120)
+    assert folds[1]["in_sample"] == (30, 120)
+    assert folds[2]["out_of_sample"] == (150, 180)
+    assert folds[0]["out_of_sample_sessions"] == ["2024-01-04", "2024-01-04"]
+
+
+def test_anchored_folds_keep_first_session(csv_sessions):
+    data = csv_sessions(days=6, bars=30)
+    folds = build_folds(data, 2, 2, anchored=True)
+    assert [f["in_sample"] for f in folds] == [(0, 60), (0, 120)]
+    assert [f["out_of_sample"] for f in folds] == [(60, 120), (120, 180)]
+
+
+def test_folds_require_enough_sessions(csv_sessions):
+    with pytest.raises(WalkForwardError):
+        build_folds(csv_sessions(days=3), 3, 1)
+
+
+def test_normalize_walk_forward_config():
+    config = normalize_walk_forward_config({"in_sample_sessions": 5, "out_of_sample_sessions": 2})
+    assert config == {
+        "in_sample_sessions": 5,
+        "out_of_sample_sessions": 2,
+        "step_sessions": 2,
+        "anchored": False,
+    }
+    with pytest.raises(WalkForwardError):
+        normalize_walk_forward_config({"in_sample_sessions": 0, "out_of_sample_sessions": 2})
+
+
+def test_stitch_equity_compounds_folds():
+    curves = [
+        [{"timestamp": "a", "equity": 100.0}, {"timestamp": "b", "equity": 110.0}],
+        [{"timestamp": "c", "equity": 100.0}, {"timestamp": "d", "equity": 90.0}],
+    ]
+    stitched = stitch_equity(curves)
+    assert [p["equity"] for p in stitched] == pytest.approx([100.0, 110.0, 110.0, 99.0])
+    assert [p["fold"] for p in stitched] == [0, 0, 1, 1]
+    summary = equity_summary(stitched)
+    assert summary["total_return_pct"] == pytest.approx(-1.0)
+    assert summary["max_drawdown_pct"] == pytest.approx(10.0)
+
+
+class FakeBacktestService:
+    """Scores a run by ``param`` on in-sample data and records the calls."""
+
+    def __init__(self):
+        self.calls = []
+        self.starts = []
+        self.metrics_only = []
+
+    def run_backtest(self, data, strategy, strategy_params, engine_options, metrics_only=False, metrics=None):
+        self.calls.append((len(data), dict(strategy_params)))
+        self.metrics_only.append((len(data), metrics_only))
+        self.starts.append((len(data), data.index[0]))
+        equity = 100.0 + strategy_params["param"]
+        return {
+            "success": True,
+            "metrics": {"sharpe_ratio": float(strategy_params["param"]), "total_trades": 1},
+            "equity_curve": [
+                {"timestamp": data["timestamp"].iloc[0], "equity": 100.0},
+                {"timestamp": data["timestamp"].iloc[-1], "equity": equity},
+            ],
+        }
+
+
+def test_walk_forward_optimizes_each_fold(csv_sessions):
+    fake = FakeBacktestService()
+    service = OptimizationService(backtest_service=fake, job_runner=object())
+    progress = []
+    data = csv_sessions(days=5)
+    result = service._run_walk_forward(
+        data,
+        {
+            "strategy_path": "unused",
+            "param_combinations": [{"param": 1}, {"param": 3}, {"param": 2}],
+            "optimization_metric": "sharpe_ratio",
+            "walk_forward": {"in_sample_sessions": 2, "out_of_sample_sessions": 1},
+            "max_workers": 2,
+        },
+        "thread",
+        lambda done, total: progress.append((done, total)),
+    )
+    assert result["success"] and result["mode"] == "walk_forward"
+    assert result["total_folds"] == 3
+    # 3 folds x 3 in-sample sets, then 3 out-of-sample runs
+    assert progress[-1] == (12, 12)
+    # Folds are windows of the one frame, never re-indexed copies
+    assert {start for bars, start in fake.starts if bars == 60} == {0, 30, 60}
+    assert {start for bars, start in fake.starts if bars == 30} == {60, 90, 120}
+    assert all(f["best_parameters"] == {"param": 3} for f in result["folds"])
+    # 3 in-sample runs plus 1 out-of-sample run per fold
+    assert len(fake.calls) == 12
+    assert result["parameter_stability"] == {'{"param": 3}': 3}
+    assert len(result["oos_equity_curve"]) == 6
+    assert result["oos_equity_curve"][-1]["equity"] == pytest.approx(100.0 * 1.03 ** 3)
+
+
+def test_walk_forward_in_sample_runs_are_metrics_only(csv_sessions):
+    fake = FakeBacktestService()
+    service = OptimizationService(backtest_service=fake, job_runner=object())
+    result = service._run_walk_forward(
+        csv_sessions(days=4),
+        {
+            "strategy_path": "unused",
+            "param_combinations": [{"param": 1}, {"param": 2}],
+            "optimization_metric": "sharpe_ratio",
+            "walk_forward": {"in_sample_sessions": 2, "out_of_sample_sessions": 1},
+            "metrics_only": True,
+        },
+        "thread",
+    )
+    assert result["successful_folds"] == 2
+    # The out-of-sample runs still need their equity curve
+    assert sorted(fake.metrics_only) == [(30, False)] * 2 + [(60, True)] * 4
+    assert len(result["oos_equity_curve"]) == 4
+
+
+def test_walk_forward_process_mode_matches_thread_mode(csv_sessions):
+    service = OptimizationService(job_runner=object())
+    job_data = {
+        "strategy_path": RSI_STRATEGY,
+        "param_combinations": [{"stop_atr": 1.5}, {"stop_atr": 2.5}],
+        "optimization_metric": "total_return",
+        "engine_options": {"intraday": True},
+        "walk_forward": {"in_sample_sessions": 2, "out_of_sample_sessions": 1},
+    }
+    data = csv_sessions(days=4, bars=375, seed=9)
+    parallel = service._run_walk_forward(data, dict(job_data, max_workers=2), "process")
+    serial = service._run_walk_forward(data, dict(job_data, max_workers=1), "thread")
+    assert parallel["successful_folds"] == 2
+    assert [f["best_parameters"] for f in parallel["folds"]] == [f["best_parameters"] for f in serial["folds"]]
+    assert parallel["oos_summary"] == pytest.approx(serial["oos_summary"])
+    assert len(parallel["oos_equity_curve"]) == 2 * 375
@@ -0,0 +1,177 @@
+"""Tests for the distributed optimization work queue, worker and coordinator."""
+
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.database import models as db_models
+from backend.app.services import optimization_service as optimization_module
+from backend.app.services.optimization_service import OptimizationService, OptimizationWorker
+from backend.app.tasks.backtest_runner import JobCancelledError
+from backend.app.tasks.work_queue import WorkQueue
+
+
+@pytest.fixture
+def queue(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'queue.db'}", connect_args={"check_same_thread": False})
+    db_models.Base.metadata.create_all(bind=engine)
+    return WorkQueue(sessionmaker(bind=engine, autoflush=False, autocommit=False))
+
+
+def test_lease_is_exclusive_and_owned(queue):
+    first, second = queue.enqueue("run-1", [{"params": [1]}, {"params": [2]}])
+    a = queue.lease("a", 60)
+    b = queue.lease("b", 60)
+    assert (a["id"], b["id"]) == (first, second)
+    assert queue.lease("c", 60) is None
+    # Only the owner may renew or complete
+    assert not queue.complete(first, "b", [])
+    assert queue.renew(first, "a", 60)
+    assert queue.complete(first, "a", [{"score": 1}])
+    assert queue.counts("run-1") == {"done": 1, "leased": 1}
+
+    finished = queue.take_finished("run-1")
+    assert [(f["id"], f["results"]) for f in finished] == [(first, [{"score": 1}])]
+    assert queue.take_finished("run-1") == []
+    assert queue.purge("run-1") == 2
+    assert queue.counts() == {}
+
+
+def test_expired_leases_are_retried_then_failed(queue):
+    (item_id,) = queue.enqueue("run-2", [{"params": [1]}], max_attempts=2)
+    assert queue.lease("crashed", 0.0)["attempts"] == 1
+    time.sleep(0.01)
+    assert queue.requeue_expired("run-2") == 1
+    retry = queue.lease("slow", 0.0)
+    assert retry["id"] == item_id and retry["attempts"] == 2
+    time.sleep(0.01)
+    queue.requeue_expired("run-2")
+    # The late worker's results no longer count
+    assert not queue.complete(item_id, "slow", [])
+    (failed,) = queue.take_finished("run-2")
+    assert failed["status"] == "failed" and "expired" in failed["error"]
+
+    (item_id,) = queue.enqueue("run-3", [{"params": [1]}], max_attempts=2)
+    queue.lease("w", 60)
+    # Live leases are left alone and only the owner may report a failure
+    assert queue.requeue_expired("run-3") == 0
+    assert not queue.fail(item_id, "other", "boom")
+    assert queue.fail(item_id, "w", "boom")
+    assert queue.counts("run-3") == {"pending": 1}
+
+
+class _Backtests:
+    def __init__(self):
+        self.rows = []
+
+    def run_backtest(self, data, strategy, strategy_params, engine_options):
+        self.rows.append(len(data))
+        if strategy_params["x"] == 3:
+            raise RuntimeError("bad parameters")
+        return {"success": True, "metrics": {"sharpe_ratio": np.float64(strategy_params["x"]), "profit_factor": np.inf}}
+
+
+def test_distributed_optimization_runs_on_workers(queue, tmp_path, monkeypatch, dataset_repository, frame_storage):
+    settings = optimization_module.get_settings().model_copy(
+        update={"optimization_worker_batch_size": 3, "optimization_worker_poll_seconds": 0.01}
+    )
+    monkeypatch.setattr(optimization_module, "get_settings", lambda: settings)
+    data = pd.DataFrame({"close": np.arange(40.0)})
+    coordinator_backtests = _Backtests()
+    service = OptimizationService(
+        backtest_service=coordinator_backtests,
+        job_runner=object(),
+        dataset_repository=dataset_repository,
+        storage=frame_storage(data),
+        results_dir=tmp_path / "results",
+        work_queue=queue,
+    )
+    worker_backtests = [_Backtests(), _Backtests()]
+    stop = threading.Event()
+    workers = [
+        OptimizationWorker(
+            queue, backtest_service=backtests, dataset_repository=dataset_repository, storage=frame_storage(data),
+            worker_id=f"w{i}", poll_interval=0.01,
+        )
+        for i, backtests in enumerate(worker_backtests)
+    ]
+    threads = [threading.Thread(target=w.run, kwargs={"stop_event": stop}) for w in workers]
+    for thread in threads:
+        thread.start()
+    try:
+        result = service.run_optimization({
+            "strategy_path": "unused",
+            "dataset_id": 1,
+            "param_combinations": [{"x": x} for x in range(10)],
+            "optimization_metric": "sharpe_ratio",
+            "execution_mode": "distributed",
+            "validation_split": 0.25,
+        })
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+    assert result["success"], result.get("error")
+    assert result["execution_mode"] == "distributed"
+    assert (result["successful_runs"], result["failed_runs"]) == (9, 1)
+    assert result["best_parameters"] == {"x": 9}
+    assert result["validation_metrics"]["sharpe_ratio"] == 9.0
+    # Every backtest ran on a worker: 10 on the training rows, 1 validation run
+    assert coordinator_backtests.rows == []
+    assert sorted(sum((b.rows for b in worker_backtests), [])) == [10] + [30] * 10
+    assert queue.counts() == {}
+
+
+def test_distributed_coordinator_stops_without_workers(queue, tmp_path, monkeypatch, dataset_repository, frame_storage):
+    settings = optimization_module.get_settings().model_copy(
+        update={"optimization_worker_poll_seconds": 0.01, "optimization_worker_idle_timeout_seconds": 0.05}
+    )
+    monkeypatch.setattr(optimization_module, "get_settings", lambda: settings)
+    service = OptimizationService(
+        backtest_service=_Backtests(),
+        job_runner=object(),
+        dataset_repository=dataset_repository,
+        storage=frame_storage(),
+        results_dir=tmp_path / "results",
+        work_queue=queue,
+    )
+    job_data = {
+        "strategy_path": "unused",
+        "dataset_id": 1,
+        "param_combinations": [{"x": x} for x in range(4)],
+        "optimization_metric": "sharpe_ratio",
+        "execution_mode": "distributed",
+    }
+
+    # Nobody leases the batches: the job fails once the idle timeout passes
+    result = service.run_optimization(job_data)
+    assert not result["success"] and "No optimization worker" in result["error"]
+    assert queue.counts() == {}
+
+    # The cancel hook is checked on every poll, long before the timeout
+    settings.optimization_worker_idle_timeout_seconds = 60.0
+    polls = []
+    with pytest.raises(JobCancelledError):
+        service.run_optimization(job_data, cancel_requested=lambda: polls.append(1) or len(polls) > 3)
+    assert len(polls) == 4
+    assert queue.counts() == {}
+
+
+def test_worker_rejects_a_different_dataset(queue, dataset_repository, frame_storage):
+    queue.enqueue("run-4", [{
+        "strategy_path": "unused", "dataset_id": 1, "fingerprint": "not-this-data", "rows": [0, 5],
+        "optimization_metric": "sharpe_ratio", "engine_options": {}, "params": [{"x": 1}],
+    }], max_attempts=1)
+    worker = OptimizationWorker(
+        queue, backtest_service=_Backtests(), dataset_repository=dataset_repository,
+        storage=frame_storage(pd.DataFrame({"close": np.arange(5.0)})), worker_id="w",
+    )
+    assert worker.run(exit_when_idle=True) == 1
+    (failed,) = queue.take_finished("run-4")
+    assert failed["status"] == "failed" and "differs" in failed["error"]
@@ -6,13 +6,76 @@ Optimized for performance with vectorized operations.
 
 import pandas as pd
 import numpy as np
-from numba import jit
+from numba import jit, prange
 import warnings
 
+from .exit_rules import END_OF_DATA_REASON, SESSION_CLOSE_REASON, compile_exit_rules
+from .metrics import equity_matrix_metrics
+from .pruning import (
+    PRUNE_BAR,
+    PRUNE_EQUITY_FLOOR,
+    PRUNE_MAX_DRAWDOWN,
+    PRUNE_MIN_TRADES,
+    PRUNE_MIN_TRADES_SESSIONS,
+    PRUNE_REASON,
+    PRUNE_SESSIONS,
+    PRUNED_EXIT_REASON,
+    normalize_pruning,
+    pruning_array,
+    pruning_summary,
+)
+from .strategy_base import StrategyBase
+
 warnings.filterwarnings('ignore')
 
+# Exit reasons emitted by the signal-reversal core, indexed by reason code
+FAST_EXIT_REASONS = ['Signal Reversal', SESSION_CLOSE_REASON, END_OF_DATA_REASON]
+
+# Exit fill models and same-bar stop/target tie-break codes for the rule kernel
+FILL_MODELS = ('close', 'ohlc')
+TIE_BREAKS = {'stop': 0, 'target': 1, 'nearest': 2}
+
+
+@jit(nopython=True, cache=True)
+def _compare(lhs, rhs, op):
+    """Evaluate ``lhs <op> rhs`` for the operator codes in exit_rules.OPS."""
+    if op == 0:
+        return lhs >= rhs
+    if op == 1:
+        return lhs <= rhs
+    if op == 2:
+        return lhs > rhs
+    return lhs < rhs
+
 
-@jit(nopython=True)
+@jit(nopython=True, cache=True)
+def _trade_pnl(position, entry_price, exit_price, option_delta, option_qty,
+               option_price_per_unit, fee_per_trade):
+    """Option PnL of a round trip, matching the traditional loop arithmetic."""
+    option_move = option_delta * (exit_price - entry_price)
+    if position == 1:
+        pnl = option_move * option_qty * option_price_per_unit
+    else:
+        pnl = -option_move * option_qty * option_price_per_unit
+    return pnl - fee_per_trade
+
+
+@jit(nopython=True, cache=True)
+def _prune_check(prune, equity, peak_equity, n_trades, sessions):
+    """Index into ``pruning.PRUNE_REASONS`` of the first rule that fires, or -1."""
+    max_drawdown = prune[PRUNE_MAX_DRAWDOWN]
+    if max_drawdown == max_drawdown and peak_equity > 0 and (peak_equity - equity) / peak_equity > max_drawdown:
+        return 0
+    floor = prune[PRUNE_EQUITY_FLOOR]
+    if floor == floor and equity < floor:
+        return 1
+    min_trades = prune[PRUNE_MIN_TRADES]
+    if min_trades == min_trades and sessions >= prune[PRUNE_MIN_TRADES_SESSIONS] and n_trades < min_trades:
+        return 2
+    return -1
+
+
+@jit(nopython=True, cache=True)
 def _vectorized_backtest_core(
     signals,
     prices,
@@ -33,71 +96,620 @@ def _vectorized_backtest_core(
     slippage : float
         Absolute price slippage applied on both entry and exit.
     """
+    no_sessions = np.zeros(len(signals), dtype=np.int64)
+    result = _vectorized_session_core(
+        signals,
+        prices,
+        no_sessions,
+        no_sessions,
+        option_delta,
+        option_qty,
+        option_price_per_unit,
+        fee_per_trade,
+        slippage,
+        initial_equity,
+        False,
+        -1,
+        np.nan,
+    )
+    return result[0]
+
+
+@jit(nopython=True, cache=True)
+def _vectorized_session_core(
+    signals,
+    prices,
+    day_idx,
+    time_of_day,
+    option_delta,
+    option_qty,
+    option_price_per_unit,
+    fee_per_trade,
+    slippage,
+    initial_equity,
+    intraday,
+    session_close,
+    daily_profit_target,
+    prune=None,
+):
+    """Signal-reversal backtest core with optional intraday session handling.
+
+    With ``intraday`` set, open positions are flattened on the first bar at or
+    after ``session_close`` (seconds since midnight, -1 disables), no new
+    entries are taken for the rest of that session, and entries are locked out
+    once the session's realised PnL reaches ``daily_profit_target`` (NaN
+    disables). Sessions re-arm whenever ``day_idx`` changes. A position still
+    open on the last bar is closed there as end of data, without re-entry.
+
+    ``prune`` (see ``pruning.pruning_array``) is checked whenever ``day_idx``
+    changes; when a rule fires the run stops before that bar, closes any
+    open position on the previous bar and records reason, bar and completed
+    sessions in ``prune``.
+
+    Returns
+    -------
+    tuple
+        (equity_curve, entry_idx, exit_idx, entry_price, exit_price,
+        direction, pnl, reason_code). The equity curve has one point per
+        simulated bar plus one holding the equity after the end-of-data
+        close; trade arrays are trimmed to the number of trades and reason
+        codes index ``FAST_EXIT_REASONS``.
+    """
     n = len(signals)
-    equity_curve = np.zeros(n)
+    equity_curve = np.zeros(n + 1)
+    t_entry_idx = np.empty(n, dtype=np.int64)
+    t_exit_idx = np.empty(n, dtype=np.int64)
+    t_entry_price = np.empty(n)
+    t_exit_price = np.empty(n)
+    t_direction = np.empty(n, dtype=np.int64)
+    t_pnl = np.empty(n)
+    t_reason = np.empty(n, dtype=np.int64)
+    n_trades = 0
 
+    use_daily_target = daily_profit_target == daily_profit_target
     position = 0  # 0=none, 1=long, -1=short
     entry_price = 0.0
+    entry_bar = -1
     current_equity = initial_equity
+    current_day = -2
+    session_closed = False
+    daily_pnl = 0.0
+    stop = n
+    peak_equity = initial_equity
+    prune_day = day_idx[0] if n > 0 else 0
+    sessions_done = 0
 
     for i in range(n):
         signal = signals[i]
         price = prices[i]
 
+        if prune is not None and day_idx[i] != prune_day:
+            prune_day = day_idx[i]
+            sessions_done += 1
+            # Equity as if the open position were closed on the previous bar
+            marked = current_equity
+            if position != 0:
+                mark = prices[i - 1] - slippage if position == 1 else prices[i - 1] + slippage
+                marked += _trade_pnl(position, entry_price, mark, option_delta,
+                                     option_qty, option_price_per_unit, fee_per_trade)
+            peak_equity = max(peak_equity, marked)
+            reason = _prune_check(prune, marked, peak_equity, n_trades, sessions_done)
+            if reason >= 0:
+                prune[PRUNE_REASON] = reason
+                prune[PRUNE_BAR] = i
+                prune[PRUNE_SESSIONS] = sessions_done
+                stop = i
+                break
+
+        if intraday:
+            if day_idx[i] != current_day:
+                current_day = day_idx[i]
+                session_closed = False
+                daily_pnl = 0.0
+            if session_close >= 0 and time_of_day[i] >= session_close:
+                if position != 0:
+                    exit_price = price - slippage if position == 1 else price + slippage
+                    pnl = _trade_pnl(position, entry_price, exit_price, option_delta,
+                                     option_qty, option_price_per_unit, fee_per_trade)
+                    t_entry_idx[n_trades] = entry_bar
+                    t_exit_idx[n_trades] = i
+                    t_entry_price[n_trades] = entry_price
+                    t_exit_price[n_trades] = exit_price
+                    t_direction[n_trades] = position
+                    t_pnl[n_trades] = pnl
+                    t_reason[n_trades] = 1
+                    n_trades += 1
+                    current_equity += pnl
+                    position = 0
+                    entry_price = 0.0
+                    entry_bar = -1
+                session_closed = True
+                equity_curve[i] = current_equity
+                continue
+
         # Entry logic
         if position == 0:
-            if signal == 1:  # Long entry
-                position = 1
-                entry_price = price + slippage
-            elif signal == -1:  # Short entry
-                position = -1
-                entry_price = price - slippage
-        else:
+            if not session_closed:
+                if signal == 1:  # Long entry
+                    position = 1
+                    entry_price = price + slippage
+                    entry_bar = i
+                elif signal == -1:  # Short entry
+                    position = -1
+                    entry_price = price - slippage
+                    entry_bar = i
+        elif i < n - 1:
             # Exit logic - simplified for performance (signal reversal only)
-            exit_now = False
-
-            # Check for signal reversal exit
             if (position == 1 and signal == -1) or (position == -1 and signal == 1):
-                exit_now = True
-
-            if exit_now:
                 exit_price = price - slippage if position == 1 else price + slippage
-                # Calculate PnL
-                option_move = option_delta * (exit_price - entry_price)
-                if position == 1:  # Long
-                    pnl = option_move * option_qty * option_price_per_unit
-                else:  # Short
-                    pnl = -option_move * option_qty * option_price_per_unit
-
-                current_equity += pnl - fee_per_trade
+                pnl = _trade_pnl(position, entry_price, exit_price, option_delta,
+                                 option_qty, option_price_per_unit, fee_per_trade)
+                t_entry_idx[n_trades] = entry_bar
+                t_exit_idx[n_trades] = i
+                t_entry_price[n_trades] = entry_price
+                t_exit_price[n_trades] = exit_price
+                t_direction[n_trades] = position
+                t_pnl[n_trades] = pnl
+                t_reason[n_trades] = 0
+                n_trades += 1
+                current_equity += pnl
+                daily_pnl += pnl
+                if intraday and use_daily_target and daily_pnl >= daily_profit_target:
+                    session_closed = True
 
                 # Reset position
                 position = 0
                 entry_price = 0.0
+                entry_bar = -1
 
                 # Immediate re-entry if signal present
+                if not session_closed:
+                    if signal == 1:
+                        position = 1
+                        entry_price = price + slippage
+                        entry_bar = i
+                    elif signal == -1:
+                        position = -1
+                        entry_price = price - slippage
+                        entry_bar = i
+
+        equity_curve[i] = current_equity
+
+    if position != 0:
+        last_price = prices[stop - 1]
+        exit_price = last_price - slippage if position == 1 else last_price + slippage
+        pnl = _trade_pnl(position, entry_price, exit_price, option_delta,
+                         option_qty, option_price_per_unit, fee_per_trade)
+        t_entry_idx[n_trades] = entry_bar
+        t_exit_idx[n_trades] = stop - 1
+        t_entry_price[n_trades] = entry_price
+        t_exit_price[n_trades] = exit_price
+        t_direction[n_trades] = position
+        t_pnl[n_trades] = pnl
+        t_reason[n_trades] = 2
+        n_trades += 1
+        current_equity += pnl
+
+    equity_curve[stop] = current_equity
+
+    return (
+        equity_curve[:stop + 1],
+        t_entry_idx[:n_trades],
+        t_exit_idx[:n_trades],
+        t_entry_price[:n_trades],
+        t_exit_price[:n_trades],
+        t_direction[:n_trades],
+        t_pnl[:n_trades],
+        t_reason[:n_trades],
+    )
+
+
+@jit(nopython=True, cache=True)
+def _trade_stats(pnl):
+    """Trade count, wins, gross profit/loss, extremes and streaks of a pnl array."""
+    n_trades = len(pnl)
+    wins = 0
+    gross_profit = 0.0
+    gross_loss = 0.0
+    largest_win = np.nan
+    largest_loss = np.nan
+    win_streak = 0
+    loss_streak = 0
+    max_win_streak = 0
+    max_loss_streak = 0
+    for t in range(n_trades):
+        value = pnl[t]
+        if t == 0 or value > largest_win:
+            largest_win = value
+        if t == 0 or value < largest_loss:
+            largest_loss = value
+        if value > 0:
+            wins += 1
+            gross_profit += value
+            win_streak += 1
+            loss_streak = 0
+        elif value < 0:
+            gross_loss += value
+            loss_streak += 1
+            win_streak = 0
+        else:
+            win_streak = 0
+            loss_streak = 0
+        max_win_streak = max(max_win_streak, win_streak)
+        max_loss_streak = max(max_loss_streak, loss_streak)
+    return (n_trades, wins, gross_profit, gross_loss, largest_win, largest_loss,
+            max_win_streak, max_loss_streak)
+
+
+@jit(nopython=True, parallel=True, cache=True)
+def _batch_session_core(
+    signal_matrix,
+    prices,
+    day_idx,
+    time_of_day,
+    option_delta,
+    option_qty,
+    option_price_per_unit,
+    fee_per_trade,
+    slippage,
+    initial_equity,
+    intraday,
+    session_close,
+    daily_profit_target,
+):
+    """Run ``_vectorized_session_core`` for every row of ``signal_matrix``.
+
+    Rows are independent parameter sets sharing the price and session arrays,
+    so they are simulated in parallel with ``prange``.
+
+    Returns
+    -------
+    tuple
+        (equity, trade_stats): equity curves of shape (sets, bars + 1) and a
+        (sets, 8) matrix with the ``_trade_stats`` fields of every set.
+    """
+    n_sets, n = signal_matrix.shape
+    equity = np.empty((n_sets, n + 1))
+    trade_stats = np.empty((n_sets, 8))
+    for j in prange(n_sets):
+        result = _vectorized_session_core(
+            signal_matrix[j],
+            prices,
+            day_idx,
+            time_of_day,
+            option_delta,
+            option_qty,
+            option_price_per_unit,
+            fee_per_trade,
+            slippage,
+            initial_equity,
+            intraday,
+            session_close,
+            daily_profit_target,
+        )
+        equity[j] = result[0]
+        stats = _trade_stats(result[6])
+        trade_stats[j, 0] = stats[0]
+        trade_stats[j, 1] = stats[1]
+        trade_stats[j, 2] = stats[2]
+        trade_stats[j, 3] = stats[3]
+        trade_stats[j, 4] = stats[4]
+        trade_stats[j, 5] = stats[5]
+        trade_stats[j, 6] = stats[6]
+        trade_stats[j, 7] = stats[7]
+    return equity, trade_stats
+
+
+@jit(nopython=True, cache=True)
+def _rule_level(r, s, i, entry_bar, entry_price, series, col, direction,
+                anchor_entry, at_entry, points, mult, fallback):
+    """Right-hand side of rule ``r`` for side ``s`` at bar ``i``."""
+    base = entry_price if anchor_entry[r] else 0.0
+    offset = points[r]
+    if col[r, s] >= 0:
+        value = series[col[r, s], entry_bar if at_entry[r] else i]
+        if fallback[r] == fallback[r] and (value != value or value == 0.0):
+            offset = fallback[r]
+        else:
+            offset = points[r] + mult[r] * value
+    return base + direction[r, s] * offset
+
+
+@jit(nopython=True, cache=True)
+def _rule_backtest_core(
+    signals,
+    prices,
+    day_idx,
+    time_of_day,
+    series,
+    src,
+    col,
+    ops,
+    direction,
+    anchor_entry,
+    at_entry,
+    points,
+    mult,
+    fallback,
+    side,
+    reentry,
+    intrabar,
+    adverse,
+    highs,
+    lows,
+    opens,
+    option_delta,
+    option_qty,
+    option_price_per_unit,
+    fee_per_trade,
+    slippage,
+    initial_equity,
+    intraday,
+    session_close,
+    daily_profit_target,
+    fill_ohlc=False,
+    tie_break=0,
+    prune=None,
+):
+    """Compiled bar loop for strategies that declare column-based exit rules.
+
+    Reproduces ``BacktestEngine._run_traditional_backtest`` (entries, rule
+    exits, same-bar re-entry, session close and daily profit target lockout)
+    without creating per-bar pandas objects.
+
+    Parameters
+    ----------
+    day_idx, time_of_day : ndarray
+        Session id and seconds since midnight of every bar.
+    series, src, col, ops, direction, anchor_entry, at_entry, points, mult,
+    fallback, side, reentry, intrabar, adverse : ndarray
+        Rule arrays produced by ``exit_rules.compile_exit_rules``.
+    highs, lows, opens : ndarray
+        Bar extremes and opens used when ``fill_ohlc`` is set (NaN opens
+        disable gap fills).
+    session_close : int
+        Session close as seconds since midnight, or -1 to disable.
+    daily_profit_target : float
+        Daily PnL lockout level, NaN to disable.
+    fill_ohlc : bool
+        Check price-level rules against high/low and fill them at the level
+        (or at the open when the bar gaps through it).
+    tie_break : int
+        Which level wins when adverse and favourable levels are both touched
+        in one bar: 0 adverse (stop) first, 1 favourable (target) first,
+        2 the level nearest the open.
+    prune : ndarray, optional
+        Pruning limits checked at every session boundary, as in
+        ``_vectorized_session_core``.
+
+    Returns
+    -------
+    tuple
+        (equity_curve, final_equity, entry_idx, exit_idx, entry_price,
+        exit_price, direction, pnl, reason_code) with the equity curve
+        covering the simulated bars and trade arrays trimmed to the number of
+        completed trades. Reason codes index the rule reasons, followed by
+        session close and end of data.
+    """
+    n = len(signals)
+    n_rules = len(points)
+    session_code = n_rules
+    end_code = n_rules + 1
+
+    equity_curve = np.empty(n)
+    t_entry_idx = np.empty(n, dtype=np.int64)
+    t_exit_idx = np.empty(n, dtype=np.int64)
+    t_entry_price = np.empty(n)
+    t_exit_price = np.empty(n)
+    t_direction = np.empty(n, dtype=np.int64)
+    t_pnl = np.empty(n)
+    t_reason = np.empty(n, dtype=np.int64)
+    n_trades = 0
+
+    use_daily_target = daily_profit_target == daily_profit_target
+    position = 0
+    entry_price = 0.0
+    entry_bar = -1
+    equity = initial_equity
+    current_day = -2
+    session_closed = False
+    daily_pnl = 0.0
+    stop = n
+    peak_equity = initial_equity
+    prune_day = day_idx[0] if n > 0 else 0
+    sessions_done = 0
+
+    for i in range(n):
+        price = prices[i]
+        signal = signals[i]
+
+        if prune is not None and day_idx[i] != prune_day:
+            prune_day = day_idx[i]
+            sessions_done += 1
+            # Equity as if the open position were closed on the previous bar
+            marked = equity
+            if position != 0:
+                mark = prices[i - 1] - slippage if position == 1 else prices[i - 1] + slippage
+                marked += _trade_pnl(position, entry_price, mark, option_delta,
+                                     option_qty, option_price_per_unit, fee_per_trade)
+            peak_equity = max(peak_equity, marked)
+            reason = _prune_check(prune, marked, peak_equity, n_trades, sessions_done)
+            if reason >= 0:
+                prune[PRUNE_REASON] = reason
+                prune[PRUNE_BAR] = i
+                prune[PRUNE_SESSIONS] = sessions_done
+                stop = i
+                break
+
+        if intraday:
+            if day_idx[i] != current_day:
+                current_day = day_idx[i]
+                session_closed = False
+                daily_pnl = 0.0
+            if session_close >= 0 and time_of_day[i] >= session_close:
+                if position != 0:
+                    exit_price = price - slippage if position == 1 else price + slippage
+                    pnl = _trade_pnl(position, entry_price, exit_price, option_delta,
+                                     option_qty, option_price_per_unit, fee_per_trade)
+                    t_entry_idx[n_trades] = entry_bar
+                    t_exit_idx[n_trades] = i
+                    t_entry_price[n_trades] = entry_price
+                    t_exit_price[n_trades] = exit_price
+                    t_direction[n_trades] = position
+                    t_pnl[n_trades] = pnl
+                    t_reason[n_trades] = session_code
+                    n_trades += 1
+                    equity += pnl
+                    position = 0
+                    entry_price = 0.0
+                    entry_bar = -1
+                equity_curve[i] = equity
+                session_closed = True
+                continue
+
+        if position == 0:
+            if not (intraday and session_closed):
                 if signal == 1:
                     position = 1
                     entry_price = price + slippage
+                    entry_bar = i
                 elif signal == -1:
                     position = -1
                     entry_price = price - slippage
+                    entry_bar = i
+        else:
+            s = 0 if position == 1 else 1
+            side_bit = 1 if position == 1 else 2
+            hit = -1
+            fill = price
+            if fill_ohlc:
+                for r in range(n_rules):
+                    if (side[r] & side_bit) == 0 or not intrabar[r]:
+                        continue
+                    rhs = _rule_level(r, s, i, entry_bar, entry_price, series, col, direction,
+                                      anchor_entry, at_entry, points, mult, fallback)
+                    op = ops[r, s]
+                    touch = highs[i] if op == 0 or op == 2 else lows[i]
+                    if not _compare(touch, rhs, op):
+                        continue
+                    level_fill = rhs
+                    if opens[i] == opens[i] and _compare(opens[i], rhs, op):
+                        level_fill = opens[i]
+                    if hit < 0:
+                        hit = r
+                        fill = level_fill
+                    elif adverse[r] != adverse[hit]:
+                        if tie_break == 0:
+                            take = adverse[r]
+                        elif tie_break == 1:
+                            take = not adverse[r]
+                        else:
+                            take = abs(level_fill - opens[i]) < abs(fill - opens[i])
+                        if take:
+                            hit = r
+                            fill = level_fill
+            if hit < 0:
+                for r in range(n_rules):
+                    if (side[r] & side_bit) == 0 or (fill_ohlc and intrabar[r]):
+                        continue
+                    lhs = series[src[r, s], i]
+                    rhs = _rule_level(r, s, i, entry_bar, entry_price, series, col, direction,
+                                      anchor_entry, at_entry, points, mult, fallback)
+                    if _compare(lhs, rhs, ops[r, s]):
+                        hit = r
+                        fill = price
+                        break
 
-        equity_curve[i] = current_equity
+            if hit >= 0:
+                exit_price = fill - slippage if position == 1 else fill + slippage
+                pnl = _trade_pnl(position, entry_price, exit_price, option_delta,
+                                 option_qty, option_price_per_unit, fee_per_trade)
+                t_entry_idx[n_trades] = entry_bar
+                t_exit_idx[n_trades] = i
+                t_entry_price[n_trades] = entry_price
+                t_exit_price[n_trades] = exit_price
+                t_direction[n_trades] = position
+                t_pnl[n_trades] = pnl
+                t_reason[n_trades] = hit
+                n_trades += 1
+                equity += pnl
+                daily_pnl += pnl
+                if use_daily_target and daily_pnl >= daily_profit_target:
+                    session_closed = True
+                position = 0
+                entry_price = 0.0
+                entry_bar = -1
+
+                if reentry[hit] and signal != 0 and not (intraday and session_closed):
+                    if signal == 1:
+                        position = 1
+                        entry_price = price + slippage
+                        entry_bar = i
+                    elif signal == -1:
+                        position = -1
+                        entry_price = price - slippage
+                        entry_bar = i
+
+        equity_curve[i] = equity
 
     if position != 0:
-        last_price = prices[-1]
-        exit_price = last_price - slippage if position == 1 else last_price + slippage
-        option_move = option_delta * (exit_price - entry_price)
-        if position == 1:
-            pnl = option_move * option_qty * option_price_per_unit
-        else:
-            pnl = -option_move * option_qty * option_price_per_unit
-        current_equity += pnl - fee_per_trade
+        exit_price = prices[stop - 1] - slippage if position == 1 else prices[stop - 1] + slippage
+        pnl = _trade_pnl(position, entry_price, exit_price, option_delta,
+                         option_qty, option_price_per_unit, fee_per_trade)
+        t_entry_idx[n_trades] = entry_bar
+        t_exit_idx[n_trades] = stop - 1
+        t_entry_price[n_trades] = entry_price
+        t_exit_price[n_trades] = exit_price
+        t_direction[n_trades] = position
+        t_pnl[n_trades] = pnl
+        t_reason[n_trades] = end_code
+        n_trades += 1
+        equity += pnl
+
+    return (
+        equity_curve[:stop],
+        equity,
+        t_entry_idx[:n_trades],
+        t_exit_idx[:n_trades],
+        t_entry_price[:n_trades],
+        t_exit_price[:n_trades],
+        t_direction[:n_trades],
+        t_pnl[:n_trades],
+        t_reason[:n_trades],
+    )
+
+
+def _overrides_should_exit(strategy):
+    """Whether ``strategy`` implements its own ``should_exit``."""
+    return type(strategy).should_exit is not StrategyBase.should_exit
 
-    equity_curve = np.append(equity_curve, current_equity)
 
-    return equity_curve
+def _session_arrays(timestamps):
+    """Return (day_idx, time_of_day) arrays: session id and seconds since midnight."""
+    ts = pd.DatetimeIndex(pd.to_datetime(timestamps))
+    day_idx = pd.factorize(ts.normalize())[0].astype(np.int64)
+    time_of_day = (ts.hour * 3600 + ts.minute * 60 + ts.second).to_numpy(dtype=np.int64)
+    return day_idx, time_of_day
+
+
+def _trade_frame(timestamps, entry_idx, exit_idx, entry_price, exit_price,
+                 direction, pnl, reason_code, reasons):
+    """Build the trade log DataFrame from the kernel's columnar trade arrays."""
+    if len(entry_idx) == 0:
+        return pd.DataFrame()
+    ts = pd.Series(timestamps).reset_index(drop=True)
+    reason_lookup = np.asarray(reasons, dtype=object)
+    return pd.DataFrame({
+        'entry_time': ts.iloc[entry_idx].to_numpy(),
+        'entry_price': entry_price,
+        'direction': np.where(direction == 1, 'long', 'short'),
+        'exit_time': ts.iloc[exit_idx].to_numpy(),
+        'exit_price': exit_price,
+        'pnl': pnl,
+        'exit_reason': reason_lookup[reason_code],
+        'normal_pnl': np.where(direction == 1, exit_price - entry_price, entry_price - exit_price),
+    })
+
 
 class BacktestEngine:
     def __init__(
@@ -113,6 +725,10 @@ class BacktestEngine:
         intraday=False,
         session_close_time="15:15",
         daily_profit_target=None,
+        fill_model="close",
+        intrabar_tie_break="stop",
+        signal_cache=None,
+        pruning=None,
     ):
         self.data = data
         self.strategy = strategy
@@ -127,6 +743,19 @@ class BacktestEngine:
             pd.to_datetime(session_close_time).time() if session_close_time else None
         )
         self.daily_profit_target = daily_profit_target
+        if fill_model not in FILL_MODELS:
+            raise ValueError(f"fill_model must be one of {FILL_MODELS}, got {fill_model!r}")
+        if intrabar_tie_break not in TIE_BREAKS:
+            raise ValueError(
+                f"intrabar_tie_break must be one of {tuple(TIE_BREAKS)}, got {intrabar_tie_break!r}"
+            )
+        # 'ohlc' fills price-level exit rules intrabar from high/low (rule path only)
+        self.fill_model = fill_model
+        self.intrabar_tie_break = intrabar_tie_break
+        # Optional signal_cache.SignalCache serving generate_signals results
+        self.signal_cache = signal_cache
+        # Early-abort rules (see pruning.py); None disables pruning
+        self.pruning = normalize_pruning(pruning)
 
     def run(self):
         """
@@ -134,7 +763,7 @@ class BacktestEngine:
         Returns: dict with equity_curve, trade_log, indicators
         """
         # Generate signals once
-        df = self.strategy.generate_signals(self.data)
+        df = self._generate_signals()
         
         # Dynamic indicator support based on strategy metadata
         indicator_cfg = []
@@ -143,26 +772,19 @@ class BacktestEngine:
         indicator_cols = [cfg.get('column') for cfg in indicator_cfg if cfg.get('column')]
         
         # Extract arrays for vectorized processing
-        signals = df['signal'].values
-        prices = df['close'].values
         timestamps = df['timestamp'].values
         option_qty = self.lots * 75
+        prune = pruning_array(self.pruning)
         
         # Use vectorized backtest if signals are simple (just entry signals)
         if self._can_use_fast_vectorized(df):
-            equity_curve_values = _vectorized_backtest_core(
-                signals,
-                prices,
-                self.option_delta,
-                option_qty,
-                self.option_price_per_unit,
-                self.fee_per_trade,
-                self.slippage,
-                self.initial_cash,
-            )
+            equity_curve_values, trade_log = self._run_fast_vectorized(df, option_qty, prune)
 
             # Build results
-            if len(equity_curve_values) > len(timestamps):
+            if prune is not None and prune[PRUNE_REASON] >= 0:
+                stop = int(prune[PRUNE_BAR])
+                ts = np.append(timestamps[:stop], timestamps[stop - 1])
+            elif len(equity_curve_values) > len(timestamps):
                 ts = np.append(timestamps, timestamps[-1])
             else:
                 ts = timestamps
@@ -170,18 +792,24 @@ class BacktestEngine:
                 'timestamp': ts,
                 'equity': equity_curve_values
             })
-            
-            # Generate trade log from signals for compatibility
-            trade_log = self._generate_trade_log_from_signals(df, equity_curve_values)
-            
+
         else:
-            # Fall back to original logic for complex strategies
-            equity_curve_df, trade_log = self._run_traditional_backtest(df, option_qty, indicator_cols)
+            rules = self._exit_rules()
+            if rules:
+                # Column-based exit rules run inside the compiled kernel
+                equity_curve_df, trade_log = self._run_rule_backtest(df, option_qty, rules, prune)
+            else:
+                # Fall back to original logic for complex strategies
+                equity_curve_df, trade_log = self._run_traditional_backtest(
+                    df, option_qty, indicator_cols, prune
+                )
         
         result = {
             'equity_curve': equity_curve_df,
             'trade_log': trade_log,
         }
+        if prune is not None:
+            result['pruned'] = pruning_summary(prune, timestamps)
         
         # Include all configured indicators
         if indicator_cols:
@@ -205,84 +833,229 @@ class BacktestEngine:
             )
 
         return result
-    
+
+    def run_batch(self, signal_matrix, labels=None):
+        """
+        Backtest many signal vectors over this engine's data in one parallel pass.
+
+        ``signal_matrix`` has one row per bar and one column per parameter set
+        (a DataFrame's columns become the labels). Every column is simulated
+        with the fast signal-reversal core, including intraday session close
+        and daily profit target, so it matches ``run()`` for strategies that
+        take the fast path (``_use_fast_vectorized`` set and, for intraday
+        runs, no ``should_exit`` of their own).
+
+        Returns: dict with 'equity' (sets x bars + 1 array) and 'metrics'
+        (DataFrame indexed by label with final_equity, total_return,
+        sharpe_ratio, max_drawdown, total_trades, win_rate, profit_factor,
+        largest_winning_trade, largest_losing_trade, max_consecutive_wins and
+        max_consecutive_losses).
+        """
+        if isinstance(signal_matrix, pd.DataFrame):
+            labels = list(signal_matrix.columns) if labels is None else labels
+            signal_matrix = signal_matrix.to_numpy()
+        signal_matrix = np.asarray(signal_matrix, dtype=np.float64)
+        if signal_matrix.ndim == 1:
+            signal_matrix = signal_matrix[:, None]
+        if signal_matrix.ndim != 2 or signal_matrix.shape[0] != len(self.data):
+            raise ValueError("signal_matrix must have one row per bar of the engine data")
+        n_sets = signal_matrix.shape[1]
+        labels = list(range(n_sets)) if labels is None else list(labels)
+        if len(labels) != n_sets:
+            raise ValueError("labels must have one entry per signal column")
+
+        if self.intraday:
+            day_idx, time_of_day = _session_arrays(self.data['timestamp'])
+        else:
+            day_idx = time_of_day = np.zeros(len(self.data), dtype=np.int64)
+
+        equity, trade_stats = _batch_session_core(
+            np.ascontiguousarray(signal_matrix.T),
+            self.data['close'].to_numpy(dtype=np.float64),
+            day_idx,
+            time_of_day,
+            float(self.option_delta),
+            float(self.lots * 75),
+            float(self.option_price_per_unit),
+            float(self.fee_per_trade),
+            float(self.slippage),
+            float(self.initial_cash),
+            bool(self.intraday),
+            self._session_close_seconds(),
+            self._daily_target_value(),
+        )
+
+        trades = trade_stats[:, 0]
+        gross_profit = trade_stats[:, 2]
+        gross_loss = trade_stats[:, 3]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            win_rate = np.where(trades > 0, trade_stats[:, 1] / trades, np.nan)
+            profit_factor = np.where(
+                gross_loss == 0,
+                np.where(gross_profit > 0, np.inf, np.nan),
+                gross_profit / np.abs(gross_loss),
+            )
+        profit_factor = np.where(trades > 0, profit_factor, np.nan)
+
+        metrics = pd.DataFrame(equity_matrix_metrics(equity), index=labels)
+        metrics['total_trades'] = trades.astype(np.int64)
+        metrics['win_rate'] = win_rate
+        metrics['profit_factor'] = profit_factor
+        metrics['largest_winning_trade'] = trade_stats[:, 4]
+        metrics['largest_losing_trade'] = trade_stats[:, 5]
+        metrics['max_consecutive_wins'] = trade_stats[:, 6].astype(np.int64)
+        metrics['max_consecutive_losses'] = trade_stats[:, 7].astype(np.int64)
+        return {'equity': equity, 'metrics': metrics}
+
+    def _generate_signals(self):
+        """Strategy signals, served from the signal cache when one is configured."""
+        if self.signal_cache is not None:
+            return self.signal_cache.generate_signals(self.strategy, self.data)
+        return self.strategy.generate_signals(self.data)
+
     def _can_use_fast_vectorized(self, df):
         """Check if we can use the fast vectorized approach."""
-        # For now, only use fast approach for simple signal-based strategies
-        # More complex exit logic or intraday session handling requires the traditional approach
-        return (
-            hasattr(self.strategy, '_use_fast_vectorized')
-            and self.strategy._use_fast_vectorized
-            and not self.intraday
-        )
+        # Only simple signal-reversal strategies can use the fast approach;
+        # intraday session close and daily target are handled by the session core
+        if not getattr(self.strategy, '_use_fast_vectorized', False):
+            return False
+        # The session core only exits on signal reversal, so intraday runs of
+        # strategies with their own should_exit take the rule kernel (when
+        # they declare exit_rules) or the row-by-row loop
+        return not (self.intraday and _overrides_should_exit(self.strategy))
+
+    def _session_close_seconds(self):
+        """Session close as seconds since midnight, or -1 when disabled."""
+        end_time = self.session_close_time
+        if not end_time:
+            return -1
+        return end_time.hour * 3600 + end_time.minute * 60 + end_time.second
+
+    def _daily_target_value(self):
+        """Daily profit target as a float, NaN when disabled."""
+        if self.daily_profit_target is None:
+            return np.nan
+        return float(self.daily_profit_target)
     
-    def _generate_trade_log_from_signals(self, df, equity_curve):
-        """Generate trade log from signal changes for fast vectorized approach."""
-        signals = df['signal'].values
-        prices = df['close'].values
-        timestamps = df['timestamp'].values
-        
-        trades = []
-        position = 0
-        entry_price = 0.0
-        entry_time = None
+    def _exit_rules(self):
+        """Return the strategy's declared exit rules, if any."""
+        if hasattr(self.strategy, 'exit_rules'):
+            return self.strategy.exit_rules() or []
+        return []
 
-        for i in range(len(signals)):
-            signal = signals[i]
+    def _run_rule_backtest(self, df, option_qty, rules, prune=None):
+        """Compiled backtest for strategies that declare column-based exit rules."""
+        day_idx, time_of_day = _session_arrays(df['timestamp'])
+        compiled = compile_exit_rules(rules, df, time_of_day)
+        extra = () if prune is None else (prune,)
+        highs, lows, opens = self._ohlc_arrays(df)
 
-            if position == 0 and signal != 0:
-                # Entry with slippage
-                position = signal
-                if signal == 1:
-                    entry_price = prices[i] + self.slippage
-                else:
-                    entry_price = prices[i] - self.slippage
-                entry_time = timestamps[i]
-            elif position != 0 and (signal == -position or i == len(signals) - 1):
-                # Exit with slippage
-                if position == 1:
-                    exit_price = prices[i] - self.slippage
-                else:
-                    exit_price = prices[i] + self.slippage
-                exit_time = timestamps[i]
-
-                # Calculate PnL
-                option_move = self.option_delta * (exit_price - entry_price)
-                option_qty = self.lots * 75
-
-                if position == 1:  # Long
-                    pnl = option_move * option_qty * self.option_price_per_unit
-                    direction = 'long'
-                else:  # Short
-                    pnl = -option_move * option_qty * self.option_price_per_unit
-                    direction = 'short'
-
-                pnl -= self.fee_per_trade
-
-                trades.append({
-                    'entry_time': entry_time,
-                    'entry_price': entry_price,
-                    'direction': direction,
-                    'exit_time': exit_time,
-                    'exit_price': exit_price,
-                    'pnl': pnl,
-                    'normal_pnl': exit_price - entry_price if position == 1 else entry_price - exit_price,
-                    'exit_reason': 'Signal Reversal' if i < len(signals) - 1 else 'End of Data'
-                })
+        (
+            equity_curve, _, entry_idx, exit_idx, entry_price, exit_price,
+            direction, pnl, reason_code,
+        ) = _rule_backtest_core(
+            df['signal'].to_numpy(dtype=np.float64),
+            df['close'].to_numpy(dtype=np.float64),
+            day_idx,
+            time_of_day,
+            compiled['series'],
+            compiled['src'],
+            compiled['col'],
+            compiled['ops'],
+            compiled['direction'],
+            compiled['anchor_entry'],
+            compiled['at_entry'],
+            compiled['points'],
+            compiled['mult'],
+            compiled['fallback'],
+            compiled['side'],
+            compiled['reentry'],
+            compiled['intrabar'],
+            compiled['adverse'],
+            highs,
+            lows,
+            opens,
+            float(self.option_delta),
+            float(option_qty),
+            float(self.option_price_per_unit),
+            float(self.fee_per_trade),
+            float(self.slippage),
+            float(self.initial_cash),
+            bool(self.intraday),
+            self._session_close_seconds(),
+            self._daily_target_value(),
+            self.fill_model == 'ohlc',
+            TIE_BREAKS[self.intrabar_tie_break],
+            *extra,
+        )
 
-                position = 0
-                if i < len(signals) - 1 and signal != 0:
-                    # Immediate re-entry
-                    position = signal
-                    if signal == 1:
-                        entry_price = prices[i] + self.slippage
-                    else:
-                        entry_price = prices[i] - self.slippage
-                    entry_time = exit_time
-        
-        return pd.DataFrame(trades)
-    
-    def _run_traditional_backtest(self, df, option_qty, indicator_cols):
+        equity_curve_df = pd.DataFrame({
+            'timestamp': df['timestamp'].iloc[:len(equity_curve)].to_numpy(),
+            'equity': equity_curve,
+        })
+        reasons = list(compiled['reasons'])
+        if prune is not None and prune[PRUNE_REASON] >= 0:
+            # The end-of-data close of a pruned run happens at the pruning bar
+            reasons[-1] = PRUNED_EXIT_REASON
+        trade_log_df = _trade_frame(
+            df['timestamp'], entry_idx, exit_idx, entry_price, exit_price,
+            direction, pnl, reason_code, reasons,
+        )
+        return equity_curve_df, trade_log_df
+
+    def _run_fast_vectorized(self, df, option_qty, prune=None):
+        """Run the signal-reversal core and return (equity values, trade log)."""
+        if self.intraday or prune is not None:
+            # Pruning is checked at session boundaries, so it needs the sessions too
+            day_idx, time_of_day = _session_arrays(df['timestamp'])
+        else:
+            day_idx = time_of_day = np.zeros(len(df), dtype=np.int64)
+        extra = () if prune is None else (prune,)
+        (
+            equity_curve, entry_idx, exit_idx, entry_price, exit_price,
+            direction, pnl, reason_code,
+        ) = _vectorized_session_core(
+            df['signal'].to_numpy(dtype=np.float64),
+            df['close'].to_numpy(dtype=np.float64),
+            day_idx,
+            time_of_day,
+            float(self.option_delta),
+            float(option_qty),
+            float(self.option_price_per_unit),
+            float(self.fee_per_trade),
+            float(self.slippage),
+            float(self.initial_cash),
+            bool(self.intraday),
+            self._session_close_seconds(),
+            self._daily_target_value(),
+            *extra,
+        )
+        reasons = FAST_EXIT_REASONS
+        if prune is not None and prune[PRUNE_REASON] >= 0:
+            reasons = FAST_EXIT_REASONS[:-1] + [PRUNED_EXIT_REASON]
+        trade_log = _trade_frame(
+            df['timestamp'], entry_idx, exit_idx, entry_price, exit_price,
+            direction, pnl, reason_code, reasons,
+        )
+        return equity_curve, trade_log
+
+    def _ohlc_arrays(self, df):
+        """High, low and open arrays for intrabar fills (empty unless fill_model='ohlc')."""
+        if self.fill_model != 'ohlc':
+            empty = np.empty(0)
+            return empty, empty, empty
+        missing = [c for c in ('high', 'low') if c not in df.columns]
+        if missing:
+            raise ValueError(f"fill_model='ohlc' requires columns: {missing}")
+        highs = df['high'].to_numpy(dtype=np.float64)
+        lows = df['low'].to_numpy(dtype=np.float64)
+        if 'open' in df.columns:
+            opens = df['open'].to_numpy(dtype=np.float64)
+        else:
+            opens = np.full(len(df), np.nan)
+        return highs, lows, opens
+
+    def _run_traditional_backtest(self, df, option_qty, indicator_cols, prune=None):
         """Traditional row-by-row backtest for complex strategies."""
         exit_col = indicator_cols[0] if indicator_cols else None
         equity = self.initial_cash
@@ -297,13 +1070,37 @@ class BacktestEngine:
         session_closed = False
         trade = None
         daily_points = 0.0
+        stop = len(df)
+        peak_equity = equity
+        prune_day = None
+        sessions_done = 0
 
-        for idx, row in df.iterrows():
+        for pos, (idx, row) in enumerate(df.iterrows()):
             ts = row['timestamp']
             signal = row['signal']
             price = row['close']
             ref = row.get(exit_col) if exit_col else None
 
+            if prune is not None:
+                day = ts.date()
+                if prune_day is not None and day != prune_day:
+                    sessions_done += 1
+                    marked = equity
+                    if position is not None:
+                        direction = 1 if position == 'long' else -1
+                        mark = df['close'].iat[pos - 1] - direction * self.slippage
+                        marked += _trade_pnl(direction, entry_price, mark, self.option_delta,
+                                             option_qty, self.option_price_per_unit, self.fee_per_trade)
+                    peak_equity = max(peak_equity, marked)
+                    reason = _prune_check(prune, marked, peak_equity, len(trade_log), sessions_done)
+                    if reason >= 0:
+                        prune[PRUNE_REASON] = reason
+                        prune[PRUNE_BAR] = pos
+                        prune[PRUNE_SESSIONS] = sessions_done
+                        stop = pos
+                        break
+                prune_day = day
+
             if self.intraday:
                 day = ts.date()
                 if day != current_day:
@@ -442,7 +1239,7 @@ class BacktestEngine:
 
         # If trade is still open at the end, close at last price
         if position is not None and trade is not None:
-            last_row = df.iloc[-1]
+            last_row = df.iloc[stop - 1]
             trade['exit_time'] = last_row['timestamp']
             if position == 'long':
                 trade['exit_price'] = last_row['close'] - self.slippage
@@ -458,15 +1255,15 @@ class BacktestEngine:
                 trade['normal_pnl'] = entry_price - exit_price
                 trade['pnl'] = -option_move * option_qty * self.option_price_per_unit
             trade['pnl'] -= self.fee_per_trade
-            trade['exit_reason'] = 'End of Data'
+            trade['exit_reason'] = 'End of Data' if stop == len(df) else PRUNED_EXIT_REASON
             trade_log.append(trade)
             equity += trade['pnl']
             equity_curve.append(equity)
 
         # Build equity curve DataFrame
         equity_curve_df = pd.DataFrame({
-            'timestamp': df['timestamp'],
-            'equity': equity_curve[:len(df)]
+            'timestamp': df['timestamp'].iloc[:stop],
+            'equity': equity_curve[:stop]
         })
 
         trade_log_df = pd.DataFrame(trade_log)
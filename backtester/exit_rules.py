@@ -0,0 +1,205 @@
+"""
+exit_rules.py
+Column-based exit rule declarations for the compiled simulation path.
+
+Strategies that expose ``exit_rules()`` describe their exits as a list of rule
+dicts instead of (or in addition to) a Python ``should_exit``. The engine
+compiles those rules into flat NumPy arrays and evaluates them inside a numba
+kernel, so no per-bar pandas objects are created.
+
+Every rule is written from the point of view of a long position and mirrored
+for shorts: the comparison operator flips, offsets from the entry price change
+sign and ``high``/``low`` swap places. Rules are evaluated in list order and the
+first match wins, which mirrors the ``if``/``elif`` chains used in
+``should_exit`` implementations.
+
+With the engine's ``fill_model='ohlc'`` the price-level rules (target, stop
+and level) are checked against the bar's high/low and filled at the level
+itself; the remaining rules still evaluate on the close.
+"""
+
+import numpy as np
+import pandas as pd
+
+OPS = {'>=': 0, '<=': 1, '>': 2, '<': 3}
+MIRROR_OPS = {'>=': '<=', '<=': '>=', '>': '<', '<': '>'}
+MIRROR_COLUMNS = {'high': 'low', 'low': 'high'}
+SIDES = {'long': 1, 'short': 2, 'both': 3}
+# Rules whose right-hand side is a price level that can be touched intrabar
+LEVEL_KINDS = ('target', 'stop', 'level')
+
+TIME_COLUMN = '__time__'
+SESSION_CLOSE_REASON = 'Session Close'
+END_OF_DATA_REASON = 'End of Data'
+
+
+def _rule(kind, price, op, reason, points=0.0, column=None, mult=1.0,
+          anchor=None, direction=1, at='bar', fallback=None, side='both'):
+    return {
+        'kind': kind,
+        'price': price,
+        'op': op,
+        'anchor': anchor,
+        'direction': direction,
+        'points': float(points),
+        'column': column,
+        'mult': float(mult),
+        'at': at,
+        'fallback': None if fallback is None else float(fallback),
+        'side': side,
+        'reason': reason,
+    }
+
+
+def target(points=0.0, column=None, mult=1.0, price='close', reason='Target',
+           fallback=None, side='both'):
+    """
+    Exit when price moves ``points + mult * column`` in favour of the position.
+    ``fallback`` replaces the offset when the column value is missing or zero.
+    """
+    return _rule('target', price, '>=', reason, points=points, column=column,
+                 mult=mult, anchor='entry', direction=1, fallback=fallback, side=side)
+
+
+def stop(points=0.0, column=None, mult=1.0, price='close', reason='Stop Loss',
+         fallback=None, side='both'):
+    """
+    Exit when price moves ``points + mult * column`` against the position.
+    ``fallback`` replaces the offset when the column value is missing or zero.
+    """
+    return _rule('stop', price, '<=', reason, points=points, column=column,
+                 mult=mult, anchor='entry', direction=-1, fallback=fallback, side=side)
+
+
+def threshold(column, op, value, reason, side='both'):
+    """
+    Exit when ``column <op> value`` for longs (mirrored operator for shorts),
+    e.g. ``threshold('rsi', '>=', 50, 'Target')``.
+    """
+    return _rule('threshold', column, op, reason, points=value, side=side)
+
+
+def cross(column, op='<', price='close', reason='Indicator exit', side='both'):
+    """
+    Exit when ``price <op> column`` for longs, e.g. close below the EMA.
+    """
+    return _rule('cross', price, op, reason, column=column, side=side)
+
+
+def level(column, op='<=', price='close', at='entry', reason='Stop Loss', side='both'):
+    """
+    Exit when ``price <op> column`` where the column is read at the entry bar
+    (``at='entry'``) or at the current bar (``at='bar'``).
+    """
+    return _rule('level', price, op, reason, column=column, at=at, side=side)
+
+
+def time_exit(at, reason='Time Stop'):
+    """
+    Exit any open position once the bar time reaches ``at`` ('HH:MM[:SS]').
+    """
+    t = pd.to_datetime(at).time()
+    seconds = t.hour * 3600 + t.minute * 60 + t.second
+    return _rule('time', TIME_COLUMN, '>=', reason, points=seconds)
+
+
+def _mirror(rule):
+    """Return the short-side view of a long-side rule."""
+    if rule['kind'] == 'time':
+        return rule['price'], rule['column'], rule['op'], rule['direction']
+    price = MIRROR_COLUMNS.get(rule['price'], rule['price'])
+    column = MIRROR_COLUMNS.get(rule['column'], rule['column'])
+    direction = -rule['direction'] if rule['anchor'] == 'entry' else rule['direction']
+    return price, column, MIRROR_OPS[rule['op']], direction
+
+
+def compile_exit_rules(rules, df, time_of_day):
+    """
+    Compile rule dicts into the flat arrays consumed by the engine kernel.
+
+    Returns a dict with the series matrix, per-rule arrays and the list of
+    exit reasons (rule reasons followed by 'Session Close' and 'End of Data').
+    """
+    if not rules:
+        raise ValueError("At least one exit rule is required")
+
+    columns = []
+    index = {}
+
+    def column_index(name):
+        if name is None:
+            return -1
+        if name not in index:
+            if name != TIME_COLUMN and name not in df.columns:
+                raise ValueError(f"Exit rule references missing column '{name}'")
+            index[name] = len(columns)
+            columns.append(name)
+        return index[name]
+
+    n_rules = len(rules)
+    src = np.empty((n_rules, 2), dtype=np.int64)
+    col = np.empty((n_rules, 2), dtype=np.int64)
+    ops = np.empty((n_rules, 2), dtype=np.int64)
+    direction = np.empty((n_rules, 2), dtype=np.float64)
+    anchor_entry = np.zeros(n_rules, dtype=np.bool_)
+    at_entry = np.zeros(n_rules, dtype=np.bool_)
+    points = np.zeros(n_rules, dtype=np.float64)
+    mult = np.ones(n_rules, dtype=np.float64)
+    fallback = np.full(n_rules, np.nan, dtype=np.float64)
+    side = np.empty(n_rules, dtype=np.int64)
+    reentry = np.zeros(n_rules, dtype=np.bool_)
+    intrabar = np.zeros(n_rules, dtype=np.bool_)
+    adverse = np.zeros(n_rules, dtype=np.bool_)
+    reasons = []
+
+    for r, rule in enumerate(rules):
+        if rule.get('op') not in OPS:
+            raise ValueError(f"Unsupported exit rule operator: {rule.get('op')!r}")
+        if rule.get('side', 'both') not in SIDES:
+            raise ValueError(f"Unsupported exit rule side: {rule.get('side')!r}")
+        long_view = (rule['price'], rule.get('column'), rule['op'], rule.get('direction', 1))
+        for s, (price, column, op, sign) in enumerate((long_view, _mirror(rule))):
+            src[r, s] = column_index(price)
+            col[r, s] = column_index(column)
+            ops[r, s] = OPS[op]
+            direction[r, s] = sign
+        anchor_entry[r] = rule.get('anchor') == 'entry'
+        at_entry[r] = rule.get('at', 'bar') == 'entry'
+        points[r] = rule.get('points', 0.0)
+        mult[r] = rule.get('mult', 1.0)
+        if rule.get('fallback') is not None:
+            fallback[r] = rule['fallback']
+        side[r] = SIDES[rule.get('side', 'both')]
+        intrabar[r] = rule.get('kind') in LEVEL_KINDS
+        # A long-side level below price (<=, <) is hit by adverse moves
+        adverse[r] = rule['op'] in ('<=', '<')
+        reason = rule.get('reason') or 'Exit'
+        # Matches the traditional loop: indicator-style exits re-enter on the same bar
+        reentry[r] = reason.lower().endswith('exit')
+        reasons.append(reason)
+
+    series = np.empty((max(len(columns), 1), len(df)), dtype=np.float64)
+    for name, i in index.items():
+        if name == TIME_COLUMN:
+            series[i] = time_of_day
+        else:
+            series[i] = pd.to_numeric(df[name], errors='coerce').to_numpy(dtype=np.float64)
+
+    reasons.extend([SESSION_CLOSE_REASON, END_OF_DATA_REASON])
+    return {
+        'series': series,
+        'src': src,
+        'col': col,
+        'ops': ops,
+        'direction': direction,
+        'anchor_entry': anchor_entry,
+        'at_entry': at_entry,
+        'points': points,
+        'mult': mult,
+        'fallback': fallback,
+        'side': side,
+        'reentry': reentry,
+        'intrabar': intrabar,
+        'adverse': adverse,
+        'reasons': reasons,
+    }
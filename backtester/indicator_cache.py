@@ -0,0 +1,364 @@
+"""
+indicator_cache.py
+Memoizing indicator service shared by strategies and runs.
+
+Most strategies compute the same handful of indicator columns (EMA, RSI,
+ATR, Bollinger bands) on the same dataset. ``IndicatorCache`` serves them
+from a two-tier cache keyed on:
+
+- a content fingerprint of the input columns the indicator reads,
+- the indicator name and its normalized params,
+- an optional timeframe label,
+- the backtester package source as of import, so disk entries written
+  before a kernel fix are not served after it,
+
+so ten strategies compared on one dataset compute each EMA once. Results
+live in a bounded in-memory LRU; with a ``cache_dir`` they are also written
+as ``.npy`` files that later runs and other processes open memory-mapped.
+Disk files are evicted least-recently-used once they grow past
+``max_bytes``.
+
+Returned arrays are shared between callers and therefore read-only;
+assigning one to a DataFrame column copies it as usual.
+
+Parameter sweeps can warm the cache for a whole grid at once:
+``get_batch`` computes an indicator for a vector of periods in one pass and
+registers every column under the key of the matching single-period
+``get``, and ``prime`` registers columns computed elsewhere (e.g. shared
+by a coordinating process).
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from . import indicators
+from .signal_cache import backtester_source_hash, normalize_params
+
+logger = logging.getLogger(__name__)
+
+_SOURCE_HASH = backtester_source_hash()
+
+
+def _single(fn):
+    """Adapter for indicators of one column, chosen with ``source`` (default ``close``)."""
+    return lambda params: ([params.pop('source', 'close')], fn)
+
+
+def _bars(fn, columns=('high', 'low', 'close')):
+    return lambda params: (list(columns), fn)
+
+
+def _vwap_inputs(params):
+    columns = ['high', 'low', 'close', 'volume']
+    session_column = params.pop('session_column', None)
+    if session_column is not None:
+        columns.append(session_column)
+    return columns, indicators.vwap
+
+
+# name -> function of the params dict that pops column-selecting params and
+# returns (input columns, compute function called with the column arrays
+# followed by the remaining params)
+INDICATORS = {
+    'sma': _single(indicators.sma),
+    'ema': _single(indicators.ema),
+    'rolling_std': _single(indicators.rolling_std),
+    'rolling_median': _single(indicators.rolling_median),
+    'rolling_quantile': _single(indicators.rolling_quantile),
+    'bollinger_bands': _single(indicators.bollinger_bands),
+    'rsi': _single(indicators.wilder_rsi),
+    'true_range': _bars(indicators.true_range),
+    'atr': _bars(indicators.atr),
+    'stochastic': _bars(indicators.stochastic),
+    'vwap': _vwap_inputs,
+}
+
+
+# name -> (function computing the indicator for a vector of periods, name of
+# the period argument); only indicators with a single period are batched
+BATCH_INDICATORS = {
+    'sma': (indicators.sma_batch, 'period'),
+    'ema': (indicators.ema_batch, 'span'),
+    'rsi': (indicators.wilder_rsi_batch, 'period'),
+    'atr': (indicators.atr_batch, 'period'),
+}
+
+
+def _input_digest(digest, values):
+    values = np.asarray(values)
+    digest.update(f'{values.dtype.str}:{values.shape}'.encode())
+    if values.dtype.kind in 'biuf':
+        digest.update(memoryview(np.ascontiguousarray(values)).cast('B'))
+    else:
+        digest.update(pd.util.hash_pandas_object(pd.Series(values), index=False).to_numpy().tobytes())
+
+
+def _inputs_fingerprint(inputs):
+    digest = hashlib.sha256()
+    for values in inputs:
+        _input_digest(digest, values)
+    return digest.hexdigest()
+
+
+def _batch_inputs(data, name, params):
+    """Input arrays, period argument and remaining params of batch indicator ``name``."""
+    if name not in BATCH_INDICATORS:
+        raise ValueError(f"Indicator '{name}' has no batch form; available: {sorted(BATCH_INDICATORS)}")
+    params = dict(params)
+    columns, _ = INDICATORS[name](params)
+    return [data[column].to_numpy() for column in columns], BATCH_INDICATORS[name][1], params
+
+
+def compute_batch(data, name, periods, **params):
+    """Batch indicator ``name`` of ``data`` for every value in ``periods``, as a ``(bars, periods)`` array."""
+    inputs, _, params = _batch_inputs(data, name, params)
+    return BATCH_INDICATORS[name][0](*inputs, periods, **params)
+
+
+def _nbytes(value):
+    return sum(a.nbytes for a in value) if isinstance(value, tuple) else value.nbytes
+
+
+def _read_only(value):
+    arrays = value if isinstance(value, tuple) else (value,)
+    for array in arrays:
+        array.flags.writeable = False
+    return value
+
+
+class IndicatorCache:
+    """
+    Two-tier (memory LRU + memory-mapped disk) cache of indicator arrays.
+
+    ``get(data, name, **params)`` computes a registered indicator from the
+    columns of ``data``; ``get_or_compute(name, inputs, compute, **params)``
+    caches any other pure function of the ``inputs`` arrays, where ``name``
+    must identify the formula.
+    """
+
+    def __init__(self, cache_dir=None, memory_bytes=256 * 1024 * 1024, max_bytes=1024 * 1024 * 1024):
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.memory_bytes = int(memory_bytes)
+        self.max_bytes = int(max_bytes)
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._entry_bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, data, name, timeframe=None, **params):
+        """Registered indicator ``name`` of ``data`` (an array, or a tuple for multi-output indicators)."""
+        if name not in INDICATORS:
+            raise ValueError(f"Unknown indicator '{name}'; available: {sorted(INDICATORS)}")
+        columns, compute = INDICATORS[name](params)
+        inputs = [data[column].to_numpy() for column in columns]
+        return self.get_or_compute(name, inputs, compute, timeframe=timeframe, **params)
+
+    def get_or_compute(self, name, inputs, compute, timeframe=None, **params):
+        """Return ``compute(*inputs, **params)``, served from cache when possible."""
+        key = self.key(name, inputs, params, timeframe)
+        value = self._memory_get(key)
+        if value is not None:
+            with self._lock:
+                self.hits += 1
+            return value
+
+        value = self._disk_get(key)
+        if value is not None:
+            with self._lock:
+                self.disk_hits += 1
+        else:
+            with self._lock:
+                self.misses += 1
+            result = compute(*inputs, **params)
+            if isinstance(result, tuple):
+                value = tuple(self._own(r, inputs) for r in result)
+            else:
+                value = self._own(result, inputs)
+            self._disk_put(key, value)
+        value = _read_only(value)
+        self._memory_put(key, value)
+        return value
+
+    def get_batch(self, data, name, periods, timeframe=None, **params):
+        """
+        Batch indicator ``name`` of ``data`` for every value in ``periods``.
+
+        Returns a read-only ``(bars, periods)`` array; column ``j`` is also
+        cached as ``get(data, name, <period arg>=periods[j], **params)``.
+        """
+        matrix = _read_only(np.asarray(compute_batch(data, name, periods, **params)))
+        self.prime(data, name, periods, matrix.T, timeframe=timeframe, **params)
+        return matrix
+
+    def prime(self, data, name, periods, columns, timeframe=None, **params):
+        """
+        Cache ``columns[j]`` as batch indicator ``name`` of ``data`` with period ``periods[j]``.
+
+        The columns are trusted to hold exactly what ``get`` would compute;
+        they are kept in memory only and never written to the disk tier.
+        """
+        inputs, arg, params = _batch_inputs(data, name, params)
+        fingerprint = _inputs_fingerprint(inputs)
+        for period, column in zip(periods, columns):
+            if isinstance(period, np.generic):  # keyed like the builtin value a strategy passes
+                period = period.item()
+            key = self._key(name, {**params, arg: period}, timeframe, fingerprint)
+            self._memory_put(key, _read_only(np.asarray(column)))
+
+    @staticmethod
+    def _own(result, inputs):
+        """``result`` as an array the cache may freeze, i.e. not a view of an input."""
+        result = np.asarray(result)
+        if any(np.may_share_memory(result, np.asarray(values)) for values in inputs):
+            result = result.copy()
+        return result
+
+    @staticmethod
+    def key(name, inputs, params, timeframe=None):
+        return IndicatorCache._key(name, params, timeframe, _inputs_fingerprint(inputs))
+
+    @staticmethod
+    def _key(name, params, timeframe, fingerprint):
+        return hashlib.sha256(
+            f'{_SOURCE_HASH}|{name}|{normalize_params(params)}|{timeframe}|{fingerprint}'.encode()
+        ).hexdigest()
+
+    def clear(self):
+        """Drop every in-memory and on-disk entry."""
+        with self._lock:
+            self._entries.clear()
+            self._entry_bytes = 0
+        if self.cache_dir is not None:
+            for path in self.cache_dir.glob('*.npy'):
+                path.unlink(missing_ok=True)
+
+    def info(self):
+        """Entry counts, sizes and hit/miss counters of both tiers."""
+        files = list(self.cache_dir.glob('*.npy')) if self.cache_dir is not None and self.cache_dir.exists() else []
+        return {
+            'memory_entries': len(self._entries),
+            'memory_bytes': self._entry_bytes,
+            'max_memory_bytes': self.memory_bytes,
+            'disk_entries': len(files),
+            'disk_bytes': sum(f.stat().st_size for f in files),
+            'max_disk_bytes': self.max_bytes,
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+        }
+
+    def _memory_get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def _memory_put(self, key, value):
+        size = _nbytes(value)
+        with self._lock:
+            if key in self._entries or size > self.memory_bytes:
+                return
+            self._entries[key] = value
+            self._entry_bytes += size
+            while self._entry_bytes > self.memory_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._entry_bytes -= _nbytes(evicted)
+
+    def _path(self, key):
+        return self.cache_dir / f'{key}.npy'
+
+    def _disk_get(self, key):
+        if self.cache_dir is None:
+            return None
+        path = self._path(key)
+        try:
+            stored = np.load(path, mmap_mode='r')
+        except FileNotFoundError:
+            return None
+        except Exception as exc:
+            logger.warning(f"Discarding unreadable indicator cache entry {path.name}: {exc}")
+            path.unlink(missing_ok=True)
+            return None
+        try:
+            os.utime(path)  # mark as recently used
+        except OSError:
+            pass
+        # Multi-output indicators are stored stacked, one row per output
+        return tuple(stored) if stored.ndim == 2 else stored
+
+    def _disk_put(self, key, value):
+        if self.cache_dir is None:
+            return
+        try:
+            stacked = np.stack(value) if isinstance(value, tuple) else value
+        except ValueError:  # outputs of different lengths are kept in memory only
+            return
+        if stacked.dtype == object:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as fh:
+                np.save(fh, stacked)
+            os.replace(tmp, self._path(key))
+        except Exception as exc:
+            logger.warning(f"Failed to write indicator cache entry: {exc}")
+            Path(tmp).unlink(missing_ok=True)
+            return
+        self._evict()
+
+    def _evict(self):
+        with self._lock:
+            files = []
+            for path in self.cache_dir.glob('*.npy'):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                files.append((stat.st_mtime_ns, stat.st_size, path))
+            total = sum(size for _, size, _ in files)
+            for _, size, path in sorted(files, key=lambda item: item[0]):
+                if total <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+
+
+_shared_cache = None
+_shared_lock = threading.Lock()
+
+
+def get_indicator_cache():
+    """The process-wide cache strategies use; memory-only until configured."""
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = IndicatorCache()
+        return _shared_cache
+
+
+def configure_indicator_cache(cache_dir=None, memory_bytes=256 * 1024 * 1024, max_bytes=1024 * 1024 * 1024):
+    """Replace the process-wide cache unless one with the same settings is installed."""
+    global _shared_cache
+    cache_dir = Path(cache_dir).resolve() if cache_dir is not None else None
+    with _shared_lock:
+        current = _shared_cache
+        if (
+            current is None
+            or current.cache_dir != cache_dir
+            or current.memory_bytes != int(memory_bytes)
+            or current.max_bytes != int(max_bytes)
+        ):
+            _shared_cache = IndicatorCache(cache_dir, memory_bytes, max_bytes)
+        return _shared_cache
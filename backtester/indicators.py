@@ -0,0 +1,622 @@
+"""
+indicators.py
+O(n) streaming indicator kernels.
+
+Every kernel makes a single pass over its inputs, carrying running sums
+(SMA), a sliding Welford accumulator (rolling std), a recursive average
+(EMA, Wilder RSI/ATR), a monotonic deque (rolling min/max) or a pair of
+indexed heaps (rolling median/quantile, O(log window) per bar) instead of
+re-reducing a window per bar. The public wrappers accept arrays or Series
+and mirror the pandas formulas the strategies use:
+
+- ``sma``            -> ``s.rolling(period).mean()``
+- ``rolling_std``    -> ``s.rolling(period).std(ddof=ddof)``
+- ``ema``            -> ``s.ewm(span=span, adjust=False).mean()``
+- ``wilder_rsi``     -> clipped ``diff()`` gains/losses averaged with
+  ``ewm(alpha=1 / period, adjust=False)``
+- ``atr``            -> true range averaged with ``ewm(alpha=1 / period,
+  adjust=False)`` (``wilder=False``: ``rolling(period).mean()``)
+- ``rolling_median`` -> ``s.rolling(period).median()``
+- ``rolling_quantile``-> ``s.rolling(period).quantile(q)`` (linear
+  interpolation)
+- ``stochastic``     -> %K of ``rolling(k_period)`` low/high, smoothed
+  with rolling means
+- ``vwap``           -> cumulative typical-price VWAP, optionally reset
+  per session
+
+``sma_batch``, ``ema_batch``, ``wilder_rsi_batch`` and ``atr_batch`` take a
+vector of periods and return a ``(bars, periods)`` array in one pass, each
+column equal to the single-period kernel's output. A parameter sweep pays
+for one traversal of the series instead of one per combination.
+
+Inputs of any dtype are converted to float64 and outputs are float64, as
+pandas ``rolling``/``ewm`` do, so float32 OHLC from ``load_csv`` gives the
+same values as the pandas formulas.
+NaNs are skipped: rolling windows need ``min_periods`` valid values, and
+recursive averages carry their last value over a NaN while its weight
+keeps decaying, as pandas ``ewm`` does by default (``ignore_na=False``).
+"""
+
+import numpy as np
+from numba import jit
+
+
+@jit(nopython=True, cache=True)
+def _rolling_mean(values, period, min_periods):
+    """Windowed mean from a Kahan-compensated running sum."""
+    n = len(values)
+    out = np.empty(n, dtype=values.dtype)
+    total = 0.0
+    comp = 0.0
+    count = 0
+    for i in range(n):
+        x = values[i]
+        if not np.isnan(x):
+            y = x - comp
+            t = total + y
+            comp = (t - total) - y
+            total = t
+            count += 1
+        if i >= period:
+            x = values[i - period]
+            if not np.isnan(x):
+                y = -x - comp
+                t = total + y
+                comp = (t - total) - y
+                total = t
+                count -= 1
+        if count > 0 and count >= min_periods:
+            out[i] = total / count
+        else:
+            out[i] = np.nan
+    return out
+
+
+@jit(nopython=True, cache=True)
+def _rolling_std(values, period, min_periods, ddof):
+    """Windowed standard deviation from a sliding Welford accumulator."""
+    n = len(values)
+    out = np.empty(n, dtype=values.dtype)
+    mean = 0.0
+    m2 = 0.0
+    count = 0
+    # Length of the current run of identical values; a window inside one
+    # run has exactly zero spread, whatever rounding Welford accumulated
+    same_run = 0
+    prev = np.nan
+    for i in range(n):
+        x = values[i]
+        if not np.isnan(x):
+            count += 1
+            delta = x - mean
+            mean += delta / count
+            m2 += delta * (x - mean)
+            same_run = same_run + 1 if x == prev else 1
+            prev = x
+        if i >= period:
+            x = values[i - period]
+            if not np.isnan(x):
+                count -= 1
+                if count == 0:
+                    mean = 0.0
+                    m2 = 0.0
+                else:
+                    delta = x - mean
+                    mean -= delta / count
+                    m2 -= delta * (x - mean)
+        if count >= min_periods and count > ddof:
+            if same_run >= count:
+                out[i] = 0.0
+            else:
+                out[i] = np.sqrt(max(m2, 0.0) / (count - ddof))
+        else:
+            out[i] = np.nan
+    return out
+
+
+@jit(nopython=True, cache=True)
+def _ewm_mean(values, alpha, min_periods):
+    """
+    ``ewm(alpha=alpha, adjust=False).mean()`` seeded with the first valid value.
+
+    A NaN repeats the previous mean but still ages it, so the next valid
+    value gets more weight (pandas' default ``ignore_na=False``).
+    """
+    n = len(values)
+    out = np.empty(n, dtype=values.dtype)
+    mean = np.nan
+    old_weight = 1.0
+    count = 0
+    for i in range(n):
+        x = values[i]
+        valid = not np.isnan(x)
+        if count:
+            old_weight *= 1.0 - alpha
+            if valid:
+                if mean != x:
+                    mean = (old_weight * mean + alpha * x) / (old_weight + alpha)
+                old_weight = 1.0
+        elif valid:
+            mean = x
+        if valid:
+            count += 1
+        out[i] = mean if count >= min_periods else np.nan
+    return out
+
+
+@jit(nopython=True, cache=True)
+def _wilder_rsi(close, period, min_periods):
+    n = len(close)
+    out = np.empty(n, dtype=close.dtype)
+    alpha = 1.0 / period
+    avg_gain = 0.0
+    avg_loss = 0.0
+    old_weight = 1.0
+    count = 0
+    if n:
+        out[0] = np.nan
+    for i in range(1, n):
+        delta = close[i] - close[i - 1]
+        valid = not np.isnan(delta)
+        gain = delta if delta > 0.0 else 0.0
+        loss = -delta if delta < 0.0 else 0.0
+        if count:
+            # Same NaN decay as _ewm_mean
+            old_weight *= 1.0 - alpha
+            if valid:
+                if avg_gain != gain:
+                    avg_gain = (old_weight * avg_gain + alpha * gain) / (old_weight + alpha)
+                if avg_loss != loss:
+                    avg_loss = (old_weight * avg_loss + alpha * loss) / (old_weight + alpha)
+                old_weight = 1.0
+        elif valid:
+            avg_gain = gain
+            avg_loss = loss
+        if valid:
+            count += 1
+        if count == 0 or count < min_periods:
+            out[i] = np.nan
+        elif avg_loss == 0.0:
+            out[i] = 100.0 if avg_gain > 0.0 else np.nan
+        else:
+            out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    return out
+
+
+@jit(nopython=True, cache=True)
+def _true_range(high, low, close):
+    n = len(close)
+    out = np.empty(n, dtype=close.dtype)
+    for i in range(n):
+        tr = abs(high[i] - low[i])
+        if i > 0 and not np.isnan(close[i - 1]):
+            tr = max(tr, abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1]))
+        out[i] = tr
+    return out
+
+
+@jit(nopython=True, cache=True)
+def _rolling_extreme(values, period, find_max):
+    """Windowed min/max over a monotonic deque of indices."""
+    n = len(values)
+    out = np.empty(n, dtype=values.dtype)
+    queue = np.empty(n, dtype=np.int64)
+    head = 0
+    tail = 0
+    count = 0
+    for i in range(n):
+        x = values[i]
+        if not np.isnan(x):
+            count += 1
+            while tail > head and (
+                values[queue[tail - 1]] <= x if find_max else values[queue[tail - 1]] >= x
+            ):
+                tail -= 1
+            queue[tail] = i
+            tail += 1
+        if i >= period:
+            if not np.isnan(values[i - period]):
+                count -= 1
+            while tail > head and queue[head] <= i - period:
+                head += 1
+        out[i] = values[queue[head]] if count >= period else np.nan
+    return out
+
+
+@jit(nopython=True, cache=True)
+def _heap_swap(heap, where, side, a, b):
+    heap[a], heap[b] = heap[b], heap[a]
+    where[heap[a]] = side * (a + 1)
+    where[heap[b]] = side * (b + 1)
+
+
+@jit(nopython=True, cache=True)
+def _heap_sift(heap, size, pos, keys, sign, where, side):
+    """Restore the min-heap order of ``sign * keys[slot]`` around ``pos``."""
+    while pos > 0:
+        parent = (pos - 1) // 2
+        if sign * keys[heap[pos]] >= sign * keys[heap[parent]]:
+            break
+        _heap_swap(heap, where, side, pos, parent)
+        pos = parent
+    while True:
+        child = 2 * pos + 1
+        if child >= size:
+            break
+        if child + 1 < size and sign * keys[heap[child + 1]] < sign * keys[heap[child]]:
+            child += 1
+        if sign * keys[heap[pos]] <= sign * keys[heap[child]]:
+            break
+        _heap_swap(heap, where, side, pos, child)
+        pos = child
+
+
+@jit(nopython=True, cache=True)
+def _heap_push(heap, size, slot, keys, sign, where, side):
+    heap[size] = slot
+    where[slot] = side * (size + 1)
+    _heap_sift(heap, size + 1, size, keys, sign, where, side)
+    return size + 1
+
+
+@jit(nopython=True, cache=True)
+def _heap_remove(heap, size, pos, keys, sign, where, side):
+    """Remove the entry at ``pos``; returns the new size."""
+    where[heap[pos]] = 0
+    size -= 1
+    if pos < size:
+        heap[pos] = heap[size]
+        where[heap[pos]] = side * (pos + 1)
+        _heap_sift(heap, size, pos, keys, sign, where, side)
+    return size
+
+
+@jit(nopython=True, cache=True)
+def _rolling_quantile(values, period, min_periods, q, median):
+    """
+    Windowed quantile from two indexed heaps.
+
+    ``low`` (a max-heap) holds the smallest ``floor((count - 1) * q) + 1``
+    window values and ``high`` (a min-heap) the rest, so the quantile reads
+    off the two tops. Every window value sits in a ring-buffer slot whose
+    heap position is tracked in ``where`` (positive: ``low``, negative:
+    ``high``), which lets the value leaving the window be removed in
+    O(log period).
+    """
+    n = len(values)
+    out = np.empty(n, dtype=values.dtype)
+    keys = np.zeros(period)
+    where = np.zeros(period, dtype=np.int64)
+    low = np.empty(period, dtype=np.int64)
+    high = np.empty(period, dtype=np.int64)
+    n_low = 0
+    n_high = 0
+    for i in range(n):
+        slot = i % period
+        # The slot of the value leaving the window is the one the new value takes
+        if i >= period and where[slot] != 0:
+            if where[slot] > 0:
+                n_low = _heap_remove(low, n_low, where[slot] - 1, keys, -1.0, where, 1)
+            else:
+                n_high = _heap_remove(high, n_high, -where[slot] - 1, keys, 1.0, where, -1)
+        x = values[i]
+        if not np.isnan(x):
+            keys[slot] = x
+            if n_low > 0 and x <= keys[low[0]]:
+                n_low = _heap_push(low, n_low, slot, keys, -1.0, where, 1)
+            else:
+                n_high = _heap_push(high, n_high, slot, keys, 1.0, where, -1)
+        count = n_low + n_high
+        target = int(np.floor((count - 1) * q)) + 1 if count > 0 else 0
+        while n_low > target:
+            moved = low[0]
+            n_low = _heap_remove(low, n_low, 0, keys, -1.0, where, 1)
+            n_high = _heap_push(high, n_high, moved, keys, 1.0, where, -1)
+        while n_low < target:
+            moved = high[0]
+            n_high = _heap_remove(high, n_high, 0, keys, 1.0, where, -1)
+            n_low = _heap_push(low, n_low, moved, keys, -1.0, where, 1)
+        if count == 0 or count < min_periods:
+            out[i] = np.nan
+            continue
+        position = (count - 1) * q
+        frac = position - np.floor(position)
+        a = keys[low[0]]
+        if frac == 0.0:
+            out[i] = a
+        elif median:
+            out[i] = (a + keys[high[0]]) / 2.0
+        else:
+            out[i] = a + (keys[high[0]] - a) * frac
+    return out
+
+
+@jit(nopython=True, cache=True)
+def _fast_k(high, low, close, period):
+    lowest = _rolling_extreme(low, period, False)
+    highest = _rolling_extreme(high, period, True)
+    out = np.empty(len(close), dtype=close.dtype)
+    for i in range(len(close)):
+        spread = highest[i] - lowest[i]
+        out[i] = 100.0 * (close[i] - lowest[i]) / spread if spread != 0.0 else np.nan
+    return out
+
+
+@jit(nopython=True, cache=True)
+def _vwap(price, volume, resets):
+    n = len(price)
+    out = np.empty(n, dtype=price.dtype)
+    pv = 0.0
+    vol = 0.0
+    for i in range(n):
+        if resets[i]:
+            pv = 0.0
+            vol = 0.0
+        if not (np.isnan(price[i]) or np.isnan(volume[i])):
+            pv += price[i] * volume[i]
+            vol += volume[i]
+        out[i] = pv / vol if vol != 0.0 else np.nan
+    return out
+
+
+@jit(nopython=True, cache=True)
+def _rolling_mean_batch(values, periods, min_periods):
+    """``_rolling_mean`` for every period at once, one row of outputs per bar."""
+    n = len(values)
+    k = len(periods)
+    out = np.empty((n, k), dtype=values.dtype)
+    total = np.zeros(k)
+    comp = np.zeros(k)
+    count = np.zeros(k, dtype=np.int64)
+    for i in range(n):
+        x = values[i]
+        for j in range(k):
+            if not np.isnan(x):
+                y = x - comp[j]
+                t = total[j] + y
+                comp[j] = (t - total[j]) - y
+                total[j] = t
+                count[j] += 1
+            if i >= periods[j]:
+                old = values[i - periods[j]]
+                if not np.isnan(old):
+                    y = -old - comp[j]
+                    t = total[j] + y
+                    comp[j] = (t - total[j]) - y
+                    total[j] = t
+                    count[j] -= 1
+            if count[j] > 0 and count[j] >= min_periods[j]:
+                out[i, j] = total[j] / count[j]
+            else:
+                out[i, j] = np.nan
+    return out
+
+
+@jit(nopython=True, cache=True)
+def _ewm_mean_batch(values, alphas, min_periods):
+    """``_ewm_mean`` for every smoothing factor at once."""
+    n = len(values)
+    k = len(alphas)
+    out = np.empty((n, k), dtype=values.dtype)
+    mean = np.full(k, np.nan)
+    old_weight = np.ones(k)
+    count = 0
+    for i in range(n):
+        x = values[i]
+        valid = not np.isnan(x)
+        for j in range(k):
+            if count:
+                old_weight[j] *= 1.0 - alphas[j]
+                if valid:
+                    if mean[j] != x:
+                        mean[j] = (old_weight[j] * mean[j] + alphas[j] * x) / (old_weight[j] + alphas[j])
+                    old_weight[j] = 1.0
+            elif valid:
+                mean[j] = x
+        if valid:
+            count += 1
+        for j in range(k):
+            out[i, j] = mean[j] if count >= min_periods else np.nan
+    return out
+
+
+@jit(nopython=True, cache=True)
+def _wilder_rsi_batch(close, periods, min_periods):
+    n = len(close)
+    k = len(periods)
+    out = np.empty((n, k), dtype=close.dtype)
+    avg_gain = np.zeros(k)
+    avg_loss = np.zeros(k)
+    old_weight = np.ones(k)
+    count = 0
+    if n:
+        out[0, :] = np.nan
+    for i in range(1, n):
+        delta = close[i] - close[i - 1]
+        valid = not np.isnan(delta)
+        gain = delta if delta > 0.0 else 0.0
+        loss = -delta if delta < 0.0 else 0.0
+        for j in range(k):
+            if count:
+                alpha = 1.0 / periods[j]
+                old_weight[j] *= 1.0 - alpha
+                if valid:
+                    if avg_gain[j] != gain:
+                        avg_gain[j] = (old_weight[j] * avg_gain[j] + alpha * gain) / (old_weight[j] + alpha)
+                    if avg_loss[j] != loss:
+                        avg_loss[j] = (old_weight[j] * avg_loss[j] + alpha * loss) / (old_weight[j] + alpha)
+                    old_weight[j] = 1.0
+            elif valid:
+                avg_gain[j] = gain
+                avg_loss[j] = loss
+        if valid:
+            count += 1
+        for j in range(k):
+            if count == 0 or count < min_periods[j]:
+                out[i, j] = np.nan
+            elif avg_loss[j] == 0.0:
+                out[i, j] = 100.0 if avg_gain[j] > 0.0 else np.nan
+            else:
+                out[i, j] = 100.0 - 100.0 / (1.0 + avg_gain[j] / avg_loss[j])
+    return out
+
+
+def _as_float(*arrays):
+    """Contiguous float64 copies (or views) of ``arrays``."""
+    converted = [np.ascontiguousarray(a, dtype=np.float64) for a in arrays]
+    return converted[0] if len(converted) == 1 else converted
+
+
+def _check_period(period, name='period'):
+    if int(period) < 1:
+        raise ValueError(f"{name} must be at least 1")
+    return int(period)
+
+
+def _check_periods(periods, name='periods'):
+    periods = np.asarray(periods, dtype=np.int64).reshape(-1)
+    if (periods < 1).any():
+        raise ValueError(f"{name} must be at least 1")
+    return periods
+
+
+def _per_period(value, periods):
+    """``value`` (a scalar or one entry per period) as an int64 array aligned with ``periods``."""
+    return np.ascontiguousarray(np.broadcast_to(np.asarray(value, dtype=np.int64), periods.shape))
+
+
+def sma(values, period, min_periods=None):
+    """Simple moving average; ``min_periods`` defaults to ``period``."""
+    period = _check_period(period)
+    return _rolling_mean(_as_float(values), period, period if min_periods is None else int(min_periods))
+
+
+def rolling_std(values, period, ddof=0, min_periods=None):
+    """Rolling standard deviation (population by default, like ``np.std``)."""
+    period = _check_period(period)
+    return _rolling_std(_as_float(values), period, period if min_periods is None else int(min_periods), int(ddof))
+
+
+def rolling_median(values, period, min_periods=None):
+    """Rolling median; ``min_periods`` defaults to ``period``."""
+    period = _check_period(period)
+    min_periods = period if min_periods is None else int(min_periods)
+    return _rolling_quantile(_as_float(values), period, min_periods, 0.5, True)
+
+
+def rolling_quantile(values, period, q, min_periods=None):
+    """Rolling ``q`` quantile, linearly interpolated like pandas; ``min_periods`` defaults to ``period``."""
+    period = _check_period(period)
+    if not 0.0 <= float(q) <= 1.0:
+        raise ValueError("q must be between 0 and 1")
+    min_periods = period if min_periods is None else int(min_periods)
+    return _rolling_quantile(_as_float(values), period, min_periods, float(q), False)
+
+
+def bollinger_bands(values, period=20, std_dev=2.0, ddof=0):
+    """``(upper, mid, lower)`` bands ``std_dev`` rolling deviations around the SMA."""
+    values = _as_float(values)
+    mid = sma(values, period)
+    spread = rolling_std(values, period, ddof=ddof) * float(std_dev)
+    return mid + spread, mid, mid - spread
+
+
+def ema(values, span):
+    """
+    Exponential moving average, ``ewm(span=span, adjust=False)``.
+
+    NaNs repeat the previous value and age it like pandas' default
+    ``ignore_na=False``: the first valid value after a gap of ``g`` NaNs has
+    weight ``alpha / ((1 - alpha) ** (g + 1) + alpha)``.
+    """
+    if float(span) < 1:
+        raise ValueError("span must be at least 1")
+    return _ewm_mean(_as_float(values), 2.0 / (float(span) + 1.0), 0)
+
+
+def wilder_rsi(close, period=14, min_periods=0):
+    """
+    Wilder RSI with ``ewm(alpha=1 / period, adjust=False)`` averages.
+
+    ``min_periods`` is the number of price changes needed before a value is
+    reported (``period`` reproduces ``ewm(..., min_periods=period)``). A
+    window with no losses reads 100; one with no movement at all is NaN.
+    """
+    period = _check_period(period)
+    return _wilder_rsi(_as_float(close), period, int(min_periods))
+
+
+def true_range(high, low, close):
+    """True range; the first bar, lacking a previous close, uses ``high - low``."""
+    return _true_range(*_as_float(high, low, close))
+
+
+def atr(high, low, close, period=14, wilder=True):
+    """Average true range: Wilder smoothing, or a simple moving average when ``wilder=False``."""
+    period = _check_period(period)
+    tr = true_range(high, low, close)
+    if wilder:
+        return _ewm_mean(tr, 1.0 / period, 0)
+    return _rolling_mean(tr, period, period)
+
+
+def stochastic(high, low, close, k_period=14, smooth_period=1, d_period=3):
+    """
+    Stochastic oscillator ``(%K, %D)``.
+
+    Raw %K is the close's position in the ``k_period`` low/high range (NaN
+    for a flat range), smoothed by a ``smooth_period`` mean; %D is the
+    ``d_period`` mean of %K.
+    """
+    k_period = _check_period(k_period, 'k_period')
+    smooth_period = _check_period(smooth_period, 'smooth_period')
+    d_period = _check_period(d_period, 'd_period')
+    high, low, close = _as_float(high, low, close)
+    k = _rolling_mean(_fast_k(high, low, close, k_period), smooth_period, smooth_period)
+    return k, _rolling_mean(k, d_period, d_period)
+
+
+def vwap(high, low, close, volume, sessions=None):
+    """
+    Volume-weighted average of the typical price ``(high + low + close) / 3``.
+
+    With ``sessions`` (one label per bar, e.g. the trading date) the running
+    sums restart whenever the label changes; otherwise they span the series.
+    """
+    high, low, close, volume = _as_float(high, low, close, volume)
+    price = (high + low + close) / 3.0
+    resets = np.zeros(len(close), dtype=np.bool_)
+    if sessions is not None:
+        labels = np.asarray(sessions)
+        resets[1:] = labels[1:] != labels[:-1]
+    return _vwap(price, volume, resets)
+
+
+def sma_batch(values, periods, min_periods=None):
+    """``sma`` for each of ``periods`` as a ``(bars, periods)`` array."""
+    periods = _check_periods(periods)
+    min_periods = periods if min_periods is None else _per_period(min_periods, periods)
+    return _rolling_mean_batch(_as_float(values), periods, min_periods)
+
+
+def ema_batch(values, spans):
+    """``ema`` for each of ``spans`` as a ``(bars, spans)`` array."""
+    spans = np.asarray(spans, dtype=np.float64).reshape(-1)
+    if (spans < 1).any():
+        raise ValueError("spans must be at least 1")
+    return _ewm_mean_batch(_as_float(values), 2.0 / (spans + 1.0), 0)
+
+
+def wilder_rsi_batch(close, periods, min_periods=0):
+    """``wilder_rsi`` for each of ``periods``; ``min_periods`` is a scalar or one value per period."""
+    periods = _check_periods(periods)
+    return _wilder_rsi_batch(_as_float(close), periods, _per_period(min_periods, periods))
+
+
+def atr_batch(high, low, close, periods, wilder=True):
+    """``atr`` for each of ``periods`` as a ``(bars, periods)`` array; the true range is computed once."""
+    periods = _check_periods(periods)
+    tr = true_range(high, low, close)
+    if wilder:
+        return _ewm_mean_batch(tr, 1.0 / periods, 0)
+    return _rolling_mean_batch(tr, periods, periods)
@@ -187,3 +187,31 @@ def daily_profit_target_stats(trade_log: pd.DataFrame, daily_target: float):
         'min_daily_pnl': daily_pnl.min(),
         'avg_daily_pnl': daily_pnl.mean(),
     }
+
+
+def equity_matrix_metrics(equity, periods_per_year=252*390):
+    """Vectorized total return, Sharpe ratio and max drawdown for many curves.
+
+    ``equity`` is a 2-D array with one equity curve per row. Each column of
+    the returned dict holds one value per row and matches ``total_return``,
+    ``sharpe_ratio`` and ``max_drawdown`` applied to that curve.
+    """
+    equity = np.asarray(equity, dtype=np.float64)
+    start = equity[:, 0]
+    end = equity[:, -1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        returns = np.diff(equity, axis=1) / equity[:, :-1]
+        if returns.shape[1] > 1:
+            std = returns.std(axis=1, ddof=1)
+            sharpe = np.sqrt(periods_per_year) * returns.mean(axis=1) / std
+            sharpe = np.where(std == 0, np.nan, sharpe)
+        else:
+            sharpe = np.full(len(equity), np.nan)
+        roll_max = np.maximum.accumulate(equity, axis=1)
+        drawdown = (equity - roll_max) / roll_max
+    return {
+        'total_return': (end - start) / start,
+        'sharpe_ratio': sharpe,
+        'max_drawdown': -drawdown.min(axis=1),
+        'final_equity': end,
+    }
@@ -0,0 +1,137 @@
+"""
+monte_carlo.py
+Monte Carlo resampling of a completed trade log.
+
+A single historical equity path says little about how deep a strategy's
+drawdowns can get; the order of its trades is largely luck. These helpers
+replay the trade PnL sequence many times in a compiled kernel:
+
+- ``bootstrap`` draws every trade with replacement, so paths differ in both
+  order and composition (and in final equity),
+- ``shuffle`` permutes the historical trades, so every path ends at the same
+  equity and only the drawdown profile changes.
+
+Each path is reduced on the fly to its final equity, maximum drawdown and
+whether it touched the ruin level, so no path matrix is ever materialised.
+"""
+
+import numpy as np
+from numba import jit, prange
+
+MC_METHODS = ('bootstrap', 'shuffle')
+DEFAULT_PERCENTILES = (1, 5, 10, 25, 50, 75, 90, 95, 99)
+
+
+@jit(nopython=True, cache=True)
+def _next_index(state, low, high):
+    """Advance a xorshift64 state; returns ``(state, index in [low, high))``."""
+    state ^= state << np.uint64(13)
+    state ^= state >> np.uint64(7)
+    state ^= state << np.uint64(17)
+    return state, low + int(state >> np.uint64(11)) % (high - low)
+
+
+@jit(nopython=True, parallel=True, cache=True)
+def _simulate(pnl, initial_equity, ruin_equity, n_trades, shuffle, seeds):
+    """
+    Final equity, max drawdown (absolute and %) and ruin flag of every path.
+
+    Each path draws from its own xorshift64 stream seeded from ``seeds``, so
+    paths are independent of each other and of how ``prange`` schedules them.
+    """
+    n = len(pnl)
+    n_paths = len(seeds)
+    final_equity = np.empty(n_paths)
+    max_drawdown = np.empty(n_paths)
+    max_drawdown_pct = np.empty(n_paths)
+    ruined = np.zeros(n_paths, dtype=np.bool_)
+
+    for p in prange(n_paths):
+        state = seeds[p]
+        order = pnl.copy() if shuffle else pnl
+        equity = initial_equity
+        peak = initial_equity
+        worst = 0.0
+        worst_pct = 0.0
+        hit = initial_equity <= ruin_equity
+        for t in range(n_trades):
+            if shuffle:
+                # Incremental Fisher-Yates: slot t takes a random remaining trade
+                state, j = _next_index(state, t, n)
+                step = order[j]
+                order[j] = order[t]
+                order[t] = step
+            else:
+                state, j = _next_index(state, 0, n)
+                step = pnl[j]
+            equity += step
+            if equity > peak:
+                peak = equity
+            else:
+                drawdown = peak - equity
+                if drawdown > worst:
+                    worst = drawdown
+                if peak > 0.0 and drawdown > worst_pct * peak:
+                    worst_pct = drawdown / peak
+                if equity <= ruin_equity:
+                    hit = True
+        final_equity[p] = equity
+        max_drawdown[p] = worst
+        max_drawdown_pct[p] = worst_pct * 100.0
+        ruined[p] = hit
+
+    return final_equity, max_drawdown, max_drawdown_pct, ruined
+
+
+def simulate_trade_paths(pnl, initial_equity, n_paths=10_000, method='bootstrap',
+                         n_trades=None, ruin_equity=0.0, seed=None):
+    """
+    Resample a trade PnL sequence into ``n_paths`` equity paths.
+
+    ``n_trades`` sets the path length for ``bootstrap`` (default: the number
+    of historical trades); ``shuffle`` always replays every trade once. A
+    path is ruined once its equity falls to ``ruin_equity`` or below.
+    Returns a dict of per-path arrays: ``final_equity``, ``max_drawdown``,
+    ``max_drawdown_pct`` and ``ruined``.
+    """
+    if method not in MC_METHODS:
+        raise ValueError(f"method must be one of {MC_METHODS}")
+    pnl = np.array(pnl, dtype=np.float64)
+    if pnl.ndim != 1 or len(pnl) == 0:
+        raise ValueError("pnl must be a non-empty 1-D sequence")
+    if not np.isfinite(pnl).all():
+        raise ValueError("pnl must be finite")
+    if int(n_paths) < 1:
+        raise ValueError("n_paths must be at least 1")
+    if n_trades is None or method == 'shuffle':
+        n_trades = len(pnl)
+    if int(n_trades) < 1:
+        raise ValueError("n_trades must be at least 1")
+
+    # One non-zero xorshift seed per path; ``seed=None`` gives a fresh run
+    seeds = np.random.default_rng(seed).integers(1, 2**63, size=int(n_paths), dtype=np.uint64)
+    final_equity, max_drawdown, max_drawdown_pct, ruined = _simulate(
+        pnl, float(initial_equity), float(ruin_equity), int(n_trades), method == 'shuffle', seeds,
+    )
+    return {
+        'final_equity': final_equity,
+        'max_drawdown': max_drawdown,
+        'max_drawdown_pct': max_drawdown_pct,
+        'ruined': ruined,
+    }
+
+
+def distribution_summary(values, percentiles=DEFAULT_PERCENTILES, bins=50):
+    """Mean, spread, percentiles and a histogram of a 1-D sample, as plain floats."""
+    values = np.asarray(values, dtype=np.float64)
+    counts, edges = np.histogram(values, bins=bins)
+    return {
+        'mean': float(values.mean()),
+        'std': float(values.std()),
+        'min': float(values.min()),
+        'max': float(values.max()),
+        'percentiles': {
+            f'p{q:g}': float(v) for q, v in zip(percentiles, np.percentile(values, percentiles))
+        },
+        'histogram': {'counts': counts.tolist(), 'bin_edges': edges.tolist()},
+    }
@@ -7,6 +7,9 @@ import pandas as pd
 import numpy as np
 from numba import jit
 import warnings
+
+from . import indicators
+
 warnings.filterwarnings('ignore')
 
 # Set pandas options for better performance
@@ -14,52 +17,23 @@ pd.set_option('mode.chained_assignment', None)
 pd.set_option('compute.use_bottleneck', True)
 pd.set_option('compute.use_numexpr', True)
 
-@jit(nopython=True)
 def fast_ema(prices, period):
     """
-    Fast EMA calculation using numba.
+    Fast EMA calculation (``ewm(span=period, adjust=False)``).
     """
-    alpha = 2.0 / (period + 1.0)
-    ema = np.empty_like(prices)
-    ema[0] = prices[0]
-    
-    for i in range(1, len(prices)):
-        ema[i] = alpha * prices[i] + (1 - alpha) * ema[i - 1]
-    
-    return ema
+    return indicators.ema(prices, period)
 
-@jit(nopython=True)
 def fast_sma(prices, period):
     """
-    Fast SMA calculation using numba.
+    Fast SMA calculation from a running sum.
     """
-    sma = np.empty_like(prices)
-    sma[:period-1] = np.nan
-    
-    for i in range(period-1, len(prices)):
-        sma[i] = np.mean(prices[i-period+1:i+1])
-    
-    return sma
+    return indicators.sma(prices, period)
 
-@jit(nopython=True)
 def fast_bollinger_bands(prices, period=20, std_dev=2):
     """
-    Fast Bollinger Bands calculation using numba.
+    Fast Bollinger Bands calculation (population standard deviation).
     """
-    mid = fast_sma(prices, period)
-    
-    upper = np.empty_like(prices)
-    lower = np.empty_like(prices)
-    
-    for i in range(period-1, len(prices)):
-        std = np.std(prices[i-period+1:i+1])
-        upper[i] = mid[i] + std_dev * std
-        lower[i] = mid[i] - std_dev * std
-    
-    upper[:period-1] = np.nan
-    lower[:period-1] = np.nan
-    
-    return upper, mid, lower
+    return indicators.bollinger_bands(prices, period, std_dev)
 
 @jit(nopython=True)
 def fast_rsi(prices, period=14):
@@ -132,7 +106,7 @@ def vectorized_signal_generation(df, strategy_type='ema_cross'):
         
     elif strategy_type == 'rsi_bounce':
         # RSI oversold/overbought signals
-        df['rsi'] = df['close'].rolling(14).apply(lambda x: fast_rsi(x.values))
+        df['rsi'] = indicators.wilder_rsi(df['close'], 14)
         
         df['signal'] = 0
         df.loc[df['rsi'] < 30, 'signal'] = 1  # Oversold - buy
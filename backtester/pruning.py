@@ -0,0 +1,96 @@
+"""
+pruning.py
+Early-abort rules for backtests of hopeless parameter sets.
+
+A pruning config is a dict with any of:
+
+- ``max_drawdown_pct``: stop once session-end equity falls this many percent
+  below its running peak,
+- ``equity_floor``: stop once equity falls below this absolute level,
+- ``min_trades`` / ``min_trades_sessions``: stop when fewer than
+  ``min_trades`` trades were closed after ``min_trades_sessions`` sessions.
+
+Rules are checked at every session boundary on equity marked to the previous
+bar's close, i.e. what closing the open position there would realise. A
+pruned run ends at the last bar of the session that triggered it, closing any
+open position there, so its metrics describe the simulated prefix only.
+"""
+
+import numpy as np
+
+PRUNE_REASONS = ('max_drawdown', 'equity_floor', 'min_trades')
+PRUNED_EXIT_REASON = 'Pruned'
+
+# Layout of the array handed to the compiled cores: four limits (NaN
+# disables) followed by three outputs written when a run is pruned
+PRUNE_MAX_DRAWDOWN = 0
+PRUNE_EQUITY_FLOOR = 1
+PRUNE_MIN_TRADES = 2
+PRUNE_MIN_TRADES_SESSIONS = 3
+PRUNE_REASON = 4
+PRUNE_BAR = 5
+PRUNE_SESSIONS = 6
+PRUNE_SIZE = 7
+
+_KEYS = ('max_drawdown_pct', 'equity_floor', 'min_trades', 'min_trades_sessions')
+
+
+def normalize_pruning(config):
+    """Validate a pruning config dict; returns None when no rule is enabled."""
+    if config is None:
+        return None
+    if not isinstance(config, dict):
+        raise ValueError("pruning must be a mapping")
+    unknown = set(config) - set(_KEYS)
+    if unknown:
+        raise ValueError(f"Unknown pruning options: {sorted(unknown)}")
+
+    normalized = {}
+    drawdown = config.get('max_drawdown_pct')
+    if drawdown is not None:
+        drawdown = float(drawdown)
+        if not 0 < drawdown <= 100:
+            raise ValueError("max_drawdown_pct must be in (0, 100]")
+        normalized['max_drawdown_pct'] = drawdown
+    floor = config.get('equity_floor')
+    if floor is not None:
+        normalized['equity_floor'] = float(floor)
+    min_trades = config.get('min_trades')
+    if min_trades is not None:
+        sessions = config.get('min_trades_sessions')
+        if not isinstance(min_trades, int) or isinstance(min_trades, bool) or min_trades < 1:
+            raise ValueError("min_trades must be a positive integer")
+        if not isinstance(sessions, int) or isinstance(sessions, bool) or sessions < 1:
+            raise ValueError("min_trades requires min_trades_sessions (a positive integer)")
+        normalized['min_trades'] = min_trades
+        normalized['min_trades_sessions'] = sessions
+    return normalized or None
+
+
+def pruning_array(config):
+    """Kernel array for a normalized pruning config (None when disabled)."""
+    if not config:
+        return None
+    prune = np.full(PRUNE_SIZE, np.nan)
+    if 'max_drawdown_pct' in config:
+        prune[PRUNE_MAX_DRAWDOWN] = config['max_drawdown_pct'] / 100.0
+    if 'equity_floor' in config:
+        prune[PRUNE_EQUITY_FLOOR] = config['equity_floor']
+    if 'min_trades' in config:
+        prune[PRUNE_MIN_TRADES] = config['min_trades']
+        prune[PRUNE_MIN_TRADES_SESSIONS] = config['min_trades_sessions']
+    prune[PRUNE_REASON] = -1
+    return prune
+
+
+def pruning_summary(prune, timestamps):
+    """``{'reason', 'bar', 'timestamp', 'sessions'}`` of a pruned run, or None."""
+    if prune is None or prune[PRUNE_REASON] < 0:
+        return None
+    bar = int(prune[PRUNE_BAR])
+    return {
+        'reason': PRUNE_REASONS[int(prune[PRUNE_REASON])],
+        'bar': bar,
+        'timestamp': str(timestamps[bar]),
+        'sessions': int(prune[PRUNE_SESSIONS]),
+    }
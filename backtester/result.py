@@ -0,0 +1,199 @@
+"""
+result.py
+Columnar backtest result shared by the engine, metrics, persistence and API.
+
+A ``BacktestResult`` keeps the equity curve and the trade table as NumPy
+columns: timestamps are int64 nanoseconds since the epoch, equity is float32
+and every trade column is one array. DataFrames for the metric helpers are
+built column-wise on demand, and JSON-ready records are only produced at the
+response edge via ``equity_records``/``trade_records``.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+NAT = np.iinfo(np.int64).min
+
+
+def _to_epoch_ns(values):
+    """Return (int64 ns since epoch, tz name or None) for datetime-like values."""
+    ts = pd.to_datetime(pd.Series(values), errors='coerce')
+    tz = getattr(ts.dt, 'tz', None)
+    if tz is not None:
+        ts = ts.dt.tz_convert('UTC').dt.tz_localize(None)
+    return ts.to_numpy(dtype='datetime64[ns]').view(np.int64), (str(tz) if tz is not None else None)
+
+
+def _iso_strings(epoch_ns, tz=None):
+    """ISO 8601 strings for int64 ns timestamps (None for NaT), vectorized."""
+    epoch_ns = np.asarray(epoch_ns, dtype=np.int64)
+    missing = epoch_ns == NAT
+    if tz is not None:
+        idx = pd.DatetimeIndex(epoch_ns.view('datetime64[ns]')).tz_localize('UTC').tz_convert(tz)
+        text = pd.Series(idx.strftime('%Y-%m-%dT%H:%M:%S%z'), dtype=object)
+        # strftime gives +0530, isoformat uses +05:30
+        out = np.array(text.str[:-2] + ':' + text.str[-2:], dtype=object)
+    else:
+        unit = 's' if not np.any(epoch_ns[~missing] % 1_000_000_000) else 'us'
+        out = np.datetime_as_string(epoch_ns.view('datetime64[ns]'), unit=unit).astype(object)
+    out[missing] = None
+    return out
+
+
+def _json_column(values):
+    """Python list for one column: NaN/NaT become None, numpy scalars become builtins."""
+    values = np.asarray(values)
+    if values.dtype.kind == 'f':
+        out = values.astype(object)
+        out[np.isnan(values)] = None
+        return out.tolist()
+    if values.dtype.kind in 'iub':
+        return values.tolist()
+    if values.dtype.kind == 'M':
+        return _iso_strings(values.astype('datetime64[ns]').view(np.int64)).tolist()
+    series = pd.Series(values, dtype=object)
+    kind = pd.api.types.infer_dtype(series, skipna=True)
+    if kind in ('date', 'datetime', 'time'):
+        series = series.map(lambda v: v.isoformat(), na_action='ignore')
+    elif kind not in ('string', 'empty', 'boolean', 'integer', 'floating', 'mixed-integer-float'):
+        series = series.astype(str).where(series.notna())
+    return series.astype(object).where(series.notna(), None).tolist()
+
+
+@dataclass
+class BacktestResult:
+    """Columnar equity curve and trade table of one backtest run."""
+
+    timestamps: np.ndarray
+    equity: np.ndarray
+    trades: Dict[str, np.ndarray] = field(default_factory=dict)
+    time_columns: List[str] = field(default_factory=list)
+    tz: Optional[str] = None
+    initial_equity: Optional[float] = None
+    final_equity: Optional[float] = None
+    indicators: Dict[str, np.ndarray] = field(default_factory=dict)
+    indicator_cfg: List[Dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_engine_result(cls, result, initial_equity=None):
+        """Build from the dict returned by ``BacktestEngine.run``."""
+        equity_curve = result.get('equity_curve')
+        if equity_curve is None or len(equity_curve) == 0:
+            timestamps = np.empty(0, dtype=np.int64)
+            equity64 = np.empty(0)
+            tz = None
+        else:
+            if 'timestamp' in equity_curve.columns:
+                timestamps, tz = _to_epoch_ns(equity_curve['timestamp'])
+            else:
+                timestamps, tz = _to_epoch_ns(equity_curve.index)
+            column = equity_curve['equity'] if 'equity' in equity_curve.columns else equity_curve.iloc[:, 0]
+            equity64 = pd.to_numeric(column, errors='coerce').to_numpy(dtype=np.float64)
+
+        trades = {}
+        time_columns = []
+        trade_log = result.get('trade_log')
+        if isinstance(trade_log, pd.DataFrame) and not trade_log.empty:
+            for name in trade_log.columns:
+                values = trade_log[name]
+                if name in ('entry_time', 'exit_time') or pd.api.types.is_datetime64_any_dtype(values):
+                    trades[name], _ = _to_epoch_ns(values)
+                    time_columns.append(name)
+                elif pd.api.types.is_numeric_dtype(values) or pd.api.types.is_bool_dtype(values):
+                    trades[name] = values.to_numpy()
+                else:
+                    trades[name] = values.to_numpy(dtype=object)
+
+        indicators = {}
+        raw_ind = result.get('indicators')
+        if isinstance(raw_ind, pd.DataFrame):
+            for name in raw_ind.columns:
+                if str(name).lower() == 'timestamp':
+                    continue
+                indicators[name] = pd.to_numeric(raw_ind[name], errors='coerce').to_numpy(dtype=np.float64)
+
+        return cls(
+            timestamps=timestamps,
+            equity=equity64.astype(np.float32),
+            trades=trades,
+            time_columns=time_columns,
+            tz=tz,
+            initial_equity=float(initial_equity) if initial_equity is not None else (
+                float(equity64[0]) if len(equity64) else None
+            ),
+            final_equity=float(equity64[-1]) if len(equity64) else None,
+            indicators=indicators,
+            indicator_cfg=list(result.get('indicator_cfg') or []),
+        )
+
+    def __len__(self):
+        return len(self.equity)
+
+    @property
+    def trade_count(self):
+        return len(next(iter(self.trades.values()))) if self.trades else 0
+
+    def _datetimes(self, epoch_ns):
+        idx = pd.DatetimeIndex(np.asarray(epoch_ns, dtype=np.int64).view('datetime64[ns]'))
+        if self.tz is not None:
+            idx = idx.tz_localize('UTC').tz_convert(self.tz)
+        return idx
+
+    def session_count(self):
+        """Distinct calendar dates (wall clock in ``tz``) of the equity curve."""
+        stamps = self.timestamps[self.timestamps != NAT]
+        if len(stamps) == 0:
+            return 0
+        if self.tz is not None:
+            stamps = self._datetimes(stamps).tz_localize(None).asi8
+        return int(len(np.unique(np.floor_divide(stamps, 86_400_000_000_000))))
+
+    def equity_frame(self):
+        """Equity curve DataFrame (timestamp, equity) for the metric helpers."""
+        if len(self) == 0:
+            return pd.DataFrame()
+        equity = self.equity.astype(np.float64)
+        if self.final_equity is not None:
+            equity[-1] = self.final_equity  # exact value, not the float32 copy
+        return pd.DataFrame({'timestamp': self._datetimes(self.timestamps), 'equity': equity})
+
+    def trades_frame(self):
+        """Trade log DataFrame for the metric helpers."""
+        if not self.trades:
+            return pd.DataFrame()
+        return pd.DataFrame({
+            name: self._datetimes(values) if name in self.time_columns else values
+            for name, values in self.trades.items()
+        })
+
+    def equity_records(self):
+        """JSON-ready ``[{'timestamp', 'equity'}]`` list."""
+        if len(self) == 0:
+            return []
+        timestamps = _iso_strings(self.timestamps, self.tz).tolist()
+        equity = self.equity.astype(np.float64)
+        if self.final_equity is not None:
+            equity[-1] = self.final_equity
+        return [
+            {'timestamp': ts, 'equity': value}
+            for ts, value in zip(timestamps, _json_column(equity))
+        ]
+
+    def trade_records(self):
+        """JSON-ready list of trade dicts."""
+        if not self.trades:
+            return []
+        names = list(self.trades)
+        columns = [
+            _iso_strings(self.trades[name], self.tz).tolist() if name in self.time_columns
+            else _json_column(self.trades[name])
+            for name in names
+        ]
+        return [dict(zip(names, row)) for row in zip(*columns)]
+
+    def indicator_lists(self):
+        """JSON-ready ``{column: [float | None]}`` mapping of indicator values."""
+        return {name: _json_column(values) for name, values in self.indicators.items()}
@@ -0,0 +1,194 @@
+"""
+sessions.py
+Vectorized trading-session helpers.
+
+Strategies used to walk sessions with ``groupby('date')`` loops,
+``groupby().apply`` or ``iterrows``. ``SessionIndex`` holds the layout of a
+bar series (session id, bar-of-session index and second of day of every
+bar) and answers per-session questions with whole-array operations:
+
+- ``first_bar`` / ``last_bar`` / ``time_mask`` / ``hour``: bar masks
+- ``cummax`` / ``cummin``: running session high/low
+- ``session_max`` / ``session_min`` / ``any``: session reductions
+  broadcast to every bar of the session
+- ``first`` / ``running_count`` / ``after_first`` / ``value_at_first``:
+  first-signal-per-session primitives
+
+A session is a calendar date of the wall-clock timestamps (the local time
+of tz-aware ones), and bars must be in time order. ``session_index`` keeps
+the layout in the shared indicator cache, so it is computed once per
+dataset however many strategies and runs ask for it.
+"""
+
+import datetime
+
+import numpy as np
+import pandas as pd
+from numba import jit
+
+from .indicator_cache import get_indicator_cache
+
+_NS_PER_SECOND = 1_000_000_000
+_SECONDS_PER_DAY = 86_400
+
+
+@jit(nopython=True, cache=True)
+def _session_extreme(values, first_bar, find_max):
+    """Running session max/min; NaN bars stay NaN, like ``groupby().cummax()``."""
+    n = len(values)
+    out = np.empty(n, dtype=values.dtype)
+    best = np.nan
+    for i in range(n):
+        if first_bar[i]:
+            best = np.nan
+        x = values[i]
+        if np.isnan(x):
+            out[i] = np.nan
+            continue
+        if np.isnan(best) or (x > best if find_max else x < best):
+            best = x
+        out[i] = best
+    return out
+
+
+def _wall_clock_ns(timestamps):
+    timestamps = pd.DatetimeIndex(pd.to_datetime(timestamps))
+    if timestamps.tz is not None:
+        timestamps = timestamps.tz_localize(None)
+    return timestamps.to_numpy(dtype='datetime64[ns]').view(np.int64)
+
+
+def _layout(wall_ns):
+    """``(session id, bar of session, session length, second of day)`` per bar."""
+    n = len(wall_ns)
+    day = wall_ns // (_SECONDS_PER_DAY * _NS_PER_SECOND)
+    second = (wall_ns - day * _SECONDS_PER_DAY * _NS_PER_SECOND) // _NS_PER_SECOND
+    new_session = np.ones(n, dtype=bool)
+    new_session[1:] = day[1:] != day[:-1]
+    ids = np.cumsum(new_session) - 1
+    starts = np.flatnonzero(new_session)
+    bar_index = np.arange(n) - starts[ids]
+    length = np.diff(np.append(starts, n))[ids]
+    return ids.astype(np.int64), bar_index.astype(np.int64), length.astype(np.int64), second.astype(np.int64)
+
+
+def _second_of_day(value):
+    """Seconds since midnight of a ``datetime.time`` or an ``'HH:MM[:SS]'`` string."""
+    if isinstance(value, datetime.time):
+        return value.hour * 3600 + value.minute * 60 + value.second
+    parts = [int(part) for part in str(value).split(':')]
+    if not 2 <= len(parts) <= 3:
+        raise ValueError(f"Expected a time like 'HH:MM', got {value!r}")
+    hours, minutes, seconds = (parts + [0])[:3]
+    return hours * 3600 + minutes * 60 + seconds
+
+
+class SessionIndex:
+    """
+    Session layout of a time-ordered bar series.
+
+    Masks and broadcasts are arrays aligned with the bars; ``values`` and
+    ``mask`` arguments may be arrays or Series of the same length.
+    """
+
+    def __init__(self, ids, bar_index, length, second):
+        self.ids = ids
+        self.bar_index = bar_index
+        self.length = length
+        self.second = second
+        self.first_bar = bar_index == 0
+        self.last_bar = bar_index == length - 1
+        self.starts = np.flatnonzero(self.first_bar)
+
+    @property
+    def count(self):
+        """Number of sessions."""
+        return len(self.starts)
+
+    @property
+    def hour(self):
+        return self.second // 3600
+
+    def time_mask(self, start=None, end=None):
+        """Bars with ``start <= time of day <= end``; either bound may be omitted."""
+        mask = np.ones(len(self.second), dtype=bool)
+        if start is not None:
+            mask &= self.second >= _second_of_day(start)
+        if end is not None:
+            mask &= self.second <= _second_of_day(end)
+        return mask
+
+    def cummax(self, values):
+        """Running maximum within each session."""
+        return _session_extreme(self._floats(values), self.first_bar, True)
+
+    def cummin(self, values):
+        """Running minimum within each session."""
+        return _session_extreme(self._floats(values), self.first_bar, False)
+
+    def session_max(self, values):
+        """Maximum of each session (NaNs skipped), broadcast to its bars."""
+        return self._reduce(np.fmax, self._floats(values))
+
+    def session_min(self, values):
+        """Minimum of each session (NaNs skipped), broadcast to its bars."""
+        return self._reduce(np.fmin, self._floats(values))
+
+    def any(self, mask):
+        """Whether ``mask`` holds on any bar of the session, broadcast to its bars."""
+        return self._reduce(np.logical_or, self._mask(mask))
+
+    def running_count(self, mask):
+        """Number of ``mask`` bars in the session up to and including each bar."""
+        mask = self._mask(mask)
+        total = np.cumsum(mask, dtype=np.int64)
+        if not len(total):
+            return total
+        before = total[self.starts] - mask[self.starts]
+        return total - before[self.ids]
+
+    def first(self, mask):
+        """The first ``mask`` bar of every session."""
+        mask = self._mask(mask)
+        return mask & (self.running_count(mask) == 1)
+
+    def after_first(self, mask):
+        """Bars strictly after the first ``mask`` bar of their session."""
+        first_index = self._first_index(mask)[self.ids]
+        return (first_index >= 0) & (np.arange(len(self.ids)) > first_index)
+
+    def value_at_first(self, mask, values):
+        """``values`` at the first ``mask`` bar of each session (NaN if none), broadcast to its bars."""
+        values = self._floats(values)
+        first_index = self._first_index(mask)
+        out = np.full(self.count, np.nan, dtype=values.dtype)
+        found = first_index >= 0
+        out[found] = values[first_index[found]]
+        return out[self.ids]
+
+    def _first_index(self, mask):
+        """Bar index of each session's first ``mask`` bar, or -1."""
+        out = np.full(self.count, -1, dtype=np.int64)
+        index = np.flatnonzero(self.first(mask))
+        out[self.ids[index]] = index
+        return out
+
+    def _reduce(self, ufunc, values):
+        if not len(values):
+            return values
+        return ufunc.reduceat(values, self.starts)[self.ids]
+
+    @staticmethod
+    def _floats(values):
+        values = np.asarray(values)
+        return values if values.dtype in (np.float32, np.float64) else values.astype(np.float64)
+
+    @staticmethod
+    def _mask(mask):
+        return np.asarray(mask, dtype=bool)
+
+
+def session_index(timestamps):
+    """``SessionIndex`` of ``timestamps``, served from the shared indicator cache."""
+    wall_ns = _wall_clock_ns(timestamps)
+    return SessionIndex(*get_indicator_cache().get_or_compute('session_layout', [wall_ns], _layout))
@@ -0,0 +1,257 @@
+"""
+signal_cache.py
+Disk cache for strategy signal and indicator columns.
+
+``generate_signals`` only depends on the strategy code, its parameters and the
+input data, never on engine options (fees, slippage, lots, option delta, daily
+target). The cache keys the columns a strategy adds or changes on:
+
+- the content hash of every source file in the strategy's class hierarchy,
+- the content hash of the backtester package (indicators, indicator cache,
+  sessions, exit rules), which strategies call into,
+- the normalized strategy params,
+- a content fingerprint of the dataset,
+
+and stores them as NumPy arrays in one ``.npz`` file per key, together with
+the strategy's output column order. Object columns are stored as fixed-width
+strings when every value is a string and are not cached otherwise, so entries
+never need unpickling. Files are evicted least-recently-used once the cache
+grows past ``max_bytes``.
+
+Strategies that keep state from ``generate_signals`` for later use in
+``should_exit`` must set ``cache_signals = False``; a cache hit skips the call.
+"""
+
+import hashlib
+import inspect
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+COLUMNS_KEY = '__columns__'
+ORDER_KEY = '__order__'
+OBJECT_COLUMNS_KEY = '__object_columns__'
+
+_PACKAGE_DIR = Path(__file__).resolve().parent
+_package_hash = None
+
+
+def strategy_source_hash(strategy_cls):
+    """Hash the source files of ``strategy_cls`` and its strategy base classes."""
+    digest = hashlib.sha256()
+    for klass in inspect.getmro(strategy_cls):
+        if klass is object:
+            continue
+        path = inspect.getsourcefile(klass)
+        digest.update(klass.__qualname__.encode())
+        with open(path, 'rb') as fh:
+            digest.update(fh.read())
+    return digest.hexdigest()
+
+
+def backtester_source_hash():
+    """Hash the source files of the backtester package (recomputed when one changes)."""
+    global _package_hash
+    paths = sorted(_PACKAGE_DIR.glob('*.py'))
+    stamp = tuple((path.name, path.stat().st_mtime_ns) for path in paths)
+    cached = _package_hash
+    if cached is None or cached[0] != stamp:
+        digest = hashlib.sha256()
+        for path in paths:
+            digest.update(path.name.encode())
+            digest.update(path.read_bytes())
+        cached = _package_hash = (stamp, digest.hexdigest())
+    return cached[1]
+
+
+def normalize_params(params):
+    """Stable JSON representation of a strategy params dict."""
+    return json.dumps(params or {}, sort_keys=True, default=str)
+
+
+def dataset_fingerprint(data):
+    """Content fingerprint of a DataFrame (column names, dtypes, index and values)."""
+    digest = hashlib.sha256()
+    digest.update(json.dumps([[str(c), str(t)] for c, t in data.dtypes.items()]).encode())
+    digest.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+class SignalCache:
+    """
+    LRU disk cache of the columns produced by ``strategy.generate_signals``.
+
+    Use ``generate_signals(strategy, data)`` as a drop-in replacement for
+    ``strategy.generate_signals(data)``. Any failure to build a key or read an
+    entry falls back to calling the strategy directly.
+    """
+
+    def __init__(self, cache_dir, max_bytes=512 * 1024 * 1024):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = int(max_bytes)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._source_hashes = {}
+
+    def key(self, strategy, data):
+        """Cache key for running ``strategy`` on ``data``."""
+        digest = hashlib.sha256()
+        digest.update(self._source_hash(type(strategy)).encode())
+        digest.update(backtester_source_hash().encode())
+        digest.update(normalize_params(getattr(strategy, 'params', None)).encode())
+        digest.update(dataset_fingerprint(data).encode())
+        return digest.hexdigest()
+
+    def generate_signals(self, strategy, data):
+        """Return ``strategy.generate_signals(data)``, served from cache when possible."""
+        if not getattr(strategy, 'cache_signals', True):
+            return strategy.generate_signals(data)
+        try:
+            key = self.key(strategy, data)
+        except Exception as exc:  # e.g. strategies defined interactively
+            logger.debug(f"Signal cache bypassed: {exc}")
+            return strategy.generate_signals(data)
+
+        entry = self._load(key)
+        if entry is not None:
+            with self._lock:
+                self.hits += 1
+            columns, order = entry
+            df = data.copy()
+            for name, values in columns.items():
+                df[name] = values
+            # Rebuild the strategy's own column order (and any columns it dropped)
+            by_name = {str(name): name for name in df.columns}
+            return df[[by_name[name] for name in order]]
+
+        with self._lock:
+            self.misses += 1
+        df = strategy.generate_signals(data)
+        if isinstance(df, pd.DataFrame) and df.index.equals(data.index):
+            self.put(key, self._changed_columns(data, df), order=list(df.columns))
+        return df
+
+    def get(self, key):
+        """Return the cached ``{column: array}`` dict for ``key`` or None."""
+        entry = self._load(key)
+        return None if entry is None else entry[0]
+
+    def _load(self, key):
+        """``({column: array}, output column order)`` stored under ``key``, or None."""
+        path = self._path(key)
+        try:
+            with np.load(path) as stored:
+                names = [str(n) for n in stored[COLUMNS_KEY]]
+                order = [str(n) for n in stored[ORDER_KEY]]
+                columns = {name: stored[f'c{i}'] for i, name in enumerate(names)}
+                for i in stored[OBJECT_COLUMNS_KEY]:
+                    columns[names[i]] = columns[names[i]].astype(object)
+        except FileNotFoundError:
+            return None
+        except Exception as exc:
+            logger.warning(f"Discarding unreadable signal cache entry {path.name}: {exc}")
+            path.unlink(missing_ok=True)
+            return None
+        try:
+            os.utime(path)  # mark as recently used
+        except OSError:
+            pass
+        return columns, order
+
+    def put(self, key, columns, order=None):
+        """
+        Store ``{column: array}`` under ``key`` and enforce the size limit.
+
+        ``order`` is the full output column order (defaults to ``columns``).
+        Entries with an object column holding anything but strings are skipped.
+        """
+        arrays = {}
+        object_columns = []
+        for i, (name, values) in enumerate(columns.items()):
+            values = np.asarray(values)
+            if values.dtype == object:
+                if not all(isinstance(value, str) for value in values):
+                    logger.debug(f"Signal cache skipped: column {name!r} holds non-string objects")
+                    return
+                values = values.astype(str)
+                object_columns.append(i)
+            arrays[f'c{i}'] = values
+        arrays[COLUMNS_KEY] = np.array([str(name) for name in columns], dtype=str)
+        arrays[ORDER_KEY] = np.array([str(name) for name in (columns if order is None else order)], dtype=str)
+        arrays[OBJECT_COLUMNS_KEY] = np.array(object_columns, dtype=np.int64)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as fh:
+                np.savez(fh, **arrays)
+            os.replace(tmp, self._path(key))
+        except Exception as exc:
+            logger.warning(f"Failed to write signal cache entry: {exc}")
+            Path(tmp).unlink(missing_ok=True)
+            return
+        self._evict()
+
+    def clear(self):
+        """Remove every cache entry."""
+        for path in self.cache_dir.glob('*.npz'):
+            path.unlink(missing_ok=True)
+
+    def info(self):
+        """Entry count, size and hit/miss counters."""
+        files = list(self.cache_dir.glob('*.npz')) if self.cache_dir.exists() else []
+        return {
+            'entries': len(files),
+            'size_bytes': sum(f.stat().st_size for f in files),
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+    def _path(self, key):
+        return self.cache_dir / f'{key}.npz'
+
+    def _source_hash(self, strategy_cls):
+        stamp = tuple(
+            os.path.getmtime(inspect.getsourcefile(k))
+            for k in inspect.getmro(strategy_cls) if k is not object
+        )
+        cached = self._source_hashes.get(strategy_cls)
+        if cached is None or cached[0] != stamp:
+            cached = (stamp, strategy_source_hash(strategy_cls))
+            self._source_hashes[strategy_cls] = cached
+        return cached[1]
+
+    @staticmethod
+    def _changed_columns(data, df):
+        """Columns of ``df`` that are new or differ from ``data``."""
+        columns = {}
+        for name in df.columns:
+            if name in data.columns and df[name].equals(data[name]):
+                continue
+            columns[name] = df[name].to_numpy()
+        return columns
+
+    def _evict(self):
+        with self._lock:
+            files = []
+            for path in self.cache_dir.glob('*.npz'):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                files.append((stat.st_mtime_ns, stat.st_size, path))
+            total = sum(size for _, size, _ in files)
+            for _, size, path in sorted(files, key=lambda item: item[0]):
+                if total <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
@@ -3,7 +3,21 @@ strategy_base.py
 Base class/interface for trading strategies.
 """
 
+from .indicator_cache import get_indicator_cache
+from .sessions import session_index
+
+
 class StrategyBase:
+    # Set to False when generate_signals stores state that should_exit relies on,
+    # so the signal cache never skips the call.
+    cache_signals = True
+
+    # Indicators whose period is a strategy parameter, as dicts like
+    # {'param': 'ema_period', 'indicator': 'ema', 'params': {...}} where
+    # params are the other arguments passed to self.indicator(). Parameter
+    # sweeps compute them for every swept period in one batch.
+    sweep_indicators = ()
+
     def __init__(self, params=None):
         self.params = params or {}
 
@@ -22,6 +36,22 @@ class StrategyBase:
         """
         raise NotImplementedError("generate_signals must be implemented by the strategy.")
 
+    def indicator(self, data, name, timeframe=None, **params):
+        """
+        Indicator ``name`` of ``data`` from the shared indicator cache, e.g.
+        ``self.indicator(df, 'ema', span=10)`` or ``self.indicator(df, 'atr',
+        period=14, wilder=False)``. Returns a read-only array (a tuple for
+        bollinger_bands and stochastic); see ``backtester.indicator_cache``.
+        """
+        return get_indicator_cache().get(data, name, timeframe=timeframe, **params)
+
+    def sessions(self, data):
+        """
+        Session layout of ``data['timestamp']`` (a ``backtester.sessions.SessionIndex``),
+        computed once per dataset, e.g. ``self.sessions(df).first(entries)``.
+        """
+        return session_index(data['timestamp'])
+
     def should_exit(self, position, row, entry_price):
         """
         Given current position ('long' or 'short'), current row, and entry price,
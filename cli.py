@@ -9,6 +9,11 @@ Examples:
     --initial-cash 100000 --lots 2 --option-delta 0.5 --fee-per-trade 4 --intraday
 
 Outputs a metrics summary to stdout. Optionally writes full JSON results.
+
+Distributed optimization worker (processes batches queued by optimization
+jobs with execution_mode='distributed'; needs the same DATABASE_URL and
+dataset files as the API server):
+  python cli.py worker [--worker-id ID] [--max-items N] [--exit-when-idle]
 """
 
 from __future__ import annotations
@@ -135,7 +140,44 @@ def print_metrics(metrics: Dict[str, Any], title: str = "Metrics") -> None:
             print(f"{k}: {metrics[k]}")
 
 
+def worker_main(argv: List[str]) -> int:
+    """Run a distributed optimization worker until interrupted."""
+    parser = argparse.ArgumentParser(
+        prog="cli.py worker",
+        description="Process optimization batches from the shared work queue",
+    )
+    parser.add_argument("--worker-id", help="Worker name (default: host:pid)")
+    parser.add_argument("--max-items", type=int, default=None, help="Stop after this many batches")
+    parser.add_argument("--exit-when-idle", action="store_true", help="Stop once the queue is empty")
+    parser.add_argument("--lease-seconds", type=float, default=None, help="Lease length per batch")
+    parser.add_argument("--poll-interval", type=float, default=None, help="Seconds between polls of an empty queue")
+    args = parser.parse_args(argv)
+
+    from backend.app.config import configure_logging, get_settings
+    from backend.app.database.models import create_tables
+    from backend.app.services.optimization_service import OptimizationWorker
+
+    configure_logging(get_settings())
+    create_tables()
+    worker = OptimizationWorker(
+        worker_id=args.worker_id,
+        lease_seconds=args.lease_seconds,
+        poll_interval=args.poll_interval,
+    )
+    print(f"Worker {worker.worker_id} waiting for optimization batches")
+    try:
+        handled = worker.run(max_items=args.max_items, exit_when_idle=args.exit_when_idle)
+    except KeyboardInterrupt:
+        handled = worker.processed
+    print(f"Worker {worker.worker_id} processed {handled} batch(es)")
+    return 0
+
+
 def main(argv: List[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "worker":
+        return worker_main(argv[1:])
+
     parser = argparse.ArgumentParser(description="Run backtests from the CLI")
     parser.add_argument("--file", "-f", required=True, help="Path to CSV data file")
     parser.add_argument(
@@ -170,6 +212,18 @@ def main(argv: List[str] | None = None) -> int:
     parser.add_argument("--slippage", type=float, default=None)
     parser.add_argument("--intraday", action="store_true")
     parser.add_argument("--daily-target", type=float, default=None)
+    parser.add_argument(
+        "--fill-model",
+        choices=["close", "ohlc"],
+        default=None,
+        help="Exit fill model: 'ohlc' fills stops/targets intrabar from high/low",
+    )
+    parser.add_argument(
+        "--tie-break",
+        choices=["stop", "target", "nearest"],
+        default=None,
+        help="Which of stop/target fills first when both are touched in one bar",
+    )
 
     # Output options
     parser.add_argument(
@@ -204,6 +258,10 @@ def main(argv: List[str] | None = None) -> int:
             engine_options[name] = val
     if args.intraday:
         engine_options["intraday"] = True
+    if args.fill_model:
+        engine_options["fill_model"] = args.fill_model
+    if args.tie_break:
+        engine_options["intrabar_tie_break"] = args.tie_break
 
     # Load data with timeframe and date filters
     df = load_csv(args.file, timeframe=args.timeframe)
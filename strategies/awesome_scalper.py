@@ -1,10 +1,15 @@
 from backtester.strategy_base import StrategyBase
-import pandas as pd
 
 class AwesomeScalperStrategy(StrategyBase):
     """
     A scalping strategy that combines Bollinger Bands and RSI for entry signals. test
     """
+
+    sweep_indicators = (
+        {'param': 'bb_length', 'indicator': 'sma'},
+        {'param': 'ema_period', 'indicator': 'ema'},
+        {'param': 'atr_period', 'indicator': 'atr', 'params': {'wilder': False}},
+    )
     
     @classmethod
     def get_params_config(cls):
@@ -128,39 +133,24 @@ class AwesomeScalperStrategy(StrategyBase):
             {"column": "rsi", "label": "RSI", "plot": True, "color": "purple", "panel": 2},
         ]
 
-    def compute_rsi(self, series, period):
-        delta = series.diff()
-        up = delta.clip(lower=0)
-        down = -delta.clip(upper=0)
-        ma_up = up.ewm(alpha=1/period, min_periods=period, adjust=False).mean()
-        ma_down = down.ewm(alpha=1/period, min_periods=period, adjust=False).mean()
-        rsi = 100 - (100 / (1 + ma_up / ma_down))
-        return rsi
-
     def generate_signals(self, data):
         df = data.copy()
 
         # Bollinger Bands
-        close = df['close']
-        ma = close.rolling(self.bb_length).mean()
-        stdev = close.rolling(self.bb_length).std()
+        ma = self.indicator(df, 'sma', period=self.bb_length)
+        stdev = self.indicator(df, 'rolling_std', period=self.bb_length, ddof=1)
         df['BBU'] = ma + self.bb_std * stdev
         df['BBM'] = ma
         df['BBL'] = ma - self.bb_std * stdev
 
         # RSI
-        df['rsi'] = self.compute_rsi(df['close'], self.rsi_period)
+        df['rsi'] = self.indicator(df, 'rsi', period=self.rsi_period, min_periods=self.rsi_period)
 
         # EMA Trend Filter
-        df['ema_trend'] = df['close'].ewm(span=self.ema_period, adjust=False).mean()
+        df['ema_trend'] = self.indicator(df, 'ema', span=self.ema_period)
 
         # ATR
-        high_low = df['high'] - df['low']
-        high_close = (df['high'] - df['close'].shift()).abs()
-        low_close = (df['low'] - df['close'].shift()).abs()
-        ranges = pd.concat([high_low, high_close, low_close], axis=1)
-        true_range = ranges.max(axis=1)
-        df['atr'] = true_range.rolling(window=self.atr_period).mean()
+        df['atr'] = self.indicator(df, 'atr', period=self.atr_period, wilder=False)
 
         # EMA Slope
         df['ema_slope'] = df['ema_trend'].diff()
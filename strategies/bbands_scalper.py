@@ -13,6 +13,7 @@ from backtester.strategy_base import StrategyBase
 import pandas as pd
 
 class BBandsScalperStrategy(StrategyBase):
+    sweep_indicators = ({'param': 'bb_period', 'indicator': 'sma'},)
     
     @classmethod
     def get_params_config(cls):
@@ -132,8 +133,8 @@ class BBandsScalperStrategy(StrategyBase):
         Exit: Flat when price hits SMA20 (midline) or opposite band
         """
         df = data.copy()
-        df['mid'] = df['close'].rolling(self.length).mean()
-        df['std'] = df['close'].rolling(self.length).std(ddof=0)
+        df['mid'] = self.indicator(df, 'sma', period=self.length)
+        df['std'] = self.indicator(df, 'rolling_std', period=self.length, ddof=0)
         df['upper'] = df['mid'] + self.stddev * df['std']
         df['lower'] = df['mid'] - self.stddev * df['std']
         df['prev_close'] = df['close'].shift(1)
@@ -14,8 +14,14 @@ Strategy Logic:
 
 import pandas as pd
 from backtester.strategy_base import StrategyBase
+from backtester.exit_rules import cross, target, stop
 
 class EMA10ScalperStrategyV2(StrategyBase):
+    sweep_indicators = (
+        {'param': 'ema_period', 'indicator': 'ema'},
+        {'param': 'atr_period', 'indicator': 'atr', 'params': {'wilder': False}},
+    )
+
     def __init__(self, params=None):
         super().__init__(params)
         self.ema_period = params.get('ema_period', 10) if params else 10
@@ -101,6 +107,18 @@ class EMA10ScalperStrategyV2(StrategyBase):
             }
         ]
 
+    def exit_rules(self):
+        """
+        Column-based equivalent of should_exit for the compiled engine path.
+        The trailing stop only applies when the caller tracks highest/lowest
+        prices, which the engine does not, so it is omitted here.
+        """
+        return [
+            cross('ema', '<', reason='EMA exit'),
+            target(column='atr', mult=self.atr_mult_target, fallback=self.profit_target),
+            stop(column='atr', mult=self.atr_mult_stop, fallback=self.stop_loss),
+        ]
+
     def generate_signals(self, data):
         """
         Optimized signal generation using vectorized operations.
@@ -111,23 +129,15 @@ class EMA10ScalperStrategyV2(StrategyBase):
         """
         df = data.copy()
         # Vectorized EMA calculation
-        df['ema'] = df['close'].ewm(span=self.ema_period, adjust=False).mean()
+        df['ema'] = self.indicator(df, 'ema', span=self.ema_period)
         # ATR calculation
-        high = df['high']
-        low = df['low']
-        close = df['close']
-        prev_close = close.shift(1)
-        tr1 = (high - low).abs()
-        tr2 = (high - prev_close).abs()
-        tr3 = (low - prev_close).abs()
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-        df['atr'] = tr.rolling(self.atr_period).mean()
+        df['atr'] = self.indicator(df, 'atr', period=self.atr_period, wilder=False)
         # Vectorized signal calculation using shift operations
         prev_ema = df['ema'].shift(1)
         prev_close = df['close'].shift(1)
         # Time filter
-        df['trade_time'] = df['timestamp'].dt.strftime('%H:%M') if 'timestamp' in df.columns else None
-        valid_time = (df['trade_time'] >= self.trade_start_time) & (df['trade_time'] <= self.trade_end_time) if df['trade_time'] is not None else True
+        sessions = self.sessions(df)
+        valid_time = sessions.time_mask(self.trade_start_time, self.trade_end_time)
         long_condition = (prev_close < prev_ema) & (df['close'] > df['ema']) & (df['atr'] >= self.min_atr) & valid_time
         short_condition = (prev_close > prev_ema) & (df['close'] < df['ema']) & (df['atr'] >= self.min_atr) & valid_time
         df['signal'] = 0
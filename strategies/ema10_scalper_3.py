@@ -16,6 +16,11 @@ import pandas as pd
 from backtester.strategy_base import StrategyBase
 
 class EMA10ScalperStrategyV3(StrategyBase):
+    sweep_indicators = (
+        {'param': 'ema_period', 'indicator': 'ema'},
+        {'param': 'atr_period', 'indicator': 'atr', 'params': {'wilder': False}},
+    )
+
     def __init__(self, params=None):
         super().__init__(params)
         self.ema_period = params.get('ema_period', 10) if params else 10
@@ -113,27 +118,18 @@ class EMA10ScalperStrategyV3(StrategyBase):
         """
         df = data.copy()
         # Vectorized EMA calculation
-        df['ema'] = df['close'].ewm(span=self.ema_period, adjust=False).mean()
+        df['ema'] = self.indicator(df, 'ema', span=self.ema_period)
         # ATR calculation
-        high = df['high']
-        low = df['low']
-        close = df['close']
-        prev_close = close.shift(1)
-        tr1 = (high - low).abs()
-        tr2 = (high - prev_close).abs()
-        tr3 = (low - prev_close).abs()
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-        df['atr'] = tr.rolling(self.atr_period).mean()
+        df['atr'] = self.indicator(df, 'atr', period=self.atr_period, wilder=False)
         # ATR-based volatility filter
-        median_atr = df['atr'].rolling(50, min_periods=1).median()
+        median_atr = self.indicator(df, 'rolling_median', source='atr', period=50, min_periods=1)
         valid_atr = df['atr'] <= 1.5 * median_atr
         # Time filter
-        df['trade_time'] = df['timestamp'].dt.strftime('%H:%M') if 'timestamp' in df.columns else None
-        valid_time = (df['trade_time'] >= self.trade_start_time) & (df['trade_time'] <= self.trade_end_time) if df['trade_time'] is not None else True
+        sessions = self.sessions(df)
+        valid_time = sessions.time_mask(self.trade_start_time, self.trade_end_time)
         # Volatility filter: skip days with range > max_daily_range
-        df['date'] = df['timestamp'].dt.date if 'timestamp' in df.columns else None
-        daily_range = df.groupby('date').apply(lambda x: x['high'].max() - x['low'].min()) if df['date'] is not None else None
-        valid_vol = df['date'].map(lambda d: daily_range[d] <= self.max_daily_range if daily_range is not None and d in daily_range else True) if df['date'] is not None else True
+        daily_range = sessions.session_max(df['high']) - sessions.session_min(df['low'])
+        valid_vol = daily_range <= self.max_daily_range
         # Signal conditions
         prev_ema = df['ema'].shift(1)
         prev_close = df['close'].shift(1)
@@ -143,14 +139,7 @@ class EMA10ScalperStrategyV3(StrategyBase):
         df.loc[long_condition, 'signal'] = 1
         df.loc[short_condition, 'signal'] = -1
         # Limit trades per day
-        if df['date'] is not None:
-            for d in df['date'].unique():
-                idx = df[df['date'] == d].index
-                signals = df.loc[idx, 'signal']
-                trade_idx = signals[signals != 0].index
-                if len(trade_idx) > self.max_trades_per_day:
-                    # Zero out excess signals
-                    df.loc[trade_idx[self.max_trades_per_day:], 'signal'] = 0
+        df.loc[sessions.running_count(df['signal'] != 0) > self.max_trades_per_day, 'signal'] = 0
         # Daily max loss filter (handled in engine, but add info column for engine)
         df['daily_max_loss'] = self.daily_max_loss
         return df
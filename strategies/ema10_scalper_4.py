@@ -16,6 +16,11 @@ import pandas as pd
 from backtester.strategy_base import StrategyBase
 
 class EMA10ScalperStrategyV4(StrategyBase):
+    sweep_indicators = (
+        {'param': 'ema_period', 'indicator': 'ema'},
+        {'param': 'atr_period', 'indicator': 'atr', 'params': {'wilder': False}},
+    )
+
     def __init__(self, params=None):
         super().__init__(params)
         self.ema_period = params.get('ema_period', 10) if params else 10
@@ -113,19 +118,11 @@ class EMA10ScalperStrategyV4(StrategyBase):
         """
         df = data.copy()
         # Vectorized EMA calculation
-        df['ema'] = df['close'].ewm(span=self.ema_period, adjust=False).mean()
+        df['ema'] = self.indicator(df, 'ema', span=self.ema_period)
         # ATR calculation
-        high = df['high']
-        low = df['low']
-        close = df['close']
-        prev_close = close.shift(1)
-        tr1 = (high - low).abs()
-        tr2 = (high - prev_close).abs()
-        tr3 = (low - prev_close).abs()
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-        df['atr'] = tr.rolling(self.atr_period).mean()
+        df['atr'] = self.indicator(df, 'atr', period=self.atr_period, wilder=False)
         # ATR-based volatility filter
-        median_atr = df['atr'].rolling(50, min_periods=1).median()
+        median_atr = self.indicator(df, 'rolling_median', source='atr', period=50, min_periods=1)
         valid_atr = df['atr'] <= 1.5 * median_atr
         # Add RSI indicator
         delta = df['close'].diff()
@@ -135,15 +132,13 @@ class EMA10ScalperStrategyV4(StrategyBase):
         df['rsi'] = 100 - (100 / (1 + rs))
 
         # Time filter
-        df['trade_time'] = df['timestamp'].dt.strftime('%H:%M') if 'timestamp' in df.columns else None
-        df['trade_hour'] = df['timestamp'].dt.hour if 'timestamp' in df.columns else None
-        valid_time = (df['trade_time'] >= self.trade_start_time) & (df['trade_time'] <= self.trade_end_time) if df['trade_time'] is not None else True
+        sessions = self.sessions(df)
+        valid_time = sessions.time_mask(self.trade_start_time, self.trade_end_time)
         # Avoid trading in first hour (9 AM)
-        valid_hour = df['trade_hour'] != 9 if df['trade_hour'] is not None else True
+        valid_hour = sessions.hour != 9
         # Volatility filter: skip days with range > max_daily_range
-        df['date'] = df['timestamp'].dt.date if 'timestamp' in df.columns else None
-        daily_range = df.groupby('date').apply(lambda x: x['high'].max() - x['low'].min()) if df['date'] is not None else None
-        valid_vol = df['date'].map(lambda d: daily_range[d] <= self.max_daily_range if daily_range is not None and d in daily_range else True) if df['date'] is not None else True
+        daily_range = sessions.session_max(df['high']) - sessions.session_min(df['low'])
+        valid_vol = daily_range <= self.max_daily_range
         # Signal conditions
         prev_ema = df['ema'].shift(1)
         prev_close = df['close'].shift(1)
@@ -164,9 +159,9 @@ class EMA10ScalperStrategyV4(StrategyBase):
         df.loc[long_condition, 'signal'] = 1
         df.loc[short_condition, 'signal'] = -1
         # Limit trades per day and after consecutive losses, and add daily stop-loss
-        if df['date'] is not None:
-            for d in df['date'].unique():
-                idx = df[df['date'] == d].index
+        if 'pnl' in df.columns:
+            for session in range(sessions.count):
+                idx = df.index[sessions.ids == session]
                 signals = df.loc[idx, 'signal']
                 trade_idx = signals[signals != 0].index
                 loss_count = 0
@@ -195,6 +190,9 @@ class EMA10ScalperStrategyV4(StrategyBase):
                 # Reduce max trades per day to 8
                 if trade_count > 8:
                     df.loc[trade_idx[8:], 'signal'] = 0
+        else:
+            # Without trade PnL only the cap of 8 trades per day applies
+            df.loc[sessions.running_count(df['signal'] != 0) > 8, 'signal'] = 0
         # Daily max loss filter (handled in engine, but add info column for engine)
         df['daily_max_loss'] = self.daily_max_loss
         return df
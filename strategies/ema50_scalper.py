@@ -11,8 +11,11 @@ Strategy Logic:
 """
 import pandas as pd
 from backtester.strategy_base import StrategyBase
+from backtester.exit_rules import cross, target
 
 class EMA50ScalperStrategy(StrategyBase):
+    sweep_indicators = ({'param': 'ema_period', 'indicator': 'ema'},)
+
     def __init__(self, params=None):
         super().__init__(params)
         self.ema_period = params.get('ema_period', 50) if params else 50
@@ -45,13 +48,23 @@ class EMA50ScalperStrategy(StrategyBase):
             }
         ]
 
+    def exit_rules(self):
+        """
+        Column-based equivalent of should_exit for the compiled engine path:
+        longs exit on a close below the EMA or when the high reaches the target.
+        """
+        return [
+            cross('ema', '<', reason='close_below_ema', side='long'),
+            target(points=self.profit_target_points, price='high', reason='profit_target', side='long'),
+        ]
+
     def generate_signals(self, data):
         """
         Adds 'signal' column to data:
         1 = Long Entry, 0 = No Entry/Flat
         """
         df = data.copy()
-        df['ema'] = df['close'].ewm(span=self.ema_period, adjust=False).mean()
+        df['ema'] = self.indicator(df, 'ema', span=self.ema_period)
         df['prev_close'] = df['close'].shift(1)
         df['prev_ema'] = df['ema'].shift(1)
 
@@ -11,6 +11,15 @@ from backtester.strategy_base import StrategyBase
 class EmaBbandScalper(StrategyBase):
     """Scalping strategy that combines EMA crossovers with Bollinger Bands."""
 
+    # should_exit reads the frame stored by generate_signals
+    cache_signals = False
+
+    sweep_indicators = (
+        {'param': 'fast_period', 'indicator': 'ema'},
+        {'param': 'slow_period', 'indicator': 'ema'},
+        {'param': 'bb_period', 'indicator': 'sma'},
+    )
+
     def __init__(self, params=None):
         super().__init__(params)
         p = params or {}
@@ -125,10 +134,10 @@ class EmaBbandScalper(StrategyBase):
             self._signals_df = df
             return df
 
-        df['ema_fast'] = df['close'].ewm(span=self.fast_period, adjust=False).mean()
-        df['ema_slow'] = df['close'].ewm(span=self.slow_period, adjust=False).mean()
-        df['bb_mid'] = df['close'].rolling(self.bb_period, min_periods=self.bb_period).mean()
-        df['bb_std'] = df['close'].rolling(self.bb_period, min_periods=self.bb_period).std(ddof=0)
+        df['ema_fast'] = self.indicator(df, 'ema', span=self.fast_period)
+        df['ema_slow'] = self.indicator(df, 'ema', span=self.slow_period)
+        df['bb_mid'] = self.indicator(df, 'sma', period=self.bb_period)
+        df['bb_std'] = self.indicator(df, 'rolling_std', period=self.bb_period, ddof=0)
         df['bb_upper'] = df['bb_mid'] + self.bb_std_dev * df['bb_std']
         df['bb_lower'] = df['bb_mid'] - self.bb_std_dev * df['bb_std']
 
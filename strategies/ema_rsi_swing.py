@@ -93,54 +93,29 @@ class EMARsiSwingStrategy(StrategyBase):
         force_time = time(force_h, force_m)
 
         df['signal'] = 0
-        per_day_counts: Dict[pd.Timestamp.date, int] = {}
-        prev_day = None
-        long_ready = False
-
-        for idx in range(1, len(df)):
-            row = df.iloc[idx]
-            ts = row['timestamp']
-            if pd.isna(ts) or ts.time() < start_time or ts.time() > end_time:
-                continue
-
-            day = ts.date()
-            if prev_day is None or day != prev_day:
-                per_day_counts[day] = 0
-                long_ready = False
-                prev_day = day
-
-            if per_day_counts[day] >= self.params.max_trades_per_day:
-                continue
-
-            ema_fast = row['ema_fast']
-            ema_slow = row['ema_slow']
-            rsi_prev = df['rsi'].iloc[idx - 1]
-            rsi_curr = row['rsi']
-
-            if any(np.isnan(v) for v in (ema_fast, ema_slow, rsi_prev, rsi_curr, row['ema_slope'])):
-                continue
-
-            uptrend = ema_fast > ema_slow and row['ema_slope'] > 0
-
-            if uptrend and rsi_prev < self.params.rsi_reset and rsi_curr >= self.params.rsi_entry:
-                pullback = (row['ema_fast'] - row['low']) / row['ema_fast'] if row['ema_fast'] else 0
-                if 0 < pullback <= self.params.pullback_pct and row['close'] > row['ema_fast'] and row['close'] > row['open']:
-                    df.at[df.index[idx], 'signal'] = 1
-                    per_day_counts[day] += 1
+        sessions = self.sessions(df)
+        # The first bar has no previous RSI
+        in_window = sessions.time_mask(start_time, end_time) & (np.arange(len(df)) > 0)
+
+        rsi_prev = df['rsi'].shift(1)
+        ready = df[['ema_fast', 'ema_slow', 'rsi', 'ema_slope']].notna().all(axis=1) & rsi_prev.notna()
+        uptrend = (df['ema_fast'] > df['ema_slow']) & (df['ema_slope'] > 0)
+        # A zero EMA gives an infinite or NaN pullback, which fails the bounds check
+        pullback = (df['ema_fast'] - df['low']) / df['ema_fast']
+        candidate = in_window & (
+            ready & uptrend
+            & (rsi_prev < self.params.rsi_reset) & (df['rsi'] >= self.params.rsi_entry)
+            & (pullback > 0) & (pullback <= self.params.pullback_pct)
+            & (df['close'] > df['ema_fast']) & (df['close'] > df['open'])
+        )
+        taken = candidate & (sessions.running_count(candidate) <= self.params.max_trades_per_day)
+        df.loc[taken, 'signal'] = 1
 
         # Force a trade if trend persists but no signal by force_time
-        df['date'] = df['timestamp'].dt.date
-        for date, group in df.groupby('date'):
-            if per_day_counts.get(date, 0) > 0:
-                continue
-            candidates = group[group['timestamp'].dt.time >= force_time]
-            if candidates.empty:
-                candidates = group.iloc[-1:]
-            row = candidates.iloc[0]
-            if row['ema_fast'] > row['ema_slow']:
-                df.at[row.name, 'signal'] = 1
-                per_day_counts[date] = 1
-        df.drop(columns=['date'], inplace=True)
+        after_force = sessions.time_mask(start=force_time)
+        force_bar = sessions.first(after_force) | (sessions.last_bar & ~sessions.any(after_force))
+        forced = force_bar & ~sessions.any(taken) & (df['ema_fast'] > df['ema_slow'])
+        df.loc[forced, 'signal'] = 1
         return df
 
     # ---------------------------------------------------------------
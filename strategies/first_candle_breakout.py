@@ -12,7 +12,8 @@ Strategy Logic:
 - Constraints: The strategy takes only one trade per day. Once a trade is exited, no new trades are initiated until the next trading day.
 """
 from backtester.strategy_base import StrategyBase
-import pandas as pd
+from backtester.exit_rules import level, target
+import numpy as np
 
 class FirstCandleBreakoutStrategy(StrategyBase):
     def __init__(self, params=None):
@@ -33,6 +34,16 @@ class FirstCandleBreakoutStrategy(StrategyBase):
             {"column": "signal_low", "label": "Signal Low", "plot": True, "color": "brown", "type": "dash", "panel": 1}
         ]
 
+    def exit_rules(self):
+        """
+        Compiled-engine exits: the points target (checked on the bar high/low)
+        and a stop at the low/high of the entry candle.
+        """
+        return [
+            target(points=self.target_points, price='high'),
+            level('low', '<=', price='low', at='entry', reason='Stop Loss'),
+        ]
+
     def generate_signals(self, data):
         """
         Adds 'signal' column to data:
@@ -42,10 +53,6 @@ class FirstCandleBreakoutStrategy(StrategyBase):
         import logging
         df = data.copy()
         df['signal'] = 0
-        df['date'] = pd.to_datetime(df['timestamp']).dt.date
-        df['time'] = pd.to_datetime(df['timestamp']).dt.time
-        df['signal_high'] = None
-        df['signal_low'] = None
 
         debug = self.params.get('debug', False)
         logger = logging.getLogger('FirstCandleBreakoutStrategy')
@@ -54,63 +61,37 @@ class FirstCandleBreakoutStrategy(StrategyBase):
         else:
             logger.setLevel(logging.WARNING)
 
-        # Prepare to track per-day state
-        last_date = None
-        in_position = False
-        day_done = False
-        signal_high = None
-        signal_low = None
-        signal_candle_time = None
-        entry_idx = None
+        sessions = self.sessions(df)
+        # Signal candle: the first candle at or after session_start; its levels
+        # apply from the next candle to the end of the day
+        signal_candle = sessions.first(sessions.time_mask(start=self.session_start))
+        after_signal = sessions.after_first(signal_candle)
+        signal_high = np.where(after_signal, sessions.value_at_first(signal_candle, df['high']), np.nan)
+        signal_low = np.where(after_signal, sessions.value_at_first(signal_candle, df['low']), np.nan)
+        df['signal_high'] = signal_high
+        df['signal_low'] = signal_low
 
-        for idx, row in df.iterrows():
-            cur_date = row['date']
-            cur_time = row['time']
-            if last_date != cur_date:
-                # New day, reset state
-                in_position = False
-                day_done = False
-                signal_high = None
-                signal_low = None
-                signal_candle_time = None
-                entry_idx = None
-                last_date = cur_date
+        # One trade per day: the first close beyond either level
+        close = df['close'].to_numpy()
+        breakout = sessions.first((close > signal_high) | (close < signal_low))
+        direction = np.where(close > signal_high, 1, -1)
+        df.loc[breakout, 'signal'] = direction[breakout]
 
-            if signal_candle_time is None:
-                # Find the first candle at or after session_start
-                if cur_time.strftime('%H:%M') >= self.session_start:
-                    signal_high = row['high']
-                    signal_low = row['low']
-                    signal_candle_time = cur_time
-                    if debug:
-                        logger.info(f"{row['timestamp']} | Signal Candle: HIGH={signal_high:.2f}, LOW={signal_low:.2f}")
-                    continue
-
-            df.at[idx, 'signal_high'] = signal_high
-            df.at[idx, 'signal_low'] = signal_low
-
-            if day_done or in_position or signal_high is None:
-                continue
-
-            # Entry logic
-            if row['close'] > signal_high:
-                df.at[idx, 'signal'] = 1
-                in_position = True
-                entry_idx = idx
-                # Set persistent SL and direction
-                self.active_stop_loss = row['low']
-                self.active_position = 'long'
-                if debug:
-                    logger.info(f"{row['timestamp']} | LONG ENTRY @ {row['close']:.2f} | Signal HIGH={signal_high:.2f} | SL={row['low']:.2f} | TP={row['close'] + self.target_points:.2f}")
-            elif row['close'] < signal_low:
-                df.at[idx, 'signal'] = -1
-                in_position = True
-                entry_idx = idx
-                # Set persistent SL and direction
-                self.active_stop_loss = row['high']
-                self.active_position = 'short'
-                if debug:
-                    logger.info(f"{row['timestamp']} | SHORT ENTRY @ {row['close']:.2f} | Signal LOW={signal_low:.2f} | SL={row['high']:.2f} | TP={row['close'] - self.target_points:.2f}")
+        entries = np.flatnonzero(breakout)
+        if len(entries):
+            # should_exit reads the stop of the latest entry
+            last = df.iloc[entries[-1]]
+            self.active_stop_loss = last['low'] if direction[entries[-1]] == 1 else last['high']
+            self.active_position = 'long' if direction[entries[-1]] == 1 else 'short'
+        if debug:
+            for i in entries:
+                row = df.iloc[i]
+                side = 'LONG' if direction[i] == 1 else 'SHORT'
+                stop = row['low'] if direction[i] == 1 else row['high']
+                logger.info(
+                    f"{row['timestamp']} | {side} ENTRY @ {row['close']:.2f} | "
+                    f"Signal HIGH={row['signal_high']:.2f} LOW={row['signal_low']:.2f} | SL={stop:.2f}"
+                )
         return df
 
     def should_exit(self, position, row, entry_price):
@@ -88,60 +88,33 @@ class HighWinScalperStrategy(StrategyBase):
         force_time = time(force_h, force_m)
 
         df['signal'] = 0
-        per_day_counts: Dict[pd.Timestamp.date, int] = {}
-        prev_day = None
-
-        for idx in range(1, len(df)):
-            row = df.iloc[idx]
-            ts = row['timestamp']
-            if pd.isna(ts) or ts.time() < start_time or ts.time() > end_time:
-                continue
-
-            day = ts.date()
-            if prev_day is None or day != prev_day:
-                per_day_counts[day] = 0
-                prev_day = day
-
-            if per_day_counts[day] >= self.params.max_trades_per_day:
-                continue
-
-            prev_rsi = df['rsi'].iloc[idx - 1]
-            rsi = row['rsi']
-            ema_fast = row['ema_fast']
-            ema_slow = row['ema_slow']
-
-            if any(np.isnan(v) for v in (rsi, prev_rsi, ema_fast, ema_slow, row['atr'])):
-                continue
-
-            trend_long = ema_fast > ema_slow
-            trend_short = ema_fast < ema_slow
-
-            signal = 0
-            if trend_long and prev_rsi < self.params.long_reset and rsi >= self.params.long_entry and row['close'] > row['open']:
-                signal = 1
-            elif trend_short and prev_rsi > self.params.short_reset and rsi <= self.params.short_entry and row['close'] < row['open']:
-                signal = -1
-
-            if signal != 0:
-                df.at[df.index[idx], 'signal'] = signal
-                per_day_counts[day] += 1
+        sessions = self.sessions(df)
+        # The first bar has no previous RSI
+        in_window = sessions.time_mask(start_time, end_time) & (np.arange(len(df)) > 0)
+
+        prev_rsi = df['rsi'].shift(1)
+        ready = df[['rsi', 'ema_fast', 'ema_slow', 'atr']].notna().all(axis=1) & prev_rsi.notna()
+        long_signal = (
+            ready & (df['ema_fast'] > df['ema_slow'])
+            & (prev_rsi < self.params.long_reset) & (df['rsi'] >= self.params.long_entry)
+            & (df['close'] > df['open'])
+        )
+        short_signal = (
+            ready & (df['ema_fast'] < df['ema_slow'])
+            & (prev_rsi > self.params.short_reset) & (df['rsi'] <= self.params.short_entry)
+            & (df['close'] < df['open'])
+        )
+        candidate = in_window & (long_signal | short_signal)
+        taken = candidate & (sessions.running_count(candidate) <= self.params.max_trades_per_day)
+        df.loc[taken & long_signal, 'signal'] = 1
+        df.loc[taken & short_signal, 'signal'] = -1
 
         # Forced trend-following entry if none triggered by cut-off time
-        df['date'] = df['timestamp'].dt.date
-        for date, group in df.groupby('date'):
-            if per_day_counts.get(date, 0) > 0:
-                continue
-            candidates = group[group['timestamp'].dt.time >= force_time]
-            if candidates.empty:
-                candidates = group.iloc[-1:]
-            row = candidates.iloc[0]
-            idx = row.name
-            if row['ema_fast'] > row['ema_slow']:
-                df.at[idx, 'signal'] = 1
-            elif row['ema_fast'] < row['ema_slow']:
-                df.at[idx, 'signal'] = -1
-            per_day_counts[date] = 1
-        df.drop(columns=['date'], inplace=True)
+        after_force = sessions.time_mask(start=force_time)
+        force_bar = sessions.first(after_force) | (sessions.last_bar & ~sessions.any(after_force))
+        forced = force_bar & ~sessions.any(taken)
+        trend = np.where(df['ema_fast'] > df['ema_slow'], 1, np.where(df['ema_fast'] < df['ema_slow'], -1, 0))
+        df.loc[forced, 'signal'] = trend[forced]
         return df
 
     # ---------------------------------------------------------------
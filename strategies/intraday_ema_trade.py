@@ -7,6 +7,9 @@ import pandas as pd
 from backtester.strategy_base import StrategyBase
 
 class IntradayEmaTradeStrategy(StrategyBase):
+    # should_exit reads the frame stored by generate_signals
+    cache_signals = False
+
     def __init__(self, params=None):
         super().__init__(params)
         self.ema_period = 21
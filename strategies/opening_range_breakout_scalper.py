@@ -13,7 +13,6 @@ The strategy relies on the engine's intraday handling and optional daily
 profit target to stop trading after a desired amount of points is achieved.
 """
 
-import pandas as pd
 from backtester.strategy_base import StrategyBase
 
 
@@ -84,32 +83,18 @@ class OpeningRangeBreakoutScalper(StrategyBase):
     def generate_signals(self, data):
         df = data.copy()
         df["signal"] = 0
-        df["date"] = pd.to_datetime(df["timestamp"]).dt.date
-        df["or_high"] = None
-        df["or_low"] = None
+        sessions = self.sessions(df)
+        in_range = sessions.bar_index < self.or_period
+        df["or_high"] = sessions.session_max(df["high"].where(in_range))
+        df["or_low"] = sessions.session_min(df["low"].where(in_range))
 
-        result_frames = []
-        for day, day_df in df.groupby("date"):
-            day_df = day_df.copy()
-            or_window = day_df.iloc[: self.or_period]
-            if or_window.empty:
-                result_frames.append(day_df)
-                continue
-            or_high = or_window["high"].max()
-            or_low = or_window["low"].min()
-            day_df.loc[:, "or_high"] = or_high
-            day_df.loc[:, "or_low"] = or_low
-
-            after_window = day_df.iloc[self.or_period :]
-            prev_close = after_window["close"].shift(1)
-            long_cond = (prev_close <= or_high) & (after_window["close"] > or_high)
-            short_cond = (prev_close >= or_low) & (after_window["close"] < or_low)
-
-            day_df.loc[after_window.index[long_cond], "signal"] = 1
-            day_df.loc[after_window.index[short_cond], "signal"] = -1
-            result_frames.append(day_df)
-
-        return pd.concat(result_frames).sort_index()
+        # Crossovers after the range; the first bar after it has no previous close
+        prev_close = df["close"].shift(1).where(sessions.bar_index > self.or_period)
+        long_cond = ~in_range & (prev_close <= df["or_high"]) & (df["close"] > df["or_high"])
+        short_cond = ~in_range & (prev_close >= df["or_low"]) & (df["close"] < df["or_low"])
+        df.loc[long_cond, "signal"] = 1
+        df.loc[short_cond, "signal"] = -1
+        return df
 
     def should_exit(self, position, row, entry_price):
         price = row.close if hasattr(row, "close") else row["close"]
@@ -1,4 +1,6 @@
 from backtester.strategy_base import StrategyBase
+from backtester.exit_rules import threshold, target, stop
+import numpy as np
 import pandas as pd
 import datetime
 
@@ -22,6 +24,14 @@ class RSIMiddayReversionScalper(StrategyBase):
             {"column": "rsi", "label": "RSI", "plot": True, "panel": 2, "color": "purple"},
         ]
 
+    def exit_rules(self):
+        """Column-based equivalent of should_exit for the compiled engine path."""
+        return [
+            threshold('rsi', '>=', 50, 'Target'),
+            target(column='atr', mult=self.target_atr, reason='Target'),
+            stop(column='atr', mult=self.stop_atr, reason='Stop Loss'),
+        ]
+
     def _compute_rsi(self, series, period):
         delta = series.diff()
         up = delta.clip(lower=0)
@@ -49,16 +59,12 @@ class RSIMiddayReversionScalper(StrategyBase):
         df.loc[short_entry, 'signal'] = -1
 
         # Ensure at least one trade per day with midday forced entry
-        df['date'] = df['timestamp'].dt.date
-        for date, group in df.groupby('date'):
-            if (group['signal'] != 0).any():
-                continue
-            midday = group[group['timestamp'].dt.time >= datetime.time(13,0)]
-            if not midday.empty:
-                idx = midday.index[0]
-            else:
-                idx = group.index[0]
-            df.loc[idx, 'signal'] = 1 if group.loc[idx, 'rsi'] > 50 else -1
+        sessions = self.sessions(df)
+        midday = sessions.time_mask(start=datetime.time(13, 0))
+        # First bar from 13:00, or the session's first bar when there is none
+        fallback = sessions.first(midday) | (sessions.first_bar & ~sessions.any(midday))
+        forced = fallback & ~sessions.any(df['signal'] != 0)
+        df.loc[forced, 'signal'] = np.where(df['rsi'] > 50, 1, -1)[forced]
         return df
 
     def should_exit(self, position, row, entry_price):
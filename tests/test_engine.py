@@ -1,3 +1,5 @@
+import importlib
+
 import pandas as pd
 import numpy as np
 import pytest
@@ -72,7 +74,15 @@ def test_vectorized_backtest_core_extended():
     assert len(equity) == len(signals) + 1
 
 
-def test_generate_trade_log_from_signals():
+class SignalColumnStrategy(StrategyBase):
+    """Trades the ``signal`` column already present in the data."""
+    _use_fast_vectorized = True
+
+    def generate_signals(self, data):
+        return data.copy()
+
+
+def test_run_trade_log_follows_signals():
     data = pd.DataFrame({
         'timestamp': pd.date_range('2024-01-01', periods=4, freq='min'),
         'close': [100.0, 102.0, 101.0, 103.0],
@@ -80,20 +90,20 @@ def test_generate_trade_log_from_signals():
     })
     engine = BacktestEngine(
         data,
-        DummyStrategy(),
+        SignalColumnStrategy(),
         option_delta=1.0,
         lots=1,
         option_price_per_unit=1.0,
         fee_per_trade=1.0,
         slippage=0.5,
     )
-    trade_log = engine._generate_trade_log_from_signals(data, np.zeros(len(data) + 1))
+    trade_log = engine.run()['trade_log']
     assert trade_log['direction'].tolist() == ['long', 'short', 'long']
     assert trade_log['exit_reason'].tolist() == ['Signal Reversal', 'Signal Reversal', 'End of Data']
     assert trade_log['pnl'].tolist() == [pytest.approx(74.0), pytest.approx(-1.0), pytest.approx(74.0)]
 
 
-def test_generate_trade_log_from_signals_short_entry():
+def test_run_trade_log_short_entry():
     data = pd.DataFrame({
         'timestamp': pd.date_range('2024-01-01', periods=2, freq='min'),
         'close': [100.0, 99.0],
@@ -101,14 +111,14 @@ def test_generate_trade_log_from_signals_short_entry():
     })
     engine = BacktestEngine(
         data,
-        DummyStrategy(),
+        SignalColumnStrategy(),
         option_delta=1.0,
         lots=1,
         option_price_per_unit=1.0,
         fee_per_trade=0.0,
         slippage=0.5,
     )
-    trade_log = engine._generate_trade_log_from_signals(data, np.zeros(len(data) + 1))
+    trade_log = engine.run()['trade_log']
     assert trade_log['direction'].tolist() == ['short']
 
 
@@ -233,10 +243,13 @@ def test_backtest_engine_run_equal_length_equity_curve(monkeypatch):
             df['signal'] = [1, -1]
             return df
 
-    def fake_core(signals, prices, option_delta, option_qty, option_price_per_unit, fee_per_trade, slippage, initial_equity):
-        return np.full(len(signals), initial_equity)
+    def fake_core(signals, prices, day_idx, time_of_day, option_delta, option_qty, option_price_per_unit,
+                  fee_per_trade, slippage, initial_equity, intraday, session_close, daily_profit_target):
+        no_trades = np.empty(0, dtype=np.int64)
+        return (np.full(len(signals), initial_equity), no_trades, no_trades,
+                np.empty(0), np.empty(0), no_trades, np.empty(0), no_trades)
 
-    monkeypatch.setattr('backtester.engine._vectorized_backtest_core', fake_core)
+    monkeypatch.setattr('backtester.engine._vectorized_session_core', fake_core)
     data = pd.DataFrame({
         'timestamp': pd.date_range('2024-01-01', periods=2, freq='min'),
         'close': [100.0, 101.0],
@@ -420,3 +433,163 @@ def test_daily_profit_target_with_pnl():
     # With the fix, daily_points will accumulate pnl, so it will be 150, which is > 100.
     # The session will be closed, and only one trade should be in the log.
     assert len(trade_log) == 1
+
+
+class FastIntradayStrategy(StrategyBase):
+    _use_fast_vectorized = True
+
+    def __init__(self, signals):
+        super().__init__()
+        self._signals = signals
+
+    def generate_signals(self, data):
+        df = data.copy()
+        df['signal'] = self._signals
+        return df
+
+
+def test_fast_intraday_session_close():
+    ts = pd.to_datetime(
+        [
+            '2024-01-01 15:00',
+            '2024-01-01 15:14',
+            '2024-01-01 15:15',
+            '2024-01-01 15:16',
+            '2024-01-02 09:15',
+            '2024-01-02 09:16',
+        ]
+    )
+    data = pd.DataFrame({'timestamp': ts, 'close': [100.0, 101.0, 102.0, 103.0, 104.0, 106.0]})
+    strategy = FastIntradayStrategy([1, 0, 0, -1, 1, 0])
+    engine = BacktestEngine(
+        data, strategy, intraday=True, option_delta=1.0, lots=1, option_price_per_unit=1.0,
+    )
+    result = engine.run()
+    trade_log = result['trade_log']
+    assert trade_log['exit_reason'].tolist() == ['Session Close', 'End of Data']
+    assert trade_log['exit_time'].tolist() == [ts[2], ts[5]]
+    # Short signal after the close is ignored; next session re-arms entries
+    assert trade_log['direction'].tolist() == ['long', 'long']
+    equity = result['equity_curve']['equity'].to_numpy()
+    assert equity[-1] == pytest.approx(100000 + (2.0 + 2.0) * 75)
+    assert equity[-1] == pytest.approx(100000 + trade_log['pnl'].sum())
+
+
+def test_fast_intraday_daily_profit_target_locks_out_entries():
+    ts = pd.date_range('2024-01-01 10:00', periods=5, freq='min')
+    data = pd.DataFrame({'timestamp': ts, 'close': [100.0, 102.0, 101.0, 99.0, 98.0]})
+    strategy = FastIntradayStrategy([1, -1, 0, 1, 0])
+    engine = BacktestEngine(
+        data, strategy, intraday=True, daily_profit_target=100,
+        option_delta=1.0, lots=1, option_price_per_unit=1.0,
+    )
+    result = engine.run()
+    trade_log = result['trade_log']
+    # First reversal books 2 * 75 = 150 >= 100, so neither the reversal
+    # re-entry nor the later long signal is taken.
+    assert len(trade_log) == 1
+    assert trade_log['exit_reason'].iloc[0] == 'Signal Reversal'
+    assert result['equity_curve']['equity'].iloc[-1] == pytest.approx(100150.0)
+
+
+def test_fast_trade_log_matches_equity_curve():
+    rng = np.random.default_rng(3)
+    n = 300
+    ts = pd.date_range('2024-01-01 09:15', periods=n, freq='min')
+    signals = rng.choice([-1, 0, 1], size=n, p=[0.1, 0.8, 0.1])
+    signals[-1] = -signals[-2] if signals[-2] != 0 else 1
+    data = pd.DataFrame({'timestamp': ts, 'close': 100 + np.cumsum(rng.normal(0, 1, n))})
+    engine = BacktestEngine(
+        data, FastIntradayStrategy(signals), initial_cash=1000.0,
+        fee_per_trade=2.0, slippage=0.25, intraday=True,
+    )
+    result = engine.run()
+    trade_log = result['trade_log']
+    equity = result['equity_curve']['equity'].to_numpy()
+    assert equity[-1] == pytest.approx(1000.0 + trade_log['pnl'].sum())
+    assert set(trade_log['exit_reason']) <= {'Signal Reversal', 'Session Close', 'End of Data'}
+    assert trade_log['exit_reason'].iloc[-1] == 'End of Data'
+    assert (trade_log['exit_time'] >= trade_log['entry_time']).all()
+
+
+@pytest.mark.parametrize('strategy_path', [
+    'strategies.ema50_scalper.EMA50ScalperStrategy',
+    'strategies.ema10_scalper_2.EMA10ScalperStrategyV2',
+    'strategies.ema10_scalper_6.EMA10ScalperStrategyV6',
+])
+def test_fast_strategies_run_their_exits_compiled_intraday(monkeypatch, strategy_path):
+    module, name = strategy_path.rsplit('.', 1)
+    strategy = getattr(importlib.import_module(module), name)()
+
+    rng = np.random.default_rng(8)
+    frames = [
+        pd.DataFrame({'timestamp': pd.date_range(f'{day} 09:15', f'{day} 15:29', freq='min')})
+        for day in ('2024-01-01', '2024-01-02', '2024-01-03')
+    ]
+    data = pd.concat(frames, ignore_index=True)
+    close = 22000 + np.cumsum(rng.normal(0, 4, len(data)))
+    data['open'] = close
+    data['high'] = close + np.abs(rng.normal(0, 3, len(data)))
+    data['low'] = close - np.abs(rng.normal(0, 3, len(data)))
+    data['close'] = close
+
+    engine = BacktestEngine(data, strategy, intraday=True)
+    # The session core would drop should_exit; the rule kernel applies the same exits
+    assert not engine._can_use_fast_vectorized(data)
+    assert engine._exit_rules()
+    # Baseline: the row-by-row loop, which applies should_exit
+    baseline_equity, baseline_trades = engine._run_traditional_backtest(
+        strategy.generate_signals(data), engine.lots * 75, ['ema']
+    )
+
+    def row_loop(*args, **kwargs):
+        raise AssertionError('intraday run fell back to the row-by-row loop')
+
+    monkeypatch.setattr(BacktestEngine, '_run_traditional_backtest', row_loop)
+    result = engine.run()
+    trades = result['trade_log']
+    assert len(trades) == len(baseline_trades) > 0
+    assert trades['exit_reason'].tolist() == baseline_trades['exit_reason'].tolist()
+    np.testing.assert_allclose(trades['pnl'], baseline_trades['pnl'])
+    np.testing.assert_allclose(result['equity_curve']['equity'], baseline_equity['equity'])
+    # Outside intraday runs the strategy keeps its signal-reversal fast path
+    assert BacktestEngine(data, strategy)._can_use_fast_vectorized(data)
+
+
+@pytest.mark.parametrize('intraday', [False, True])
+def test_run_batch_matches_single_runs(intraday):
+    from backtester import metrics
+
+    rng = np.random.default_rng(5)
+    n = 600
+    ts = pd.date_range('2024-01-01 14:00', periods=n, freq='min')
+    data = pd.DataFrame({'timestamp': ts, 'close': 100 + np.cumsum(rng.normal(0, 1, n))})
+    matrix = pd.DataFrame({
+        f'set{j}': rng.choice([-1, 0, 1], size=n, p=[0.05, 0.9, 0.05]) for j in range(3)
+    })
+    kwargs = dict(fee_per_trade=1.0, slippage=0.1, intraday=intraday, daily_profit_target=200)
+    batch = BacktestEngine(data, FastIntradayStrategy(matrix['set0']), **kwargs).run_batch(matrix)
+    assert list(batch['metrics'].index) == ['set0', 'set1', 'set2']
+    for j, label in enumerate(matrix.columns):
+        single = BacktestEngine(data, FastIntradayStrategy(matrix[label]), **kwargs).run()
+        equity = single['equity_curve']
+        trades = single['trade_log']
+        row = batch['metrics'].loc[label]
+        assert np.allclose(batch['equity'][j], equity['equity'].to_numpy())
+        assert row['total_trades'] == len(trades)
+        assert row['final_equity'] == pytest.approx(equity['equity'].iloc[-1])
+        assert row['max_drawdown'] == pytest.approx(metrics.max_drawdown(equity))
+        assert row['sharpe_ratio'] == pytest.approx(metrics.sharpe_ratio(equity))
+        assert row['win_rate'] == pytest.approx(metrics.win_rate(trades))
+        assert row['profit_factor'] == pytest.approx(metrics.profit_factor(trades))
+        assert row['max_consecutive_losses'] == metrics.max_consecutive_losses(trades)
+
+
+def test_run_batch_rejects_misaligned_signals():
+    data = pd.DataFrame({
+        'timestamp': pd.date_range('2024-01-01', periods=3, freq='min'),
+        'close': [100.0, 101.0, 102.0],
+    })
+    engine = BacktestEngine(data, DummyStrategy())
+    with pytest.raises(ValueError):
+        engine.run_batch(np.zeros((2, 4)))
@@ -0,0 +1,201 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtester.engine import BacktestEngine
+from backtester.exit_rules import compile_exit_rules, cross, level, stop, target, threshold, time_exit
+from backtester.strategy_base import StrategyBase
+from strategies.ema10_scalper_1 import EMA10ScalperStrategyV1
+from strategies.first_candle_breakout import FirstCandleBreakoutStrategy
+from strategies.rsi_midday_reversion_scalper import RSIMiddayReversionScalper
+
+
+def _intraday_data(days=3, seed=7):
+    rng = np.random.default_rng(seed)
+    frames = []
+    for day in pd.date_range('2024-01-01', periods=days, freq='D'):
+        ts = pd.date_range(day + pd.Timedelta(hours=9, minutes=15), day + pd.Timedelta(hours=15, minutes=29), freq='min')
+        frames.append(pd.DataFrame({'timestamp': ts}))
+    df = pd.concat(frames, ignore_index=True)
+    close = 22000 + np.cumsum(rng.normal(0, 4, len(df)))
+    spread = np.abs(rng.normal(0, 3, len(df)))
+    df['open'] = close + rng.normal(0, 1, len(df))
+    df['high'] = np.maximum(close, df['open']) + spread
+    df['low'] = np.minimum(close, df['open']) - spread
+    df['close'] = close
+    return df
+
+
+def _run_both(strategy, data, **engine_kwargs):
+    engine = BacktestEngine(data, strategy, **engine_kwargs)
+    df = strategy.generate_signals(data)
+    option_qty = engine.lots * 75
+    traditional = engine._run_traditional_backtest(df, option_qty, [])
+    compiled = engine._run_rule_backtest(df, option_qty, strategy.exit_rules())
+    return traditional, compiled
+
+
+def _assert_same(traditional, compiled):
+    trad_equity, trad_trades = traditional
+    rule_equity, rule_trades = compiled
+    assert np.allclose(trad_equity['equity'].to_numpy(), rule_equity['equity'].to_numpy())
+    assert len(trad_trades) == len(rule_trades)
+    if len(trad_trades):
+        assert trad_trades['exit_reason'].tolist() == rule_trades['exit_reason'].tolist()
+        assert trad_trades['direction'].tolist() == rule_trades['direction'].tolist()
+        assert (pd.to_datetime(trad_trades['entry_time']) == rule_trades['entry_time']).all()
+        assert (pd.to_datetime(trad_trades['exit_time']) == rule_trades['exit_time']).all()
+        assert np.allclose(trad_trades['pnl'].astype(float), rule_trades['pnl'])
+        assert np.allclose(trad_trades['normal_pnl'].astype(float), rule_trades['normal_pnl'])
+
+
+@pytest.mark.parametrize('intraday,daily_target', [(False, None), (True, None), (True, 300.0)])
+def test_rsi_midday_rule_path_matches_traditional(intraday, daily_target):
+    data = _intraday_data()
+    strategy = RSIMiddayReversionScalper({'stop_atr': 2.0, 'target_atr': 1.0})
+    traditional, compiled = _run_both(
+        strategy, data, intraday=intraday, daily_profit_target=daily_target,
+        fee_per_trade=4.0, slippage=0.5,
+    )
+    assert len(compiled[1]) > 0
+    _assert_same(traditional, compiled)
+
+
+def test_ema10_rule_path_matches_traditional():
+    data = _intraday_data(days=4, seed=11)
+    strategy = EMA10ScalperStrategyV1({'min_atr': 0.0})
+    traditional, compiled = _run_both(strategy, data, intraday=True, fee_per_trade=4.0)
+    _assert_same(traditional, compiled)
+
+
+def test_engine_run_uses_rule_path(monkeypatch):
+    data = _intraday_data(days=1)
+    strategy = RSIMiddayReversionScalper()
+
+    def fail(*args, **kwargs):
+        raise AssertionError('traditional loop should not run')
+
+    monkeypatch.setattr(BacktestEngine, '_run_traditional_backtest', fail)
+    result = BacktestEngine(data, strategy, intraday=True).run()
+    assert len(result['equity_curve']) == len(data)
+    assert set(result['trade_log']['exit_reason']) <= {'Target', 'Stop Loss', 'Session Close', 'End of Data'}
+
+
+class LevelStopStrategy(StrategyBase):
+    def generate_signals(self, data):
+        df = data.copy()
+        df['signal'] = [1, 0, 0, -1, 0, 0]
+        return df
+
+    def exit_rules(self):
+        return [
+            target(points=5, price='high'),
+            level('low', '<=', price='low', at='entry'),
+        ]
+
+
+def test_level_rule_mirrors_high_low_for_shorts():
+    data = pd.DataFrame({
+        'timestamp': pd.date_range('2024-01-01 10:00', periods=6, freq='min'),
+        'open': [100.0, 100.0, 100.0, 100.0, 100.0, 100.0],
+        'high': [101.0, 102.0, 100.5, 101.0, 100.8, 100.0],
+        'low': [99.0, 99.5, 98.5, 99.0, 98.0, 94.0],
+        'close': [100.0, 101.0, 99.0, 100.0, 99.0, 95.0],
+    })
+    engine = BacktestEngine(data, LevelStopStrategy(), option_delta=1.0, lots=1, option_price_per_unit=1.0)
+    trades = engine.run()['trade_log']
+    # Long stopped when low (98.5) breaks the entry bar low (99.0); short exits
+    # on target when low reaches entry - 5 (95.0 >= 94.0).
+    assert trades['direction'].tolist() == ['long', 'short']
+    assert trades['exit_reason'].tolist() == ['Stop Loss', 'Target']
+    assert trades['exit_time'].tolist() == [data['timestamp'][2], data['timestamp'][5]]
+
+
+def test_compile_exit_rules_validation():
+    df = pd.DataFrame({'close': [1.0, 2.0]})
+    tod = np.zeros(2)
+    with pytest.raises(ValueError):
+        compile_exit_rules([], df, tod)
+    with pytest.raises(ValueError):
+        compile_exit_rules([cross('ema')], df, tod)
+    with pytest.raises(ValueError):
+        compile_exit_rules([threshold('close', '==', 1, 'x')], df, tod)
+    compiled = compile_exit_rules([time_exit('14:30'), stop(points=3)], df, tod)
+    assert compiled['reasons'] == ['Time Stop', 'Stop Loss', 'Session Close', 'End of Data']
+    assert compiled['points'][0] == 14 * 3600 + 30 * 60
+    # time rules are not mirrored for shorts
+    assert compiled['ops'][0, 0] == compiled['ops'][0, 1]
+
+
+class BracketStrategy(StrategyBase):
+    def generate_signals(self, data):
+        df = data.copy()
+        df['signal'] = [1, 0, 0, 0]
+        return df
+
+    def exit_rules(self):
+        return [target(points=4), stop(points=2)]
+
+
+def _bracket_engine(high, low, open_, **kwargs):
+    data = pd.DataFrame({
+        'timestamp': pd.date_range('2024-01-01 10:00', periods=4, freq='min'),
+        'open': open_,
+        'high': high,
+        'low': low,
+        'close': [100.0, 100.5, 100.0, 100.0],
+    })
+    return BacktestEngine(
+        data, BracketStrategy(), option_delta=1.0, lots=1, option_price_per_unit=1.0, **kwargs
+    )
+
+
+def test_ohlc_fill_model_exits_at_level_intrabar():
+    high = [100.0, 101.0, 104.5, 100.0]
+    low = [100.0, 99.0, 99.5, 100.0]
+    close_fill = _bracket_engine(high, low, [100.0] * 4).run()['trade_log']
+    ohlc_fill = _bracket_engine(high, low, [100.0] * 4, fill_model='ohlc').run()['trade_log']
+    # On closes the position only exits at end of data
+    assert close_fill['exit_reason'].tolist() == ['End of Data']
+    # Intrabar the target (104) is touched on bar 2 and filled at the level
+    assert ohlc_fill['exit_reason'].tolist() == ['Target']
+    assert ohlc_fill['exit_price'].iloc[0] == pytest.approx(104.0)
+    assert ohlc_fill['exit_time'].iloc[0] == pd.Timestamp('2024-01-01 10:02')
+
+
+def test_ohlc_fill_model_gap_fills_at_open():
+    high = [100.0, 97.5, 100.0, 100.0]
+    low = [100.0, 96.0, 100.0, 100.0]
+    trades = _bracket_engine(high, low, [100.0, 97.0, 100.0, 100.0], fill_model='ohlc').run()['trade_log']
+    assert trades['exit_reason'].tolist() == ['Stop Loss']
+    assert trades['exit_price'].iloc[0] == pytest.approx(97.0)
+
+
+@pytest.mark.parametrize('tie_break,reason,price', [
+    ('stop', 'Stop Loss', 98.0),
+    ('target', 'Target', 104.0),
+    ('nearest', 'Stop Loss', 98.0),
+])
+def test_ohlc_fill_model_same_bar_tie_break(tie_break, reason, price):
+    high = [100.0, 105.0, 100.0, 100.0]
+    low = [100.0, 97.0, 100.0, 100.0]
+    trades = _bracket_engine(
+        high, low, [100.0, 99.0, 100.0, 100.0], fill_model='ohlc', intrabar_tie_break=tie_break,
+    ).run()['trade_log']
+    assert trades['exit_reason'].tolist() == [reason]
+    assert trades['exit_price'].iloc[0] == pytest.approx(price)
+
+
+def test_fill_model_validation():
+    with pytest.raises(ValueError):
+        _bracket_engine([100.0] * 4, [100.0] * 4, [100.0] * 4, fill_model='tick')
+    with pytest.raises(ValueError):
+        _bracket_engine([100.0] * 4, [100.0] * 4, [100.0] * 4, intrabar_tie_break='random')
+
+
+def test_first_candle_breakout_rule_path_matches_traditional():
+    data = _intraday_data(days=1, seed=3)
+    strategy = FirstCandleBreakoutStrategy({'target_points': 10})
+    traditional, compiled = _run_both(strategy, data, intraday=True, fee_per_trade=4.0)
+    assert len(compiled[1]) == 1
+    _assert_same(traditional, compiled)
@@ -0,0 +1,119 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtester import indicator_cache
+from backtester.indicator_cache import IndicatorCache
+from backtester.strategy_base import StrategyBase
+
+
+@pytest.fixture
+def bars():
+    rng = np.random.default_rng(5)
+    close = 100 + np.cumsum(rng.normal(0, 1, 500))
+    return pd.DataFrame({'high': close + 1, 'low': close - 1, 'close': close, 'volume': np.ones(500)})
+
+
+def test_memory_tier_serves_repeated_requests(bars):
+    cache = IndicatorCache()
+    first = cache.get(bars, 'ema', span=10)
+    # A copy of the frame with extra columns still hits: only the input column is fingerprinted
+    other = bars.assign(signal=1)
+    assert cache.get(other, 'ema', span=10) is first
+    assert not first.flags.writeable
+    np.testing.assert_allclose(first, bars['close'].ewm(span=10, adjust=False).mean())
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # Different params, source column, timeframe or data are different entries
+    cache.get(bars, 'ema', span=20)
+    cache.get(bars, 'ema', span=10, source='high')
+    cache.get(bars, 'ema', span=10, timeframe='5min')
+    cache.get(bars.assign(close=bars['close'] * 2), 'ema', span=10)
+    assert cache.misses == 5
+
+    upper, mid, lower = cache.get(bars, 'bollinger_bands', period=20)
+    assert cache.get(bars, 'bollinger_bands', period=20)[1] is mid
+    with pytest.raises(ValueError):
+        cache.get(bars, 'macd')
+
+
+def test_disk_tier_is_shared_and_memory_mapped(bars, tmp_path):
+    writer = IndicatorCache(tmp_path)
+    expected = writer.get(bars, 'stochastic', k_period=14, smooth_period=3)
+    reader = IndicatorCache(tmp_path)
+    k, d = reader.get(bars, 'stochastic', k_period=14, smooth_period=3)
+    assert (reader.disk_hits, reader.misses) == (1, 0)
+    assert isinstance(k.base, np.memmap) or isinstance(k, np.memmap)
+    np.testing.assert_array_equal(k, expected[0])
+    np.testing.assert_array_equal(d, expected[1])
+    assert reader.info()['disk_entries'] == 1
+
+    reader.clear()
+    assert reader.info()['disk_entries'] == 0 and reader.info()['memory_entries'] == 0
+
+
+def test_lru_bounds(bars, tmp_path):
+    entry = bars['close'].to_numpy().nbytes
+    cache = IndicatorCache(tmp_path, memory_bytes=2 * entry, max_bytes=2 * entry + 2 * 128)
+    for span in (5, 6, 7):
+        cache.get(bars, 'ema', span=span)
+    assert cache.info()['memory_entries'] == 2
+    assert cache.info()['disk_entries'] == 2
+    # span=5 was evicted from both tiers
+    cache.get(bars, 'ema', span=5)
+    assert cache.misses == 4
+
+
+def test_get_or_compute_caches_custom_formulas():
+    cache = IndicatorCache()
+    values = np.arange(10.0)
+    calls = []
+
+    def doubled(x, factor):
+        calls.append(factor)
+        return x * factor
+
+    assert cache.get_or_compute('scaled', [values], doubled, factor=2)[-1] == 18.0
+    cache.get_or_compute('scaled', [values], doubled, factor=2)
+    assert calls == [2]
+    # Identity results are copied before the cache freezes them
+    cache.get_or_compute('same', [values], lambda x: x)
+    assert values.flags.writeable
+
+
+def test_get_batch_primes_single_period_lookups(bars):
+    cache = IndicatorCache()
+    matrix = cache.get_batch(bars, 'atr', np.array([5, 14]), wilder=False)
+    assert matrix.shape == (len(bars), 2) and not matrix.flags.writeable
+    # Numpy periods are keyed like the builtin ints strategies pass
+    atr = cache.get(bars, 'atr', period=14, wilder=False)
+    np.testing.assert_array_equal(atr, matrix[:, 1])
+    assert (cache.hits, cache.misses) == (1, 0)
+    cache.get(bars, 'atr', period=14)  # Wilder smoothing is a different entry
+    assert cache.misses == 1
+
+    columns = [np.full(len(bars), 1.0), np.full(len(bars), 2.0)]
+    cache.prime(bars, 'ema', [3, 4], columns, source='high')
+    assert cache.get(bars, 'ema', span=4, source='high')[0] == 2.0
+    with pytest.raises(ValueError):
+        cache.get_batch(bars, 'vwap', [5])
+
+
+class _EmaStrategy(StrategyBase):
+    def generate_signals(self, data):
+        df = data.copy()
+        df['ema'] = self.indicator(df, 'ema', span=self.params.get('span', 10))
+        df['signal'] = np.sign(df['close'] - df['ema']).fillna(0).astype(int)
+        return df
+
+
+def test_strategies_share_the_process_cache(bars, monkeypatch):
+    cache = IndicatorCache()
+    monkeypatch.setattr(indicator_cache, '_shared_cache', cache)
+    for _ in range(3):
+        _EmaStrategy({'span': 10}).generate_signals(bars)
+    _EmaStrategy({'span': 20}).generate_signals(bars)
+    assert (cache.misses, cache.hits) == (2, 2)
+    # Reconfiguring with the same settings keeps the warm cache
+    assert indicator_cache.configure_indicator_cache(None) is cache
+    assert indicator_cache.configure_indicator_cache(None, memory_bytes=1024) is not cache
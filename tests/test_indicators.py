@@ -0,0 +1,182 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtester import indicators
+
+
+@pytest.fixture
+def ohlcv():
+    rng = np.random.default_rng(11)
+    close = 20000 + np.cumsum(rng.normal(0, 5, 600))
+    close[100:130] = close[99]  # flat stretch: zero spread, zero RSI movement
+    high = close + rng.uniform(0, 8, 600)
+    low = close - rng.uniform(0, 8, 600)
+    high[100:130] = low[100:130] = close[100:130]
+    volume = rng.integers(0, 500, 600).astype(float)
+    days = np.repeat(pd.bdate_range('2024-01-01', periods=6).date, 100)
+    return pd.DataFrame({'high': high, 'low': low, 'close': close, 'volume': volume, 'date': days})
+
+
+def _assert_parity(actual, expected, rtol=1e-9, atol=1e-9):
+    np.testing.assert_allclose(actual, np.asarray(expected, dtype=float), rtol=rtol, atol=atol, equal_nan=True)
+
+
+@pytest.mark.parametrize('period', [1, 5, 20])
+def test_sma_and_std_match_pandas_rolling(ohlcv, period):
+    close = ohlcv['close'].copy()
+    close[[40, 41, 300]] = np.nan
+    _assert_parity(indicators.sma(close, period), close.rolling(period).mean())
+    _assert_parity(indicators.sma(close, period, min_periods=1), close.rolling(period, min_periods=1).mean())
+    # pandas leaves ~1e-5 of rounding residue in flat windows at a 20000 price level
+    _assert_parity(indicators.rolling_std(close, period), close.rolling(period).std(ddof=0), rtol=1e-6, atol=1e-4)
+    _assert_parity(indicators.rolling_std(close, period, ddof=1), close.rolling(period).std(), rtol=1e-6, atol=1e-4)
+
+
+def test_flat_window_has_zero_std(ohlcv):
+    std = indicators.rolling_std(ohlcv['close'], 20)
+    assert (std[119:130] == 0.0).all()
+
+
+def test_bollinger_bands(ohlcv):
+    close = ohlcv['close']
+    upper, mid, lower = indicators.bollinger_bands(close, period=20, std_dev=2)
+    ma, sd = close.rolling(20).mean(), close.rolling(20).std(ddof=0)
+    _assert_parity(mid, ma)
+    _assert_parity(upper, ma + 2 * sd, atol=1e-4)
+    _assert_parity(lower, ma - 2 * sd, atol=1e-4)
+
+
+def test_ema_matches_ewm(ohlcv):
+    close = ohlcv['close']
+    for span in (2, 10, 50):
+        _assert_parity(indicators.ema(close, span), close.ewm(span=span, adjust=False).mean())
+
+
+def test_recursive_averages_decay_across_nans_like_ewm(ohlcv):
+    # Leading NaNs, single NaNs and a longer gap; pandas' default ignore_na=False
+    close = ohlcv['close'].copy()
+    close[[0, 1, 50, 200, 201, 202, 203, 204, 205, 206, 207, 400]] = np.nan
+    for span in (2, 10):
+        expected = close.ewm(span=span, adjust=False).mean()
+        _assert_parity(indicators.ema(close, span), expected)
+        _assert_parity(indicators.ema_batch(close, [span])[:, 0], expected)
+    assert indicators.ema(close, 10)[210] != close.ewm(span=10, adjust=False, ignore_na=True).mean()[210]
+
+    high, low = ohlcv['high'].copy(), ohlcv['low'].copy()
+    high[[30, 31]] = np.nan
+    tr = pd.Series(indicators.true_range(high, low, close))
+    _assert_parity(indicators.atr(high, low, close, period=14), tr.ewm(alpha=1 / 14, adjust=False).mean())
+    _assert_parity(indicators.atr_batch(high, low, close, [14])[:, 0], tr.ewm(alpha=1 / 14, adjust=False).mean())
+
+    delta = close.diff()
+    gain = delta.clip(lower=0).ewm(alpha=1 / 14, min_periods=14, adjust=False).mean()
+    loss = (-delta.clip(upper=0)).ewm(alpha=1 / 14, min_periods=14, adjust=False).mean()
+    expected = 100 - 100 / (1 + gain / loss)
+    _assert_parity(indicators.wilder_rsi(close, 14, min_periods=14), expected)
+    _assert_parity(indicators.wilder_rsi_batch(close, [14], min_periods=14)[:, 0], expected)
+
+
+def test_wilder_rsi_matches_ewm(ohlcv):
+    close = ohlcv['close']
+    delta = close.diff()
+    for min_periods in (0, 14):
+        gain = delta.clip(lower=0).ewm(alpha=1 / 14, min_periods=min_periods, adjust=False).mean()
+        loss = (-delta.clip(upper=0)).ewm(alpha=1 / 14, min_periods=min_periods, adjust=False).mean()
+        expected = 100 - 100 / (1 + gain / loss)
+        _assert_parity(indicators.wilder_rsi(close, 14, min_periods=min_periods), expected)
+    rising = indicators.wilder_rsi(np.arange(30.0), 14)
+    assert np.isnan(rising[0]) and (rising[1:] == 100).all()
+
+
+def test_atr_matches_true_range_averages(ohlcv):
+    prev_close = ohlcv['close'].shift(1)
+    tr = pd.concat([
+        (ohlcv['high'] - ohlcv['low']).abs(),
+        (ohlcv['high'] - prev_close).abs(),
+        (ohlcv['low'] - prev_close).abs(),
+    ], axis=1).max(axis=1)
+    args = (ohlcv['high'], ohlcv['low'], ohlcv['close'])
+    _assert_parity(indicators.true_range(*args), tr)
+    _assert_parity(indicators.atr(*args, period=14), tr.ewm(alpha=1 / 14, adjust=False).mean())
+    _assert_parity(indicators.atr(*args, period=14, wilder=False), tr.rolling(14).mean())
+
+
+def test_stochastic_matches_rolling_extremes(ohlcv):
+    low_min = ohlcv['low'].rolling(14).min()
+    high_max = ohlcv['high'].rolling(14).max()
+    fast_k = 100 * (ohlcv['close'] - low_min) / (high_max - low_min).replace(0, np.nan)
+    stoch_k = fast_k.rolling(3).mean()
+    k, d = indicators.stochastic(ohlcv['high'], ohlcv['low'], ohlcv['close'], 14, 3, 3)
+    _assert_parity(k, stoch_k)
+    _assert_parity(d, stoch_k.rolling(3).mean())
+
+
+def test_vwap_resets_per_session(ohlcv):
+    price = (ohlcv['high'] + ohlcv['low'] + ohlcv['close']) / 3
+    pv = price * ohlcv['volume']
+    by_day = pv.groupby(ohlcv['date']).cumsum() / ohlcv['volume'].groupby(ohlcv['date']).cumsum()
+    args = (ohlcv['high'], ohlcv['low'], ohlcv['close'], ohlcv['volume'])
+    _assert_parity(indicators.vwap(*args, sessions=ohlcv['date']), by_day)
+    _assert_parity(indicators.vwap(*args), pv.cumsum() / ohlcv['volume'].cumsum())
+
+
+def test_float32_inputs_match_pandas_in_float64(ohlcv):
+    # load_csv reads OHLC as float32; pandas rolling/ewm compute and return float64
+    frame32 = ohlcv[['high', 'low', 'close']].astype(np.float32)
+    close32 = frame32['close']
+    high32, low32 = frame32['high'], frame32['low']
+    prev_close = close32.shift()
+    tr = pd.concat([high32 - low32, (high32 - prev_close).abs(), (low32 - prev_close).abs()], axis=1).max(axis=1)
+    cases = [
+        (indicators.sma(close32, 10), close32.rolling(10).mean()),
+        (indicators.rolling_std(close32, 10), close32.rolling(10).std(ddof=0)),
+        (indicators.ema(close32, 10), close32.ewm(span=10, adjust=False).mean()),
+        (indicators.atr(high32, low32, close32, period=14, wilder=False), tr.rolling(14).mean()),
+        (indicators.ema_batch(close32, [10])[:, 0], close32.ewm(span=10, adjust=False).mean()),
+    ]
+    for result, expected in cases:
+        assert result.dtype == np.float64
+        _assert_parity(result, expected, atol=1e-6)
+    # Integer prices are promoted to float64 as well
+    assert indicators.sma(np.arange(10), 3).dtype == np.float64
+    with pytest.raises(ValueError):
+        indicators.sma(close32, 0)
+
+
+def test_batch_kernels_match_single_period_columns(ohlcv):
+    close = ohlcv['close'].copy()
+    close[[40, 300]] = np.nan
+    args = (ohlcv['high'], ohlcv['low'], ohlcv['close'])
+    periods = [2, 5, 14, 50]
+    cases = [
+        (indicators.sma_batch(close, periods), lambda p: indicators.sma(close, p)),
+        (indicators.ema_batch(close, periods), lambda p: indicators.ema(close, p)),
+        (indicators.wilder_rsi_batch(close, periods, min_periods=3), lambda p: indicators.wilder_rsi(close, p, 3)),
+        (indicators.atr_batch(*args, periods), lambda p: indicators.atr(*args, period=p)),
+        (indicators.atr_batch(*args, periods, wilder=False), lambda p: indicators.atr(*args, period=p, wilder=False)),
+    ]
+    for batch, single in cases:
+        assert batch.shape == (len(close), len(periods))
+        for j, period in enumerate(periods):
+            # Same arithmetic per column, so results are bit-identical
+            np.testing.assert_array_equal(batch[:, j], single(period))
+    # min_periods may differ per column
+    rsi = indicators.wilder_rsi_batch(close, [5, 14], min_periods=[5, 14])
+    np.testing.assert_array_equal(rsi[:, 1], indicators.wilder_rsi(close, 14, 14))
+    with pytest.raises(ValueError):
+        indicators.sma_batch(close, [5, 0])
+
+
+@pytest.mark.parametrize('period', [1, 4, 50])
+def test_rolling_median_and_quantile_match_pandas(ohlcv, period):
+    atr = pd.Series(indicators.atr(ohlcv['high'], ohlcv['low'], ohlcv['close'], 14, wilder=False))
+    atr[[200, 201, 450]] = np.nan
+    atr[300:340] = 5.0  # long run of ties
+    rolling = atr.rolling(period, min_periods=1)
+    _assert_parity(indicators.rolling_median(atr, period, min_periods=1), rolling.median())
+    _assert_parity(indicators.rolling_median(atr, period), atr.rolling(period).median())
+    for q in (0.0, 0.1, 0.75, 1.0):
+        _assert_parity(indicators.rolling_quantile(atr, period, q, min_periods=1), rolling.quantile(q))
+    with pytest.raises(ValueError):
+        indicators.rolling_quantile(atr, period, 1.5)
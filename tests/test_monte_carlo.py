@@ -0,0 +1,60 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from backtester.monte_carlo import distribution_summary, simulate_trade_paths
+
+
+def _path_stats(pnl, initial_equity):
+    equity = initial_equity + np.cumsum(pnl)
+    peak = np.maximum.accumulate(np.r_[initial_equity, equity])[1:]
+    return equity[-1], float((peak - equity).max(initial=0.0)), float(((peak - equity) / peak).max(initial=0.0) * 100)
+
+
+def test_shuffle_covers_every_permutation():
+    pnl = np.array([30.0, -50.0, 20.0, -10.0])
+    expected = {
+        round(_path_stats(np.array(order), 100.0)[1], 9)
+        for order in itertools.permutations(pnl)
+    }
+    paths = simulate_trade_paths(pnl, 100.0, n_paths=2000, method='shuffle', seed=3)
+    # Reordering trades never changes where the path ends
+    assert np.allclose(paths['final_equity'], 90.0)
+    assert set(np.round(paths['max_drawdown'], 9)) == expected
+
+
+def test_bootstrap_draws_with_replacement_and_is_seeded():
+    pnl = np.array([-40.0, 15.0])
+    paths = simulate_trade_paths(pnl, 100.0, n_paths=2000, n_trades=3, ruin_equity=0.0, seed=7)
+    again = simulate_trade_paths(pnl, 100.0, n_paths=2000, n_trades=3, ruin_equity=0.0, seed=7)
+    for key in paths:
+        assert np.array_equal(paths[key], again[key])
+
+    outcomes = {100.0 + sum(order) for order in itertools.product(pnl, repeat=3)}
+    assert set(np.round(paths['final_equity'], 9)) == outcomes
+    # Only three straight losses (100 -> 60 -> 20 -> -20) reach the ruin level
+    wiped_out = np.isclose(paths['final_equity'], -20.0)
+    assert np.array_equal(paths['ruined'], wiped_out)
+    assert np.allclose(paths['max_drawdown'][wiped_out], 120.0)
+    assert np.allclose(paths['max_drawdown_pct'][wiped_out], 120.0)
+    assert paths['ruined'].mean() == pytest.approx(1 / 8, abs=0.03)
+
+
+def test_simulate_trade_paths_validates():
+    with pytest.raises(ValueError):
+        simulate_trade_paths([], 100.0)
+    with pytest.raises(ValueError):
+        simulate_trade_paths([1.0, np.nan], 100.0)
+    with pytest.raises(ValueError):
+        simulate_trade_paths([1.0], 100.0, method='block')
+    with pytest.raises(ValueError):
+        simulate_trade_paths([1.0], 100.0, n_paths=0)
+
+
+def test_distribution_summary():
+    summary = distribution_summary(np.arange(101.0), percentiles=(5, 50), bins=4)
+    assert summary['percentiles'] == {'p5': 5.0, 'p50': 50.0}
+    assert summary['mean'] == 50.0 and (summary['min'], summary['max']) == (0.0, 100.0)
+    assert sum(summary['histogram']['counts']) == 101
+    assert len(summary['histogram']['bin_edges']) == 5
@@ -52,6 +52,13 @@ def test_vectorized_signal_generation():
     assert set(df['signal'].unique()) <= {0, 1, -1}
 
 
+def test_vectorized_signal_generation_rsi_bounce():
+    close = pd.Series(np.r_[np.linspace(100, 80, 30), np.linspace(80, 100, 30)])
+    df = ou.vectorized_signal_generation(pd.DataFrame({'close': close}), strategy_type='rsi_bounce')
+    assert df['rsi'].iloc[1:].notna().all()
+    assert df['signal'].iloc[5] == 1 and df['signal'].iloc[-1] == -1
+
+
 def test_performance_optimizer():
     est = ou.PerformanceOptimizer.estimate_processing_time(100000, 1.5)
     assert est > 0
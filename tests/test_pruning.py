@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtester.engine import BacktestEngine
+from backtester.exit_rules import stop
+from backtester.pruning import normalize_pruning, pruning_array
+
+
+class _HoldLong:
+    """Goes long on the first bar and never exits on its own."""
+
+    def __init__(self, mode):
+        self.mode = mode
+
+    @property
+    def _use_fast_vectorized(self):
+        return self.mode == 'fast'
+
+    def generate_signals(self, data):
+        df = data.copy()
+        df['signal'] = 0
+        df.loc[0, 'signal'] = 1
+        return df
+
+    def should_exit(self, position, row, entry_price):
+        return False, ''
+
+    def exit_rules(self):
+        return [stop(points=10_000)] if self.mode == 'rule' else []
+
+
+def _falling_sessions(days=10, bars=5):
+    days = pd.bdate_range('2024-01-01', periods=days)
+    ts = [d + pd.Timedelta(hours=9, minutes=15 + m) for d in days for m in range(bars)]
+    return pd.DataFrame({'timestamp': ts, 'close': np.linspace(100.0, 50.0, len(ts))})
+
+
+def test_normalize_pruning_validates():
+    assert normalize_pruning(None) is None
+    assert normalize_pruning({}) is None
+    config = normalize_pruning({'max_drawdown_pct': 20, 'min_trades': 3, 'min_trades_sessions': 5})
+    assert config == {'max_drawdown_pct': 20.0, 'min_trades': 3, 'min_trades_sessions': 5}
+    assert pruning_array(config)[0] == pytest.approx(0.2)
+    for bad in ({'max_drawdown_pct': 0}, {'min_trades': 3}, {'min_trades': 0, 'min_trades_sessions': 2},
+                {'stop_loss': 1}):
+        with pytest.raises(ValueError):
+            normalize_pruning(bad)
+
+
+@pytest.mark.parametrize('mode', ['fast', 'rule', 'traditional'])
+def test_equity_floor_prunes_at_session_boundary(mode):
+    data = _falling_sessions()
+    full = BacktestEngine(data, _HoldLong(mode)).run()
+    assert 'pruned' not in full
+    assert full['trade_log']['exit_reason'].tolist() == ['End of Data']
+
+    result = BacktestEngine(data, _HoldLong(mode), pruning={'equity_floor': 99_000}).run()
+    # Marked to day 3's last close (85.71) the long has lost 1071
+    assert result['pruned'] == {
+        'reason': 'equity_floor', 'bar': 15, 'timestamp': str(data['timestamp'].values[15]), 'sessions': 3,
+    }
+    trades = result['trade_log']
+    assert trades['exit_reason'].tolist() == ['Pruned']
+    assert trades['exit_time'].iloc[0] == data['timestamp'].iloc[14]
+    assert trades['exit_price'].iloc[0] == pytest.approx(data['close'].iloc[14])
+    equity = result['equity_curve']
+    assert equity['timestamp'].iloc[-1] == data['timestamp'].iloc[14]
+    assert len(equity) == (16 if mode == 'fast' else 15)
+
+
+@pytest.mark.parametrize('mode', ['fast', 'traditional'])
+def test_drawdown_and_min_trade_rules(mode):
+    data = _falling_sessions()
+    # The long has lost 689 (0.69%) by the end of day 2
+    result = BacktestEngine(data, _HoldLong(mode), pruning={'max_drawdown_pct': 0.5}).run()
+    assert result['pruned']['reason'] == 'max_drawdown'
+    assert result['pruned']['sessions'] == 2
+
+    result = BacktestEngine(
+        data, _HoldLong(mode), pruning={'min_trades': 3, 'min_trades_sessions': 4}
+    ).run()
+    assert result['pruned']['reason'] == 'min_trades'
+    assert result['pruned']['sessions'] == 4
+
+    untouched = BacktestEngine(data, _HoldLong(mode), pruning={'equity_floor': 1_000}).run()
+    assert untouched['pruned'] is None
+    assert len(untouched['equity_curve']) == len(BacktestEngine(data, _HoldLong(mode)).run()['equity_curve'])
@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtester.engine import BacktestEngine
+from backtester.result import BacktestResult
+from strategies.rsi_midday_reversion_scalper import RSIMiddayReversionScalper
+
+
+def _engine_result():
+    rng = np.random.default_rng(2)
+    n = 400
+    close = 100 + np.cumsum(rng.normal(0, 1, n))
+    data = pd.DataFrame({
+        'timestamp': pd.date_range('2024-01-01 09:15', periods=n, freq='min'),
+        'open': close,
+        'high': close + 1,
+        'low': close - 1,
+        'close': close,
+    })
+    return BacktestEngine(data, RSIMiddayReversionScalper(), daily_profit_target=10).run()
+
+
+def test_columnar_result_round_trips_engine_output():
+    raw = _engine_result()
+    result = BacktestResult.from_engine_result(raw, initial_equity=100000)
+    assert result.timestamps.dtype == np.int64
+    assert result.equity.dtype == np.float32
+    assert result.trade_count == len(raw['trade_log']) > 0
+    assert result.final_equity == raw['equity_curve']['equity'].iloc[-1]
+
+    equity = result.equity_frame()
+    assert (equity['timestamp'] == raw['equity_curve']['timestamp']).all()
+    assert np.allclose(equity['equity'], raw['equity_curve']['equity'], rtol=1e-6)
+
+    trades = result.trades_frame()
+    for column in ('entry_time', 'exit_time'):
+        assert (trades[column] == pd.to_datetime(raw['trade_log'][column])).all()
+    assert trades['pnl'].tolist() == raw['trade_log']['pnl'].tolist()
+    assert trades['exit_reason'].tolist() == raw['trade_log']['exit_reason'].tolist()
+
+
+def test_records_are_json_ready():
+    raw = _engine_result()
+    result = BacktestResult.from_engine_result(raw)
+    equity = result.equity_records()
+    assert equity[0] == {'timestamp': '2024-01-01T09:15:00', 'equity': pytest.approx(100000.0)}
+    assert equity[-1]['equity'] == result.final_equity
+
+    trades = result.trade_records()
+    first = raw['trade_log'].iloc[0]
+    assert trades[0]['entry_time'] == pd.Timestamp(first['entry_time']).isoformat()
+    assert trades[0]['direction'] == first['direction']
+    assert trades[0]['trade_date'] == str(first['trade_date'])
+    assert isinstance(trades[0]['pnl'], float)
+    assert all(v is None or isinstance(v, float) for v in result.indicator_lists().get('rsi', []))
+
+
+def test_missing_values_and_timezones():
+    ts = pd.date_range('2024-01-01 09:15', periods=2, freq='min', tz='Asia/Kolkata')
+    raw = {
+        'equity_curve': pd.DataFrame({'timestamp': ts, 'equity': [100.0, 101.0]}),
+        'trade_log': pd.DataFrame({
+            'entry_time': [ts[0]],
+            'exit_time': [pd.NaT],
+            'pnl': [np.nan],
+            'exit_reason': [None],
+        }),
+    }
+    result = BacktestResult.from_engine_result(raw)
+    assert result.tz == 'Asia/Kolkata'
+    assert result.equity_records()[0]['timestamp'] == ts[0].isoformat()
+    assert result.trade_records() == [
+        {'entry_time': ts[0].isoformat(), 'exit_time': None, 'pnl': None, 'exit_reason': None}
+    ]
+    assert BacktestResult.from_engine_result({'equity_curve': pd.DataFrame()}).equity_records() == []
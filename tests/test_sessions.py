@@ -0,0 +1,152 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtester import indicator_cache
+from backtester.indicator_cache import IndicatorCache
+from backtester.sessions import session_index
+from strategies.first_candle_breakout import FirstCandleBreakoutStrategy
+from strategies.opening_range_breakout_scalper import OpeningRangeBreakoutScalper
+from strategies.rsi_midday_reversion_scalper import RSIMiddayReversionScalper
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(indicator_cache, '_shared_cache', IndicatorCache())
+
+
+def _intraday_data(days=3, seed=7, start='09:15', end='15:29'):
+    rng = np.random.default_rng(seed)
+    frames = []
+    for day in pd.date_range('2024-01-01', periods=days, freq='D'):
+        ts = pd.date_range(f'{day.date()} {start}', f'{day.date()} {end}', freq='min')
+        frames.append(pd.DataFrame({'timestamp': ts}))
+    df = pd.concat(frames, ignore_index=True)
+    close = 22000 + np.cumsum(rng.normal(0, 4, len(df)))
+    spread = np.abs(rng.normal(0, 3, len(df)))
+    df['open'] = close + rng.normal(0, 1, len(df))
+    df['high'] = np.maximum(close, df['open']) + spread
+    df['low'] = np.minimum(close, df['open']) - spread
+    df['close'] = close
+    return df
+
+
+def test_primitives_match_groupby():
+    df = _intraday_data(days=4)
+    df.loc[[5, 700], 'high'] = np.nan
+    sessions = session_index(df['timestamp'])
+    date = df['timestamp'].dt.date
+    groups = df.groupby(date)
+
+    assert sessions.count == 4
+    np.testing.assert_array_equal(sessions.ids, groups.ngroup())
+    np.testing.assert_array_equal(sessions.bar_index, groups.cumcount())
+    np.testing.assert_array_equal(sessions.hour, df['timestamp'].dt.hour)
+    np.testing.assert_array_equal(sessions.first_bar, ~date.duplicated())
+    np.testing.assert_array_equal(sessions.last_bar, ~date.duplicated(keep='last'))
+    np.testing.assert_array_equal(sessions.cummax(df['high']), groups['high'].cummax())
+    np.testing.assert_array_equal(sessions.cummin(df['low']), groups['low'].cummin())
+    np.testing.assert_array_equal(sessions.session_max(df['high']), groups['high'].transform('max'))
+    np.testing.assert_array_equal(sessions.session_min(df['low']), groups['low'].transform('min'))
+
+    times = df['timestamp'].dt.strftime('%H:%M')
+    np.testing.assert_array_equal(
+        sessions.time_mask('10:00', datetime.time(11, 30)), (times >= '10:00') & (times <= '11:30')
+    )
+
+    mask = pd.Series(df['close'] > df['open'])
+    mask[date == date.iloc[-1]] = False
+    np.testing.assert_array_equal(sessions.running_count(mask), mask.astype(int).groupby(date).cumsum())
+    np.testing.assert_array_equal(sessions.any(mask), mask.groupby(date).transform('any'))
+    first = sessions.first(mask)
+    np.testing.assert_array_equal(first, mask & (mask.astype(int).groupby(date).cumsum() == 1))
+    assert first.sum() == 3
+
+    value = sessions.value_at_first(mask, df['close'])
+    expected = df['close'].where(first).groupby(date).transform('max')
+    np.testing.assert_array_equal(value, expected)
+    after = sessions.after_first(mask)
+    np.testing.assert_array_equal(after, (pd.Series(first).astype(int).groupby(date).cumsum() > 0) & ~first)
+
+
+def test_sessions_follow_wall_clock_of_tz_aware_timestamps():
+    ts = pd.Series(pd.date_range('2024-01-01 23:00', periods=4, freq='h', tz='Asia/Kolkata'))
+    sessions = session_index(ts)
+    np.testing.assert_array_equal(sessions.ids, [0, 1, 1, 1])
+    np.testing.assert_array_equal(sessions.hour, [23, 0, 1, 2])
+
+
+def test_layout_is_served_from_the_indicator_cache():
+    df = _intraday_data(days=2)
+    cache = indicator_cache.get_indicator_cache()
+    session_index(df['timestamp'])
+    session_index(df['timestamp'].copy())
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def _legacy_rsi_forced_entries(df):
+    out = df.copy()
+    out['date'] = out['timestamp'].dt.date
+    for _, group in out.groupby('date'):
+        if (group['signal'] != 0).any():
+            continue
+        midday = group[group['timestamp'].dt.time >= datetime.time(13, 0)]
+        idx = midday.index[0] if not midday.empty else group.index[0]
+        out.loc[idx, 'signal'] = 1 if group.loc[idx, 'rsi'] > 50 else -1
+    return out['signal']
+
+
+def test_rsi_midday_forced_entries_match_loop():
+    # The last session ends before 13:00, so its forced entry falls back to the first bar
+    late = _intraday_data(days=1, seed=3, end='12:30')
+    late['timestamp'] += pd.Timedelta(days=3)
+    data = pd.concat([_intraday_data(days=3, seed=2), late], ignore_index=True)
+    df = RSIMiddayReversionScalper().generate_signals(data)
+
+    rsi = df['rsi']
+    crossed = np.where((rsi.shift(1) < 30) & (rsi >= 30), 1, np.where((rsi.shift(1) > 70) & (rsi <= 70), -1, 0))
+    expected = _legacy_rsi_forced_entries(df.assign(signal=crossed))
+    np.testing.assert_array_equal(df['signal'], expected)
+    assert df['signal'].ne(0).groupby(df['timestamp'].dt.date).any().all()
+
+
+def test_first_candle_breakout_takes_one_trade_per_day():
+    data = _intraday_data(days=3, seed=5)
+    strategy = FirstCandleBreakoutStrategy({'session_start': '09:15'})
+    df = strategy.generate_signals(data)
+    date = df['timestamp'].dt.date
+
+    for _, day in df.groupby(date):
+        signal_candle = day.iloc[0]
+        rest = day.iloc[1:]
+        assert np.isnan(day['signal_high'].iloc[0])
+        np.testing.assert_array_equal(rest['signal_high'], signal_candle['high'])
+        np.testing.assert_array_equal(rest['signal_low'], signal_candle['low'])
+        beyond = rest[(rest['close'] > signal_candle['high']) | (rest['close'] < signal_candle['low'])]
+        entries = day[day['signal'] != 0]
+        assert len(entries) == min(len(beyond), 1)
+        if len(beyond):
+            entry = beyond.iloc[0]
+            assert entries.index[0] == entry.name
+            assert entries['signal'].iloc[0] == (1 if entry['close'] > signal_candle['high'] else -1)
+
+
+def test_opening_range_breakout_matches_groupby():
+    data = _intraday_data(days=3, seed=9)
+    df = OpeningRangeBreakoutScalper({'or_period': 15}).generate_signals(data)
+
+    for _, day in df.groupby(df['timestamp'].dt.date):
+        or_window = day.iloc[:15]
+        after = day.iloc[15:]
+        or_high, or_low = or_window['high'].max(), or_window['low'].min()
+        np.testing.assert_array_equal(day['or_high'], or_high)
+        np.testing.assert_array_equal(day['or_low'], or_low)
+        prev_close = after['close'].shift(1)
+        expected = np.where(
+            (prev_close <= or_high) & (after['close'] > or_high), 1,
+            np.where((prev_close >= or_low) & (after['close'] < or_low), -1, 0),
+        )
+        np.testing.assert_array_equal(after['signal'], expected)
+        assert (or_window['signal'] == 0).all()
@@ -0,0 +1,130 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtester.engine import BacktestEngine
+from backtester import signal_cache
+from backtester.signal_cache import SignalCache, dataset_fingerprint
+from backtester.strategy_base import StrategyBase
+from strategies.rsi_midday_reversion_scalper import RSIMiddayReversionScalper
+
+
+def _data(n=300, seed=1):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, n))
+    return pd.DataFrame({
+        'timestamp': pd.date_range('2024-01-01 09:15', periods=n, freq='min'),
+        'open': close,
+        'high': close + 1,
+        'low': close - 1,
+        'close': close,
+    })
+
+
+class CountingStrategy(RSIMiddayReversionScalper):
+    calls = 0
+
+    def generate_signals(self, data):
+        type(self).calls += 1
+        return super().generate_signals(data)
+
+
+def test_cache_hit_skips_generate_signals(tmp_path):
+    cache = SignalCache(tmp_path)
+    data = _data()
+    CountingStrategy.calls = 0
+    first = cache.generate_signals(CountingStrategy({'rsi_period': 10}), data)
+    second = cache.generate_signals(CountingStrategy({'rsi_period': 10}), data)
+    assert CountingStrategy.calls == 1
+    assert cache.info()['hits'] == 1 and cache.info()['misses'] == 1
+    # Hits rebuild the strategy's own column order
+    pd.testing.assert_frame_equal(first, second, check_dtype=False)
+
+
+def test_cache_key_depends_on_params_and_data(tmp_path):
+    cache = SignalCache(tmp_path)
+    data = _data()
+    base = cache.key(RSIMiddayReversionScalper({'rsi_period': 10}), data)
+    assert base == cache.key(RSIMiddayReversionScalper({'rsi_period': 10}), data.copy())
+    assert base != cache.key(RSIMiddayReversionScalper({'rsi_period': 12}), data)
+    changed = data.copy()
+    changed.loc[5, 'close'] += 0.01
+    assert dataset_fingerprint(changed) != dataset_fingerprint(data)
+    assert base != cache.key(RSIMiddayReversionScalper({'rsi_period': 10}), changed)
+
+
+def test_cache_key_depends_on_backtester_source(tmp_path, monkeypatch):
+    cache = SignalCache(tmp_path)
+    data = _data()
+    base = cache.key(RSIMiddayReversionScalper(), data)
+    # An indicator or engine fix changes the package hash and so every key
+    monkeypatch.setattr(signal_cache, 'backtester_source_hash', lambda: 'patched')
+    assert base != cache.key(RSIMiddayReversionScalper(), data)
+
+
+class LabelStrategy(StrategyBase):
+    def __init__(self, labels):
+        super().__init__({'labels': labels})
+        self.labels = labels
+
+    def generate_signals(self, data):
+        df = data[['timestamp', 'close']].copy()
+        df.insert(0, 'label', self.labels)
+        df['signal'] = 0
+        return df
+
+
+def test_entries_never_need_unpickling(tmp_path):
+    cache = SignalCache(tmp_path)
+    data = _data(n=4)
+    strings = LabelStrategy(['a', 'bb', '', 'ccc'])
+    first = cache.generate_signals(strings, data)
+    second = cache.generate_signals(strings, data)
+    assert cache.info()['hits'] == 1
+    pd.testing.assert_frame_equal(first, second)
+    with np.load(next(tmp_path.glob('*.npz'))) as stored:  # allow_pickle=False
+        assert {stored[name].dtype.kind for name in stored.files} <= {'U', 'i', 'f', 'M'}
+
+    # Object columns holding anything but strings are not cached
+    mixed = LabelStrategy(['a', None, 1, 'b'])
+    cache.generate_signals(mixed, data)
+    assert cache.info()['entries'] == 1
+
+
+def test_engine_results_identical_with_cache(tmp_path):
+    cache = SignalCache(tmp_path)
+    data = _data()
+    plain = BacktestEngine(data, RSIMiddayReversionScalper(), fee_per_trade=4.0).run()
+    for fee in (4.0, 4.0):
+        cached = BacktestEngine(
+            data, RSIMiddayReversionScalper(), fee_per_trade=fee, signal_cache=cache,
+        ).run()
+        pd.testing.assert_frame_equal(plain['equity_curve'], cached['equity_curve'])
+        pd.testing.assert_frame_equal(plain['trade_log'], cached['trade_log'])
+    assert cache.info()['hits'] == 1
+
+
+def test_lru_eviction(tmp_path):
+    data = _data(n=2000)
+    probe = SignalCache(tmp_path / 'probe')
+    probe.generate_signals(RSIMiddayReversionScalper({'rsi_period': 5}), data)
+    entry_size = probe.info()['size_bytes']
+
+    cache = SignalCache(tmp_path / 'lru', max_bytes=int(entry_size * 2.5))
+    for period in (5, 6, 7):
+        cache.generate_signals(RSIMiddayReversionScalper({'rsi_period': period}), data)
+    assert cache.info()['entries'] == 2
+    assert cache.get(cache.key(RSIMiddayReversionScalper({'rsi_period': 5}), data)) is None
+    assert cache.get(cache.key(RSIMiddayReversionScalper({'rsi_period': 7}), data)) is not None
+
+
+def test_opted_out_strategy_bypasses_cache(tmp_path):
+    class Stateful(CountingStrategy):
+        cache_signals = False
+
+    cache = SignalCache(tmp_path)
+    Stateful.calls = 0
+    for _ in range(2):
+        cache.generate_signals(Stateful(), _data())
+    assert Stateful.calls == 2
+    assert cache.info()['entries'] == 0